@@ -7,8 +7,11 @@ def load_beliefs(filename, jtms):
     with open(f"Beliefs/{filename}", "r") as f:
         data = json.load(f)
 
-    for b in data["beliefs"]:
-        jtms.add_justification(b["in"], b["out"], b["conclusion"])
+    if hasattr(jtms, "add_justifications"):
+        jtms.add_justifications(data["beliefs"])
+    else:
+        for b in data["beliefs"]:
+            jtms.add_justification(b["in"], b["out"], b["conclusion"])
 
     for init in data.get("initial", []):
         jtms.add_belief(init)
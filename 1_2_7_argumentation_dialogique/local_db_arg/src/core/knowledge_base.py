@@ -1,6 +1,23 @@
-from typing import Dict, List
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Set, Tuple
+
 from .models import Proposition, Argument
 
+# Index maintenus à l'insertion (conclusion -> arguments, prémisse ->
+# arguments dépendants, propositions contredites) : chaque requête est une
+# recherche en dictionnaire, quelle que soit la longueur du débat.
+# snapshot/rollback annulent les ajouts via un journal, pour l'anticipation
+# des coups par les protocoles.
+
+NEGATION = "¬"
+
+_MISSING = object()
+
+
+def negate(content: str) -> str:
+    """Contenu de la négation de ``content``"""
+    return f"{NEGATION}{content}"
+
 
 class KnowledgeBase:
     """Base de connaissances avec support d'argumentation"""
@@ -10,42 +27,65 @@ class KnowledgeBase:
         self.arguments: Dict[str, Argument] = {}
         self.rules: List[Dict] = []
         self.preferences: Dict[str, float] = {}
+        # contenu -> {id d'argument: argument}, dans l'ordre d'insertion
+        self._by_conclusion: Dict[str, Dict[str, Argument]] = {}
+        self._by_premise: Dict[str, Dict[str, Argument]] = {}
+        # contenus p tels que p et ¬p sont tous deux dans la base
+        self._contradicted: Set[str] = set()
+        # journal d'annulation, tenu seulement quand un instantané est ouvert
+        self._journal: List[Tuple] = []
+        self._marks: List[int] = []
 
     def add_proposition(self, prop: Proposition) -> None:
         """Ajoute une proposition à la base"""
-        self.propositions[prop.content] = prop
+        content = prop.content
+        previous = self.propositions.get(content, _MISSING)
+        self.propositions[content] = prop
+        if self._marks:
+            self._journal.append(("proposition", content, previous))
+        if previous is not _MISSING:
+            return
+        if negate(content) in self.propositions:
+            self._mark_contradicted(content)
+        if content.startswith(NEGATION) and content[1:] in self.propositions:
+            self._mark_contradicted(content[1:])
 
     def add_argument(self, arg: Argument) -> None:
-        """Ajoute un argument à la base"""
+        """Ajoute un argument à la base (avec ses prémisses et sa conclusion)"""
+        previous = self.arguments.get(arg.id, _MISSING)
         self.arguments[arg.id] = arg
-        # Ajoute automatiquement les prémisses et conclusion
+        if previous is _MISSING:
+            self._index(arg)
+        else:
+            self._reindex(previous, arg)
+        if self._marks:
+            self._journal.append(("argument", arg.id, previous))
         for premise in arg.premises:
             self.add_proposition(premise)
         self.add_proposition(arg.conclusion)
 
     def find_supporting_arguments(self, prop: Proposition) -> List[Argument]:
         """Trouve les arguments supportant une proposition"""
-        return [
-            arg
-            for arg in self.arguments.values()
-            if arg.conclusion.content == prop.content
-        ]
+        return list(self._by_conclusion.get(prop.content, {}).values())
 
     def find_attacking_arguments(self, prop: Proposition) -> List[Argument]:
         """Trouve les arguments attaquant une proposition"""
-        return [
-            arg
-            for arg in self.arguments.values()
-            if arg.conclusion.content == f"¬{prop.content}"
-        ]
+        return list(self._by_conclusion.get(negate(prop.content), {}).values())
+
+    def find_dependent_arguments(self, prop: Proposition) -> List[Argument]:
+        """Trouve les arguments utilisant la proposition comme prémisse"""
+        return list(self._by_premise.get(prop.content, {}).values())
 
     def is_consistent(self) -> bool:
         """Vérifie la cohérence de la base"""
-        for prop_content in self.propositions:
-            neg_content = f"¬{prop_content}"
-            if neg_content in self.propositions:
-                return False
-        return True
+        return not self._contradicted
+
+    def get_contradictions(self) -> List[Tuple[Proposition, Proposition]]:
+        """Paires ``(p, ¬p)`` présentes toutes deux dans la base"""
+        return [
+            (self.propositions[content], self.propositions[negate(content)])
+            for content in self._contradicted
+        ]
 
     def entails(self, prop: Proposition) -> bool:
         """Vérifie si la base implique une proposition"""
@@ -58,3 +98,117 @@ class KnowledgeBase:
     def get_all_arguments(self) -> List[Argument]:
         """Retourne tous les arguments"""
         return list(self.arguments.values())
+
+    # ── Instantanés ──
+
+    def snapshot(self) -> int:
+        """Ouvre un instantané ; renvoie le jeton de ``rollback``/``release``.
+
+        Les instantanés s'imbriquent : annuler ou libérer un jeton ferme
+        aussi ceux ouverts après lui. ``rules`` et ``preferences`` ne sont
+        pas couverts.
+        """
+        self._marks.append(len(self._journal))
+        return len(self._marks)
+
+    def rollback(self, token: int) -> None:
+        """Annule les ajouts faits depuis l'instantané ``token``"""
+        mark = self._close(token)
+        while len(self._journal) > mark:
+            entry = self._journal.pop()
+            if entry[0] == "proposition":
+                self._undo_proposition(entry[1], entry[2])
+            elif entry[0] == "argument":
+                self._undo_argument(entry[1], entry[2])
+            else:  # "contradicted"
+                self._contradicted.discard(entry[1])
+        if not self._marks:
+            self._journal.clear()
+
+    def release(self, token: int) -> None:
+        """Conserve les ajouts faits depuis ``token`` et ferme l'instantané"""
+        self._close(token)
+        if not self._marks:
+            self._journal.clear()
+
+    @contextmanager
+    def lookahead(self) -> Iterator["KnowledgeBase"]:
+        """Contexte dont toutes les modifications sont annulées en sortie"""
+        token = self.snapshot()
+        try:
+            yield self
+        finally:
+            self.rollback(token)
+
+    # ── Interne ──
+
+    def _close(self, token: int) -> int:
+        if not 1 <= token <= len(self._marks):
+            raise ValueError(f"Instantané inconnu ou fermé : {token}")
+        mark = self._marks[token - 1]
+        del self._marks[token - 1 :]
+        return mark
+
+    def _mark_contradicted(self, content: str) -> None:
+        if content not in self._contradicted:
+            self._contradicted.add(content)
+            if self._marks:
+                self._journal.append(("contradicted", content))
+
+    def _index(self, arg: Argument) -> None:
+        for index, content in self._keys(arg):
+            index.setdefault(content, {})[arg.id] = arg
+
+    def _reindex(self, old: Argument, new: Argument) -> None:
+        """Remplace ``old`` par ``new`` (même id) dans les index.
+
+        L'id garde sa place dans les index où il reste et prend, dans les
+        nouveaux, sa position dans ``arguments`` : les recherches rendent
+        l'ordre d'un parcours de ``arguments``.
+        """
+        keys = self._keys(new)
+        for index, content in self._keys(old):
+            if not any(i is index and c == content for i, c in keys):
+                self._drop(index, content, old.id)
+        for index, content in keys:
+            bucket = index.setdefault(content, {})
+            moved = bucket and new.id not in bucket
+            bucket[new.id] = new
+            if moved:
+                index[content] = {
+                    arg_id: bucket[arg_id]
+                    for arg_id in self.arguments
+                    if arg_id in bucket
+                }
+
+    def _unindex(self, arg: Argument) -> None:
+        for index, content in self._keys(arg):
+            self._drop(index, content, arg.id)
+
+    def _keys(self, arg: Argument) -> List[Tuple[Dict[str, Dict[str, Argument]], str]]:
+        return [(self._by_conclusion, arg.conclusion.content)] + [
+            (self._by_premise, p.content) for p in arg.premises
+        ]
+
+    @staticmethod
+    def _drop(index: Dict[str, Dict[str, Argument]], content: str, arg_id: str) -> None:
+        bucket = index.get(content)
+        if bucket is not None:
+            bucket.pop(arg_id, None)
+            if not bucket:
+                del index[content]
+
+    def _undo_proposition(self, content: str, previous) -> None:
+        if previous is _MISSING:
+            del self.propositions[content]
+        else:
+            self.propositions[content] = previous
+
+    def _undo_argument(self, arg_id: str, previous) -> None:
+        current = self.arguments[arg_id]
+        if previous is _MISSING:
+            self._unindex(current)
+            del self.arguments[arg_id]
+        else:
+            self.arguments[arg_id] = previous
+            self._reindex(current, previous)
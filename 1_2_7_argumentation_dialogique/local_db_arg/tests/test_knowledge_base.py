@@ -1,6 +1,55 @@
 import pytest
 
+from src.core.knowledge_base import KnowledgeBase
+from src.core.models import Argument, Proposition
+
 
 @pytest.mark.skip(reason="Test étudiant - Fichier de test vide.")
 def test_placeholder():
     pass
+
+
+@pytest.fixture
+def kb():
+    return KnowledgeBase()
+
+
+def _arg(arg_id, conclusion, *premises, strength=1.0):
+    return Argument(
+        id=arg_id,
+        premises=[Proposition(p) for p in premises],
+        conclusion=Proposition(conclusion),
+        strength=strength,
+    )
+
+
+def test_queries_use_the_indexes(kb):
+    kb.add_argument(_arg("a", "B", "A"))
+    kb.add_argument(_arg("b", "¬B", "A", "C"))
+    assert [a.id for a in kb.find_supporting_arguments(Proposition("B"))] == ["a"]
+    assert [a.id for a in kb.find_attacking_arguments(Proposition("B"))] == ["b"]
+    assert [a.id for a in kb.find_dependent_arguments(Proposition("A"))] == ["a", "b"]
+    assert not kb.is_consistent()
+
+
+def test_re_adding_an_argument_keeps_its_position(kb):
+    kb.add_argument(_arg("a", "B", "A"))
+    kb.add_argument(_arg("b", "B", "C"))
+    kb.add_argument(_arg("a", "B", "A", strength=2.0))
+    assert [a.id for a in kb.find_supporting_arguments(Proposition("B"))] == ["a", "b"]
+    kb.add_argument(_arg("a", "B", "C"))
+    assert [a.id for a in kb.find_dependent_arguments(Proposition("C"))] == ["a", "b"]
+    assert kb.find_dependent_arguments(Proposition("A")) == []
+
+
+def test_lookahead_restores_indexes_and_order(kb):
+    kb.add_argument(_arg("a", "B"))
+    kb.add_argument(_arg("b", "B"))
+    with kb.lookahead():
+        kb.add_argument(_arg("a", "D"))
+        kb.add_argument(_arg("c", "¬B"))
+        assert not kb.is_consistent()
+    assert kb.is_consistent()
+    assert [a.id for a in kb.find_supporting_arguments(Proposition("B"))] == ["a", "b"]
+    assert kb.find_supporting_arguments(Proposition("D")) == []
+    assert list(kb.arguments) == ["a", "b"]
@@ -1,3 +1,6 @@
+import sys
+from pathlib import Path
+
 import pandas as pd
 from agents.agent_factory import AgentFactory
 from governance.methods import GOVERNANCE_METHODS
@@ -6,6 +9,10 @@ from metrics.metrics import summarize_results
 import numpy as np
 import json
 
+# batch_run uses the experiment engine of the main package; appended so the
+# prototype's own packages keep precedence.
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
 
 def run_simulation(agents, scenario_data, method):
     # Placeholder: import actual simulation logic
@@ -14,22 +21,71 @@ def run_simulation(agents, scenario_data, method):
     return simulate_governance(agents, scenario_data, method)
 
 
-def batch_run(config_path, n_runs=100, method=None, output_csv="results.csv"):
+def run_task(scenario_data, task):
+    """One seeded run of the sweep (module-level so process workers can load it)."""
+    from governance.simulation import simulate_manipulation
+
+    agents = AgentFactory.create_agents(scenario_data["agents"], seed=task.seed)
+    m = task.manipulation
+    if m.kind == "none":
+        results = run_simulation(agents, scenario_data, task.method)
+    else:
+        results = simulate_manipulation(
+            agents,
+            scenario_data,
+            task.method,
+            m.kind,
+            noise_level=m.noise_level,
+            bribery_budget=m.bribery_budget,
+        )
+    return summarize_results(results)
+
+
+def batch_run(
+    config_path,
+    n_runs=100,
+    method=None,
+    output_csv="results.csv",
+    methods=None,
+    manipulations=None,
+    n_workers=None,
+    resume=True,
+    seed=0,
+):
+    """Run ``n_runs`` × methods × manipulations over a process pool.
+
+    Rows are appended to ``output_csv`` as they complete; rerunning with the
+    same arguments resumes an interrupted sweep. ``manipulations`` defaults
+    to honest voting only; use ``MANIPULATION_SUITE`` for the full
+    manipulability study.
+    """
+    from argumentation_analysis.agents.core.governance.experiments import (
+        run_experiment,
+    )
+    from argumentation_analysis.agents.core.governance.simulation import Manipulation
+
+    if manipulations is None:
+        manipulations = (Manipulation("none"),)
     with open(config_path) as f:
         scenario_data = json.load(f)
-    all_results = []
-    for i in range(n_runs):
-        agents = AgentFactory.create_agents(scenario_data["agents"], seed=i)
-        m = method or scenario_data.get("default_method", "majority")
-        results = run_simulation(agents, scenario_data, m)
-        summary = summarize_results(results)
-        summary["run"] = i
-        summary["method"] = m
-        all_results.append(summary)
-    df = pd.DataFrame(all_results)
-    df.to_csv(output_csv, index=False)
+    if methods is None:
+        methods = [method or scenario_data.get("default_method", "majority")]
+    report = run_experiment(
+        scenario_data,
+        methods,
+        n_runs=n_runs,
+        manipulations=manipulations,
+        output=output_csv,
+        workers=n_workers,
+        base_seed=seed,
+        resume=resume,
+        task_fn=run_task,
+    )
     print(f"Batch results saved to {output_csv}")
-    print(df.groupby("method").mean(numeric_only=True))
+    if report.failures:
+        print(f"{len(report.failures)} runs failed, first: {report.failures[0]}")
+    print(pd.DataFrame(report.summary()).set_index(["method", "manipulation"]))
+    return report
 
 
 if __name__ == "__main__":
@@ -39,6 +95,31 @@ if __name__ == "__main__":
     parser.add_argument("--config", required=True, help="Scenario config JSON")
     parser.add_argument("--n_runs", type=int, default=100, help="Number of runs")
     parser.add_argument("--method", default=None, help="Governance method")
+    parser.add_argument(
+        "--methods", nargs="+", default=None, help="Several governance methods"
+    )
+    parser.add_argument(
+        "--manipulability",
+        action="store_true",
+        help="Sweep the manipulation suite (strategic, coalition, bribery, noise)",
+    )
     parser.add_argument("--output_csv", default="results.csv", help="CSV output file")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="Base seed")
+    parser.add_argument("--no-resume", action="store_true", help="Overwrite output_csv")
     args = parser.parse_args()
-    batch_run(args.config, args.n_runs, args.method, args.output_csv)
+    from argumentation_analysis.agents.core.governance.simulation import (
+        MANIPULATION_SUITE,
+    )
+
+    batch_run(
+        args.config,
+        args.n_runs,
+        args.method,
+        args.output_csv,
+        methods=args.methods,
+        manipulations=MANIPULATION_SUITE if args.manipulability else None,
+        n_workers=args.workers,
+        resume=not args.no_resume,
+        seed=args.seed,
+    )
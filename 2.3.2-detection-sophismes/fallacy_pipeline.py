@@ -3,22 +3,16 @@ Main file for the French Fallacy Detection Pipeline.
 This file outlines the structure and flow of the system.
 """
 
-from typing import List, Dict, Any
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
 import torch
 from transformers import CamembertForSequenceClassification, CamembertTokenizer
 import json
-import pandas as pd
 import spacy
 from spacy.matcher import Matcher
+from spacy.tokens import Doc, Span
 from symbolic_rules import fallacy_rules
 from argument_mining_rules import claim_patterns, premise_patterns
 
-# Load metadata for the neural model
-with open("./data/french_metadata.json", "r") as f:
-    metadata = json.load(f)
-num_labels = metadata["num_classes"]
-id_to_label = {v: k for k, v in metadata["reverse_label_mapping"].items()}
-
 # Standardize fallacy names for ensembling
 fallacy_name_mapping = {
     "ad hominem": "Attaque personnelle (Ad Hominem)",
@@ -41,140 +35,264 @@ fallacy_name_mapping = {
     "Pente glissante (Slippery Slope)": "Pente glissante (Slippery Slope)",  # Already standardized
 }
 
-# Load pre-trained CamemBERT model and tokenizer
-tokenizer = CamembertTokenizer.from_pretrained("./fine_tuned_camembert")
-model = CamembertForSequenceClassification.from_pretrained(
-    "./fine_tuned_camembert", num_labels=num_labels
-)
+SPACY_MODEL = "fr_core_news_lg"
+CAMEMBERT_DIR = "./fine_tuned_camembert"
+METADATA_PATH = "./data/french_metadata.json"
 
-nlp = spacy.load("fr_core_news_lg")
+# The rules only read LOWER, LEMMA, POS and sentence boundaries, so the
+# named-entity recogniser is never needed.
+UNUSED_COMPONENTS = ("ner",)
 
 
-# --- Module 1: Argument Mining ---
-def argument_mining_module(text: str) -> Dict[str, List[str]]:
+class FallacyPipeline:
     """
-    Identifies claims and premises in the input text using spaCy and rule-based patterns.
-    """
-    print(f"1. Mining arguments from: '{text[:50]}...'")
+    Reusable fallacy detection pipeline.
 
-    doc = nlp(text)
+    Loads the spaCy model and the CamemBERT classifier once, compiles the
+    claim, premise and fallacy matchers at construction, and parses each
+    text a single time: argument mining and symbolic matching share the
+    same Doc. Use run_batch() to stream a corpus through nlp.pipe.
+    """
 
-    claim_matcher = Matcher(nlp.vocab)
-    for i, pattern in enumerate(claim_patterns):
-        claim_matcher.add(f"CLAIM_PATTERN_{i}", [pattern["PATTERN"]])
+    def __init__(
+        self,
+        spacy_model: str = SPACY_MODEL,
+        camembert_dir: Optional[str] = CAMEMBERT_DIR,
+        metadata_path: str = METADATA_PATH,
+        exclude: Sequence[str] = UNUSED_COMPONENTS,
+        batch_size: int = 64,
+        n_process: int = 1,
+    ):
+        self.nlp = spacy.load(spacy_model, exclude=list(exclude))
+        self.batch_size = batch_size
+        self.n_process = n_process
+
+        self.claim_matcher = Matcher(self.nlp.vocab)
+        for i, pattern in enumerate(claim_patterns):
+            self.claim_matcher.add(f"CLAIM_PATTERN_{i}", [pattern["PATTERN"]])
+
+        self.premise_matcher = Matcher(self.nlp.vocab)
+        for i, pattern in enumerate(premise_patterns):
+            self.premise_matcher.add(f"PREMISE_PATTERN_{i}", [pattern["PATTERN"]])
+
+        self.fallacy_matcher = Matcher(self.nlp.vocab)
+        for fallacy_type, rules in fallacy_rules.items():
+            for rule in rules:
+                self.fallacy_matcher.add(fallacy_type, [rule["PATTERN"]])
+
+        # Neural classifier (skipped when camembert_dir is None)
+        self.tokenizer = None
+        self.model = None
+        self.id_to_label: Dict[int, str] = {}
+        if camembert_dir is not None:
+            with open(metadata_path, "r") as f:
+                metadata = json.load(f)
+            self.id_to_label = {
+                v: k for k, v in metadata["reverse_label_mapping"].items()
+            }
+            self.tokenizer = CamembertTokenizer.from_pretrained(camembert_dir)
+            self.model = CamembertForSequenceClassification.from_pretrained(
+                camembert_dir, num_labels=metadata["num_classes"]
+            )
+            self.model.eval()
+
+    # --- Module 1: Argument Mining ---
+    def mine_arguments(self, doc: Doc) -> Tuple[Dict[str, List[str]], List[Span]]:
+        """
+        Identifies claims and premises in a parsed text.
+
+        Returns the arguments and the sentences they come from, so that
+        symbolic matching can reuse the same Doc.
+        """
+        claims, premises, selected = [], [], []
+
+        for sent in doc.sents:
+            # If it's a claim, it's less likely to be a premise in the same sentence
+            if self.claim_matcher(sent):
+                claims.append(sent.text)
+                selected.append(sent)
+            elif self.premise_matcher(sent):
+                premises.append(sent.text)
+                selected.append(sent)
+
+        # Fallback: if no explicit claims/premises found, treat sentences as general arguments
+        if not claims and not premises:
+            # Simple heuristic: first sentence as claim, rest as premises
+            sents = list(doc.sents)
+            if sents:
+                claims.append(sents[0].text)
+                premises.extend(s.text for s in sents[1:])
+                selected = sents
+            else:
+                claims.append(
+                    doc.text
+                )  # If only one sentence, treat whole text as claim
+                selected = [doc[:]]
+
+        return {"claims": claims, "premises": premises}, selected
+
+    # --- Module 2: Neural Fallacy Classification ---
+    def classify(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """
+        Single-label fallacy classification of several texts with CamemBERT.
+
+        Texts are sorted by length and classified in padded batches.
+        """
+        if self.model is None:
+            return [[] for _ in texts]
+
+        results: List[List[Dict[str, Any]]] = [[] for _ in texts]
+        order = sorted(range(len(texts)), key=lambda i: len(texts[i]))
+        for start in range(0, len(order), self.batch_size):
+            chunk = order[start : start + self.batch_size]
+            inputs = self.tokenizer(
+                [texts[i] for i in chunk],
+                return_tensors="pt",
+                truncation=True,
+                padding=True,
+            )
+            with torch.inference_mode():
+                outputs = self.model(**inputs)
+
+            # Apply softmax to get probabilities for single-label classification
+            probabilities = torch.softmax(outputs.logits, dim=1)
+            confidences, class_ids = torch.max(probabilities, dim=1)
+            for row, i in enumerate(chunk):
+                label = self.id_to_label[class_ids[row].item()]
+                results[i] = [
+                    {
+                        "fallacy_type": fallacy_name_mapping.get(label, label),
+                        "confidence": confidences[row].item(),
+                    }
+                ]
+        return results
+
+    # --- Module 3: Symbolic Pattern Matching ---
+    def match_fallacies(
+        self, spans: Iterable[Union[Doc, Span]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Matches parsed argument sentences against the French fallacy rules.
+        """
+        results = []
+        for span in spans:
+            for match_id, start, end in self.fallacy_matcher(span):
+                rule_name = self.nlp.vocab.strings[match_id]
+                user_friendly_fallacy_type = rule_name
+                if rule_name in fallacy_rules and len(fallacy_rules[rule_name]) > 0:
+                    user_friendly_fallacy_type = fallacy_rules[rule_name][0][
+                        "FALLACY_TYPE"
+                    ]
+                results.append(
+                    {
+                        "fallacy_type": user_friendly_fallacy_type,
+                        "matched_rule": span[start:end].text,
+                        "confidence": 1.0,
+                    }
+                )
+        return results
+
+    def run(self, text: str) -> Dict[str, Any]:
+        """Analyses a single text (see run_batch for the result layout)."""
+        return self.run_batch([text], n_process=1)[0]
+
+    def run_batch(
+        self,
+        texts: Iterable[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Analyses a corpus at spaCy's native throughput.
+
+        Texts are parsed with nlp.pipe (optionally in n_process worker
+        processes), each Doc is parsed once for both mining and matching,
+        and the neural classifier runs in batches.
+
+        Returns one dict per text with the keys text, arguments,
+        neural_results, symbolic_results, detected_fallacies and
+        explanation.
+        """
+        texts = list(texts)
+        staged = []
+        for text, doc in zip(
+            texts,
+            self.nlp.pipe(
+                texts,
+                batch_size=batch_size or self.batch_size,
+                n_process=n_process or self.n_process,
+            ),
+        ):
+            arguments, selected = self.mine_arguments(doc)
+            staged.append((text, arguments, self.match_fallacies(selected)))
+
+        neural_batch = self.classify(
+            [" ".join(a["claims"] + a["premises"]) for _, a, _ in staged]
+        )
 
-    premise_matcher = Matcher(nlp.vocab)
-    for i, pattern in enumerate(premise_patterns):
-        premise_matcher.add(f"PREMISE_PATTERN_{i}", [pattern["PATTERN"]])
+        reports = []
+        for (text, arguments, symbolic_results), neural_results in zip(
+            staged, neural_batch
+        ):
+            analysis = ensemble_results(neural_results, symbolic_results)
+            reports.append(
+                {
+                    "text": text,
+                    "arguments": arguments,
+                    "neural_results": neural_results,
+                    "symbolic_results": symbolic_results,
+                    "detected_fallacies": analysis["detected_fallacies"],
+                    "explanation": generate_explanation(text, arguments, analysis),
+                }
+            )
+        return reports
 
-    claims = []
-    premises = []
 
-    for sent in doc.sents:
-        sent_text = sent.text
+_default_pipeline: Optional[FallacyPipeline] = None
 
-        # Check for claims
-        claim_matches = claim_matcher(sent)
-        if claim_matches:
-            claims.append(sent_text)
-            continue  # If it's a claim, it's less likely to be a premise in the same sentence
 
-        # Check for premises
-        premise_matches = premise_matcher(sent)
-        if premise_matches:
-            premises.append(sent_text)
+def get_pipeline() -> FallacyPipeline:
+    """Returns the shared pipeline, loading the models on first use."""
+    global _default_pipeline
+    if _default_pipeline is None:
+        _default_pipeline = FallacyPipeline()
+    return _default_pipeline
 
-    # Fallback: if no explicit claims/premises found, treat sentences as general arguments
-    if not claims and not premises:
-        # Simple heuristic: first sentence as claim, rest as premises
-        if len(list(doc.sents)) > 0:
-            claims.append(list(doc.sents)[0].text)
-            premises.extend([s.text for s in list(doc.sents)[1:]])
-        else:
-            claims.append(text)  # If only one sentence, treat whole text as claim
 
-    return {"claims": claims, "premises": premises}
+# --- Module 1: Argument Mining ---
+def argument_mining_module(text: str) -> Dict[str, List[str]]:
+    """
+    Identifies claims and premises in the input text using spaCy and rule-based patterns.
+    """
+    print(f"1. Mining arguments from: '{text[:50]}...'")
+    pipeline = get_pipeline()
+    return pipeline.mine_arguments(pipeline.nlp(text))[0]
 
 
 # --- Module 2: Neural Fallacy Classification ---
 def neural_classification_module(
-    arguments: Dict[str, List[str]]
+    arguments: Dict[str, List[str]],
 ) -> List[Dict[str, Any]]:
     """
-    Performs multi-label fallacy classification using a transformer model.
-    - Model: Fine-tuned CamemBERT, FlauBERT, or XLM-R.
+    Performs single-label fallacy classification using the fine-tuned CamemBERT.
     - Input: Claims and premises.
     - Output: List of potential fallacies with confidence scores.
     """
     print("2. Running neural classification...")
-
-    # Combine claims and premises into a single text for classification
-    input_text = " ".join(arguments["claims"] + arguments["premises"])
-
-    # Tokenize the input text
-    inputs = tokenizer(input_text, return_tensors="pt", truncation=True, padding=True)
-
-    # Get model predictions
-    with torch.no_grad():
-        outputs = model(**inputs)
-
-    # Apply softmax to get probabilities for single-label classification
-    probabilities = torch.softmax(outputs.logits, dim=1)
-
-    # Get the predicted label (class with highest probability)
-    predicted_class_id = torch.argmax(probabilities, dim=1).item()
-
-    detected_fallacies = []
-    fallacy_type = fallacy_name_mapping.get(
-        id_to_label[predicted_class_id], id_to_label[predicted_class_id]
-    )
-    confidence = probabilities[0][predicted_class_id].item()
-    detected_fallacies.append({"fallacy_type": fallacy_type, "confidence": confidence})
-
-    return detected_fallacies
+    return get_pipeline().classify(
+        [" ".join(arguments["claims"] + arguments["premises"])]
+    )[0]
 
 
 # --- Module 3: Symbolic Pattern Matching ---
-import spacy
-from spacy.matcher import Matcher
-from symbolic_rules import fallacy_rules
-
-nlp = spacy.load("fr_core_news_lg")
-
-
 def symbolic_matching_module(arguments: Dict[str, List[str]]) -> List[Dict[str, Any]]:
     """
     Matches arguments against a predefined set of French fallacy rules.
-    - Uses a rule-based engine (e.g., spaCy's Matcher or custom logic).
     """
     print("3. Running symbolic pattern matching...")
-
-    matcher = Matcher(nlp.vocab)
-    for fallacy_type, rules in fallacy_rules.items():
-        for rule in rules:
-            matcher.add(fallacy_type, [rule["PATTERN"]])
-
-    doc = nlp(" ".join(arguments["claims"] + arguments["premises"]))
-    matches = matcher(doc)
-
-    results = []
-    for match_id, start, end in matches:
-        rule_name = nlp.vocab.strings[match_id]
-        span = doc[start:end]
-
-        user_friendly_fallacy_type = rule_name
-        if rule_name in fallacy_rules and len(fallacy_rules[rule_name]) > 0:
-            user_friendly_fallacy_type = fallacy_rules[rule_name][0]["FALLACY_TYPE"]
-
-        results.append(
-            {
-                "fallacy_type": user_friendly_fallacy_type,
-                "matched_rule": span.text,
-                "confidence": 1.0,
-            }
-        )
-
-    return results
+    pipeline = get_pipeline()
+    doc = pipeline.nlp(" ".join(arguments["claims"] + arguments["premises"]))
+    return pipeline.match_fallacies([doc])
 
 
 # --- Module 4: Ensemble & Verification ---
@@ -187,7 +305,16 @@ def ensemble_and_verification_module(
     - Optional: RAG for external evidence retrieval.
     """
     print("4. Ensembling and verifying results...")
+    return ensemble_results(neural_results, symbolic_results)
 
+
+def ensemble_results(
+    neural_results: List[Dict[str, Any]], symbolic_results: List[Dict[str, Any]]
+) -> Dict[str, Any]:
+    """
+    Print-free ensembling used by FallacyPipeline.run_batch, whose stdout
+    may carry JSON lines (run_cli.py --file).
+    """
     combined_fallacies = {}
 
     # Process neural results
@@ -253,7 +380,17 @@ def explanation_generation_module(
     - Uses a fine-tuned generative model (e.g., T5-base-french or GPT).
     """
     print("5. Generating explanation...")
+    return generate_explanation(original_text, arguments, analysis_results)
 
+
+def generate_explanation(
+    original_text: str,
+    arguments: Dict[str, List[str]],
+    analysis_results: Dict[str, Any],
+) -> str:
+    """
+    Print-free explanation used by FallacyPipeline.run_batch.
+    """
     fallacies = analysis_results.get("detected_fallacies", {})
     if not fallacies:
         return "Aucune erreur de raisonnement détectée dans le texte fourni."
@@ -297,23 +434,16 @@ def run_fallacy_pipeline(text: str):
     """
     Orchestrates the full fallacy detection and explanation pipeline.
     """
-    # 1. Argument Mining
-    arguments = argument_mining_module(text)
-
-    # 2. Parallel Fallacy Detection
-    neural_results = neural_classification_module(arguments)
-    symbolic_results = symbolic_matching_module(arguments)
-
-    # 3. Ensemble & Verification
-    analysis = ensemble_and_verification_module(neural_results, symbolic_results)
-
-    # 4. Explanation Generation
-    final_explanation = explanation_generation_module(text, arguments, analysis)
+    # run() goes through the print-free batch path: report its steps here.
+    report = get_pipeline().run(text)
+    print("4. Ensembling and verifying results...")
+    print("5. Generating explanation...")
 
     print("\n" + "=" * 50)
     print("Rapport d'analyse final :")
     print("=" * 50)
-    print(final_explanation)
+    print(report["explanation"])
+    return report
 
 
 if __name__ == "__main__":
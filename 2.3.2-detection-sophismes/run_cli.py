@@ -1,5 +1,7 @@
 import argparse
-from fallacy_pipeline import run_fallacy_pipeline
+import json
+
+from fallacy_pipeline import FallacyPipeline, run_fallacy_pipeline
 
 
 def main():
@@ -7,11 +9,48 @@ def main():
         description="Run the French Fallacy Detection Pipeline on a given text."
     )
     parser.add_argument(
-        "text", type=str, help="The French text argument to analyze for fallacies."
+        "text",
+        type=str,
+        nargs="?",
+        help="The French text argument to analyze for fallacies.",
+    )
+    parser.add_argument(
+        "--file",
+        type=str,
+        help="Analyze a corpus instead: one text per line, written as JSON lines.",
+    )
+    parser.add_argument(
+        "--batch-size", type=int, default=64, help="spaCy nlp.pipe batch size."
+    )
+    parser.add_argument(
+        "--n-process",
+        type=int,
+        default=1,
+        help="Number of spaCy worker processes for --file.",
     )
 
     args = parser.parse_args()
 
+    if args.file:
+        with open(args.file, "r", encoding="utf-8") as f:
+            texts = [line.strip() for line in f if line.strip()]
+        pipeline = FallacyPipeline(batch_size=args.batch_size, n_process=args.n_process)
+        for report in pipeline.run_batch(texts):
+            print(
+                json.dumps(
+                    {
+                        "text": report["text"],
+                        "arguments": report["arguments"],
+                        "detected_fallacies": report["detected_fallacies"],
+                    },
+                    ensure_ascii=False,
+                )
+            )
+        return
+
+    if args.text is None:
+        parser.error("provide a text or --file")
+
     print(f"\nAnalyzing the provided text: '{args.text}'\n")
     run_fallacy_pipeline(args.text)
 
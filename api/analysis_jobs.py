@@ -0,0 +1,302 @@
+"""Analysis job subsystem behind ``/api/analyze``.
+
+The ``/analyze`` route used to call the blocking Tweety analysis directly
+from its ``async`` handler, so one slow parse stalled the event loop and
+every other request (including the WebSocket pings) behind it. Analyses
+now run as jobs:
+
+- a bounded ``ThreadPoolExecutor`` executes them (threads, not processes:
+  the JVM and the Tweety classes in ``project_context`` live in this
+  process and cannot be shipped to a child);
+- admission control caps the in-flight jobs (running + queued) at
+  ``max_workers + max_pending`` and raises ``QueueSaturatedError`` (HTTP
+  429) beyond that, instead of letting the executor queue grow unbounded;
+- identical texts submitted while a job for them is still in flight are
+  deduplicated onto that job (keyed by the SHA-256 of the text);
+- every state change is broadcast on the existing ``/ws/analysis/{job_id}``
+  channel, and finished jobs stay pollable for ``retention`` seconds.
+
+Job state is guarded by a lock and completion is driven by
+``concurrent.futures`` callbacks, so a job can be awaited from any event
+loop (``asyncio.wrap_future``) or polled from any thread.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from .errors import QueueSaturatedError
+
+logger = logging.getLogger(__name__)
+
+JOB_QUEUED = "queued"
+JOB_RUNNING = "running"
+JOB_SUCCEEDED = "succeeded"
+JOB_FAILED = "failed"
+
+# Job function: text -> JSON-ready result payload.
+JobFunction = Callable[[str], Dict[str, Any]]
+
+
+def text_fingerprint(text: str) -> str:
+    """Deduplication key of an analysis request."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class AnalysisJob:
+    """One submitted analysis and its lifecycle timestamps."""
+
+    job_id: str
+    fingerprint: str
+    status: str = JOB_QUEUED
+    created_at: float = field(default_factory=time.time)
+    started_at: Optional[float] = None
+    finished_at: Optional[float] = None
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[BaseException] = None
+    # Number of submissions served by this job (1 + deduplicated ones).
+    submissions: int = 1
+    future: Future = field(default_factory=Future, repr=False)
+
+    @property
+    def done(self) -> bool:
+        return self.status in (JOB_SUCCEEDED, JOB_FAILED)
+
+    async def wait(self) -> "AnalysisJob":
+        """Wait for completion without blocking the calling event loop."""
+        try:
+            await asyncio.shield(asyncio.wrap_future(self.future))
+        except asyncio.CancelledError:
+            raise
+        except Exception:
+            pass  # the outcome is recorded on the job (status, error)
+        return self
+
+    def to_dict(self) -> Dict[str, Any]:
+        data: Dict[str, Any] = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "created_at": self.created_at,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at,
+            "submissions": self.submissions,
+        }
+        if self.started_at is not None:
+            data["queue_wait"] = round(self.started_at - self.created_at, 4)
+        if self.finished_at is not None and self.started_at is not None:
+            data["duration"] = round(self.finished_at - self.started_at, 4)
+        return data
+
+
+class AnalysisJobManager:
+    """Bounded worker pool with admission control and in-flight dedup.
+
+    ``notifier`` is anything exposing the ``AnalysisWebSocketManager``
+    broadcast coroutines (``broadcast_status``, ``broadcast_phase_result``,
+    ``broadcast_error``); ``None`` disables streaming.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = 2,
+        max_pending: int = 32,
+        retention: float = 600.0,
+        max_retained: int = 1000,
+        notifier: Any = None,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+        self.retention = retention
+        self.max_retained = max_retained
+        self._notifier = notifier
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_workers, thread_name_prefix="analysis-job"
+        )
+        self._lock = threading.Lock()
+        self._jobs: "OrderedDict[str, AnalysisJob]" = OrderedDict()
+        self._inflight: Dict[str, AnalysisJob] = {}
+        self._loops: Dict[str, asyncio.AbstractEventLoop] = {}
+        self.submitted = 0
+        self.deduplicated = 0
+        self.rejected = 0
+        self.succeeded = 0
+        self.failed = 0
+
+    @property
+    def capacity(self) -> int:
+        return self.max_workers + self.max_pending
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+
+    def submit(self, text: str, fn: JobFunction) -> AnalysisJob:
+        """Queue ``fn(text)``, or join the in-flight job for the same text.
+
+        Raises ``QueueSaturatedError`` when ``capacity`` jobs are already
+        running or queued.
+        """
+        fingerprint = text_fingerprint(text)
+        with self._lock:
+            job = self._inflight.get(fingerprint)
+            if job is not None:
+                job.submissions += 1
+                self.deduplicated += 1
+                return job
+            if len(self._inflight) >= self.capacity:
+                self.rejected += 1
+                raise QueueSaturatedError(
+                    "Analysis queue is saturated, retry later.",
+                    context={
+                        "in_flight": len(self._inflight),
+                        "capacity": self.capacity,
+                    },
+                )
+            self._prune(time.time())
+            job = AnalysisJob(job_id=uuid.uuid4().hex[:8], fingerprint=fingerprint)
+            self._jobs[job.job_id] = job
+            self._inflight[fingerprint] = job
+            self.submitted += 1
+            try:
+                self._loops[job.job_id] = asyncio.get_running_loop()
+            except RuntimeError:
+                pass
+
+        self._notify(job)
+        work = self._executor.submit(self._execute, job, fn, text)
+        work.add_done_callback(lambda f: self._complete(job, f))
+        return job
+
+    def get(self, job_id: str) -> Optional[AnalysisJob]:
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "in_flight": len(self._inflight),
+                "capacity": self.capacity,
+                "retained": len(self._jobs),
+                "submitted": self.submitted,
+                "deduplicated": self.deduplicated,
+                "rejected": self.rejected,
+                "succeeded": self.succeeded,
+                "failed": self.failed,
+            }
+
+    def shutdown(self, wait: bool = False) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    # ── Execution ──
+
+    def _execute(self, job: AnalysisJob, fn: JobFunction, text: str):
+        job.started_at = time.time()
+        job.status = JOB_RUNNING
+        self._notify(job)
+        return fn(text)
+
+    def _complete(self, job: AnalysisJob, work: Future) -> None:
+        with self._lock:
+            job.finished_at = time.time()
+            if job.started_at is None:  # cancelled before it started
+                job.started_at = job.finished_at
+            if work.cancelled():
+                job.error = RuntimeError("analysis job cancelled at shutdown")
+            else:
+                job.error = work.exception()
+            if job.error is None:
+                job.result = work.result()
+                job.status = JOB_SUCCEEDED
+                self.succeeded += 1
+            else:
+                job.status = JOB_FAILED
+                self.failed += 1
+            self._inflight.pop(job.fingerprint, None)
+        self._notify(job)
+        if job.error is None:
+            job.future.set_result(job)
+        else:
+            job.future.set_exception(job.error)
+
+    def _prune(self, now: float) -> None:
+        """Forget finished jobs past ``retention`` or beyond ``max_retained``."""
+        for job_id in list(self._jobs):
+            job = self._jobs[job_id]
+            expired = job.done and now - (job.finished_at or now) > self.retention
+            if expired or (job.done and len(self._jobs) > self.max_retained):
+                del self._jobs[job_id]
+                self._loops.pop(job_id, None)
+
+    # ── Streaming ──
+
+    def _notify(self, job: AnalysisJob) -> None:
+        if self._notifier is None:
+            return
+        loop = self._loops.get(job.job_id)
+        if loop is None or loop.is_closed():
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._broadcast(job, job.status), loop)
+        except RuntimeError:  # loop shut down between the check and the call
+            pass
+
+    async def _broadcast(self, job: AnalysisJob, status: str) -> None:
+        try:
+            if status == JOB_SUCCEEDED:
+                await self._notifier.broadcast_phase_result(
+                    job.job_id, "analysis", job.result
+                )
+            elif status == JOB_FAILED:
+                await self._notifier.broadcast_error(job.job_id, str(job.error))
+            await self._notifier.broadcast_status(
+                job.job_id, status, f"submissions={job.submissions}"
+            )
+        except Exception as exc:
+            logger.warning(f"[{job.job_id}] Job broadcast failed: {exc}")
+
+
+# ── Singleton ──
+
+_manager: Optional[AnalysisJobManager] = None
+_manager_lock = threading.Lock()
+
+
+def get_analysis_job_manager() -> AnalysisJobManager:
+    """Get or create the global job manager.
+
+    Sized by ``ANALYSIS_JOB_WORKERS`` (default 2) and
+    ``ANALYSIS_JOB_MAX_PENDING`` (default 32).
+    """
+    global _manager
+    with _manager_lock:
+        if _manager is None:
+            from argumentation_analysis.services.websocket_manager import (
+                get_websocket_manager,
+            )
+
+            _manager = AnalysisJobManager(
+                max_workers=int(os.environ.get("ANALYSIS_JOB_WORKERS", "2")),
+                max_pending=int(os.environ.get("ANALYSIS_JOB_MAX_PENDING", "32")),
+                notifier=get_websocket_manager(),
+            )
+        return _manager
+
+
+def shutdown_analysis_jobs() -> None:
+    """Shutdown hook: cancel queued jobs and release the worker threads."""
+    global _manager
+    with _manager_lock:
+        if _manager is not None:
+            _manager.shutdown()
+            _manager = None
@@ -2,7 +2,13 @@ from fastapi import APIRouter, Depends, Request, HTTPException
 from pydantic import BaseModel
 from typing import List, Dict, Optional
 
-from .errors import TimeoutError_, UpstreamError
+from .analysis_jobs import (
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    AnalysisJob,
+    get_analysis_job_manager,
+)
+from .errors import APIError, NotFoundError, TimeoutError_, UpstreamError
 
 from .models import (
     AnalysisRequest,
@@ -25,7 +31,6 @@ from .dependencies import (
 from .models import FrameworkAnalysisRequest, FrameworkAnalysisResponse
 from .services import DungAnalysisService
 import asyncio
-import uuid
 from datetime import datetime
 
 
@@ -168,6 +173,38 @@ def _build_response_payload(analysis_result: Dict) -> Dict:
     }
 
 
+def _run_analysis_job(text: str, project_context) -> Dict:
+    """Corps d'un job d'analyse, exécuté sur le pool de workers."""
+    start_time = time.time()
+    service_result = _perform_tweety_analysis(text, project_context)
+    service_result.setdefault("duration", time.time() - start_time)
+    return _build_response_payload(service_result)
+
+
+def _job_error(job: AnalysisJob) -> APIError:
+    """Traduit l'échec d'un job en erreur API lisible (DT-1 #1499)."""
+    exc = job.error
+    if isinstance(exc, TimeoutError):
+        return TimeoutError_(
+            f"Analysis exceeded its time budget: {exc}",
+            context={"analysis_id": job.job_id},
+        )
+    return UpstreamError(
+        f"Analysis service failed: {exc}",
+        context={
+            "analysis_id": job.job_id,
+            "exception_type": type(exc).__name__,
+        },
+    )
+
+
+def _submit_analysis(text: str, fastapi_req: Request) -> AnalysisJob:
+    project_context = fastapi_req.app.state.project_context
+    return get_analysis_job_manager().submit(
+        text, lambda t: _run_analysis_job(t, project_context)
+    )
+
+
 @router.post("/analyze")
 async def analyze_text_endpoint(analysis_req: AnalysisRequest, fastapi_req: Request):
     """
@@ -176,44 +213,66 @@ async def analyze_text_endpoint(analysis_req: AnalysisRequest, fastapi_req: Requ
     DT-1 #1499: replaces the prior silent `try/except: pass` with a
     legible error surface. Real upstream errors are now raised as
     ``UpstreamError`` (HTTP 502 with machine-parseable envelope).
+
+    L'analyse s'exécute comme un job du pool (voir ``api.analysis_jobs``) :
+    la boucle d'événements n'est plus bloquée, un texte identique déjà en
+    cours est dédupliqué, et un pool saturé répond 429. L'``analysis_id``
+    renvoyé est l'identifiant du job.
     """
-    analysis_id = str(uuid.uuid4())[:8]
+    job = _submit_analysis(analysis_req.text, fastapi_req)
     logger.info(
-        f"[{analysis_id}] Requête d'analyse reçue: '{analysis_req.text[:80]}...'"
+        f"[{job.job_id}] Requête d'analyse reçue: '{analysis_req.text[:80]}...'"
     )
 
-    start_time = time.time()
-    project_context = fastapi_req.app.state.project_context
-
-    try:
-        service_result = _perform_tweety_analysis(analysis_req.text, project_context)
-        logger.info(f"[{analysis_id}] Analyse réussie.")
-    except TimeoutError as exc:
-        logger.error(
-            f"[{analysis_id}] Analyse timeout: {exc}", exc_info=True
-        )
-        raise TimeoutError_(
-            f"Analysis exceeded its time budget: {exc}",
-            context={"analysis_id": analysis_id},
-        ) from exc
-    except Exception as exc:
+    await job.wait()
+    if job.status == JOB_FAILED:
         logger.error(
-            f"[{analysis_id}] Erreur lors de l'analyse: {exc}", exc_info=True
+            f"[{job.job_id}] Erreur lors de l'analyse: {job.error}",
+            exc_info=job.error,
         )
-        raise UpstreamError(
-            f"Analysis service failed: {exc}",
-            context={
-                "analysis_id": analysis_id,
-                "exception_type": type(exc).__name__,
-            },
-        ) from exc
+        raise _job_error(job) from job.error
+    logger.info(f"[{job.job_id}] Analyse réussie.")
+
+    return {"analysis_id": job.job_id, "status": "success", "results": job.result}
+
+
+@router.post("/analyze/jobs", status_code=202)
+async def submit_analysis_job_endpoint(
+    analysis_req: AnalysisRequest, fastapi_req: Request
+):
+    """
+    Soumet une analyse sans attendre son résultat.
 
-    duration = time.time() - start_time
-    service_result.setdefault("duration", duration)
+    Renvoie l'identifiant du job ; l'état et le résultat se consultent via
+    ``GET /api/analyze/jobs/{job_id}`` ou se suivent en direct sur
+    ``/ws/analysis/{job_id}``.
+    """
+    job = _submit_analysis(analysis_req.text, fastapi_req)
+    return {
+        **job.to_dict(),
+        "status_url": f"/api/analyze/jobs/{job.job_id}",
+        "stream_url": f"/ws/analysis/{job.job_id}",
+    }
 
-    results_payload = _build_response_payload(service_result)
 
-    return {"analysis_id": analysis_id, "status": "success", "results": results_payload}
+@router.get("/analyze/jobs/{job_id}")
+async def get_analysis_job_endpoint(job_id: str):
+    """
+    État d'un job d'analyse ; inclut ``results`` (succès) ou ``error``
+    (enveloppe DT-1) une fois le job terminé.
+    """
+    job = get_analysis_job_manager().get(job_id)
+    if job is None:
+        raise NotFoundError(
+            f"Unknown or expired analysis job: {job_id}",
+            context={"job_id": job_id},
+        )
+    payload = job.to_dict()
+    if job.status == JOB_SUCCEEDED:
+        payload["results"] = job.result
+    elif job.status == JOB_FAILED:
+        payload["error"] = _job_error(job).to_envelope()
+    return payload
 
 
 @router.get("/status", response_model=StatusResponse)
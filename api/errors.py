@@ -13,7 +13,7 @@ machine-parseable error envelopes. The contract:
 Routes on the Democratech critical path (/analyze, /governance, /ws/*)
 raise these instead of HTTPException. The global handler registered by
 ``install_error_handlers(app)`` translates them to the right HTTP status
-(400 / 422 / 502 / 503 / 504) with the legible envelope.
+(400 / 404 / 422 / 429 / 502 / 503 / 504) with the legible envelope.
 
 Anti-pendule: we do NOT replace every HTTPException in the codebase —
 only the routes the user-facing dashboard consumes. The other 30+ admin
@@ -61,6 +61,28 @@ class ValidationError(APIError):
     error_code = "validation_error"
 
 
+class NotFoundError(APIError):
+    """The requested resource (e.g. an analysis job id) does not exist.
+
+    Finished analysis jobs are only retained for a limited time, so a
+    previously valid id can also end up here.
+    """
+
+    status_code = 404
+    error_code = "not_found"
+
+
+class QueueSaturatedError(APIError):
+    """Admission control rejected the request: the worker pool is saturated.
+
+    The client should retry later; the envelope context carries the
+    current in-flight count and the configured capacity.
+    """
+
+    status_code = 429
+    error_code = "queue_saturated"
+
+
 class UpstreamError(APIError):
     """An upstream service (LLM, JPype/Tweety, JTMS) failed unrecoverably.
 
@@ -4,6 +4,25 @@ from fastapi.middleware.cors import CORSMiddleware
 from typing import List, Callable, Optional
 
 from .errors import install_error_handlers
+from argumentation_analysis.services.llm_scheduler import llm_priority_scope
+
+
+class InteractiveLLMPriorityMiddleware:
+    """
+    Middleware ASGI qui place les appels LLM d'une requête HTTP dans la classe
+    de priorité "interactive" du scheduler LLM : ils passent devant les appels
+    des benchmarks (classe "batch") lorsque le fournisseur est saturé.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+        with llm_priority_scope("interactive"):
+            await self.app(scope, receive, send)
 
 
 def create_app(
@@ -57,6 +76,9 @@ def create_app(
         allow_headers=["*"],
     )
 
+    # Les appels LLM déclenchés par une requête passent avant les lots de benchmark.
+    app.add_middleware(InteractiveLLMPriorityMiddleware)
+
     # NEW (DT-1 #1499): install the legible error surface for the
     # Democratech critical path. Other endpoints keep their existing
     # HTTPException behavior. Anti-pendule: do NOT replace globally.
@@ -22,6 +22,7 @@ from .mobile_endpoints import mobile_router
 from .shield_endpoints import shield_router
 from .websocket_routes import ws_router
 from .agent_routes import agent_router
+from .analysis_jobs import shutdown_analysis_jobs
 from argumentation_analysis.core.bootstrap import initialize_project_environment
 
 # JTMS endpoints — optional, graceful degradation if import fails (#857).
@@ -91,6 +92,7 @@ app = create_app(
     description="API principale d'analyse argumentative avec intégration Java/Tweety.",
     version="2.0.0",
     on_startup=[startup_event],
+    on_shutdown=[shutdown_analysis_jobs],
 )
 
 # Inclure les routeurs
@@ -109,9 +109,9 @@ async def shield_validate(
 
     try:
         if request.direction == "output":
-            result = shield.validate_output(request.text)
+            result = await shield.validate_output_async(request.text)
         else:
-            result = shield.validate_input(request.text)
+            result = await shield.validate_input_async(request.text)
     except Exception as exc:
         logger.error(f"Shield validation failed: {exc}")
         if request.fail_open:
@@ -0,0 +1,331 @@
+"""
+Batched transformer inference for the local fallacy tiers.
+
+The CamemBERT and NLI tiers of ``french_fallacy_adapter`` used to run one
+forward pass per text (and, for NLI, one pipeline call per text that
+re-tokenised the premise once per candidate label). This module provides
+the shared pieces that let them classify many texts in a few passes:
+
+- ``MicroBatcher``: a worker thread that coalesces concurrent single-text
+  requests into batches (optionally waiting a few milliseconds to fill one);
+- ``length_buckets``: groups items of similar length so that dynamic
+  padding (pad to the longest item of the batch) wastes little compute;
+- ``NLIBatchScorer``: zero-shot NLI scoring over (premise, hypothesis)
+  pairs with cached hypothesis encodings, premises tokenised once, and
+  ``torch.inference_mode``. Scores follow the transformers
+  zero-shot-classification pipeline conventions;
+- ``quantize_dynamic_int8``: optional dynamic int8 quantisation of the
+  Linear layers for CPU inference.
+
+torch is imported lazily; only ``NLIBatchScorer`` and
+``quantize_dynamic_int8`` need it.
+"""
+
+import logging
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+def length_buckets(lengths: Sequence[int], batch_size: int) -> List[List[int]]:
+    """Indices grouped into batches of similar length (shortest first)."""
+    order = sorted(range(len(lengths)), key=lambda i: lengths[i])
+    return [order[i : i + batch_size] for i in range(0, len(order), batch_size)]
+
+
+class MicroBatcher:
+    """Coalesces concurrent requests into calls of a batch function.
+
+    ``batch_fn`` receives a list of items and must return one result per
+    item, in order. Callers block on ``submit``/``submit_many`` from any
+    thread; a single daemon worker drains the queue, waiting at most
+    ``max_wait`` seconds after the first item for more to arrive (0 only
+    takes what is already queued, so a lone request is not delayed).
+    An exception raised by ``batch_fn`` is re-raised in every caller of
+    that batch.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 32,
+        max_wait: float = 0.0,
+        name: str = "micro-batcher",
+    ):
+        self._batch_fn = batch_fn
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max_wait
+        self._name = name
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._lock = threading.Lock()
+        self._thread: Optional[threading.Thread] = None
+        self.batches = 0
+        self.items = 0
+
+    def submit(self, item: Any) -> Any:
+        return self.submit_many([item])[0]
+
+    def submit_many(self, items: Sequence[Any]) -> List[Any]:
+        futures: List[Future] = [Future() for _ in items]
+        self._ensure_worker()
+        for item, future in zip(items, futures):
+            self._queue.put((item, future))
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                self._queue.put(_STOP)
+                self._thread.join()
+                self._thread = None
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "mean_batch_size": (
+                round(self.items / self.batches, 2) if self.batches else 0.0
+            ),
+        }
+
+    def _ensure_worker(self) -> None:
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name=self._name, daemon=True
+                )
+                self._thread.start()
+
+    def _run(self) -> None:
+        while True:
+            entry = self._queue.get()
+            if entry is _STOP:
+                return
+            batch = [entry]
+            stop = False
+            deadline = time.monotonic() + self._max_wait
+            while len(batch) < self._max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    if remaining > 0:
+                        entry = self._queue.get(timeout=remaining)
+                    else:
+                        entry = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if entry is _STOP:
+                    stop = True
+                    break
+                batch.append(entry)
+            self._execute(batch)
+            if stop:
+                return
+
+    def _execute(self, batch: List[Tuple[Any, Future]]) -> None:
+        self.batches += 1
+        self.items += len(batch)
+        try:
+            results = self._batch_fn([item for item, _ in batch])
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"{self._name}: batch function returned {len(results)} "
+                    f"results for {len(batch)} items"
+                )
+        except BaseException as e:
+            for _, future in batch:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(batch, results):
+            future.set_result(result)
+
+
+def quantize_dynamic_int8(model: Any) -> Any:
+    """Dynamic int8 quantisation of ``model``'s Linear layers (CPU only).
+
+    Returns the model unchanged when it lives on an accelerator or when
+    quantisation is not supported by the installed torch build.
+    """
+    import torch
+
+    try:
+        device = next(model.parameters()).device
+    except (StopIteration, AttributeError):
+        device = torch.device("cpu")
+    if device.type != "cpu":
+        return model
+    try:
+        quantized = torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    except Exception as e:  # unsupported quantisation engine
+        logger.warning("Dynamic int8 quantisation unavailable: %s", e)
+        return model
+    logger.info("Applied dynamic int8 quantisation to %s", type(model).__name__)
+    return quantized
+
+
+# (premise, candidate labels, multi_label) — one zero-shot classification
+NLIRequest = Tuple[str, Sequence[str], bool]
+
+
+class NLIBatchScorer:
+    """Batched zero-shot NLI classification with a hypothesis cache.
+
+    Equivalent to calling a transformers ``zero-shot-classification``
+    pipeline once per request, but every (premise, hypothesis) pair of all
+    requests is scored in length-bucketed batches: each premise is
+    tokenised once, each hypothesis ``template.format(label)`` is encoded
+    once for the lifetime of the scorer, and batches are padded only to
+    their longest pair.
+    """
+
+    def __init__(
+        self,
+        model: Any,
+        tokenizer: Any,
+        hypothesis_template: str,
+        batch_size: int = 32,
+        max_length: Optional[int] = None,
+    ):
+        self._model = model
+        self._tokenizer = tokenizer
+        self._template = hypothesis_template
+        self._batch_size = max(1, batch_size)
+        model_max = getattr(tokenizer, "model_max_length", 512) or 512
+        self._max_length = min(max_length or 512, model_max)
+        self._hypotheses: Dict[str, List[int]] = {}
+        self._use_token_types = "token_type_ids" in getattr(
+            tokenizer, "model_input_names", []
+        )
+        self._pad_id = tokenizer.pad_token_id or 0
+        self._entailment_id, self._contradiction_id = self._nli_label_ids(model)
+        self.forward_passes = 0
+
+    @staticmethod
+    def supports(pipeline: Any) -> bool:
+        """True when ``pipeline`` exposes a torch model and a tokenizer."""
+        try:
+            import torch
+        except ImportError:
+            return False
+        return isinstance(
+            getattr(pipeline, "model", None), torch.nn.Module
+        ) and callable(getattr(pipeline, "tokenizer", None))
+
+    @staticmethod
+    def _nli_label_ids(model: Any) -> Tuple[int, int]:
+        label2id = getattr(model.config, "label2id", {}) or {}
+        entailment = next(
+            (i for label, i in label2id.items() if label.lower().startswith("entail")),
+            -1,
+        )
+        if entailment == -1:
+            raise ValueError("NLI model config has no entailment label")
+        contradiction = next(
+            (i for label, i in label2id.items() if label.lower().startswith("contra")),
+            0 if entailment != 0 else -1,
+        )
+        return entailment, contradiction
+
+    def _hypothesis_ids(self, label: str) -> List[int]:
+        ids = self._hypotheses.get(label)
+        if ids is None:
+            ids = self._tokenizer(
+                self._template.format(label), add_special_tokens=False
+            )["input_ids"]
+            self._hypotheses[label] = ids
+        return ids
+
+    def _pair(self, premise: List[int], hypothesis: List[int]) -> Dict[str, List[int]]:
+        budget = (
+            self._max_length
+            - len(hypothesis)
+            - self._tokenizer.num_special_tokens_to_add(pair=True)
+        )
+        premise = premise[: max(budget, 1)]
+        encoded = {
+            "input_ids": self._tokenizer.build_inputs_with_special_tokens(
+                premise, hypothesis
+            )
+        }
+        if self._use_token_types:
+            encoded["token_type_ids"] = (
+                self._tokenizer.create_token_type_ids_from_sequences(
+                    premise, hypothesis
+                )
+            )
+        return encoded
+
+    def _entailment_logits(
+        self, pairs: List[Dict[str, List[int]]]
+    ) -> List[List[float]]:
+        """[contradiction, entailment] logits for each pair."""
+        import torch
+
+        device = next(self._model.parameters()).device
+        out: List[Optional[List[float]]] = [None] * len(pairs)
+        lengths = [len(p["input_ids"]) for p in pairs]
+        for bucket in length_buckets(lengths, self._batch_size):
+            width = max(lengths[i] for i in bucket)
+            batch: Dict[str, List[List[int]]] = {"input_ids": [], "attention_mask": []}
+            if self._use_token_types:
+                batch["token_type_ids"] = []
+            for i in bucket:
+                pad = width - lengths[i]
+                batch["input_ids"].append(pairs[i]["input_ids"] + [self._pad_id] * pad)
+                batch["attention_mask"].append([1] * lengths[i] + [0] * pad)
+                if self._use_token_types:
+                    batch["token_type_ids"].append(
+                        pairs[i]["token_type_ids"] + [0] * pad
+                    )
+            inputs = {
+                key: torch.tensor(value, device=device) for key, value in batch.items()
+            }
+            with torch.inference_mode():
+                logits = self._model(**inputs).logits
+            self.forward_passes += 1
+            selected = logits[:, [self._contradiction_id, self._entailment_id]]
+            for row, i in enumerate(bucket):
+                out[i] = selected[row].float().cpu().tolist()
+        return out  # type: ignore[return-value]
+
+    def classify(self, requests: Sequence[NLIRequest]) -> List[Dict[str, list]]:
+        """Pipeline-style ``{"labels", "scores"}`` (sorted) for each request."""
+        import torch
+
+        premises: Dict[str, List[int]] = {}
+        pairs: List[Dict[str, List[int]]] = []
+        spans: List[Tuple[int, int]] = []
+        for premise, labels, _ in requests:
+            if premise not in premises:
+                premises[premise] = self._tokenizer(premise, add_special_tokens=False)[
+                    "input_ids"
+                ]
+            start = len(pairs)
+            for label in labels:
+                pairs.append(self._pair(premises[premise], self._hypothesis_ids(label)))
+            spans.append((start, len(pairs)))
+
+        logits = self._entailment_logits(pairs) if pairs else []
+        results = []
+        for (_, labels, multi_label), (start, end) in zip(requests, spans):
+            request_logits = torch.tensor(logits[start:end]).reshape(-1, 2)
+            if multi_label or len(labels) == 1:
+                scores = torch.softmax(request_logits, dim=-1)[:, 1]
+            else:
+                scores = torch.softmax(request_logits[:, 1], dim=0)
+            ranked = sorted(zip(labels, scores.tolist()), key=lambda item: -item[1])
+            results.append(
+                {
+                    "labels": [label for label, _ in ranked],
+                    "scores": [score for _, score in ranked],
+                }
+            )
+        return results
@@ -19,12 +19,21 @@ All tiers degrade gracefully if their dependencies are missing.
 Integration from student project 2.3.2-detection-sophismes (GitHub #44).
 """
 
+import asyncio
 import csv
 import logging
+import time
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from argumentation_analysis.adapters.batch_inference import (
+    MicroBatcher,
+    NLIBatchScorer,
+    NLIRequest,
+    length_buckets,
+    quantize_dynamic_int8,
+)
 from argumentation_analysis.core.interfaces.fallacy_detector import (
     AbstractFallacyDetector,
 )
@@ -337,7 +346,7 @@ _SYMBOLIC_FALLACY_RULES = {
     ],
 }
 
-# G5 (#1186, restored from student 2.3.2 fallacy_pipeline.py:279-288):
+# G5 (#1186, restored from student 2.3.2 fallacy_pipeline.py:401-410):
 # Per-family French explanation templates — one specific justification per
 # fallacy family, instead of a single generic line. The student pipeline
 # emitted these verbatim per detected fallacy; the trunk had collapsed them
@@ -467,6 +476,12 @@ class FallacyAnalysisResult:
     arguments: Optional[Dict[str, List[str]]] = None
     tiers_used: List[str] = field(default_factory=list)
     explanation: str = ""
+    # Wall-clock time spent in each tier that ran to completion (ms).
+    tier_latencies: Dict[str, float] = field(default_factory=dict)
+    # Per-tier outcome: "ok", "timeout", "error" or "skipped" (cancelled by
+    # the early-exit policy). #1019: a timed-out tier is reported, never
+    # silently folded into "no fallacies found".
+    tier_status: Dict[str, str] = field(default_factory=dict)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dict matching AbstractFallacyDetector.detect() output.
@@ -493,6 +508,10 @@ class FallacyAnalysisResult:
             "tiers_used": self.tiers_used,
             "explanation": self.explanation,
             "total_fallacies": len(self.fallacies),
+            "tier_latencies_ms": {
+                name: round(ms, 2) for name, ms in self.tier_latencies.items()
+            },
+            "tier_status": self.tier_status,
         }
 
 
@@ -500,24 +519,42 @@ class FallacyAnalysisResult:
 
 
 class SymbolicFallacyDetector:
-    """Rule-based fallacy detection using spaCy Matcher patterns."""
+    """Rule-based fallacy detection using spaCy Matcher patterns.
+
+    The spaCy model is loaded once (without the unused NER component) and
+    the claim, premise and fallacy matchers are compiled once. The last
+    parsed Doc is kept so that ``mine_arguments`` and ``detect`` on the same
+    text parse it only once; ``analyze_batch`` streams a corpus through
+    ``nlp.pipe``.
+    """
+
+    # The rules read LOWER, LEMMA, POS and sentence boundaries only.
+    _UNUSED_COMPONENTS = ["ner"]
 
     def __init__(self):
         self._nlp = None
         self._available = None
+        self._claim_matcher = None
+        self._premise_matcher = None
+        self._fallacy_matcher = None
+        self._last_parse: Optional[Tuple[str, Any]] = None
 
     def is_available(self) -> bool:
         if self._available is None:
             try:
                 import spacy
 
-                self._nlp = spacy.load("fr_core_news_lg")
+                self._nlp = spacy.load(
+                    "fr_core_news_lg", exclude=self._UNUSED_COMPONENTS
+                )
                 self._available = True
             except (ImportError, OSError):
                 try:
                     import spacy
 
-                    self._nlp = spacy.load("fr_core_news_sm")
+                    self._nlp = spacy.load(
+                        "fr_core_news_sm", exclude=self._UNUSED_COMPONENTS
+                    )
                     self._available = True
                     logger.info("Using fr_core_news_sm (lg not available)")
                 except (ImportError, OSError):
@@ -525,21 +562,62 @@ class SymbolicFallacyDetector:
                     logger.warning("spaCy French model not available")
         return self._available
 
+    def _matchers(self):
+        """Claim, premise and fallacy matchers, compiled on first use."""
+        if self._fallacy_matcher is None:
+            from spacy.matcher import Matcher
+
+            claim_matcher = Matcher(self._nlp.vocab)
+            for i, p in enumerate(_CLAIM_PATTERNS):
+                claim_matcher.add(f"CLAIM_{i}", [p["PATTERN"]])
+
+            premise_matcher = Matcher(self._nlp.vocab)
+            for i, p in enumerate(_PREMISE_PATTERNS):
+                premise_matcher.add(f"PREMISE_{i}", [p["PATTERN"]])
+
+            fallacy_matcher = Matcher(self._nlp.vocab)
+            for rule_key, rules in _SYMBOLIC_FALLACY_RULES.items():
+                for i, rule in enumerate(rules):
+                    fallacy_matcher.add(f"{rule_key}_{i}", [rule["PATTERN"]])
+
+            self._claim_matcher = claim_matcher
+            self._premise_matcher = premise_matcher
+            self._fallacy_matcher = fallacy_matcher
+        return self._claim_matcher, self._premise_matcher, self._fallacy_matcher
+
+    def _parse(self, text: str):
+        last = self._last_parse
+        if last is not None and last[0] == text:
+            return last[1]
+        doc = self._nlp(text)
+        self._last_parse = (text, doc)
+        return doc
+
     def mine_arguments(self, text: str) -> Dict[str, List[str]]:
         """Extract claims and premises using spaCy Matcher patterns."""
         if not self.is_available():
             return {"claims": [text], "premises": []}
+        return self._mine_doc(self._parse(text))
 
-        from spacy.matcher import Matcher
+    def detect(self, text: str) -> List[FallacyDetection]:
+        """Detect fallacies using symbolic rules."""
+        if not self.is_available():
+            return []
+        return self._detect_doc(self._parse(text))
 
-        doc = self._nlp(text)
-        claim_matcher = Matcher(self._nlp.vocab)
-        for i, p in enumerate(_CLAIM_PATTERNS):
-            claim_matcher.add(f"CLAIM_{i}", [p["PATTERN"]])
+    def analyze_batch(
+        self, texts: List[str], batch_size: int = 64, n_process: int = 1
+    ) -> List[Tuple[Dict[str, List[str]], List[FallacyDetection]]]:
+        """``(arguments, detections)`` per text, parsing the corpus with nlp.pipe."""
+        if not self.is_available():
+            return [({"claims": [text], "premises": []}, []) for text in texts]
+        return [
+            (self._mine_doc(doc), self._detect_doc(doc))
+            for doc in self._nlp.pipe(texts, batch_size=batch_size, n_process=n_process)
+        ]
 
-        premise_matcher = Matcher(self._nlp.vocab)
-        for i, p in enumerate(_PREMISE_PATTERNS):
-            premise_matcher.add(f"PREMISE_{i}", [p["PATTERN"]])
+    def _mine_doc(self, doc) -> Dict[str, List[str]]:
+        claim_matcher, premise_matcher, _ = self._matchers()
 
         claims, premises = [], []
         for sent in doc.sents:
@@ -554,22 +632,12 @@ class SymbolicFallacyDetector:
                 claims.append(sents[0].text)
                 premises.extend(s.text for s in sents[1:])
             else:
-                claims.append(text)
+                claims.append(doc.text)
 
         return {"claims": claims, "premises": premises}
 
-    def detect(self, text: str) -> List[FallacyDetection]:
-        """Detect fallacies using symbolic rules."""
-        if not self.is_available():
-            return []
-
-        from spacy.matcher import Matcher
-
-        doc = self._nlp(text)
-        matcher = Matcher(self._nlp.vocab)
-        for rule_key, rules in _SYMBOLIC_FALLACY_RULES.items():
-            for i, rule in enumerate(rules):
-                matcher.add(f"{rule_key}_{i}", [rule["PATTERN"]])
+    def _detect_doc(self, doc) -> List[FallacyDetection]:
+        _, _, matcher = self._matchers()
 
         results = []
         seen_types = set()
@@ -614,12 +682,33 @@ class NLIFallacyDetector:
 
     DEFAULT_MODEL = "MoritzLaurer/mDeBERTa-v3-base-xnli-multilingual-nli-2mil7"
     CONFIDENCE_THRESHOLD = 0.5
+    HYPOTHESIS_TEMPLATE = "Ce texte contient un sophisme de type {}."
 
-    def __init__(self, model_name: Optional[str] = None, threshold: float = 0.5):
+    def __init__(
+        self,
+        model_name: Optional[str] = None,
+        threshold: float = 0.5,
+        batch_size: int = 32,
+        max_wait_ms: float = 0.0,
+        quantize: bool = False,
+    ):
         self._model_name = model_name or self.DEFAULT_MODEL
         self._classifier = None
         self._available = None
         self.threshold = threshold
+        self._batch_size = batch_size
+        self._quantize = quantize
+        # Batched scorer over the pipeline's model/tokenizer, built lazily
+        # when the classifier is a real transformers pipeline.
+        self._scorer = None
+        # Concurrent detect() calls (threads of detect_async, per-argument
+        # loops) are coalesced into shared forward passes.
+        self._batcher = MicroBatcher(
+            self._detect_items,
+            max_batch_size=batch_size,
+            max_wait=max_wait_ms / 1000,
+            name="nli-fallacy-batcher",
+        )
 
     def is_available(self) -> bool:
         if self._available is None:
@@ -641,9 +730,38 @@ class NLIFallacyDetector:
                 "zero-shot-classification",
                 model=self._model_name,
             )
+            if self._quantize:
+                self._classifier.model = quantize_dynamic_int8(self._classifier.model)
             logger.info("NLI model loaded")
         return self._classifier
 
+    def _classify(self, requests: List[NLIRequest]) -> List[Dict[str, list]]:
+        """Zero-shot classification of many (text, labels, multi_label) requests.
+
+        Uses the batched scorer when the classifier is a transformers
+        pipeline; any other callable (e.g. a test double) is called once per
+        request with the pipeline signature.
+        """
+        classifier = self._get_classifier()
+        if self._scorer is None and NLIBatchScorer.supports(classifier):
+            self._scorer = NLIBatchScorer(
+                classifier.model,
+                classifier.tokenizer,
+                self.HYPOTHESIS_TEMPLATE,
+                batch_size=self._batch_size,
+            )
+        if self._scorer is not None:
+            return self._scorer.classify(requests)
+        return [
+            classifier(
+                text,
+                candidate_labels=list(labels),
+                hypothesis_template=self.HYPOTHESIS_TEMPLATE,
+                multi_label=multi_label,
+            )
+            for text, labels, multi_label in requests
+        ]
+
     def detect(
         self, text: str, *, hierarchical: bool = False
     ) -> List[FallacyDetection]:
@@ -655,22 +773,50 @@ class NLIFallacyDetector:
                 classification (family then sub-family) instead of
                 flat 28-label matching.  Requires taxonomy_full.csv.
         """
-        if not self.is_available():
-            return []
+        return self.detect_batch([text], hierarchical=hierarchical)[0]
+
+    def detect_batch(
+        self, texts: List[str], *, hierarchical: bool = False
+    ) -> List[List[FallacyDetection]]:
+        """Classify many texts; one detection list per text, in order.
 
-        if hierarchical:
-            return self._nli_hierarchical_classify(text)
+        All (text, label) pairs go through a few length-bucketed forward
+        passes instead of one pipeline call per text (and per family in
+        hierarchical mode).
+        """
+        if not self.is_available():
+            return [[] for _ in texts]
+        return self._batcher.submit_many([(text, hierarchical) for text in texts])
+
+    def _detect_items(
+        self, items: List[Tuple[str, bool]]
+    ) -> List[List[FallacyDetection]]:
+        """MicroBatcher callback: items are ``(text, hierarchical)``."""
+        results: List[List[FallacyDetection]] = [[] for _ in items]
+        for hierarchical in (False, True):
+            positions = [i for i, item in enumerate(items) if item[1] is hierarchical]
+            if not positions:
+                continue
+            texts = [items[i][0] for i in positions]
+            if hierarchical:
+                outputs = self._nli_hierarchical_batch(texts)
+            else:
+                outputs = self._flat_batch(texts)
+            for i, detections in zip(positions, outputs):
+                results[i] = detections
+        return results
 
+    def _flat_batch(self, texts: List[str]) -> List[List[FallacyDetection]]:
         try:
-            classifier = self._get_classifier()
-            hypothesis_template = "Ce texte contient un sophisme de type {}."
-            result = classifier(
-                text,
-                candidate_labels=FALLACY_LABELS_FR,
-                hypothesis_template=hypothesis_template,
-                multi_label=True,
+            classified = self._classify(
+                [(text, FALLACY_LABELS_FR, True) for text in texts]
             )
+        except Exception as e:
+            logger.error(f"NLI detection failed: {e}")
+            return [[] for _ in texts]
 
+        batch = []
+        for result in classified:
             detections = []
             for label, score in zip(result["labels"], result["scores"]):
                 if score >= self.threshold:
@@ -687,11 +833,8 @@ class NLIFallacyDetector:
                             taxonomy_pk=taxonomy_pk,
                         )
                     )
-            return detections
-
-        except Exception as e:
-            logger.error(f"NLI detection failed: {e}")
-            return []
+            batch.append(detections)
+        return batch
 
     # ── Hierarchical 2-stage NLI classification ────────────────────────
 
@@ -699,6 +842,10 @@ class NLIFallacyDetector:
     HIERARCHICAL_STAGE1_THRESHOLD = 0.3
 
     def _nli_hierarchical_classify(self, text: str) -> List[FallacyDetection]:
+        """2-stage hierarchical NLI classification of a single text."""
+        return self._nli_hierarchical_batch([text])[0]
+
+    def _nli_hierarchical_batch(self, texts: List[str]) -> List[List[FallacyDetection]]:
         """2-stage hierarchical NLI classification.
 
         Stage 1: classify against the 7 depth-1 families.
@@ -706,6 +853,7 @@ class NLIFallacyDetector:
                  classify against its depth-2 (and optionally depth-3)
                  children to get the most specific match.
 
+        Each stage is a single batched classification over all texts.
         Falls back to flat classification if hierarchy is unavailable.
         """
         hierarchy = _load_taxonomy_hierarchy()
@@ -714,127 +862,139 @@ class NLIFallacyDetector:
                 "Taxonomy hierarchy not available — "
                 "falling back to flat NLI classification"
             )
-            return self.detect(text, hierarchical=False)
+            return self._flat_batch(texts)
 
         try:
-            classifier = self._get_classifier()
-            hypothesis_template = "Ce texte contient un sophisme de type {}."
-
             # ── Stage 1: classify against depth-1 families ────────────
             families = hierarchy["children"]
             family_labels = [f["label"] for f in families]
-
-            stage1_result = classifier(
-                text,
-                candidate_labels=family_labels,
-                hypothesis_template=hypothesis_template,
-                multi_label=True,
+            stage1_results = self._classify(
+                [(text, family_labels, True) for text in texts]
             )
 
-            detections: List[FallacyDetection] = []
-
-            for label, score in zip(stage1_result["labels"], stage1_result["scores"]):
-                if score < self.HIERARCHICAL_STAGE1_THRESHOLD:
-                    continue
-
-                # Find the family node
-                family_node = None
-                for f in families:
-                    if f["label"] == label:
-                        family_node = f
-                        break
-
-                if family_node is None or not family_node.get("children"):
-                    # No children to drill into — report the family itself
-                    detections.append(
-                        FallacyDetection(
-                            fallacy_type=label,
-                            confidence=round(score, 3),
-                            source="nli_hierarchical",
-                            description=(
-                                f"NLI hierarchical stage-1 " f"({self._model_name})"
-                            ),
-                            taxonomy_pk=family_node["pk"] if family_node else None,
+            # Per text: ordered (label, score, family_node, child_labels_map)
+            plans: List[List[tuple]] = []
+            stage2_requests: List[NLIRequest] = []
+            for text, stage1_result in zip(texts, stage1_results):
+                plan = []
+                for label, score in zip(
+                    stage1_result["labels"], stage1_result["scores"]
+                ):
+                    if score < self.HIERARCHICAL_STAGE1_THRESHOLD:
+                        continue
+
+                    # Find the family node
+                    family_node = None
+                    for f in families:
+                        if f["label"] == label:
+                            family_node = f
+                            break
+
+                    # Collect depth-2 children, and optionally depth-3
+                    child_labels_map: Dict[str, Dict[str, Any]] = {}
+                    if family_node is not None:
+                        for child in family_node.get("children", []):
+                            child_labels_map[child["label"]] = child
+                            # Also include depth-3 grandchildren for finer grain
+                            for grandchild in child.get("children", []):
+                                child_labels_map[grandchild["label"]] = grandchild
+
+                    stage2_index = None
+                    if child_labels_map:
+                        stage2_index = len(stage2_requests)
+                        stage2_requests.append(
+                            (text, list(child_labels_map.keys()), False)
                         )
+                    plan.append(
+                        (label, score, family_node, child_labels_map, stage2_index)
                     )
-                    continue
+                plans.append(plan)
 
-                # ── Stage 2: classify against children ────────────────
-                # Collect depth-2 children, and optionally depth-3
-                child_labels_map: Dict[str, Dict[str, Any]] = {}
-                for child in family_node["children"]:
-                    child_labels_map[child["label"]] = child
-                    # Also include depth-3 grandchildren for finer grain
-                    for grandchild in child.get("children", []):
-                        child_labels_map[grandchild["label"]] = grandchild
+            # ── Stage 2: classify against children ────────────────────
+            stage2_results = self._classify(stage2_requests) if stage2_requests else []
 
-                if not child_labels_map:
-                    detections.append(
-                        FallacyDetection(
-                            fallacy_type=label,
-                            confidence=round(score, 3),
-                            source="nli_hierarchical",
-                            description=(
-                                f"NLI hierarchical stage-1 only "
-                                f"({self._model_name})"
-                            ),
-                            taxonomy_pk=family_node["pk"],
-                        )
+            return [
+                self._hierarchical_detections(plan, stage2_results) for plan in plans
+            ]
+
+        except Exception as e:
+            logger.error(f"NLI hierarchical detection failed: {e}")
+            return [[] for _ in texts]
+
+    def _hierarchical_detections(
+        self, plan: List[tuple], stage2_results: List[Dict[str, list]]
+    ) -> List[FallacyDetection]:
+        detections: List[FallacyDetection] = []
+        for label, score, family_node, child_labels_map, stage2_index in plan:
+            if family_node is None or not family_node.get("children"):
+                # No children to drill into — report the family itself
+                detections.append(
+                    FallacyDetection(
+                        fallacy_type=label,
+                        confidence=round(score, 3),
+                        source="nli_hierarchical",
+                        description=(
+                            f"NLI hierarchical stage-1 " f"({self._model_name})"
+                        ),
+                        taxonomy_pk=family_node["pk"] if family_node else None,
                     )
-                    continue
+                )
+                continue
 
-                child_labels = list(child_labels_map.keys())
-                stage2_result = classifier(
-                    text,
-                    candidate_labels=child_labels,
-                    hypothesis_template=hypothesis_template,
-                    multi_label=False,
+            if stage2_index is None:
+                detections.append(
+                    FallacyDetection(
+                        fallacy_type=label,
+                        confidence=round(score, 3),
+                        source="nli_hierarchical",
+                        description=(
+                            f"NLI hierarchical stage-1 only " f"({self._model_name})"
+                        ),
+                        taxonomy_pk=family_node["pk"],
+                    )
                 )
+                continue
 
-                best_child_label = stage2_result["labels"][0]
-                best_child_score = stage2_result["scores"][0]
-                best_child_node = child_labels_map[best_child_label]
+            stage2_result = stage2_results[stage2_index]
+            best_child_label = stage2_result["labels"][0]
+            best_child_score = stage2_result["scores"][0]
+            best_child_node = child_labels_map[best_child_label]
 
-                # Use the finer result if confident enough; else keep family
-                if best_child_score >= self.threshold:
-                    # Combined confidence: family_score * child_score
-                    combined = round(score * best_child_score, 3)
-                    detections.append(
-                        FallacyDetection(
-                            fallacy_type=best_child_label,
-                            confidence=combined,
-                            source="nli_hierarchical",
-                            description=(
-                                f"NLI hierarchical stage-2: "
-                                f"{label} → {best_child_label} "
-                                f"(s1={score:.3f}, s2={best_child_score:.3f}) "
-                                f"({self._model_name})"
-                            ),
-                            taxonomy_pk=best_child_node["pk"],
-                        )
+            # Use the finer result if confident enough; else keep family
+            if best_child_score >= self.threshold:
+                # Combined confidence: family_score * child_score
+                combined = round(score * best_child_score, 3)
+                detections.append(
+                    FallacyDetection(
+                        fallacy_type=best_child_label,
+                        confidence=combined,
+                        source="nli_hierarchical",
+                        description=(
+                            f"NLI hierarchical stage-2: "
+                            f"{label} → {best_child_label} "
+                            f"(s1={score:.3f}, s2={best_child_score:.3f}) "
+                            f"({self._model_name})"
+                        ),
+                        taxonomy_pk=best_child_node["pk"],
                     )
-                else:
-                    # Stage 2 not confident — report family level
-                    detections.append(
-                        FallacyDetection(
-                            fallacy_type=label,
-                            confidence=round(score, 3),
-                            source="nli_hierarchical",
-                            description=(
-                                f"NLI hierarchical stage-1 only "
-                                f"(stage-2 best={best_child_score:.3f} "
-                                f"< threshold={self.threshold}) "
-                                f"({self._model_name})"
-                            ),
-                            taxonomy_pk=family_node["pk"],
-                        )
+                )
+            else:
+                # Stage 2 not confident — report family level
+                detections.append(
+                    FallacyDetection(
+                        fallacy_type=label,
+                        confidence=round(score, 3),
+                        source="nli_hierarchical",
+                        description=(
+                            f"NLI hierarchical stage-1 only "
+                            f"(stage-2 best={best_child_score:.3f} "
+                            f"< threshold={self.threshold}) "
+                            f"({self._model_name})"
+                        ),
+                        taxonomy_pk=family_node["pk"],
                     )
-
-            return detections
-
-        except Exception as e:
-            logger.error(f"NLI hierarchical detection failed: {e}")
-            return []
+                )
+        return detections
 
 
 # ── Tier 2.5: CamemBERT Fine-Tuned Detection (#169) ─────────────────────
@@ -883,13 +1043,24 @@ class CamemBERTFallacyDetector:
         model_path: Optional[str] = None,
         threshold: float = 0.3,
         max_length: int = 128,
+        batch_size: int = 32,
+        max_wait_ms: float = 0.0,
+        quantize: bool = False,
     ):
         self._model_path = model_path
         self._threshold = threshold
         self._max_length = max_length
+        self._batch_size = batch_size
+        self._quantize = quantize
         self._tokenizer = None
         self._model = None
         self._available = None
+        self._batcher = MicroBatcher(
+            self._classify_batch,
+            max_batch_size=batch_size,
+            max_wait=max_wait_ms / 1000,
+            name="camembert-fallacy-batcher",
+        )
 
     def _find_model_path(self) -> Optional[str]:
         """Search for the fine-tuned model in known locations."""
@@ -944,6 +1115,8 @@ class CamemBERTFallacyDetector:
             self._tokenizer = CamembertTokenizer.from_pretrained(model_path)
             self._model = CamembertForSequenceClassification.from_pretrained(model_path)
             self._model.eval()
+            if self._quantize:
+                self._model = quantize_dynamic_int8(self._model)
             self._available = True
             logger.info(f"CamemBERT fallacy detector loaded from {model_path}")
         except Exception as e:
@@ -957,53 +1130,73 @@ class CamemBERTFallacyDetector:
 
         Returns at most one detection (the highest-confidence class).
         """
-        if not self.is_available():
-            return []
+        return self.detect_batch([text])[0]
+
+    def detect_batch(self, texts: List[str]) -> List[List[FallacyDetection]]:
+        """Classify many texts; one detection list (0 or 1 item) per text.
 
+        Texts are grouped by length and each group runs as one dynamically
+        padded forward pass under ``torch.inference_mode``.
+        """
+        if not self.is_available():
+            return [[] for _ in texts]
         try:
-            import torch
+            return self._batcher.submit_many(list(texts))
+        except Exception as e:
+            logger.error(f"CamemBERT detection failed: {e}")
+            return [[] for _ in texts]
+
+    def _classify_batch(self, texts: List[str]) -> List[List[FallacyDetection]]:
+        """MicroBatcher callback: batched forward passes over ``texts``."""
+        import torch
 
+        results: List[List[FallacyDetection]] = [[] for _ in texts]
+        # Character length is a close proxy for token count: sorting by it
+        # keeps each padded batch tight without tokenising twice.
+        for bucket in length_buckets([len(t) for t in texts], self._batch_size):
             inputs = self._tokenizer(
-                text,
+                [texts[i] for i in bucket],
                 return_tensors="pt",
                 truncation=True,
                 max_length=self._max_length,
                 padding=True,
             )
 
-            with torch.no_grad():
+            with torch.inference_mode():
                 outputs = self._model(**inputs)
 
-            logits = outputs.logits
-            probabilities = torch.softmax(logits, dim=1)
-            predicted_class_id = torch.argmax(probabilities, dim=1).item()
-            confidence = probabilities[0][predicted_class_id].item()
-
-            if confidence < self._threshold:
-                return []
-
-            fallacy_type = _CAMEMBERT_LABEL_MAPPING.get(
-                predicted_class_id, f"unknown_class_{predicted_class_id}"
-            )
-            taxonomy_pk = _TAXONOMY_LABEL_TO_PK.get(fallacy_type)
-
-            return [
-                FallacyDetection(
-                    fallacy_type=fallacy_type,
-                    confidence=round(confidence, 3),
-                    source="camembert",
-                    description=(
-                        f"CamemBERT fine-tuned classifier "
-                        f"[class={predicted_class_id}, conf={confidence:.3f}]"
-                    ),
-                    taxonomy_pk=taxonomy_pk,
+            probabilities = torch.softmax(outputs.logits, dim=1)
+            confidences, class_ids = torch.max(probabilities, dim=1)
+            for row, i in enumerate(bucket):
+                results[i] = self._detections(
+                    class_ids[row].item(), confidences[row].item()
                 )
-            ]
+        return results
 
-        except Exception as e:
-            logger.error(f"CamemBERT detection failed: {e}")
+    def _detections(
+        self, predicted_class_id: int, confidence: float
+    ) -> List[FallacyDetection]:
+        if confidence < self._threshold:
             return []
 
+        fallacy_type = _CAMEMBERT_LABEL_MAPPING.get(
+            predicted_class_id, f"unknown_class_{predicted_class_id}"
+        )
+        taxonomy_pk = _TAXONOMY_LABEL_TO_PK.get(fallacy_type)
+
+        return [
+            FallacyDetection(
+                fallacy_type=fallacy_type,
+                confidence=round(confidence, 3),
+                source="camembert",
+                description=(
+                    f"CamemBERT fine-tuned classifier "
+                    f"[class={predicted_class_id}, conf={confidence:.3f}]"
+                ),
+                taxonomy_pk=taxonomy_pk,
+            )
+        ]
+
     def get_status_details(self) -> Dict[str, Any]:
         """Return detector status details."""
         return {
@@ -1353,6 +1546,13 @@ class LLMFallacyDetector:
 
 # ── Main Adapter ─────────────────────────────────────────────────────────
 
+# (tier name, blocking run, coroutine run) — see FrenchFallacyAdapter._tier_plan
+_TierRunner = Tuple[
+    str,
+    Callable[[], List[FallacyDetection]],
+    Callable[[], Awaitable[List[FallacyDetection]]],
+]
+
 
 class FrenchFallacyAdapter(AbstractFallacyDetector):
     """Multi-tier French fallacy detection adapter.
@@ -1368,6 +1568,10 @@ class FrenchFallacyAdapter(AbstractFallacyDetector):
       Tier 1:   Remote LLM (OpenAI via ServiceDiscovery)
       Tier 0.5: CamemBERT fine-tuned (deprecated, model never deployed)
 
+    ``detect()`` runs the tiers sequentially; ``detect_async()`` runs them
+    concurrently under per-tier timeouts, an optional latency budget and an
+    optional early exit once ``min_agreeing_tiers`` tiers agree.
+
     Register with CapabilityRegistry:
         registry.register_service(
             "french_fallacy_detector",
@@ -1394,6 +1598,12 @@ class FrenchFallacyAdapter(AbstractFallacyDetector):
         service_discovery=None,
         llm_confidence_threshold: float = 0.4,
         nli_hierarchical: bool = False,
+        tier_timeouts: Optional[Dict[str, float]] = None,
+        latency_budget: Optional[float] = None,
+        min_agreeing_tiers: Optional[int] = None,
+        agreement_confidence: float = 0.8,
+        inference_batch_size: int = 32,
+        quantize_int8: bool = False,
     ):
         self._symbolic = SymbolicFallacyDetector() if enable_symbolic else None
         # Self-hosted LLM replaces CamemBERT + NLI (#297)
@@ -1411,12 +1621,19 @@ class FrenchFallacyAdapter(AbstractFallacyDetector):
             CamemBERTFallacyDetector(
                 model_path=camembert_model_path,
                 threshold=camembert_threshold,
+                batch_size=inference_batch_size,
+                quantize=quantize_int8,
             )
             if enable_camembert and not enable_self_hosted_llm
             else None
         )
         self._nli = (
-            NLIFallacyDetector(model_name=nli_model, threshold=nli_threshold)
+            NLIFallacyDetector(
+                model_name=nli_model,
+                threshold=nli_threshold,
+                batch_size=inference_batch_size,
+                quantize=quantize_int8,
+            )
             if enable_nli and not enable_self_hosted_llm
             else None
         )
@@ -1429,6 +1646,11 @@ class FrenchFallacyAdapter(AbstractFallacyDetector):
             else None
         )
         self._nli_hierarchical = nli_hierarchical
+        # detect_async() scheduling policy (see its docstring)
+        self._tier_timeouts: Dict[str, float] = dict(tier_timeouts or {})
+        self._latency_budget = latency_budget
+        self._min_agreeing_tiers = min_agreeing_tiers
+        self._agreement_confidence = agreement_confidence
 
     def is_available(self) -> bool:
         """At least one tier must be available."""
@@ -1458,12 +1680,68 @@ class FrenchFallacyAdapter(AbstractFallacyDetector):
             tiers.append("llm")
         return tiers
 
+    def _tier_plan(self, text: str) -> List[_TierRunner]:
+        """Available tiers in cascade order as ``(name, sync_run, async_run)``.
+
+        The order is also the merge order, so ``detect`` and ``detect_async``
+        produce the same ensemble whatever order the tiers finish in.
+        """
+        plan = []
+        if self._symbolic and self._symbolic.is_available():
+            symbolic = self._symbolic
+            plan.append(
+                (
+                    "symbolic",
+                    lambda: symbolic.detect(text),
+                    lambda: asyncio.to_thread(symbolic.detect, text),
+                )
+            )
+        if self._self_hosted_llm and self._self_hosted_llm.is_available():
+            self_hosted = self._self_hosted_llm
+            plan.append(
+                (
+                    "self_hosted_llm",
+                    lambda: self_hosted.detect(text),
+                    lambda: self_hosted.detect_async(text),
+                )
+            )
+        if self._camembert and self._camembert.is_available():
+            camembert = self._camembert
+            plan.append(
+                (
+                    "camembert",
+                    lambda: camembert.detect(text),
+                    lambda: asyncio.to_thread(camembert.detect, text),
+                )
+            )
+        if self._nli and self._nli.is_available():
+            nli, hierarchical = self._nli, self._nli_hierarchical
+            plan.append(
+                (
+                    "nli_hierarchical" if hierarchical else "nli",
+                    lambda: nli.detect(text, hierarchical=hierarchical),
+                    lambda: asyncio.to_thread(
+                        nli.detect, text, hierarchical=hierarchical
+                    ),
+                )
+            )
+        if self._llm and self._llm.is_available():
+            llm = self._llm
+            plan.append(
+                (
+                    "llm",
+                    lambda: llm.detect(text),
+                    lambda: llm.detect_async(text),
+                )
+            )
+        return plan
+
     def detect(self, text: str) -> dict:
-        """Detect fallacies using all available tiers.
+        """Detect fallacies using all available tiers, one after another.
 
         Returns:
             Dict with keys: detected_fallacies, arguments, tiers_used,
-            explanation, total_fallacies
+            explanation, total_fallacies, tier_latencies_ms, tier_status
         """
         result = FallacyAnalysisResult(text=text)
 
@@ -1471,45 +1749,213 @@ class FrenchFallacyAdapter(AbstractFallacyDetector):
         if self._symbolic and self._symbolic.is_available():
             result.arguments = self._symbolic.mine_arguments(text)
 
-        # Collect detections from all tiers
-        all_detections: List[FallacyDetection] = []
+        per_tier: Dict[str, List[FallacyDetection]] = {}
+        for name, run, _ in self._tier_plan(text):
+            started = time.perf_counter()
+            per_tier[name] = run()
+            result.tier_latencies[name] = (time.perf_counter() - started) * 1000
+            result.tier_status[name] = "ok"
 
-        # Tier 2: Symbolic (fastest, always tried first)
-        if self._symbolic and self._symbolic.is_available():
-            symbolic_results = self._symbolic.detect(text)
-            all_detections.extend(symbolic_results)
-            if symbolic_results:
-                result.tiers_used.append("symbolic")
+        return self._finalize(result, per_tier)
 
-        # Tier 1: Self-hosted LLM (#297)
-        if self._self_hosted_llm and self._self_hosted_llm.is_available():
-            self_hosted_results = self._self_hosted_llm.detect(text)
-            all_detections.extend(self_hosted_results)
-            if self_hosted_results:
-                result.tiers_used.append("self_hosted_llm")
+    def detect_batch(self, texts: List[str]) -> List[dict]:
+        """Detect fallacies in many texts (e.g. one per extracted argument).
 
-        # Tier 1.5: CamemBERT fine-tuned (#169, deprecated)
-        if self._camembert and self._camembert.is_available():
-            camembert_results = self._camembert.detect(text)
-            all_detections.extend(camembert_results)
-            if camembert_results:
-                result.tiers_used.append("camembert")
+        The symbolic tier parses all texts in one ``nlp.pipe`` pass and the
+        transformer tiers (CamemBERT, NLI) classify every text in a few
+        batched forward passes; the LLM tiers run per text as in
+        :meth:`detect`. Returns one :meth:`detect`-shaped dict per text; the
+        latency reported for a batched tier is the wall time of the batch.
+        """
+        texts = list(texts)
+        results = [FallacyAnalysisResult(text=text) for text in texts]
+        per_tier: List[Dict[str, List[FallacyDetection]]] = [{} for _ in texts]
 
-        # Tier 2: NLI zero-shot (deprecated, shadowed by self-hosted LLM)
+        batched: Dict[str, Callable[[], List[List[FallacyDetection]]]] = {}
+        if self._symbolic and self._symbolic.is_available():
+            # One nlp.pipe pass yields both the arguments and the detections.
+            def symbolic_batch() -> List[List[FallacyDetection]]:
+                analyses = self._symbolic.analyze_batch(texts)
+                for result, (arguments, _) in zip(results, analyses):
+                    result.arguments = arguments
+                return [detections for _, detections in analyses]
+
+            batched["symbolic"] = symbolic_batch
+        if self._camembert and self._camembert.is_available():
+            batched["camembert"] = lambda: self._camembert.detect_batch(texts)
         if self._nli and self._nli.is_available():
-            nli_results = self._nli.detect(text, hierarchical=self._nli_hierarchical)
-            all_detections.extend(nli_results)
-            if nli_results:
-                tier_name = "nli_hierarchical" if self._nli_hierarchical else "nli"
-                result.tiers_used.append(tier_name)
+            batched["nli_hierarchical" if self._nli_hierarchical else "nli"] = (
+                lambda: self._nli.detect_batch(
+                    texts, hierarchical=self._nli_hierarchical
+                )
+            )
+        for name, run_batch in batched.items():
+            started = time.perf_counter()
+            outputs = run_batch()
+            elapsed = (time.perf_counter() - started) * 1000
+            for result, tiers, detections in zip(results, per_tier, outputs):
+                tiers[name] = detections
+                result.tier_latencies[name] = elapsed
+                result.tier_status[name] = "ok"
+
+        for result, tiers in zip(results, per_tier):
+            for name, run, _ in self._tier_plan(result.text):
+                if name in batched:
+                    continue
+                started = time.perf_counter()
+                tiers[name] = run()
+                result.tier_latencies[name] = (time.perf_counter() - started) * 1000
+                result.tier_status[name] = "ok"
 
-        # Tier 0: Remote LLM zero-shot
-        if self._llm and self._llm.is_available():
-            llm_results = self._llm.detect(text)
-            all_detections.extend(llm_results)
-            if llm_results:
-                result.tiers_used.append("llm")
+        return [
+            self._finalize(result, tiers) for result, tiers in zip(results, per_tier)
+        ]
 
+    async def detect_async(
+        self,
+        text: str,
+        *,
+        tier_timeouts: Optional[Dict[str, float]] = None,
+        latency_budget: Optional[float] = None,
+        min_agreeing_tiers: Optional[int] = None,
+        agreement_confidence: Optional[float] = None,
+    ) -> dict:
+        """Detect fallacies with all available tiers running concurrently.
+
+        Blocking tiers (symbolic, CamemBERT, NLI) run in worker threads, the
+        LLM tiers use their native coroutines. Keyword arguments override the
+        values given to the constructor.
+
+        Args:
+            text: Text to analyse.
+            tier_timeouts: Per-tier timeout in seconds, keyed by tier name
+                (``"default"`` applies to tiers not listed).
+            latency_budget: Overall wall-clock budget in seconds; tiers still
+                running when it expires are cancelled and reported as
+                ``"timeout"``.
+            min_agreeing_tiers: Early exit once this many tiers report the
+                same fallacy type with at least ``agreement_confidence``;
+                the remaining tiers are cancelled and reported as
+                ``"skipped"``. ``None`` waits for every tier.
+            agreement_confidence: Confidence a detection needs to count
+                towards the early-exit agreement.
+
+        Returns:
+            Same dict as :meth:`detect`. Results of tiers that timed out,
+            failed or were skipped are left out of the ensemble. Cancelling
+            a thread-backed tier only drops its result; the worker thread
+            finishes in the background.
+        """
+        tier_timeouts = self._tier_timeouts if tier_timeouts is None else tier_timeouts
+        if latency_budget is None:
+            latency_budget = self._latency_budget
+        if min_agreeing_tiers is None:
+            min_agreeing_tiers = self._min_agreeing_tiers
+        if agreement_confidence is None:
+            agreement_confidence = self._agreement_confidence
+
+        result = FallacyAnalysisResult(text=text)
+        started = time.perf_counter()
+        deadline = None if latency_budget is None else started + latency_budget
+
+        async def timed(
+            name: str, run: Callable[[], Awaitable[List[FallacyDetection]]]
+        ) -> List[FallacyDetection]:
+            tier_started = time.perf_counter()
+            timeout = tier_timeouts.get(name, tier_timeouts.get("default"))
+            detections = await asyncio.wait_for(run(), timeout)
+            result.tier_latencies[name] = (time.perf_counter() - tier_started) * 1000
+            return detections
+
+        tasks: Dict[asyncio.Task, str] = {
+            asyncio.create_task(timed(name, run_async)): name
+            for name, _, run_async in self._tier_plan(text)
+        }
+        arguments_task = None
+        if self._symbolic and self._symbolic.is_available():
+            arguments_task = asyncio.create_task(
+                asyncio.to_thread(self._symbolic.mine_arguments, text)
+            )
+
+        per_tier: Dict[str, List[FallacyDetection]] = {}
+        pending = set(tasks)
+        while pending:
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            if remaining is not None and remaining <= 0:
+                break
+            done, pending = await asyncio.wait(
+                pending, timeout=remaining, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                name = tasks[task]
+                try:
+                    per_tier[name] = task.result()
+                    result.tier_status[name] = "ok"
+                except asyncio.TimeoutError:
+                    result.tier_status[name] = "timeout"
+                    logger.warning("[DEGRADED] Fallacy tier %s timed out", name)
+                except Exception as e:
+                    result.tier_status[name] = "error"
+                    logger.warning("[DEGRADED] Fallacy tier %s failed: %s", name, e)
+            if pending and self._tiers_agree(
+                per_tier, min_agreeing_tiers, agreement_confidence
+            ):
+                for task in pending:
+                    task.cancel()
+                    result.tier_status[tasks[task]] = "skipped"
+                pending = set()
+
+        for task in pending:
+            task.cancel()
+            result.tier_status[tasks[task]] = "timeout"
+            logger.warning(
+                "[DEGRADED] Fallacy tier %s exceeded the %.2fs latency budget",
+                tasks[task],
+                latency_budget,
+            )
+
+        if arguments_task is not None:
+            remaining = None if deadline is None else deadline - time.perf_counter()
+            try:
+                result.arguments = await asyncio.wait_for(
+                    arguments_task, None if remaining is None else max(remaining, 0)
+                )
+            except Exception as e:
+                logger.warning("Argument mining skipped: %s", e)
+
+        return self._finalize(result, per_tier)
+
+    @staticmethod
+    def _tiers_agree(
+        per_tier: Dict[str, List[FallacyDetection]],
+        min_agreeing_tiers: Optional[int],
+        agreement_confidence: float,
+    ) -> bool:
+        """True when enough finished tiers confidently report a common type."""
+        if not min_agreeing_tiers:
+            return False
+        votes: Dict[str, int] = {}
+        for detections in per_tier.values():
+            for fallacy_type in {
+                d.fallacy_type
+                for d in detections
+                if d.confidence >= agreement_confidence
+            }:
+                votes[fallacy_type] = votes.get(fallacy_type, 0) + 1
+        return any(count >= min_agreeing_tiers for count in votes.values())
+
+    def _finalize(
+        self,
+        result: FallacyAnalysisResult,
+        per_tier: Dict[str, List[FallacyDetection]],
+    ) -> dict:
+        """Merge per-tier detections (in cascade order) and build the output."""
+        all_detections: List[FallacyDetection] = []
+        for name, _, _ in self._tier_plan(result.text):
+            tier_results = per_tier.get(name)
+            if tier_results:
+                all_detections.extend(tier_results)
+                result.tiers_used.append(name)
         # Ensemble: merge detections by fallacy type
         merged: Dict[str, FallacyDetection] = {}
         for d in all_detections:
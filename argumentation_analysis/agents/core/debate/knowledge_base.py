@@ -4,13 +4,33 @@ Knowledge base for argumentation dialogues.
 Stores propositions and arguments, checks consistency,
 and finds supporting/attacking arguments.
 
+Debate protocols query the base on every turn, so lookups go through
+indexes maintained on insertion rather than scans: conclusion -> arguments,
+premise -> dependent arguments, and the set of contradicted propositions
+(``p`` and ``¬p`` both present). Every query is a dictionary lookup,
+independent of the debate length.
+
+``snapshot``/``rollback`` (or the ``lookahead`` context manager) undo the
+insertions made since a snapshot through a journal, so a protocol can try
+a move and cheaply restore the previous state.
+
 Adapted from 1_2_7_argumentation_dialogique/local_db_arg/src/core/knowledge_base.py.
 """
 
-from typing import Dict, List
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Set, Tuple
 
 from .protocols import FormalArgument, Proposition
 
+NEGATION = "¬"
+
+_MISSING = object()
+
+
+def negate(content: str) -> str:
+    """Content of the negation of ``content``."""
+    return f"{NEGATION}{content}"
+
 
 class KnowledgeBase:
     """Knowledge base with argumentation support."""
@@ -20,40 +40,65 @@ class KnowledgeBase:
         self.arguments: Dict[str, FormalArgument] = {}
         self.rules: List[Dict] = []
         self.preferences: Dict[str, float] = {}
+        # content -> {argument id: argument}, in insertion order
+        self._by_conclusion: Dict[str, Dict[str, FormalArgument]] = {}
+        self._by_premise: Dict[str, Dict[str, FormalArgument]] = {}
+        # contents p such that both p and ¬p are propositions
+        self._contradicted: Set[str] = set()
+        # undo entries, recorded only while a snapshot is open
+        self._journal: List[Tuple] = []
+        self._marks: List[int] = []
 
     def add_proposition(self, prop: Proposition) -> None:
         """Add a proposition to the knowledge base."""
-        self.propositions[prop.content] = prop
+        content = prop.content
+        previous = self.propositions.get(content, _MISSING)
+        self.propositions[content] = prop
+        if self._marks:
+            self._journal.append(("proposition", content, previous))
+        if previous is not _MISSING:
+            return
+        if negate(content) in self.propositions:
+            self._mark_contradicted(content)
+        if content.startswith(NEGATION) and content[1:] in self.propositions:
+            self._mark_contradicted(content[1:])
 
     def add_argument(self, arg: FormalArgument) -> None:
         """Add an argument and auto-register its premises and conclusion."""
+        previous = self.arguments.get(arg.id, _MISSING)
         self.arguments[arg.id] = arg
+        if previous is _MISSING:
+            self._index(arg)
+        else:
+            self._reindex(previous, arg)
+        if self._marks:
+            self._journal.append(("argument", arg.id, previous))
         for premise in arg.premises:
             self.add_proposition(premise)
         self.add_proposition(arg.conclusion)
 
     def find_supporting_arguments(self, prop: Proposition) -> List[FormalArgument]:
         """Find arguments whose conclusion matches the proposition."""
-        return [
-            arg
-            for arg in self.arguments.values()
-            if arg.conclusion.content == prop.content
-        ]
+        return list(self._by_conclusion.get(prop.content, {}).values())
 
     def find_attacking_arguments(self, prop: Proposition) -> List[FormalArgument]:
         """Find arguments whose conclusion negates the proposition."""
-        return [
-            arg
-            for arg in self.arguments.values()
-            if arg.conclusion.content == f"\u00ac{prop.content}"
-        ]
+        return list(self._by_conclusion.get(negate(prop.content), {}).values())
+
+    def find_dependent_arguments(self, prop: Proposition) -> List[FormalArgument]:
+        """Find arguments that use the proposition as a premise."""
+        return list(self._by_premise.get(prop.content, {}).values())
 
     def is_consistent(self) -> bool:
         """Check that no proposition and its negation coexist."""
-        for prop_content in self.propositions:
-            if f"\u00ac{prop_content}" in self.propositions:
-                return False
-        return True
+        return not self._contradicted
+
+    def get_contradictions(self) -> List[Tuple[Proposition, Proposition]]:
+        """Pairs ``(p, ¬p)`` of propositions that are both in the base."""
+        return [
+            (self.propositions[content], self.propositions[negate(content)])
+            for content in self._contradicted
+        ]
 
     def entails(self, prop: Proposition) -> bool:
         """Check if the knowledge base contains this proposition."""
@@ -64,3 +109,121 @@ class KnowledgeBase:
 
     def get_all_arguments(self) -> List[FormalArgument]:
         return list(self.arguments.values())
+
+    # ── Snapshots ──
+
+    def snapshot(self) -> int:
+        """Open a snapshot; returns the token for ``rollback``/``release``.
+
+        Snapshots nest: rolling back or releasing a token also closes the
+        snapshots opened after it. ``rules`` and ``preferences`` are not
+        covered.
+        """
+        self._marks.append(len(self._journal))
+        return len(self._marks)
+
+    def rollback(self, token: int) -> None:
+        """Undo every insertion made since snapshot ``token``."""
+        mark = self._close(token)
+        while len(self._journal) > mark:
+            entry = self._journal.pop()
+            if entry[0] == "proposition":
+                self._undo_proposition(entry[1], entry[2])
+            elif entry[0] == "argument":
+                self._undo_argument(entry[1], entry[2])
+            else:  # "contradicted"
+                self._contradicted.discard(entry[1])
+        if not self._marks:
+            self._journal.clear()
+
+    def release(self, token: int) -> None:
+        """Keep the changes made since snapshot ``token`` and close it."""
+        self._close(token)
+        if not self._marks:
+            self._journal.clear()
+
+    @contextmanager
+    def lookahead(self) -> Iterator["KnowledgeBase"]:
+        """Context in which every change is rolled back on exit."""
+        token = self.snapshot()
+        try:
+            yield self
+        finally:
+            self.rollback(token)
+
+    # ── Internals ──
+
+    def _close(self, token: int) -> int:
+        if not 1 <= token <= len(self._marks):
+            raise ValueError(f"Unknown or closed snapshot: {token}")
+        mark = self._marks[token - 1]
+        del self._marks[token - 1 :]
+        return mark
+
+    def _mark_contradicted(self, content: str) -> None:
+        if content not in self._contradicted:
+            self._contradicted.add(content)
+            if self._marks:
+                self._journal.append(("contradicted", content))
+
+    def _index(self, arg: FormalArgument) -> None:
+        for index, content in self._keys(arg):
+            index.setdefault(content, {})[arg.id] = arg
+
+    def _reindex(self, old: FormalArgument, new: FormalArgument) -> None:
+        """Replace ``old`` by ``new`` (same id) in the indexes.
+
+        The id keeps its place in the buckets it stays in, and is inserted at
+        its ``arguments`` position in new ones, so lookups return the order of
+        a scan of ``arguments``.
+        """
+        keys = self._keys(new)
+        for index, content in self._keys(old):
+            if not any(i is index and c == content for i, c in keys):
+                self._drop(index, content, old.id)
+        for index, content in keys:
+            bucket = index.setdefault(content, {})
+            moved = bucket and new.id not in bucket
+            bucket[new.id] = new
+            if moved:
+                index[content] = {
+                    arg_id: bucket[arg_id]
+                    for arg_id in self.arguments
+                    if arg_id in bucket
+                }
+
+    def _unindex(self, arg: FormalArgument) -> None:
+        for index, content in self._keys(arg):
+            self._drop(index, content, arg.id)
+
+    def _keys(
+        self, arg: FormalArgument
+    ) -> List[Tuple[Dict[str, Dict[str, FormalArgument]], str]]:
+        return [(self._by_conclusion, arg.conclusion.content)] + [
+            (self._by_premise, p.content) for p in arg.premises
+        ]
+
+    @staticmethod
+    def _drop(
+        index: Dict[str, Dict[str, FormalArgument]], content: str, arg_id: str
+    ) -> None:
+        bucket = index.get(content)
+        if bucket is not None:
+            bucket.pop(arg_id, None)
+            if not bucket:
+                del index[content]
+
+    def _undo_proposition(self, content: str, previous) -> None:
+        if previous is _MISSING:
+            del self.propositions[content]
+        else:
+            self.propositions[content] = previous
+
+    def _undo_argument(self, arg_id: str, previous) -> None:
+        current = self.arguments[arg_id]
+        if previous is _MISSING:
+            self._unindex(current)
+            del self.arguments[arg_id]
+        else:
+            self.arguments[arg_id] = previous
+            self._reindex(current, previous)
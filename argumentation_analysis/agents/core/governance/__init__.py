@@ -10,7 +10,9 @@ Integration from student project 2.1.6_multiagent_governance_prototype (GitHub #
 
 from .governance_agent import Agent, BDIAgent, ReactiveAgent, AgentFactory
 from .governance_methods import GOVERNANCE_METHODS
-from .simulation import simulate_governance, manipulability_analysis
+from .simulation import Manipulation, simulate_governance, manipulability_analysis
+from .experiments import ExperimentReport, run_experiment
+from .shapley import ShapleyResult, shapley_values
 from .conflict_resolution import detect_conflicts, resolve_conflict
 from .metrics import consensus_rate, fairness_index, satisfaction, summarize_results
 
@@ -22,6 +24,11 @@ __all__ = [
     "GOVERNANCE_METHODS",
     "simulate_governance",
     "manipulability_analysis",
+    "Manipulation",
+    "ExperimentReport",
+    "run_experiment",
+    "ShapleyResult",
+    "shapley_values",
     "detect_conflicts",
     "resolve_conflict",
     "consensus_rate",
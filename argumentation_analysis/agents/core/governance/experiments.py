@@ -0,0 +1,375 @@
+"""
+Governance experiment engine — parallel, seeded and resumable sweeps.
+
+A sweep is the grid ``runs × methods × manipulations``. Every cell is an
+``ExperimentTask`` whose seed is derived from ``(base_seed, run, method,
+manipulation)`` through ``numpy.random.SeedSequence``: a task draws the
+same random stream whatever the grid size, the worker count or the order
+in which tasks complete.
+
+Tasks fan out over a ``ProcessPoolExecutor`` in chunks. Each finished row
+is appended to a CSV file (one column per field, header written once) and
+flushed as it arrives; running the same sweep again on that file skips the
+tasks already recorded, so an interrupted study resumes where it stopped.
+Per (method, manipulation) cell, numeric metrics are accumulated online
+(Welford) and reported as mean ± normal-approximation half-width, both at
+the end and to an optional ``progress`` callback after every chunk.
+"""
+
+import csv
+import logging
+import math
+import os
+import zlib
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from .governance_agent import AgentFactory
+from .metrics import summarize_results
+from .simulation import MANIPULATION_SUITE, Manipulation, run_manipulation
+
+logger = logging.getLogger(__name__)
+
+KEY_COLUMNS = ("run", "method", "manipulation", "seed")
+
+# Task function: (scenario_data, task) -> flat row of metrics.
+TaskFunction = Callable[[Dict[str, Any], "ExperimentTask"], Dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class ExperimentTask:
+    """One cell of a sweep."""
+
+    run: int
+    method: str
+    manipulation: Manipulation
+    seed: int
+
+    @property
+    def key(self) -> Tuple[int, str, str]:
+        return (self.run, self.method, self.manipulation.label)
+
+
+def _stable_hash(text: str) -> int:
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def task_seed(base_seed: int, run: int, method: str, manipulation: str) -> int:
+    """Deterministic 32-bit seed of one task, independent of the grid."""
+    sequence = np.random.SeedSequence(
+        base_seed,
+        spawn_key=(run, _stable_hash(method), _stable_hash(manipulation)),
+    )
+    return int(sequence.generate_state(1)[0])
+
+
+def build_tasks(
+    n_runs: int,
+    methods: Sequence[str],
+    manipulations: Sequence[Manipulation] = MANIPULATION_SUITE,
+    base_seed: int = 0,
+) -> List[ExperimentTask]:
+    """The ``runs × methods × manipulations`` grid, run-major."""
+    return [
+        ExperimentTask(run, method, m, task_seed(base_seed, run, method, m.label))
+        for run in range(n_runs)
+        for method in methods
+        for m in manipulations
+    ]
+
+
+def run_governance_task(
+    scenario_data: Dict[str, Any], task: ExperimentTask
+) -> Dict[str, Any]:
+    """Default task: fresh seeded agents, one manipulation, summary metrics."""
+    agents = AgentFactory.create_agents(scenario_data["agents"], seed=task.seed)
+    data = dict(scenario_data)
+    data["context"] = {"seed": task.seed, **scenario_data.get("context", {})}
+    result = run_manipulation(agents, data, task.method, task.manipulation)
+    row = summarize_results(result)
+    row["winner"] = result["winner"]
+    return row
+
+
+def _run_chunk(
+    task_fn: TaskFunction,
+    scenario_data: Dict[str, Any],
+    tasks: Sequence[ExperimentTask],
+) -> List[Tuple[ExperimentTask, Optional[Dict[str, Any]], Optional[str]]]:
+    """Worker entry point: run ``tasks``, capturing per-task failures."""
+    out = []
+    for task in tasks:
+        try:
+            out.append((task, task_fn(scenario_data, task), None))
+        except Exception as exc:
+            out.append((task, None, f"{type(exc).__name__}: {exc}"))
+    return out
+
+
+class RunningStats:
+    """Online mean and variance (Welford)."""
+
+    __slots__ = ("n", "mean", "_m2")
+
+    def __init__(self):
+        self.n = 0
+        self.mean = 0.0
+        self._m2 = 0.0
+
+    def update(self, value: float) -> None:
+        self.n += 1
+        delta = value - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (value - self.mean)
+
+    @property
+    def variance(self) -> float:
+        return self._m2 / (self.n - 1) if self.n > 1 else 0.0
+
+    def half_width(self, confidence: float = 0.95) -> float:
+        """Half-width of the normal-approximation interval of the mean."""
+        if self.n < 2:
+            return math.inf
+        z = NormalDist().inv_cdf(0.5 + confidence / 2)
+        return z * math.sqrt(self.variance / self.n)
+
+
+@dataclass
+class ExperimentReport:
+    """Progress and running statistics of a sweep."""
+
+    total: int
+    output: Optional[str] = None
+    completed: int = 0  # rows produced by this call
+    resumed: int = 0  # rows found in ``output`` and skipped
+    failures: List[Tuple[Tuple[int, str, str], str]] = field(default_factory=list)
+    stopped_early: bool = False
+    stats: Dict[Tuple[str, str], Dict[str, RunningStats]] = field(default_factory=dict)
+
+    @property
+    def done(self) -> int:
+        return self.completed + self.resumed
+
+    def add(self, method: str, manipulation: str, row: Dict[str, Any]) -> None:
+        cell = self.stats.setdefault((method, manipulation), {})
+        for name, value in row.items():
+            if name in KEY_COLUMNS:
+                continue
+            number = _as_number(value)
+            if number is not None:
+                cell.setdefault(name, RunningStats()).update(number)
+
+    def summary(self, confidence: float = 0.95) -> List[Dict[str, Any]]:
+        """One row per (method, manipulation): ``n``, ``<metric>`` means and
+        ``<metric>_ci`` half-widths."""
+        rows = []
+        for (method, manipulation), cell in self.stats.items():
+            row: Dict[str, Any] = {"method": method, "manipulation": manipulation}
+            row["n"] = max((s.n for s in cell.values()), default=0)
+            for name, s in cell.items():
+                row[name] = s.mean
+                row[f"{name}_ci"] = s.half_width(confidence)
+            rows.append(row)
+        return rows
+
+    def max_half_width(self, metric: str, confidence: float = 0.95) -> float:
+        """Widest interval of ``metric`` over all cells (inf if unseen)."""
+        widths = [
+            cell[metric].half_width(confidence)
+            for cell in self.stats.values()
+            if metric in cell
+        ]
+        return max(widths) if widths else math.inf
+
+
+def _as_number(value: Any) -> Optional[float]:
+    if isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (int, float, np.integer, np.floating)):
+        return float(value)
+    if isinstance(value, str):
+        try:
+            return float(value)
+        except ValueError:
+            return None
+    return None
+
+
+def _drop_partial_line(path: str) -> None:
+    """Truncate a trailing row cut short by an interruption."""
+    with open(path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+
+
+class _CsvSink:
+    """Append-only CSV of task rows, with the key columns first."""
+
+    def __init__(self, path: str, resume: bool):
+        self.path = path
+        self.fieldnames: Optional[List[str]] = None
+        self.existing: List[Dict[str, str]] = []
+        if resume and os.path.exists(path) and os.path.getsize(path) > 0:
+            _drop_partial_line(path)
+            with open(path, newline="", encoding="utf-8") as f:
+                reader = csv.DictReader(f)
+                self.fieldnames = list(reader.fieldnames or [])
+                self.existing = list(reader)
+        mode = "a" if self.fieldnames else "w"
+        self._file = open(path, mode, newline="", encoding="utf-8")
+        self._writer: Optional[csv.DictWriter] = None
+        if self.fieldnames:
+            self._writer = csv.DictWriter(self._file, self.fieldnames)
+
+    def write(self, rows: Iterable[Dict[str, Any]]) -> None:
+        for row in rows:
+            if self._writer is None:
+                extra = [k for k in row if k not in KEY_COLUMNS]
+                self.fieldnames = list(KEY_COLUMNS) + extra
+                self._writer = csv.DictWriter(self._file, self.fieldnames)
+                self._writer.writeheader()
+            unknown = set(row) - set(self.fieldnames)
+            if unknown:
+                raise ValueError(
+                    f"Row fields {sorted(unknown)} are not columns of {self.path}"
+                )
+            self._writer.writerow(row)
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def run_experiment(
+    scenario_data: Dict[str, Any],
+    methods: Sequence[str],
+    n_runs: int = 100,
+    manipulations: Sequence[Manipulation] = MANIPULATION_SUITE,
+    output: Optional[str] = None,
+    workers: Optional[int] = None,
+    base_seed: int = 0,
+    resume: bool = True,
+    chunk_size: Optional[int] = None,
+    task_fn: TaskFunction = run_governance_task,
+    progress: Optional[Callable[[ExperimentReport], Any]] = None,
+) -> ExperimentReport:
+    """Run a ``runs × methods × manipulations`` sweep.
+
+    Args:
+        scenario_data: Scenario dict (``agents`` configs, ``options``,
+            optional ``context``), shipped to every worker.
+        methods: Governance method names.
+        n_runs: Runs per (method, manipulation) cell.
+        manipulations: Scenarios of each cell, see ``Manipulation``.
+        output: CSV file receiving one row per task as it completes.
+        workers: Worker processes (default: CPU count); ``<= 1`` runs inline.
+            ``task_fn`` must be a module-level function for process workers.
+        base_seed: Root of the per-task seeds.
+        resume: Skip the tasks already present in ``output`` (otherwise the
+            file is overwritten). Rows written with another ``base_seed``
+            raise ``ValueError``.
+        chunk_size: Tasks per worker submission (default: balanced).
+        task_fn: ``task_fn(scenario_data, task) -> row`` of metrics.
+        progress: Called with the report after every chunk; a truthy return
+            stops the sweep (finished rows stay in ``output`` for a resume).
+
+    Returns:
+        ExperimentReport with running statistics over resumed and new rows.
+    """
+    tasks = build_tasks(n_runs, methods, manipulations, base_seed)
+    report = ExperimentReport(total=len(tasks), output=output)
+    sink = _CsvSink(output, resume) if output else None
+    try:
+        if sink is not None and sink.existing:
+            tasks = _skip_recorded(tasks, sink.existing, report)
+        if not tasks:
+            return report
+        if workers is None:
+            workers = os.cpu_count() or 1
+        if chunk_size is None:
+            chunk_size = max(1, min(64, len(tasks) // (max(1, workers) * 4)))
+        chunks = [tasks[i : i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+        if workers <= 1:
+            for chunk in chunks:
+                if _collect(
+                    _run_chunk(task_fn, scenario_data, chunk), report, sink, progress
+                ):
+                    return report
+        else:
+            _run_pool(task_fn, scenario_data, chunks, workers, report, sink, progress)
+    finally:
+        if sink is not None:
+            sink.close()
+    return report
+
+
+def _run_pool(task_fn, scenario_data, chunks, workers, report, sink, progress):
+    executor = ProcessPoolExecutor(max_workers=workers)
+    try:
+        futures = [
+            executor.submit(_run_chunk, task_fn, scenario_data, chunk)
+            for chunk in chunks
+        ]
+        for future in as_completed(futures):
+            if _collect(future.result(), report, sink, progress):
+                break
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _collect(results, report, sink, progress) -> bool:
+    """Record one chunk of results; True when ``progress`` asks to stop."""
+    rows = []
+    for task, row, error in results:
+        if error is not None:
+            logger.warning(f"Governance experiment task {task.key} failed: {error}")
+            report.failures.append((task.key, error))
+            continue
+        record = {
+            "run": task.run,
+            "method": task.method,
+            "manipulation": task.manipulation.label,
+            "seed": task.seed,
+            **row,
+        }
+        rows.append(record)
+        report.add(task.method, task.manipulation.label, record)
+        report.completed += 1
+    if sink is not None:
+        sink.write(rows)
+    if progress is not None and progress(report):
+        report.stopped_early = True
+        return True
+    return False
+
+
+def _skip_recorded(
+    tasks: List[ExperimentTask],
+    existing: List[Dict[str, str]],
+    report: ExperimentReport,
+) -> List[ExperimentTask]:
+    """Fold the rows already in the output into ``report``; return the rest."""
+    expected = {task.key: task for task in tasks}
+    recorded = set()
+    for row in existing:
+        try:
+            key = (int(row["run"]), row["method"], row["manipulation"])
+            seed = int(row["seed"])
+        except (KeyError, TypeError, ValueError):
+            raise ValueError(f"Cannot resume: malformed row {row!r}")
+        task = expected.get(key)
+        if task is None or key in recorded:
+            continue  # outside this sweep's grid, or a duplicate
+        if seed != task.seed:
+            raise ValueError(
+                f"Cannot resume: row {key} was written with another base_seed"
+            )
+        recorded.add(key)
+        report.add(key[1], key[2], row)
+        report.resumed += 1
+    return [task for task in tasks if task.key not in recorded]
@@ -0,0 +1,289 @@
+"""
+Shapley values for cooperative games over named players.
+
+Two estimators share one interface:
+
+- ``exact``: the weighted-subset formula
+  ``phi_i = sum_{S ⊆ N\\{i}} |S|! (n-|S|-1)! / n! * (v(S ∪ {i}) - v(S))``,
+  evaluating each of the 2^n coalitions exactly once, then combining them
+  with NumPy (no permutation enumeration). Practical up to ~20 players.
+- ``monte_carlo``: permutation sampling. Each sampled order yields one
+  marginal contribution per player; sampling stops once every player's
+  confidence half-width is below ``epsilon`` (or ``max_permutations`` is
+  reached), and the achieved half-widths are reported with the values.
+
+Payoffs are given either as ``payoff(names) -> float`` (``names`` is a
+frozenset of player names) or, for speed, as
+``batch_payoff(members) -> array`` where ``members`` is a boolean
+``(k, n)`` matrix whose columns follow the player order.
+"""
+
+import math
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+Payoff = Callable[[frozenset], float]
+BatchPayoff = Callable[[np.ndarray], np.ndarray]
+
+# Largest game solved exactly by default (2^n coalitions). A batch payoff
+# makes coalition evaluation cheap enough to go further.
+_MAX_EXACT_PLAYERS = 14
+_MAX_EXACT_PLAYERS_BATCHED = 20
+
+# Coalitions evaluated per batch (rows of the membership matrix).
+_BATCH_ROWS = 1 << 15
+
+
+@dataclass
+class ShapleyResult:
+    """Shapley values with the provenance of their computation."""
+
+    values: Dict[str, float]
+    method: str  # "exact" or "monte_carlo"
+    evaluations: int  # distinct coalitions whose payoff was computed
+    permutations: int = 0  # sampled orders (monte_carlo only)
+    half_widths: Dict[str, float] = field(default_factory=dict)
+    confidence: Optional[float] = None
+    converged: bool = True
+
+    @property
+    def max_half_width(self) -> float:
+        return max(self.half_widths.values(), default=0.0)
+
+    def to_dict(self) -> Dict:
+        return {
+            "values": self.values,
+            "method": self.method,
+            "evaluations": self.evaluations,
+            "permutations": self.permutations,
+            "max_half_width": self.max_half_width,
+            "confidence": self.confidence,
+            "converged": self.converged,
+        }
+
+
+def player_names(players: Iterable) -> List[str]:
+    """Names of ``players`` (objects with a ``name`` or plain strings)."""
+    return [getattr(p, "name", p) for p in players]
+
+
+class _Evaluator:
+    """Memoised coalition payoffs keyed by membership bitmask."""
+
+    def __init__(
+        self,
+        names: Sequence[str],
+        payoff: Optional[Payoff],
+        batch_payoff: Optional[BatchPayoff],
+        memoize: bool = True,
+    ):
+        if payoff is None and batch_payoff is None:
+            raise ValueError("Provide payoff or batch_payoff")
+        self.names = list(names)
+        self.payoff = payoff
+        self.batch_payoff = batch_payoff
+        self.memoize = memoize
+        self.cache: Dict[int, float] = {}
+        self.evaluations = 0
+
+    def masks_to_members(self, masks: np.ndarray) -> np.ndarray:
+        bits = np.arange(len(self.names), dtype=np.int64)
+        return ((masks[:, None] >> bits) & 1).astype(bool)
+
+    def members_to_masks(self, members: np.ndarray) -> np.ndarray:
+        weights = np.left_shift(1, np.arange(members.shape[-1], dtype=object))
+        if members.shape[-1] < 63:
+            weights = weights.astype(np.int64)
+        return members.astype(weights.dtype) @ weights
+
+    def _compute(self, members: np.ndarray) -> np.ndarray:
+        self.evaluations += len(members)
+        if self.batch_payoff is not None:
+            return np.asarray(self.batch_payoff(members), dtype=np.float64)
+        return np.array(
+            [
+                self.payoff(frozenset(self.names[i] for i in np.flatnonzero(row)))
+                for row in members
+            ],
+            dtype=np.float64,
+        )
+
+    def evaluate(self, members: np.ndarray, masks: np.ndarray) -> np.ndarray:
+        """Payoffs of the coalitions given as membership rows and bitmasks."""
+        if not self.memoize:
+            return self._compute(members)
+        out = np.empty(len(masks), dtype=np.float64)
+        missing = []
+        for row, mask in enumerate(masks.tolist()):
+            cached = self.cache.get(mask)
+            if cached is None:
+                missing.append(row)
+            else:
+                out[row] = cached
+        if not missing:
+            return out
+        # Identical coalitions within one call are computed once.
+        todo: Dict[int, List[int]] = {}
+        for row in missing:
+            todo.setdefault(int(masks[row]), []).append(row)
+        computed = self._compute(members[[rows[0] for rows in todo.values()]])
+        for (mask, rows), value in zip(todo.items(), computed.tolist()):
+            self.cache[mask] = value
+            out[rows] = value
+        return out
+
+
+def shapley_exact(
+    players: Sequence,
+    payoff: Optional[Payoff] = None,
+    batch_payoff: Optional[BatchPayoff] = None,
+) -> ShapleyResult:
+    """Exact Shapley values from the 2^n coalition payoffs."""
+    names = player_names(players)
+    n = len(names)
+    if n == 0:
+        return ShapleyResult(values={}, method="exact", evaluations=0)
+    # Every coalition is visited exactly once: nothing to memoise.
+    evaluator = _Evaluator(names, payoff, batch_payoff, memoize=False)
+
+    size = 1 << n
+    v = np.empty(size, dtype=np.float64)
+    for start in range(0, size, _BATCH_ROWS):
+        masks = np.arange(start, min(size, start + _BATCH_ROWS), dtype=np.int64)
+        v[masks] = evaluator.evaluate(evaluator.masks_to_members(masks), masks)
+
+    popcount = np.zeros(size, dtype=np.int64)
+    for i in range(n):
+        popcount[1 << i : 1 << (i + 1)] = popcount[: 1 << i] + 1
+    # |S|! (n-|S|-1)! / n!  ==  1 / (n * C(n-1, |S|))
+    weight = np.array([1.0 / (n * math.comb(n - 1, s)) for s in range(n)])
+
+    all_masks = np.arange(size, dtype=np.int64)
+    values = {}
+    for i, name in enumerate(names):
+        without = all_masks[(all_masks >> i) & 1 == 0]
+        marginal = v[without | (1 << i)] - v[without]
+        values[name] = float(weight[popcount[without]] @ marginal)
+    return ShapleyResult(values=values, method="exact", evaluations=size)
+
+
+def shapley_monte_carlo(
+    players: Sequence,
+    payoff: Optional[Payoff] = None,
+    batch_payoff: Optional[BatchPayoff] = None,
+    epsilon: float = 0.01,
+    confidence: float = 0.95,
+    min_permutations: int = 100,
+    max_permutations: int = 20_000,
+    batch_permutations: int = 100,
+    seed: Optional[int] = None,
+) -> ShapleyResult:
+    """Shapley values by permutation sampling with early stopping.
+
+    Sampling proceeds by batches of ``batch_permutations`` orders and stops
+    once at least ``min_permutations`` were drawn and every player's
+    normal-approximation half-width at ``confidence`` is ``<= epsilon``
+    (payoff units). ``converged`` is False when ``max_permutations`` was hit
+    first.
+    """
+    names = player_names(players)
+    n = len(names)
+    if n == 0:
+        return ShapleyResult(values={}, method="monte_carlo", evaluations=0)
+    # Memoising only pays off for scalar payoffs; batches are cheaper to redo.
+    evaluator = _Evaluator(names, payoff, batch_payoff, memoize=batch_payoff is None)
+    rng = np.random.default_rng(seed)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    steps = np.arange(n + 1)
+
+    total = np.zeros(n)
+    total_sq = np.zeros(n)
+    drawn = 0
+    half = np.full(n, np.inf)
+    while drawn < max_permutations:
+        batch = min(batch_permutations, max_permutations - drawn)
+        orders = rng.permuted(np.tile(np.arange(n), (batch, 1)), axis=1)
+        position = np.argsort(orders, axis=1)
+        # members[b, k, p]: player p is among the first k of order b
+        members = position[:, None, :] < steps[None, :, None]
+        flat = members.reshape(-1, n)
+        masks = evaluator.members_to_masks(flat) if evaluator.memoize else None
+        v = evaluator.evaluate(flat, masks)
+        v = v.reshape(batch, n + 1)
+        marginal = np.take_along_axis(v, position + 1, axis=1) - np.take_along_axis(
+            v, position, axis=1
+        )
+        total += marginal.sum(axis=0)
+        total_sq += (marginal**2).sum(axis=0)
+        drawn += batch
+        if drawn >= min(min_permutations, max_permutations) and drawn > 1:
+            mean = total / drawn
+            var = np.maximum(total_sq / drawn - mean**2, 0.0) * drawn / (drawn - 1)
+            half = z * np.sqrt(var / drawn)
+            if half.max() <= epsilon:
+                break
+
+    mean = total / drawn
+    return ShapleyResult(
+        values={name: float(mean[i]) for i, name in enumerate(names)},
+        method="monte_carlo",
+        evaluations=evaluator.evaluations,
+        permutations=drawn,
+        half_widths={name: float(half[i]) for i, name in enumerate(names)},
+        confidence=confidence,
+        converged=bool(half.max() <= epsilon),
+    )
+
+
+def shapley_values(
+    players: Sequence,
+    payoff: Optional[Payoff] = None,
+    batch_payoff: Optional[BatchPayoff] = None,
+    method: str = "auto",
+    **sampling,
+) -> ShapleyResult:
+    """Shapley values, exact when affordable and sampled otherwise.
+
+    Args:
+        players: Agents (with ``name``) or player names.
+        payoff: ``payoff(frozenset_of_names) -> float``.
+        batch_payoff: Vectorised alternative, see module docstring.
+        method: "auto", "exact" or "monte_carlo". "auto" is exact up to
+            ``_MAX_EXACT_PLAYERS`` players (``_MAX_EXACT_PLAYERS_BATCHED``
+            with a batch payoff).
+        **sampling: Options forwarded to ``shapley_monte_carlo``.
+
+    Returns:
+        ShapleyResult
+    """
+    if method == "auto":
+        limit = (
+            _MAX_EXACT_PLAYERS_BATCHED
+            if batch_payoff is not None
+            else _MAX_EXACT_PLAYERS
+        )
+        method = "exact" if len(players) <= limit else "monte_carlo"
+    if method == "exact":
+        return shapley_exact(players, payoff, batch_payoff)
+    if method == "monte_carlo":
+        return shapley_monte_carlo(players, payoff, batch_payoff, **sampling)
+    raise ValueError(f"Unknown Shapley method: {method!r}")
+
+
+def weighted_voting_power(
+    weights: Sequence[float], quota: float
+) -> Callable[[np.ndarray], np.ndarray]:
+    """Batch payoff of the weighted voting game ``[quota; weights]``.
+
+    A coalition wins (payoff 1) when its total weight reaches ``quota``; the
+    Shapley values of this game are the Shapley-Shubik power indices.
+    """
+    w = np.asarray(weights, dtype=np.float64)
+
+    def batch_payoff(members: np.ndarray) -> np.ndarray:
+        return (members @ w >= quota).astype(np.float64)
+
+    return batch_payoff
@@ -5,33 +5,40 @@ and manipulability analysis.
 Adapted from 2.1.6_multiagent_governance_prototype/governance/simulation.py.
 """
 
-import math
+import copy
 from collections import defaultdict
-from itertools import permutations
+from dataclasses import dataclass
 
 import numpy as np
 
 from . import conflict_resolution
 from .governance_methods import GOVERNANCE_METHODS
+from .shapley import shapley_values, weighted_voting_power
 
 
-def shapley_value(coalition, all_agents, payoff_func):
-    """Compute Shapley value for each agent in a coalition."""
-    n = len(coalition)
-    if n == 0:
-        return {}
-    values = {a.name: 0.0 for a in coalition}
-    agents_list = list(coalition)
-    for perm in permutations(agents_list):
-        prev = set()
-        for agent in perm:
-            prev_set = set(a.name for a in prev)
-            with_agent = prev_set | {agent.name}
-            without_agent = prev_set
-            marginal = payoff_func(with_agent) - payoff_func(without_agent)
-            values[agent.name] += marginal / math.factorial(n)
-            prev.add(agent)
-    return values
+def shapley_value(coalition, all_agents, payoff_func, seed=0):
+    """Compute Shapley value for each agent in a coalition.
+
+    ``payoff_func`` receives a frozenset of agent names. Exact for small
+    coalitions, seeded permutation sampling beyond (see ``shapley.py``).
+    """
+    return shapley_values(list(coalition), payoff=payoff_func, seed=seed).values
+
+
+def coalition_power(coalitions, labels, seed=0, epsilon=0.005):
+    """Shapley-Shubik power of each coalition voting as one bloc.
+
+    Each coalition weighs its number of agents; a set of coalitions wins
+    once it holds a strict majority of all agents.
+    """
+    sizes = [len(c) for c in coalitions]
+    quota = sum(sizes) // 2 + 1
+    return shapley_values(
+        labels,
+        batch_payoff=weighted_voting_power(sizes, quota),
+        seed=seed,
+        epsilon=epsilon,
+    )
 
 
 def get_neighbors(agent, agents, adjacency):
@@ -135,16 +142,25 @@ def simulate_governance(agents, scenario_data, method):
         tally[v] += 1
     winner = max(tally, key=tally.get)
 
-    def payoff_func(agent_names):
-        return sum(
-            1.0 for a in agents if a.name in agent_names and winner == a.preferences[0]
-        )
-
+    # Payoff of a sub-coalition: its members whose first choice won.
     coalition_payoffs = {}
     for coalition in coalitions:
-        sv = shapley_value(coalition, agents, payoff_func)
+        supports = np.array(
+            [1.0 if a.preferences[0] == winner else 0.0 for a in coalition]
+        )
+        sv = shapley_values(
+            coalition,
+            batch_payoff=lambda members, w=supports: members @ w,
+            seed=context.get("seed", 0),
+        )
         for a in coalition:
-            coalition_payoffs[a.name] = sv[a.name]
+            coalition_payoffs[a.name] = sv.values[a.name]
+
+    power = coalition_power(
+        coalitions,
+        [c[0].coalition for c in coalitions],
+        seed=context.get("seed", 0),
+    )
 
     votes = [a.decide(options, context) for a in agents]
     satisfaction = [
@@ -177,6 +193,10 @@ def simulate_governance(agents, scenario_data, method):
         "agent_names": [a.name for a in agents],
         "coalitions": [[a.name for a in c] for c in coalitions],
         "coalition_payoffs": coalition_payoffs,
+        "coalition_power": power.values,
+        "coalition_power_estimate": {
+            k: v for k, v in power.to_dict().items() if k != "values"
+        },
         "rounds": 1,
         "history": [],
         "conflicts": conflicts,
@@ -184,6 +204,66 @@ def simulate_governance(agents, scenario_data, method):
     }
 
 
+@dataclass(frozen=True)
+class Manipulation:
+    """One manipulation scenario: ``kind`` and its intensity parameters.
+
+    ``kind`` is "none", "strategic", "false_coalition", "bribery" or "noise".
+    """
+
+    kind: str = "none"
+    noise_level: float = 0.0
+    bribery_budget: int = 0
+
+    @property
+    def label(self) -> str:
+        if self.kind == "bribery":
+            return f"bribery:{self.bribery_budget}"
+        if self.kind == "noise":
+            return f"noise:{self.noise_level:g}"
+        return self.kind
+
+
+# Scenarios compared by ``manipulability_analysis``.
+MANIPULATION_SUITE = (
+    Manipulation("none"),
+    Manipulation("strategic"),
+    Manipulation("false_coalition"),
+    Manipulation("bribery", bribery_budget=1),
+    Manipulation("bribery", bribery_budget=2),
+    Manipulation("noise", noise_level=0.1),
+    Manipulation("noise", noise_level=0.3),
+)
+
+
+class _VoteFor:
+    """``decide`` override always voting for ``option``.
+
+    A module-level callable rather than a lambda so manipulated agents stay
+    picklable (process pools, deep copies).
+    """
+
+    def __init__(self, option):
+        self.option = option
+
+    def __call__(self, options, context=None):
+        return self.option
+
+
+class _NoisyVote:
+    """``decide`` override: ``inner`` with probability ``1 - noise_level``,
+    a uniformly random option otherwise."""
+
+    def __init__(self, inner, noise_level):
+        self.inner = inner
+        self.noise_level = noise_level
+
+    def __call__(self, options, context=None):
+        if np.random.rand() > self.noise_level:
+            return self.inner(options, context)
+        return np.random.choice(options)
+
+
 def simulate_manipulation(
     agents,
     scenario_data,
@@ -192,34 +272,33 @@ def simulate_manipulation(
     noise_level=0.0,
     bribery_budget=0,
 ):
-    """Simulate governance under manipulation (strategic, coalition, bribery, noise)."""
+    """Simulate governance under manipulation (strategic, coalition, bribery, noise).
+
+    The manipulation is applied to ``agents`` in place; pass copies to keep
+    the originals intact.
+    """
     options = scenario_data["options"]
     agents_copy = list(agents)
 
     if manipulation_type == "strategic":
         for a in agents_copy:
             if len(a.preferences) > 1:
-                a.decide = lambda opts, ctx=None, a=a: a.preferences[1]
+                a.decide = _VoteFor(a.preferences[1])
     if manipulation_type == "false_coalition":
         target = options[0]
         for a in agents_copy[: len(agents_copy) // 2]:
             a.coalition = "false_coalition"
-            a.decide = lambda opts, ctx=None, t=target: t
+            a.decide = _VoteFor(target)
     if manipulation_type == "bribery" and bribery_budget > 0:
         target = options[-1]
         bribed = np.random.choice(
-            agents_copy, min(bribery_budget, len(agents_copy)), replace=False
+            len(agents_copy), min(bribery_budget, len(agents_copy)), replace=False
         )
-        for a in bribed:
-            a.decide = lambda opts, ctx=None, t=target: t
+        for i in bribed:
+            agents_copy[i].decide = _VoteFor(target)
     if manipulation_type == "noise" and noise_level > 0.0:
         for a in agents_copy:
-            orig_decide = a.decide
-            a.decide = lambda opts, ctx=None, od=orig_decide: (
-                od(opts, ctx)
-                if np.random.rand() > noise_level
-                else np.random.choice(opts)
-            )
+            a.decide = _NoisyVote(a.decide, noise_level)
 
     result = simulate_governance(agents_copy, scenario_data, method)
     result["manipulation_type"] = manipulation_type
@@ -228,30 +307,33 @@ def simulate_manipulation(
     return result
 
 
-def manipulability_analysis(agents, scenario_data, method):
-    """Run a suite of manipulation scenarios and report impact."""
-    results = []
-    baseline = simulate_governance(agents, scenario_data, method)
-    baseline["manipulation_type"] = "none"
-    results.append(baseline)
-    results.append(simulate_manipulation(agents, scenario_data, method, "strategic"))
-    results.append(
-        simulate_manipulation(agents, scenario_data, method, "false_coalition")
-    )
-    results.append(
-        simulate_manipulation(
-            agents, scenario_data, method, "bribery", bribery_budget=1
-        )
+def run_manipulation(agents, scenario_data, method, manipulation):
+    """Run one ``Manipulation`` scenario (baseline when its kind is "none")."""
+    if manipulation.kind == "none":
+        result = simulate_governance(agents, scenario_data, method)
+        result["manipulation_type"] = "none"
+        return result
+    return simulate_manipulation(
+        agents,
+        scenario_data,
+        method,
+        manipulation.kind,
+        noise_level=manipulation.noise_level,
+        bribery_budget=manipulation.bribery_budget,
     )
-    results.append(
-        simulate_manipulation(
-            agents, scenario_data, method, "bribery", bribery_budget=2
-        )
-    )
-    results.append(
-        simulate_manipulation(agents, scenario_data, method, "noise", noise_level=0.1)
-    )
-    results.append(
-        simulate_manipulation(agents, scenario_data, method, "noise", noise_level=0.3)
-    )
-    return results
+
+
+def manipulability_analysis(
+    agents, scenario_data, method, manipulations=MANIPULATION_SUITE
+):
+    """Run a suite of manipulation scenarios and report impact.
+
+    Each scenario runs on its own deep copy of ``agents``, so one
+    manipulation (or the memory updates of a run) does not leak into the
+    next. For many runs, methods or workers use
+    ``experiments.run_experiment``.
+    """
+    return [
+        run_manipulation(copy.deepcopy(agents), scenario_data, method, m)
+        for m in manipulations
+    ]
@@ -6,19 +6,158 @@ Implements classical voting procedures from computational social choice:
 - Single Transferable Vote (STV / Instant Runoff)
 - Copeland's method (pairwise comparison)
 - Kemeny-Young (optimal ranking)
-- Schulze method (strongest paths)
+- Schulze (strongest paths)
 
 These work on preference profiles (list of ranked ballots) and complement
 the agent-based methods in governance_methods.py.
+
+Ballots are converted once into a ``PreferenceProfile``: a NumPy rank matrix
+(identical ballots merged into weighted rows) from which the pairwise
+majority matrix is computed by broadcasting. Every method accepts either the
+raw ballots or a profile, so callers running several methods on the same
+ballots (e.g. ``_aggregate_governance_votes``) pay for the conversion once.
 """
 
-import itertools
-from collections import Counter
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+# Rank of a candidate absent from a ballot (sorts after every real position).
+UNRANKED = np.iinfo(np.int32).max
+
+# Upper bound on the boolean tensor built per pairwise chunk (rows * n * n).
+_PAIRWISE_CHUNK_CELLS = 1 << 22
+
+
+class PreferenceProfile:
+    """Ranked ballots as a weighted rank matrix over ``options``.
+
+    ``ranks[r, i]`` is the position of ``options[i]`` in the ballots of row
+    ``r`` (first occurrence, positions counted in the raw ballot) or
+    ``UNRANKED``; ``weights[r]`` is how many ballots share that row. Rows are
+    ordered by first appearance so order-sensitive tie-breaks (STV) match a
+    ballot-by-ballot scan.
+
+    Ballots naming a candidate more than once are also kept aside: Schulze,
+    ``pairwise_matrix`` and approval voting count every occurrence
+    (``occurrence_pairwise``, ``approvals``), the other methods only the
+    first one.
+    """
+
+    def __init__(self, ballots: Sequence[Sequence[str]], options: Sequence[str]):
+        self.ballots = ballots
+        self.options = list(options)
+        self.n_ballots = len(ballots)
+        n = len(self.options)
+        index: Dict[str, int] = {}
+        for i, option in enumerate(self.options):
+            index.setdefault(option, i)
+        self._index = index
+        self._repeated = [
+            ballot
+            for ballot in ballots
+            if len({c for c in ballot if c in index})
+            < sum(1 for c in ballot if c in index)
+        ]
+
+        ranks = np.full((len(ballots), n), UNRANKED, dtype=np.int32)
+        for row, ballot in zip(ranks, ballots):
+            for position, candidate in enumerate(ballot):
+                i = index.get(candidate)
+                if i is not None and row[i] == UNRANKED:
+                    row[i] = position
+
+        if len(ballots) and n:
+            unique, first, counts = np.unique(
+                ranks, axis=0, return_index=True, return_counts=True
+            )
+            order = np.argsort(first, kind="stable")
+            self.ranks = unique[order]
+            self.weights = counts[order].astype(np.int64)
+        else:
+            self.ranks = np.empty((0, n), dtype=np.int32)
+            self.weights = np.empty(0, dtype=np.int64)
+        self._pairwise: Dict[bool, np.ndarray] = {}
+        self._occurrence_pairwise: Optional[np.ndarray] = None
+
+    def pairwise(self, unranked_last: bool = False) -> np.ndarray:
+        """``P[a, b]``: number of voters ranking ``a`` above ``b``.
+
+        By default only ballots ranking both candidates count. With
+        ``unranked_last`` a ranked candidate also beats an unranked one
+        (Copeland's historical convention).
+        """
+        cached = self._pairwise.get(unranked_last)
+        if cached is not None:
+            return cached
+        n = len(self.options)
+        matrix = np.zeros((n, n), dtype=np.int64)
+        chunk = max(1, _PAIRWISE_CHUNK_CELLS // max(1, n * n))
+        for start in range(0, len(self.ranks), chunk):
+            ranks = self.ranks[start : start + chunk]
+            beats = ranks[:, :, None] < ranks[:, None, :]
+            if not unranked_last:
+                beats &= (ranks != UNRANKED)[:, None, :]
+            matrix += np.tensordot(
+                self.weights[start : start + chunk], beats, axes=(0, 0)
+            )
+        self._pairwise[unranked_last] = matrix
+        return matrix
+
+    def occurrence_pairwise(self) -> np.ndarray:
+        """``pairwise()`` counting every ordered pair of ballot entries.
+
+        Differs only for ballots repeating a candidate: each occurrence is
+        compared with the entries after it.
+        """
+        if not self._repeated:
+            return self.pairwise()
+        if self._occurrence_pairwise is None:
+            matrix = self.pairwise().copy()
+            for ballot in self._repeated:
+                entries = [self._index[c] for c in ballot if c in self._index]
+                firsts = list(dict.fromkeys(entries))
+                for k, a in enumerate(entries):
+                    for b in entries[k + 1 :]:
+                        if a != b:
+                            matrix[a, b] += 1
+                for k, a in enumerate(firsts):
+                    for b in firsts[k + 1 :]:
+                        matrix[a, b] -= 1
+            self._occurrence_pairwise = matrix
+        return self._occurrence_pairwise
+
+    def approvals(self, approval_threshold: int) -> np.ndarray:
+        """Per option, its occurrences among the first entries of each ballot."""
+        counts = self.weights @ (self.ranks < approval_threshold)
+        for ballot in self._repeated:
+            top = [
+                self._index[c] for c in ballot[:approval_threshold] if c in self._index
+            ]
+            for i in top:
+                counts[i] += 1
+            for i in set(top):
+                counts[i] -= 1
+        return counts
+
+
+def as_profile(
+    ballots: Union[Sequence[Sequence[str]], PreferenceProfile],
+    options: Sequence[str],
+) -> PreferenceProfile:
+    """Return ``ballots`` as a profile over ``options``, converting if needed."""
+    if isinstance(ballots, PreferenceProfile) and ballots.options == list(options):
+        return ballots
+    if isinstance(ballots, PreferenceProfile):
+        ballots = ballots.ballots
+    return PreferenceProfile(ballots, options)
+
+
+Ballots = Union[List[List[str]], PreferenceProfile]
 
 
 def approval_voting(
-    ballots: List[List[str]],
+    ballots: Ballots,
     options: List[str],
     approval_threshold: int = 2,
 ) -> Tuple[str, Dict[str, int]]:
@@ -32,17 +171,15 @@ def approval_voting(
     Returns:
         (winner, approval_counts)
     """
-    counts = {o: 0 for o in options}
-    for ballot in ballots:
-        for candidate in ballot[:approval_threshold]:
-            if candidate in counts:
-                counts[candidate] += 1
+    profile = as_profile(ballots, options)
+    approved = profile.approvals(approval_threshold)
+    counts = {o: int(approved[i]) for i, o in enumerate(profile.options)}
     winner = max(counts, key=counts.get) if counts else None
     return winner, counts
 
 
 def stv(
-    ballots: List[List[str]],
+    ballots: Ballots,
     options: List[str],
     seats: int = 1,
 ) -> Tuple[List[str], List[dict]]:
@@ -59,21 +196,29 @@ def stv(
     Returns:
         (winners, elimination_rounds)
     """
+    profile = as_profile(ballots, options)
+    index = {o: i for i, o in enumerate(profile.options)}
     remaining = set(options)
-    active_ballots = [list(b) for b in ballots]
     winners = []
     rounds = []
-    quota = len(ballots) // (seats + 1) + 1
+    quota = profile.n_ballots // (seats + 1) + 1
+    rows = np.arange(len(profile.ranks))
 
     while remaining and len(winners) < seats:
-        # Count first preferences among remaining candidates
-        first_prefs = Counter()
-        for ballot in active_ballots:
-            # Find first remaining candidate in ballot
-            for candidate in ballot:
-                if candidate in remaining:
-                    first_prefs[candidate] += 1
-                    break
+        # First remaining candidate of every ballot row, weighted
+        active = np.zeros(len(profile.options), dtype=bool)
+        active[[index[c] for c in remaining]] = True
+        masked = np.where(active, profile.ranks, UNRANKED)
+        first = masked.argmin(axis=1)
+        counted = masked[rows, first] != UNRANKED
+        tallies = np.bincount(
+            first[counted], weights=profile.weights[counted], minlength=len(active)
+        )
+        # Candidates in order of first encounter, as a ballot scan sees them
+        seen, first_rows = np.unique(first[counted], return_index=True)
+        first_prefs = {
+            profile.options[c]: int(tallies[c]) for c in seen[np.argsort(first_rows)]
+        }
 
         if not first_prefs:
             break
@@ -107,11 +252,14 @@ def stv(
 
 
 def copeland(
-    ballots: List[List[str]],
+    ballots: Ballots,
     options: List[str],
 ) -> Tuple[str, Dict[str, int]]:
     """Copeland's method: pairwise majority wins minus losses.
 
+    A candidate missing from a ballot counts as ranked below every
+    candidate that ballot does rank.
+
     Args:
         ballots: List of ranked preference lists.
         options: All candidate options.
@@ -119,97 +267,235 @@ def copeland(
     Returns:
         (winner, copeland_scores)
     """
+    profile = as_profile(ballots, options)
+    d = profile.pairwise(unranked_last=True)
+    net = np.sign(d - d.T).sum(axis=1)
     scores = {o: 0 for o in options}
-    for a in options:
-        for b in options:
-            if a == b:
-                continue
-            a_wins = 0
-            b_wins = 0
-            for ballot in ballots:
-                a_idx = ballot.index(a) if a in ballot else len(ballot)
-                b_idx = ballot.index(b) if b in ballot else len(ballot)
-                if a_idx < b_idx:
-                    a_wins += 1
-                elif b_idx < a_idx:
-                    b_wins += 1
-            if a_wins > b_wins:
-                scores[a] += 1
-            elif b_wins > a_wins:
-                scores[a] -= 1
+    for i, o in enumerate(profile.options):
+        scores[o] += int(net[i])
     winner = max(scores, key=scores.get) if scores else None
     return winner, scores
 
 
-# Maximum candidate count for exact Kemeny-Young (O(n!) enumeration).
-# Beyond this threshold, the safe wrapper falls back to Copeland (#971).
-_MAX_KEMENY_CANDIDATES = 8
+# Maximum candidate count for exact Kemeny-Young. Up to
+# _MAX_KEMENY_DP_CANDIDATES the subset dynamic programme (O(2^n * n^2) time,
+# O(2^n) memory) is used; above, a node-bounded branch and bound. Beyond
+# _MAX_KEMENY_CANDIDATES the safe wrapper falls back to Copeland (#971).
+_MAX_KEMENY_CANDIDATES = 32
+_MAX_KEMENY_DP_CANDIDATES = 20
+_KEMENY_BNB_NODE_LIMIT = 10_000
+
+
+def _kemeny_dp(d: np.ndarray) -> Tuple[List[int], int]:
+    """Exact Kemeny ranking by dynamic programming over candidate subsets.
+
+    ``rest[S]`` is the best score obtainable by ranking the candidates not in
+    ``S`` below those of ``S``; placing ``c`` right after ``S`` gains
+    ``sum(d[S, c])``. Subsets are processed by decreasing size, one NumPy
+    pass per subset size. The ranking is rebuilt front to back taking
+    the lowest-index optimal candidate each time, i.e. the lexicographically
+    first optimal permutation (the one full enumeration would report).
+    """
+    n = len(d)
+    full = (1 << n) - 1
+    popcount = np.zeros(1 << n, dtype=np.int8)
+    for i in range(n):
+        popcount[1 << i : 1 << (i + 1)] = popcount[: 1 << i] + 1
+    by_size = np.argsort(popcount, kind="stable")
+    bounds = np.concatenate(([0], np.cumsum(np.bincount(popcount, minlength=n + 1))))
+    # BLAS matmul, exact below 2**53. The diagonal penalty makes the column
+    # of every candidate already in S hugely negative, so it is never chosen.
+    weights = d.astype(np.float64) - np.eye(n) * 2.0**62
+    bits = np.arange(n, dtype=np.int32)
+
+    rest = np.zeros(1 << n, dtype=np.float64)
+    for size in range(n - 1, -1, -1):
+        subsets = by_size[bounds[size] : bounds[size + 1]].astype(np.int32)
+        members = ((subsets[:, None] >> bits) & 1).astype(np.float64)
+        value = members @ weights
+        value += rest[subsets[:, None] | (1 << bits)]
+        best = value.max(axis=1)
+        rest[subsets] = best
+
+    ranking: List[int] = []
+    placed = 0
+    while placed != full:
+        for c in range(n):
+            if placed >> c & 1:
+                continue
+            gain = sum(int(d[p, c]) for p in ranking)
+            if gain + rest[placed | (1 << c)] == rest[placed]:
+                ranking.append(c)
+                placed |= 1 << c
+                break
+    return ranking, int(rest[0])
+
+
+def _ranking_score(d: List[List[int]], ranking: List[int]) -> int:
+    return sum(
+        d[ranking[i]][ranking[j]]
+        for i in range(len(ranking))
+        for j in range(i + 1, len(ranking))
+    )
+
+
+def _kemeny_local_search(d: List[List[int]], ranking: List[int]) -> List[int]:
+    """Improve ``ranking`` by single-candidate moves until none helps."""
+    ranking = list(ranking)
+    improved = True
+    while improved:
+        improved = False
+        for i in range(len(ranking)):
+            c = ranking[i]
+            # Delta of moving c to each other position, scanning outwards
+            best_delta, best_pos, delta = 0, i, 0
+            for j in range(i - 1, -1, -1):
+                delta += d[c][ranking[j]] - d[ranking[j]][c]
+                if delta > best_delta:
+                    best_delta, best_pos = delta, j
+            delta = 0
+            for j in range(i + 1, len(ranking)):
+                delta += d[ranking[j]][c] - d[c][ranking[j]]
+                if delta > best_delta:
+                    best_delta, best_pos = delta, j
+            if best_pos != i:
+                ranking.insert(best_pos, ranking.pop(i))
+                improved = True
+    return ranking
+
+
+def _kemeny_branch_and_bound(
+    d: np.ndarray, node_limit: int = _KEMENY_BNB_NODE_LIMIT
+) -> Tuple[List[int], int, bool]:
+    """Kemeny ranking by depth-first branch and bound.
+
+    The incumbent starts from the local-search-improved Copeland order.
+    A prefix is pruned when its score plus ``max(d[a, b], d[b, a])`` over the
+    unplaced pairs cannot beat the incumbent. Returns
+    ``(ranking, score, proven_optimal)``; ``proven_optimal`` is False when
+    ``node_limit`` nodes were expanded before the search space was closed.
+    """
+    n = len(d)
+    m = d.tolist()
+    strength = np.sign(d - d.T).sum(axis=1) * (n * n) + d.sum(axis=1)
+    incumbent = _kemeny_local_search(m, list(np.argsort(-strength, kind="stable")))
+    best = [_ranking_score(m, incumbent), incumbent]
+
+    pair_max = np.maximum(d, d.T)
+    # out[c]: sum of d[c, r] over unplaced r; cap: pair bound of unplaced set
+    out = d.sum(axis=1).tolist()
+    cap = [int(np.triu(pair_max, 1).sum())]
+    pm = pair_max.tolist()
+    nodes = [0]
+    prefix: List[int] = []
+    unplaced = set(range(n))
+
+    def search(score: int) -> bool:
+        if not unplaced:
+            if score > best[0]:
+                best[0], best[1] = score, list(prefix)
+            return True
+        if score + cap[0] <= best[0]:
+            return True
+        nodes[0] += 1
+        if nodes[0] > node_limit:
+            return False
+        for c in sorted(unplaced, key=lambda x: -out[x]):
+            gain = out[c]  # c precedes every other unplaced candidate
+            unplaced.discard(c)
+            removed = sum(pm[c][r] for r in unplaced)
+            cap[0] -= removed
+            for r in unplaced:
+                out[r] -= m[r][c]
+            prefix.append(c)
+            complete = search(score + gain)
+            prefix.pop()
+            for r in unplaced:
+                out[r] += m[r][c]
+            cap[0] += removed
+            unplaced.add(c)
+            if not complete:
+                return False
+        return True
+
+    proven = search(0)
+    return best[1], best[0], proven
 
 
 def kemeny_young(
-    ballots: List[List[str]],
+    ballots: Ballots,
     options: List[str],
+    method: str = "auto",
 ) -> Tuple[List[str], int]:
     """Kemeny-Young method: find the ranking minimizing total disagreement.
 
-    Warning: O(n!) complexity — only practical for ≤_MAX_KEMENY_CANDIDATES candidates.
-    Raises ValueError above that threshold.  Use kemeny_young_safe() for automatic
-    Copeland fallback (#971).
+    Exact for up to _MAX_KEMENY_CANDIDATES candidates: subset dynamic
+    programming (``method="dp"``, at most _MAX_KEMENY_DP_CANDIDATES) or branch
+    and bound (``method="branch_and_bound"``); ``"auto"`` picks the DP when it
+    fits. Raises ValueError above that threshold, or when branch and bound
+    cannot prove optimality within its node budget. Use kemeny_young_safe()
+    for an automatic fallback (#971).
 
     Args:
         ballots: List of ranked preference lists.
         options: All candidate options.
+        method: "auto", "dp" or "branch_and_bound".
 
     Returns:
         (optimal_ranking, kemeny_score)
     """
-    if len(options) > _MAX_KEMENY_CANDIDATES:
+    ranking, score, exact = _kemeny(ballots, options, method)
+    if not exact:
+        raise ValueError(
+            f"Kemeny-Young is impractical for {len(options)} candidates: "
+            f"branch and bound exhausted its {_KEMENY_BNB_NODE_LIMIT} node budget. "
+            f"Use kemeny_young_safe() for an approximate ranking. (#971)"
+        )
+    return ranking, score
+
+
+def _kemeny(
+    ballots: Ballots, options: List[str], method: str = "auto"
+) -> Tuple[List[str], int, bool]:
+    n = len(options)
+    if n > _MAX_KEMENY_CANDIDATES:
         raise ValueError(
-            f"Kemeny-Young is impractical for {len(options)} candidates "
+            f"Kemeny-Young is impractical for {n} candidates "
             f"(max {_MAX_KEMENY_CANDIDATES}). "
             f"Use kemeny_young_safe() for Copeland fallback. (#971)"
         )
+    if method == "auto":
+        method = "dp" if n <= _MAX_KEMENY_DP_CANDIDATES else "branch_and_bound"
+    if method == "dp" and n > _MAX_KEMENY_DP_CANDIDATES:
+        raise ValueError(
+            f"Kemeny-Young dynamic programming is impractical for {n} candidates "
+            f"(max {_MAX_KEMENY_DP_CANDIDATES}); use method='branch_and_bound'."
+        )
+    if method not in ("dp", "branch_and_bound"):
+        raise ValueError(f"Unknown Kemeny-Young method: {method!r}")
+    if n == 0:
+        return [], 0, True
 
-    # Build pairwise preference matrix
-    pairwise = {}
-    for a in options:
-        for b in options:
-            if a != b:
-                count = sum(
-                    1
-                    for ballot in ballots
-                    if (
-                        a in ballot
-                        and b in ballot
-                        and ballot.index(a) < ballot.index(b)
-                    )
-                )
-                pairwise[(a, b)] = count
-
-    best_ranking = None
-    best_score = -1
-
-    for perm in itertools.permutations(options):
-        score = 0
-        for i in range(len(perm)):
-            for j in range(i + 1, len(perm)):
-                score += pairwise.get((perm[i], perm[j]), 0)
-        if score > best_score:
-            best_score = score
-            best_ranking = list(perm)
-
-    return best_ranking, best_score
+    profile = as_profile(ballots, options)
+    d = profile.pairwise()
+    if method == "dp":
+        order, score = _kemeny_dp(d)
+        exact = True
+    else:
+        order, score, exact = _kemeny_branch_and_bound(d)
+    return [profile.options[i] for i in order], score, exact
 
 
 def kemeny_young_safe(
-    ballots: List[List[str]],
+    ballots: Ballots,
     options: List[str],
 ) -> Tuple[List[str], int, bool]:
-    """Kemeny-Young with Copeland fallback for large candidate sets (#971).
+    """Kemeny-Young with fallbacks for large candidate sets (#971).
 
-    When the number of candidates is within the enumeration limit, delegates
-    to kemeny_young() for the exact result.  When it exceeds the limit,
-    falls back to a Copeland-score-based ranking (O(n²) instead of O(n!)).
+    Within _MAX_KEMENY_CANDIDATES the ranking is computed exactly; if branch
+    and bound runs out of budget, its best ranking found so far is returned
+    with its true score, flagged approximate. Beyond the limit, falls back to
+    a Copeland-score-based ranking (O(n²)).
 
     Args:
         ballots: List of ranked preference lists.
@@ -217,21 +503,20 @@ def kemeny_young_safe(
 
     Returns:
         (ranking, score, approximate) where approximate=True means the
-        ranking is a Copeland approximation, not an exact Kemeny-Young result.
+        ranking is not a proven Kemeny-Young optimum (score is -1 for the
+        Copeland fallback).
     """
     if len(options) <= _MAX_KEMENY_CANDIDATES:
-        ranking, score = kemeny_young(ballots, options)
-        return ranking, score, False
+        ranking, score, exact = _kemeny(ballots, options)
+        return ranking, score, not exact
     # Copeland fallback — O(n²) polynomial approximation
     _, copeland_scores = copeland(ballots, options)
-    ranking = sorted(
-        options, key=lambda o: copeland_scores.get(o, 0), reverse=True
-    )
+    ranking = sorted(options, key=lambda o: copeland_scores.get(o, 0), reverse=True)
     return ranking, -1, True
 
 
 def schulze(
-    ballots: List[List[str]],
+    ballots: Ballots,
     options: List[str],
 ) -> Tuple[str, Dict[str, Dict[str, int]]]:
     """Schulze method (Beatpath): strongest path between all pairs.
@@ -243,47 +528,29 @@ def schulze(
     Returns:
         (winner, strongest_paths_matrix)
     """
+    profile = as_profile(ballots, options)
+    options = profile.options
     n = len(options)
-    idx = {o: i for i, o in enumerate(options)}
-
-    # Build pairwise preference counts
-    d = [[0] * n for _ in range(n)]
-    for ballot in ballots:
-        for i, a in enumerate(ballot):
-            if a not in idx:
-                continue
-            for b in ballot[i + 1 :]:
-                if b not in idx:
-                    continue
-                d[idx[a]][idx[b]] += 1
-
-    # Floyd-Warshall for strongest paths
-    p = [[0] * n for _ in range(n)]
-    for i in range(n):
-        for j in range(n):
-            if i != j:
-                if d[i][j] > d[j][i]:
-                    p[i][j] = d[i][j]
+    d = profile.occurrence_pairwise()
 
+    # Floyd-Warshall for strongest paths, one (n x n) array update per k.
+    # Diagonal entries may grow but never raise an off-diagonal path.
+    p = np.where(d > d.T, d, 0)
     for k in range(n):
-        for i in range(n):
-            if i == k:
-                continue
-            for j in range(n):
-                if j == i or j == k:
-                    continue
-                p[i][j] = max(p[i][j], min(p[i][k], p[k][j]))
+        p = np.maximum(p, np.minimum(p[:, k : k + 1], p[k : k + 1, :]))
+    np.fill_diagonal(p, 0)
 
     # Winner: candidate who beats all others in strongest paths
+    wins = (p > p.T).sum(axis=1)
     scores = {o: 0 for o in options}
-    for i in range(n):
-        for j in range(n):
-            if i != j and p[i][j] > p[j][i]:
-                scores[options[i]] += 1
+    for i, o in enumerate(options):
+        scores[o] += int(wins[i])
 
     winner = max(scores, key=scores.get) if scores else None
+    rows = p.tolist()
     paths = {
-        options[i]: {options[j]: p[i][j] for j in range(n) if i != j} for i in range(n)
+        options[i]: {options[j]: rows[i][j] for j in range(n) if i != j}
+        for i in range(n)
     }
     return winner, paths
 
@@ -292,47 +559,30 @@ def schulze(
 
 
 def condorcet_winner(
-    ballots: List[List[str]],
+    ballots: Ballots,
     options: List[str],
 ) -> Optional[str]:
     """Find Condorcet winner if one exists (beats all others pairwise)."""
-    for candidate in options:
-        beats_all = True
-        for other in options:
-            if candidate == other:
-                continue
-            wins = sum(
-                1
-                for b in ballots
-                if candidate in b and other in b and b.index(candidate) < b.index(other)
-            )
-            losses = sum(
-                1
-                for b in ballots
-                if candidate in b and other in b and b.index(other) < b.index(candidate)
-            )
-            if wins <= losses:
-                beats_all = False
-                break
-        if beats_all:
-            return candidate
+    profile = as_profile(ballots, options)
+    d = profile.pairwise()
+    beats = d > d.T
+    np.fill_diagonal(beats, True)
+    for i in np.flatnonzero(beats.all(axis=1)):
+        return profile.options[i]
     return None
 
 
 def pairwise_matrix(
-    ballots: List[List[str]],
+    ballots: Ballots,
     options: List[str],
 ) -> Dict[str, Dict[str, int]]:
     """Build pairwise preference matrix from ballots."""
-    matrix = {a: {b: 0 for b in options if b != a} for a in options}
-    for ballot in ballots:
-        for i, a in enumerate(ballot):
-            if a not in matrix:
-                continue
-            for b in ballot[i + 1 :]:
-                if b in matrix.get(a, {}):
-                    matrix[a][b] += 1
-    return matrix
+    profile = as_profile(ballots, options)
+    rows = profile.occurrence_pairwise().tolist()
+    index = {o: i for i, o in enumerate(profile.options)}
+    return {
+        a: {b: rows[index[a]][index[b]] for b in options if b != a} for a in options
+    }
 
 
 SOCIAL_CHOICE_METHODS = {
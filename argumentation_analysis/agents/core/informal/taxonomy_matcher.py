@@ -0,0 +1,271 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+"""
+Appariement lexical précompilé de la taxonomie des sophismes.
+
+Le détecteur parcourait tout le DataFrame de la taxonomie (``iterrows``) à
+chaque appel et testait chaque nom, nom vulgarisé et mot-clé par sous-chaîne,
+puis relançait des filtrages pandas pour le contexte de branche et les
+sophismes apparentés. Ce module construit une fois par chargement de
+taxonomie :
+
+- un automate d'Aho-Corasick sur les termes normalisés (minuscules, accents
+  repliés), qui trouve tous les termes présents en un seul passage linéaire
+  sur le texte ;
+- des index précalculés (enfants directs, descendants du parent) qui
+  remplacent les scans du DataFrame lors de l'enrichissement.
+
+La sémantique de l'heuristique est conservée : correspondance par
+sous-chaîne, 0.7 pour le nom vulgarisé, 0.5 pour le nom officiel, 0.1 par
+mot-clé de description (les 5 premiers mots de plus de 4 lettres). Les
+cellules vides (NaN) ne produisent plus de terme.
+"""
+
+import unicodedata
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import pandas as pd
+
+NOM_VULGARISE_WEIGHT = 0.7
+NAME_WEIGHT = 0.5
+KEYWORD_WEIGHT = 0.1
+MAX_KEYWORDS = 5
+MIN_KEYWORD_LENGTH = 5
+
+
+def fold_text(text: str) -> str:
+    """Minuscules, accents retirés et apostrophes typographiques unifiées."""
+    decomposed = unicodedata.normalize("NFKD", text.casefold())
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return stripped.replace("’", "'").replace("ʼ", "'")
+
+
+def cell_text(value: Any) -> str:
+    """Texte d'une cellule du DataFrame ; chaîne vide pour NaN/None."""
+    if value is None:
+        return ""
+    try:
+        if pd.isna(value):
+            return ""
+    except (TypeError, ValueError):
+        pass
+    return str(value)
+
+
+class AhoCorasick:
+    """Automate d'Aho-Corasick sur un ensemble fixe de motifs.
+
+    ``find_all(text)`` renvoie les indices des motifs présents au moins une
+    fois dans ``text`` (recherche de sous-chaînes, chevauchements compris).
+    """
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: List[str] = []
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[int]] = [[]]
+        # Prochain état terminal le long des liens d'échec (-1 : aucun).
+        self._dict_link: List[int] = [-1]
+        for pattern in patterns:
+            self._insert(pattern)
+        self._link()
+
+    def _insert(self, pattern: str) -> None:
+        index = len(self.patterns)
+        self.patterns.append(pattern)
+        if not pattern:
+            return
+        state = 0
+        for char in pattern:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][char] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+                self._dict_link.append(-1)
+            state = nxt
+        self._output[state].append(index)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(char, 0)
+                self._fail[child] = target if target != child else 0
+                link = self._fail[child]
+                self._dict_link[child] = (
+                    link if self._output[link] else self._dict_link[link]
+                )
+
+    def find_all(self, text: str) -> Set[int]:
+        found: Set[int] = set()
+        goto, fail, output, dict_link = (
+            self._goto,
+            self._fail,
+            self._output,
+            self._dict_link,
+        )
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            terminal = state if output[state] else dict_link[state]
+            while terminal > 0:
+                found.update(output[terminal])
+                terminal = dict_link[terminal]
+        return found
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+
+@dataclass
+class TaxonomyEntry:
+    """Champs d'un nœud de la taxonomie utilisés par le détecteur."""
+
+    pk: int
+    position: int
+    name: str
+    nom_vulgarise: str
+    famille: str
+    description: str
+    depth: int
+    path: str
+    # (indice du terme, libellé de correspondance, poids), dans l'ordre de
+    # l'heuristique historique.
+    terms: List[Tuple[int, str, float]] = field(default_factory=list)
+
+
+class TaxonomyMatcher:
+    """Index précompilé d'une taxonomie de sophismes.
+
+    Construit une fois à partir du DataFrame préparé par
+    ``InformalAnalysisPlugin`` (index = PK).
+    """
+
+    def __init__(self, df: pd.DataFrame) -> None:
+        self.source = df
+        self.entries: Dict[int, TaxonomyEntry] = {}
+        term_ids: Dict[str, int] = {}
+        self._term_entries: List[List[int]] = []
+
+        def term(text: str) -> int:
+            folded = fold_text(text)
+            if folded not in term_ids:
+                term_ids[folded] = len(term_ids)
+                self._term_entries.append([])
+            return term_ids[folded]
+
+        for position, (pk, row) in enumerate(df.iterrows()):
+            entry = TaxonomyEntry(
+                pk=int(pk),
+                position=position,
+                name=cell_text(row.get("Name", "")),
+                nom_vulgarise=cell_text(row.get("nom_vulgarisé", "")),
+                famille=cell_text(row.get("Famille", "")),
+                description=cell_text(row.get("text_fr", "")),
+                depth=int(row["depth"]) if pd.notna(row.get("depth")) else 0,
+                path=cell_text(row.get("path", "")),
+            )
+            nom_vulgarise = entry.nom_vulgarise.lower()
+            name = entry.name.lower()
+            if nom_vulgarise:
+                entry.terms.append(
+                    (
+                        term(nom_vulgarise),
+                        f"Nom vulgarisé: '{nom_vulgarise}'",
+                        NOM_VULGARISE_WEIGHT,
+                    )
+                )
+            if name:
+                entry.terms.append((term(name), f"Nom officiel: '{name}'", NAME_WEIGHT))
+            keywords = [
+                w
+                for w in entry.description.lower().split()
+                if len(w) >= MIN_KEYWORD_LENGTH
+            ]
+            for word in keywords[:MAX_KEYWORDS]:
+                entry.terms.append((term(word), f"Mot-clé: '{word}'", KEYWORD_WEIGHT))
+            for term_id, _, _ in entry.terms:
+                if not self._term_entries[term_id] or (
+                    self._term_entries[term_id][-1] != entry.pk
+                ):
+                    self._term_entries[term_id].append(entry.pk)
+            self.entries[entry.pk] = entry
+
+        self.automaton = AhoCorasick(term_ids)
+        self._build_hierarchy(df)
+
+    # ── Index hiérarchiques ──
+
+    def _build_hierarchy(self, df: pd.DataFrame) -> None:
+        self.children: Dict[int, List[int]] = {pk: [] for pk in self.entries}
+        by_path = {e.path: e.pk for e in self.entries.values() if e.path}
+        parent_column = next(
+            (c for c in ("FK_Parent", "parent_pk") if c in df.columns), None
+        )
+        for pk, entry in self.entries.items():
+            parent: Optional[int] = None
+            if parent_column is not None:
+                value = df.at[pk, parent_column]
+                if pd.notna(value) and int(value) in self.entries:
+                    parent = int(value)
+            elif "." in entry.path:
+                parent = by_path.get(entry.path.rsplit(".", 1)[0])
+            if parent is not None:
+                self.children[parent].append(pk)
+
+        # Descendants (ordre du DataFrame) de chaque chemin ayant des enfants :
+        # ce que renvoyait le filtre ``path.startswith(parent + ".")``.
+        self.descendants: Dict[str, List[int]] = {}
+        for entry in self.entries.values():
+            parts = entry.path.split(".") if entry.path else []
+            for cut in range(1, len(parts)):
+                self.descendants.setdefault(".".join(parts[:cut]), []).append(entry.pk)
+
+    def siblings(self, pk: int, limit: int = 5) -> Tuple[Optional[str], List[int]]:
+        """Chemin parent et nœuds apparentés (descendants du parent)."""
+        entry = self.entries.get(pk)
+        if entry is None or "." not in entry.path:
+            return None, []
+        parent_path = entry.path.rsplit(".", 1)[0]
+        related = []
+        for other in self.descendants.get(parent_path, []):
+            if other != pk:
+                related.append(other)
+                if len(related) == limit:
+                    break
+        return parent_path, related
+
+    # ── Détection ──
+
+    def scan(self, text: str) -> List[Tuple[TaxonomyEntry, float, List[str]]]:
+        """Correspondances lexicales de ``text``, dans l'ordre de la taxonomie.
+
+        Un seul passage de l'automate sur le texte replié ; seuls les nœuds
+        ayant au moins un terme présent sont ensuite évalués.
+        """
+        hits = self.automaton.find_all(fold_text(text))
+        candidates = {pk for term_id in hits for pk in self._term_entries[term_id]}
+        results = []
+        for pk in sorted(candidates, key=lambda k: self.entries[k].position):
+            entry = self.entries[pk]
+            confidence = 0.0
+            matches = []
+            for term_id, label, weight in entry.terms:
+                if term_id in hits:
+                    confidence += weight
+                    matches.append(label)
+            results.append((entry, confidence, matches))
+        return results
@@ -18,9 +18,13 @@ from pathlib import Path
 
 # Import de l'InformalAnalysisPlugin pour accéder à la taxonomie
 from .informal_definitions import InformalAnalysisPlugin
+from .taxonomy_matcher import TaxonomyMatcher
 
 logger = logging.getLogger("TaxonomySophismDetector")
 
+# Nombre maximal d'enfants listés par nœud lors de l'exploration d'une branche.
+MAX_BRANCH_CHILDREN = 20
+
 
 class TaxonomySophismDetector:
     """
@@ -37,6 +41,8 @@ class TaxonomySophismDetector:
             aux données de la taxonomie.
         _taxonomy_cache (Optional[pd.DataFrame]): Cache pour le DataFrame de
             la taxonomie afin d'éviter les lectures répétées.
+        _matcher (Optional[TaxonomyMatcher]): Automate et index hiérarchiques
+            construits une fois par chargement de la taxonomie.
         logger: Instance du logger pour ce module.
     """
 
@@ -50,8 +56,13 @@ class TaxonomySophismDetector:
                 utilisera son chemin par défaut.
         """
         self.logger = logging.getLogger("TaxonomySophismDetector")
-        self.plugin = InformalAnalysisPlugin(taxonomy_file_path=taxonomy_file_path)
+        # Le plugin ne sert ici qu'au chargement de la taxonomie : aucun
+        # kernel n'est nécessaire.
+        self.plugin = InformalAnalysisPlugin(
+            kernel=None, taxonomy_file_path=taxonomy_file_path
+        )
         self._taxonomy_cache = None
+        self._matcher = None
 
     def _get_taxonomy_df(self) -> pd.DataFrame:
         """
@@ -64,6 +75,26 @@ class TaxonomySophismDetector:
             self._taxonomy_cache = self.plugin._get_taxonomy_dataframe()
         return self._taxonomy_cache
 
+    def _get_matcher(self) -> TaxonomyMatcher:
+        """
+        Récupère l'index précompilé de la taxonomie.
+
+        L'index est construit au premier appel puis reconstruit seulement si
+        le DataFrame de la taxonomie a été rechargé.
+
+        Returns:
+            TaxonomyMatcher: L'automate des termes et les index hiérarchiques.
+        """
+        df = self._get_taxonomy_df()
+        matcher = getattr(self, "_matcher", None)
+        if matcher is None or matcher.source is not df:
+            self._matcher = TaxonomyMatcher(df)
+            self.logger.info(
+                f"Index de taxonomie construit: {len(self._matcher.entries)} nœuds, "
+                f"{len(self._matcher.automaton)} états d'automate"
+            )
+        return self._matcher
+
     def get_main_branches(self) -> List[Dict[str, Any]]:
         """
         Récupère les branches principales (racines) de la taxonomie.
@@ -116,28 +147,51 @@ class TaxonomySophismDetector:
             de la branche, incluant le nœud courant et ses enfants.
         """
         try:
-            # Utiliser la méthode du plugin pour explorer la hiérarchie
-            result = self.plugin._internal_explore_hierarchy(
-                current_pk=taxonomy_key, df=self._get_taxonomy_df(), max_children=20
-            )
-
-            if result.get("error"):
+            matcher = self._get_matcher()
+            entry = matcher.entries.get(taxonomy_key)
+            if entry is None:
+                error = f"PK {taxonomy_key} non trouvée dans la taxonomie."
                 self.logger.warning(
-                    f"Erreur d'exploration pour la clé {taxonomy_key}: {result['error']}"
+                    f"Erreur d'exploration pour la clé {taxonomy_key}: {error}"
                 )
-                return result
-
-            # Enrichir avec les sous-branches si nécessaire
-            if result.get("children") and max_depth > 1:
-                for child in result["children"]:
-                    child_key = child.get("pk")
-                    if child_key:
-                        child["sub_branches"] = self.explore_branch(
-                            child_key, max_depth - 1
-                        )
+                return {"current_node": None, "children": [], "error": error}
+
+            result = {
+                "current_node": {
+                    "pk": entry.pk,
+                    "path": entry.path,
+                    "depth": entry.depth,
+                    "Name": entry.name,
+                    "nom_vulgarise": entry.nom_vulgarise,
+                    "famille": entry.famille,
+                    "description_courte": entry.description,
+                },
+                "children": [],
+                "error": None,
+            }
+            children = matcher.children[taxonomy_key]
+            if len(children) > MAX_BRANCH_CHILDREN:
+                result["children_truncated"] = True
+                result["total_children"] = len(children)
+
+            for child_key in children[:MAX_BRANCH_CHILDREN]:
+                child_entry = matcher.entries[child_key]
+                child = {
+                    "pk": child_key,
+                    "nom_vulgarise": child_entry.nom_vulgarise,
+                    "description_courte": child_entry.description,
+                    "famille": child_entry.famille,
+                    "has_children": bool(matcher.children[child_key]),
+                }
+                # Enrichir avec les sous-branches si nécessaire
+                if max_depth > 1:
+                    child["sub_branches"] = self.explore_branch(
+                        child_key, max_depth - 1
+                    )
+                result["children"].append(child)
 
             self.logger.debug(
-                f"Branche {taxonomy_key} explorée avec {len(result.get('children', []))} enfants"
+                f"Branche {taxonomy_key} explorée avec {len(result['children'])} enfants"
             )
             return result
 
@@ -180,51 +234,22 @@ class TaxonomySophismDetector:
         detected_sophisms = []
 
         try:
-            df = self._get_taxonomy_df()
-            text_lower = text.lower()
-
-            # 1. Analyse lexicale basée sur les noms et descriptions
-            for pk, row in df.iterrows():
-                confidence = 0.0
-                matches = []
-
-                # Vérifier les correspondances avec les noms
-                name = str(row.get("Name", "")).lower()
-                nom_vulgarise = str(row.get("nom_vulgarisé", "")).lower()
-                description = str(row.get("text_fr", "")).lower()
-
-                # Correspondance avec le nom vulgarisé (plus probable)
-                if nom_vulgarise and nom_vulgarise in text_lower:
-                    confidence += 0.7
-                    matches.append(f"Nom vulgarisé: '{nom_vulgarise}'")
-
-                # Correspondance avec le nom officiel
-                if name and name in text_lower:
-                    confidence += 0.5
-                    matches.append(f"Nom officiel: '{name}'")
-
-                # Correspondance avec des mots-clés de la description
-                if description:
-                    desc_words = [w for w in description.split() if len(w) > 4]
-                    for word in desc_words[
-                        :5
-                    ]:  # Limiter aux 5 premiers mots significatifs
-                        if word in text_lower:
-                            confidence += 0.1
-                            matches.append(f"Mot-clé: '{word}'")
+            matcher = self._get_matcher()
 
+            # 1. Analyse lexicale : un seul passage de l'automate sur le texte
+            for entry, confidence, matches in matcher.scan(text):
                 # Si on a des correspondances significatives
                 if confidence >= 0.3:
                     sophism = {
-                        "taxonomy_key": int(pk),
-                        "name": row.get("Name", ""),
-                        "nom_vulgarise": row.get("nom_vulgarisé", ""),
-                        "famille": row.get("Famille", ""),
-                        "description": row.get("text_fr", ""),
+                        "taxonomy_key": entry.pk,
+                        "name": entry.name,
+                        "nom_vulgarise": entry.nom_vulgarise,
+                        "famille": entry.famille,
+                        "description": entry.description,
                         "confidence": min(confidence, 1.0),
                         "matches": matches,
-                        "depth": int(row.get("depth", 0)),
-                        "path": row.get("path", ""),
+                        "depth": entry.depth,
+                        "path": entry.path,
                         "detection_method": "taxonomy_lexical",
                     }
                     detected_sophisms.append(sophism)
@@ -266,44 +291,24 @@ class TaxonomySophismDetector:
             une liste des nœuds frères.
         """
         try:
-            df = self._get_taxonomy_df()
-
-            if taxonomy_key not in df.index:
-                return {"siblings": []}
-
-            current_row = df.loc[taxonomy_key]
-            current_path = current_row.get("path", "")
-
-            if not current_path:
-                return {"siblings": []}
-
-            # Trouver le path parent
-            path_parts = str(current_path).split(".")
-            if len(path_parts) <= 1:
+            matcher = self._get_matcher()
+            parent_path, related = matcher.siblings(taxonomy_key, limit=5)
+            if parent_path is None:
                 return {"siblings": []}
 
-            parent_path = ".".join(path_parts[:-1])
-
-            # Trouver les frères/sœurs (même parent)
-            siblings = df[
-                df["path"].astype(str).str.startswith(parent_path + ".", na=False)
-            ]
-            siblings = siblings[siblings.index != taxonomy_key]  # Exclure soi-même
-
             siblings_list = []
-            for _, sibling in siblings.iterrows():
-                sibling_info = {
-                    "taxonomy_key": int(sibling.name),
-                    "name": sibling.get("Name", ""),
-                    "nom_vulgarise": sibling.get("nom_vulgarisé", ""),
-                    "description_courte": sibling.get("text_fr", ""),
-                }
-                siblings_list.append(sibling_info)
+            for sibling_key in related:
+                sibling = matcher.entries[sibling_key]
+                siblings_list.append(
+                    {
+                        "taxonomy_key": sibling_key,
+                        "name": sibling.name,
+                        "nom_vulgarise": sibling.nom_vulgarise,
+                        "description_courte": sibling.description,
+                    }
+                )
 
-            return {
-                "parent_path": parent_path,
-                "siblings": siblings_list[:5],  # Limiter à 5 frères/sœurs
-            }
+            return {"parent_path": parent_path, "siblings": siblings_list}
 
         except Exception as e:
             self.logger.error(f"Erreur lors de la récupération du contexte parent: {e}")
@@ -0,0 +1,214 @@
+"""IN/OUT/UNDEC labelling engine for the grounded semantics of dung_native.
+
+The grounded labelling is computed in O(|A| + |R|) with the classic
+counter-based propagation (Modgil & Caminada 2009): an argument becomes IN
+once all its attackers are OUT, and every argument attacked by an IN
+argument becomes OUT. Arguments never reached stay UNDEC.
+
+Propagation is organised SCC by SCC in topological order of the condensed
+attack graph (Baroni, Giacomin & Guida 2005): the label of an argument only
+depends on its ancestors, so each strongly connected component is solved
+once its attacking components are final. The same property makes updates
+incremental — adding an attack ``(a, b)`` can only change labels of the
+arguments reachable from ``b``, so only the components in that region are
+recomputed.
+"""
+
+import logging
+from typing import Dict, Iterable, List, Set
+
+logger = logging.getLogger("DungLabelling")
+
+IN = "IN"
+OUT = "OUT"
+UNDEC = "UNDEC"
+
+
+class GroundedLabelling:
+    """Incrementally maintained grounded labelling of an attack graph.
+
+    The engine shares the adjacency dicts of its owner (``attackers`` maps an
+    argument to the set of its attackers, ``targets`` to the set of arguments
+    it attacks) and must be notified through :meth:`argument_added` and
+    :meth:`attack_added` after each mutation.
+    """
+
+    def __init__(
+        self,
+        attackers: Dict[str, Set[str]],
+        targets: Dict[str, Set[str]],
+    ) -> None:
+        self._attackers = attackers
+        self._targets = targets
+        self._labels: Dict[str, str] = {}
+        self._dirty: Set[str] = set(attackers)
+        self.stats: Dict[str, int] = {"relabelled": 0, "components_solved": 0}
+
+    # ── Change notification ──────────────────────────────────────────
+
+    def argument_added(self, arg: str) -> None:
+        """A new, isolated argument only needs its own label."""
+        self._dirty.add(arg)
+
+    def attack_added(self, source: str, target: str) -> None:
+        """Only arguments reachable from the target can change label."""
+        self._dirty.add(target)
+
+    def invalidate(self) -> None:
+        """Force a full relabelling (e.g. after direct mutation of the graph)."""
+        self._labels.clear()
+        self._dirty = set(self._attackers)
+
+    # ── Queries ──────────────────────────────────────────────────────
+
+    @property
+    def labels(self) -> Dict[str, str]:
+        """Current argument → IN/OUT/UNDEC mapping (recomputed lazily)."""
+        self._refresh()
+        return self._labels
+
+    def extension(self) -> Set[str]:
+        """The grounded extension: every argument labelled IN."""
+        return {arg for arg, label in self.labels.items() if label == IN}
+
+    def components(self) -> List[List[str]]:
+        """SCCs of the attack graph in topological order (attackers first)."""
+        return self.strongly_connected_components(self._attackers)
+
+    # ── Internals ────────────────────────────────────────────────────
+
+    def _refresh(self) -> None:
+        if not self._dirty:
+            return
+        region = self._downstream(self._dirty)
+        self._dirty = set()
+        for arg in region:
+            self._labels.pop(arg, None)
+        for component in self.strongly_connected_components(region):
+            self._solve_component(component)
+        self.stats["relabelled"] += len(region)
+
+    def _downstream(self, seeds: Iterable[str]) -> Set[str]:
+        """Every argument reachable from the seeds along attack edges."""
+        region: Set[str] = set()
+        stack = [s for s in seeds if s in self._attackers]
+        while stack:
+            arg = stack.pop()
+            if arg in region:
+                continue
+            region.add(arg)
+            stack.extend(t for t in self._targets.get(arg, ()) if t not in region)
+        return region
+
+    def strongly_connected_components(self, nodes: Iterable[str]) -> List[List[str]]:
+        """Iterative Tarjan on the subgraph induced by ``nodes``.
+
+        Tarjan emits components in reverse topological order of the edge
+        direction followed; walking attacker → target edges and reversing the
+        output puts attacking components first. ``nodes`` must be closed
+        under successors (true for the whole graph and any downstream region)
+        for the components to be those of the full graph.
+        """
+        node_set = set(nodes)
+        index: Dict[str, int] = {}
+        lowlink: Dict[str, int] = {}
+        on_stack: Set[str] = set()
+        stack: List[str] = []
+        result: List[List[str]] = []
+        counter = 0
+
+        for root in sorted(node_set):
+            if root in index:
+                continue
+            work = [(root, iter(self._targets.get(root, ())))]
+            index[root] = lowlink[root] = counter
+            counter += 1
+            stack.append(root)
+            on_stack.add(root)
+            while work:
+                node, successors = work[-1]
+                advanced = False
+                for succ in successors:
+                    if succ not in node_set:
+                        continue
+                    if succ not in index:
+                        index[succ] = lowlink[succ] = counter
+                        counter += 1
+                        stack.append(succ)
+                        on_stack.add(succ)
+                        work.append((succ, iter(self._targets.get(succ, ()))))
+                        advanced = True
+                        break
+                    if succ in on_stack:
+                        lowlink[node] = min(lowlink[node], index[succ])
+                if advanced:
+                    continue
+                work.pop()
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+                if lowlink[node] == index[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack.discard(member)
+                        component.append(member)
+                        if member == node:
+                            break
+                    result.append(sorted(component))
+        result.reverse()
+        return result
+
+    def _solve_component(self, component: List[str]) -> None:
+        """Label one SCC once all attacking components are final.
+
+        Attackers outside the component already carry their final label:
+        an IN one makes the argument OUT, an UNDEC one blocks it from IN.
+        Inside the component, the counter of not-yet-OUT attackers drives
+        the linear propagation; what is left unlabelled is UNDEC.
+        """
+        members = set(component)
+        pending: Dict[str, int] = {}
+        queue: List[str] = []
+        for arg in component:
+            count = 0
+            attacked_by_in = False
+            for attacker in self._attackers.get(arg, ()):
+                if attacker in members:
+                    count += 1
+                    continue
+                label = self._labels.get(attacker, UNDEC)
+                if label == IN:
+                    attacked_by_in = True
+                elif label == UNDEC:
+                    count += 1
+            if attacked_by_in:
+                self._labels[arg] = OUT
+            pending[arg] = count
+        for arg in component:
+            if arg not in self._labels and pending[arg] == 0:
+                queue.append(arg)
+        # OUT arguments labelled from outside still release their targets
+        released = [a for a in component if self._labels.get(a) == OUT]
+
+        def _release(out_arg: str) -> None:
+            for target in self._targets.get(out_arg, ()):
+                if target in members and target not in self._labels:
+                    pending[target] -= 1
+                    if pending[target] == 0:
+                        queue.append(target)
+
+        for arg in released:
+            _release(arg)
+        while queue:
+            arg = queue.pop()
+            if arg in self._labels:
+                continue
+            self._labels[arg] = IN
+            for target in self._targets.get(arg, ()):
+                if target in members and target not in self._labels:
+                    self._labels[target] = OUT
+                    _release(target)
+        for arg in component:
+            self._labels.setdefault(arg, UNDEC)
+        self.stats["components_solved"] += 1
@@ -5,6 +5,12 @@ Implements 5 classical semantics (grounded, preferred, stable, complete,
 admissible) without requiring Java/JPype. Serves as fallback when
 TweetyBridge is unavailable.
 
+When PySAT is installed, the exponential semantics are delegated to the
+CNF-based :class:`dung_sat.DungSATEngine` (no argument-count limit); the
+subset enumeration below is only the last-resort path without PySAT.
+The grounded extension comes from the incremental IN/OUT/UNDEC labelling
+of :class:`dung_labelling.GroundedLabelling`.
+
 Integrated from student project 1.2.1 (Da Silva, Badraoui, Jeyakumar),
 with algorithms rewritten in pure Python (the original delegated all
 computation to Tweety via JPype).
@@ -16,15 +22,29 @@ n-person games", Artificial Intelligence, 77(2), 1995.
 
 import logging
 from itertools import combinations
-from typing import Dict, FrozenSet, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
+
+from .dung_labelling import GroundedLabelling
+from .dung_sat import SAT_ENGINE_AVAILABLE, DungSATEngine
 
 logger = logging.getLogger("DungNative")
 
 # Maximum argument count for exponential enumeration semantics.
 # Beyond this threshold, only grounded (polynomial) is computed;
 # other semantics report honest unavailability (#970).
+# Only applies to the subset-enumeration fallback (PySAT missing).
 _MAX_ENUM_ARGS = 15
 
+# Maximum number of extensions returned by the SAT engine per semantics.
+# The framework size is no longer the bottleneck, the output size is:
+# n unattacked arguments have 2^n admissible sets.
+_MAX_SAT_EXTENSIONS = 4096
+
+
+def _ordered(extensions: Iterable[FrozenSet[str]]) -> List[FrozenSet[str]]:
+    """Order extensions by size then lexicographically (enumeration order)."""
+    return sorted(extensions, key=lambda ext: (len(ext), sorted(ext)))
+
 
 class DungFramework:
     """Pure-Python implementation of Dung's argumentation framework.
@@ -40,10 +60,21 @@ class DungFramework:
     def __init__(self) -> None:
         self.arguments: Set[str] = set()
         self.attacks: Set[Tuple[str, str]] = set()
+        # Adjacency indexes, kept in sync by add_argument/add_attack
+        self._attackers: Dict[str, Set[str]] = {}
+        self._targets: Dict[str, Set[str]] = {}
+        self._indexed_attacks = 0
+        self._labelling = GroundedLabelling(self._attackers, self._targets)
 
     def add_argument(self, name: str) -> None:
         """Add an argument to the framework."""
+        self._sync_index()
+        if name in self.arguments:
+            return
         self.arguments.add(name)
+        self._attackers[name] = set()
+        self._targets[name] = set()
+        self._labelling.argument_added(name)
 
     def add_attack(self, source: str, target: str) -> None:
         """Add an attack relation. Both arguments must exist."""
@@ -51,15 +82,44 @@ class DungFramework:
             self.add_argument(source)
         if target not in self.arguments:
             self.add_argument(target)
+        self._sync_index()
+        if (source, target) in self.attacks:
+            return
         self.attacks.add((source, target))
+        self._attackers[target].add(source)
+        self._targets[source].add(target)
+        self._indexed_attacks += 1
+        self._labelling.attack_added(source, target)
+
+    def _sync_index(self) -> None:
+        """Rebuild the indexes if ``arguments``/``attacks`` were mutated directly."""
+        if len(self._attackers) == len(self.arguments) and (
+            self._indexed_attacks == len(self.attacks)
+        ):
+            return
+        self._attackers.clear()
+        self._targets.clear()
+        for arg in self.arguments:
+            self._attackers[arg] = set()
+            self._targets[arg] = set()
+        for src, tgt in self.attacks:
+            self._attackers.setdefault(src, set())
+            self._targets.setdefault(src, set())
+            self._attackers.setdefault(tgt, set()).add(src)
+            self._targets.setdefault(tgt, set())
+            self._targets[src].add(tgt)
+        self._indexed_attacks = len(self.attacks)
+        self._labelling.invalidate()
 
     def attackers_of(self, arg: str) -> Set[str]:
         """Get all arguments that attack the given argument."""
-        return {src for src, tgt in self.attacks if tgt == arg}
+        self._sync_index()
+        return set(self._attackers.get(arg, ()))
 
     def attacked_by(self, arg: str) -> Set[str]:
         """Get all arguments attacked by the given argument."""
-        return {tgt for src, tgt in self.attacks if src == arg}
+        self._sync_index()
+        return set(self._targets.get(arg, ()))
 
     def is_attacked_by_set(self, arg: str, s: FrozenSet[str]) -> bool:
         """Check if arg is attacked by any member of set s."""
@@ -90,29 +150,51 @@ class DungFramework:
         """
         return frozenset(arg for arg in self.arguments if self.defends(s, arg))
 
+    def _sat_engine(self) -> Optional[DungSATEngine]:
+        """Build a SAT engine over the current graph, or None without PySAT."""
+        if not SAT_ENGINE_AVAILABLE:
+            return None
+        return DungSATEngine(self.arguments, self.attacks)
+
     # --- Semantics ---
 
     def grounded_extension(self) -> FrozenSet[str]:
         """Compute the grounded extension (least fixed point of F).
 
-        Iteratively applies the characteristic function starting from
-        the empty set until a fixed point is reached.
+        Read off the IN arguments of the grounded labelling, which is kept
+        up to date incrementally (see grounded_labelling()).
+        """
+        self._sync_index()
+        return frozenset(self._labelling.extension())
+
+    def grounded_labelling(self) -> Dict[str, str]:
+        """Grounded IN/OUT/UNDEC labelling of every argument.
+
+        Computed in O(|A| + |R|), SCC by SCC in topological order. After
+        add_argument/add_attack, only the arguments downstream of the change
+        are relabelled.
         """
-        current = frozenset()
-        while True:
-            next_set = self.characteristic_function(current)
-            if next_set == current:
-                return current
-            current = next_set
+        self._sync_index()
+        return dict(self._labelling.labels)
+
+    def strongly_connected_components(self) -> List[List[str]]:
+        """SCCs of the attack graph, attacking components first."""
+        self._sync_index()
+        return self._labelling.components()
 
     def admissible_sets(self) -> List[FrozenSet[str]]:
         """Compute all admissible sets.
 
         A set S is admissible iff it is conflict-free and defends all its members.
 
-        Raises RuntimeError if the framework has more than _MAX_ENUM_ARGS arguments
-        (exponential enumeration would be too costly).
+        Uses the SAT engine when available (RuntimeError beyond
+        _MAX_SAT_EXTENSIONS sets). Otherwise raises RuntimeError if the
+        framework has more than _MAX_ENUM_ARGS arguments (exponential
+        enumeration would be too costly).
         """
+        engine = self._sat_engine()
+        if engine is not None:
+            return _ordered(engine.admissible_sets(limit=_MAX_SAT_EXTENSIONS))
         if len(self.arguments) > _MAX_ENUM_ARGS:
             raise RuntimeError(
                 f"Framework has {len(self.arguments)} arguments, exceeding "
@@ -135,6 +217,9 @@ class DungFramework:
         A set S is a complete extension iff it is admissible and contains
         every argument it defends (S = F(S)).
         """
+        engine = self._sat_engine()
+        if engine is not None:
+            return _ordered(engine.complete_extensions(limit=_MAX_SAT_EXTENSIONS))
         result = []
         for s in self.admissible_sets():
             if self.characteristic_function(s) == s:
@@ -145,7 +230,12 @@ class DungFramework:
         """Compute all preferred extensions.
 
         Preferred extensions are maximal (w.r.t. set inclusion) complete extensions.
+        With the SAT engine they are found by maximisation, without
+        enumerating the complete extensions first.
         """
+        engine = self._sat_engine()
+        if engine is not None:
+            return _ordered(engine.preferred_extensions(limit=_MAX_SAT_EXTENSIONS))
         complete = self.complete_extensions()
         preferred = []
         for s in complete:
@@ -159,8 +249,12 @@ class DungFramework:
         A set S is stable iff it is conflict-free and attacks every argument
         not in S.
 
-        Raises RuntimeError if the framework has more than _MAX_ENUM_ARGS arguments.
+        Raises RuntimeError if the framework has more than _MAX_ENUM_ARGS
+        arguments and the SAT engine is unavailable.
         """
+        engine = self._sat_engine()
+        if engine is not None:
+            return _ordered(engine.stable_extensions(limit=_MAX_SAT_EXTENSIONS))
         if len(self.arguments) > _MAX_ENUM_ARGS:
             raise RuntimeError(
                 f"Framework has {len(self.arguments)} arguments, exceeding "
@@ -182,9 +276,41 @@ class DungFramework:
 
         return result
 
+    def is_credulously_accepted(self, arg: str, semantics: str = "preferred") -> bool:
+        """True iff arg belongs to at least one extension of the semantics."""
+        engine = self._sat_engine()
+        if engine is not None:
+            return engine.is_credulously_accepted(arg, semantics)
+        return any(arg in ext for ext in self._extensions_for(semantics))
+
+    def is_skeptically_accepted(self, arg: str, semantics: str = "preferred") -> bool:
+        """True iff arg belongs to every extension of the semantics."""
+        engine = self._sat_engine()
+        if engine is not None:
+            return engine.is_skeptically_accepted(arg, semantics)
+        return all(arg in ext for ext in self._extensions_for(semantics))
+
+    def _extensions_for(self, semantics: str) -> List[FrozenSet[str]]:
+        if semantics == "grounded":
+            return [self.grounded_extension()]
+        if semantics == "stable":
+            return self.stable_extensions()
+        if semantics == "complete":
+            return self.complete_extensions()
+        return self.preferred_extensions()
+
     def get_argument_status(self, arg: str) -> Dict[str, bool]:
         """Determine the acceptance status of an argument under all semantics."""
         grounded = self.grounded_extension()
+        engine = self._sat_engine()
+        if engine is not None and arg in self.arguments:
+            # Acceptance queries: no enumeration of preferred/stable extensions
+            return {
+                "in_grounded": arg in grounded,
+                "credulously_accepted": engine.is_credulously_accepted(arg),
+                "skeptically_accepted": engine.is_skeptically_accepted(arg),
+                "in_stable": engine.is_credulously_accepted(arg, "stable"),
+            }
         preferred = self.preferred_extensions()
         stable = self.stable_extensions()
 
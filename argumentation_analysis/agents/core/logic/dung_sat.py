@@ -0,0 +1,253 @@
+"""SAT-backed Dung extension engine — replaces subset enumeration in dung_native.
+
+Encodes admissible, complete and stable semantics as CNF over one Boolean
+variable per argument (``x_a`` ⇔ "a is IN") and drives the PySAT solvers
+already wrapped by :class:`sat_handler.SATHandler`. Preferred extensions are
+computed with the CEGAR-style maximisation loop of PrefSAT (grow a complete
+extension until no strict superset is complete, then block its subsets), and
+credulous/skeptical acceptance are answered with dedicated solver calls
+instead of full enumeration.
+
+Encodings (Besnard & Doutre 2004; Cerutti et al. 2014):
+
+- conflict-free: ``¬x_a ∨ ¬x_b`` for every attack ``(a, b)``;
+- admissible:    conflict-free ∧ ``x_a → ∨_{c ∈ att(b)} x_c`` for ``b ∈ att(a)``;
+- complete:      conflict-free ∧ ``x_a ↔ ∧_{b ∈ att(a)} d_b`` with the
+                 auxiliary "defeated" variable ``d_b ↔ ∨_{c ∈ att(b)} x_c``;
+- stable:        conflict-free ∧ ``x_a ∨ ∨_{b ∈ att(a)} x_b``.
+"""
+
+import logging
+import time
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+from .sat_handler import PYSAT_AVAILABLE, RECOMMENDED_SOLVERS
+
+if PYSAT_AVAILABLE:
+    from pysat.solvers import Solver
+
+logger = logging.getLogger("DungSAT")
+
+SAT_ENGINE_AVAILABLE = PYSAT_AVAILABLE
+
+_SEMANTICS = ("admissible", "complete", "stable")
+
+
+class DungSATEngine:
+    """CNF encoding of a Dung framework solved incrementally with PySAT.
+
+    The engine is built from a snapshot of the framework; mutate the
+    framework and build a new engine to reason about the updated graph.
+
+    Usage:
+        engine = DungSATEngine(["a", "b"], [("a", "b")])
+        engine.preferred_extensions()          # [frozenset({"a"})]
+        engine.is_skeptically_accepted("a")    # True
+    """
+
+    def __init__(
+        self,
+        arguments: Iterable[str],
+        attacks: Iterable[Tuple[str, str]],
+        solver_name: Optional[str] = None,
+    ) -> None:
+        if not SAT_ENGINE_AVAILABLE:
+            raise RuntimeError("PySAT is not installed. Run: pip install python-sat")
+        self._solver_name = solver_name or RECOMMENDED_SOLVERS[0]
+        self._args: List[str] = sorted(set(arguments))
+        self._attackers: Dict[str, List[str]] = {a: [] for a in self._args}
+        self._attacks: List[Tuple[str, str]] = []
+        for src, tgt in sorted(set(attacks)):
+            self._attackers.setdefault(src, [])
+            self._attackers.setdefault(tgt, [])
+            self._attackers[tgt].append(src)
+            self._attacks.append((src, tgt))
+        self._args = sorted(self._attackers)
+        # x_a variables occupy 1..n, "defeated" variables n+1..2n
+        self._var: Dict[str, int] = {a: i + 1 for i, a in enumerate(self._args)}
+        self._n = len(self._args)
+        self._next_var = 2 * self._n + 1  # activation literals for _maximise
+        self.stats: Dict[str, float] = {"solver_calls": 0, "solve_time": 0.0}
+
+    # ── Encoding ─────────────────────────────────────────────────────
+
+    def _defeated_var(self, arg: str) -> int:
+        return self._n + self._var[arg]
+
+    def _clauses(self, semantics: str) -> List[List[int]]:
+        """CNF clauses whose models (restricted to x vars) are the extensions."""
+        if semantics not in _SEMANTICS:
+            raise ValueError(f"Unsupported semantics for SAT encoding: {semantics}")
+        x = self._var
+        clauses: List[List[int]] = []
+        for src, tgt in self._attacks:
+            if src == tgt:
+                clauses.append([-x[src]])
+            else:
+                clauses.append([-x[src], -x[tgt]])
+
+        if semantics == "admissible":
+            for arg in self._args:
+                for attacker in self._attackers[arg]:
+                    clauses.append(
+                        [-x[arg]] + [x[c] for c in self._attackers[attacker]]
+                    )
+        elif semantics == "complete":
+            for arg in self._args:
+                d = self._defeated_var(arg)
+                clauses.append([-d] + [x[c] for c in self._attackers[arg]])
+                for c in self._attackers[arg]:
+                    clauses.append([d, -x[c]])
+                attackers_defeated = [
+                    self._defeated_var(b) for b in self._attackers[arg]
+                ]
+                clauses.append([x[arg]] + [-d_b for d_b in attackers_defeated])
+                for d_b in attackers_defeated:
+                    clauses.append([-x[arg], d_b])
+        else:  # stable
+            for arg in self._args:
+                clauses.append([x[arg]] + [x[b] for b in self._attackers[arg]])
+        return clauses
+
+    def _new_solver(self, semantics: str) -> "Solver":
+        return Solver(name=self._solver_name, bootstrap_with=self._clauses(semantics))
+
+    def _solve(self, solver: "Solver", assumptions: Optional[List[int]] = None) -> bool:
+        start = time.perf_counter()
+        result = solver.solve(assumptions=assumptions or [])
+        self.stats["solver_calls"] += 1
+        self.stats["solve_time"] += time.perf_counter() - start
+        return bool(result)
+
+    def _extension(self, solver: "Solver") -> FrozenSet[str]:
+        model = solver.get_model() or []
+        return frozenset(self._args[lit - 1] for lit in model if 0 < lit <= self._n)
+
+    # ── Enumeration ──────────────────────────────────────────────────
+
+    def extensions(
+        self, semantics: str, limit: Optional[int] = None
+    ) -> List[FrozenSet[str]]:
+        """Enumerate every admissible, complete or stable extension.
+
+        Each model is blocked on the argument variables only, so the number
+        of solver calls equals the number of extensions plus one. Raises
+        RuntimeError when more than ``limit`` extensions exist.
+        """
+        result: List[FrozenSet[str]] = []
+        with self._new_solver(semantics) as solver:
+            while self._solve(solver):
+                ext = self._extension(solver)
+                result.append(ext)
+                if limit is not None and len(result) > limit:
+                    raise RuntimeError(
+                        f"Framework has more than {limit} {semantics} extensions, "
+                        f"exceeding the enumeration limit. Use acceptance queries "
+                        f"(is_credulously_accepted / is_skeptically_accepted) instead."
+                    )
+                if self._n == 0:
+                    break
+                solver.add_clause(
+                    [-self._var[a] if a in ext else self._var[a] for a in self._args]
+                )
+        return result
+
+    def admissible_sets(self, limit: Optional[int] = None) -> List[FrozenSet[str]]:
+        return self.extensions("admissible", limit)
+
+    def complete_extensions(self, limit: Optional[int] = None) -> List[FrozenSet[str]]:
+        return self.extensions("complete", limit)
+
+    def stable_extensions(self, limit: Optional[int] = None) -> List[FrozenSet[str]]:
+        return self.extensions("stable", limit)
+
+    def _maximise(self, solver: "Solver", ext: FrozenSet[str]) -> FrozenSet[str]:
+        """Grow a complete extension until no complete strict superset exists.
+
+        Each step asks for a complete extension containing ``ext`` plus at
+        least one outside argument; the "at least one" clause is guarded by a
+        fresh activation literal so it can be retired afterwards.
+        """
+        while True:
+            outside = [a for a in self._args if a not in ext]
+            if not outside:
+                return ext
+            act = self._next_var
+            self._next_var += 1
+            solver.add_clause([-act] + [self._var[a] for a in outside])
+            found = self._solve(solver, [self._var[a] for a in ext] + [act])
+            if found:
+                grown = self._extension(solver)
+            solver.add_clause([-act])
+            if not found:
+                return ext
+            ext = grown
+
+    def preferred_extensions(self, limit: Optional[int] = None) -> List[FrozenSet[str]]:
+        """Enumerate preferred extensions with the PrefSAT CEGAR loop.
+
+        Find any complete extension outside the subsets of those already
+        found, maximise it, record it, then forbid all its subsets.
+        """
+        result: List[FrozenSet[str]] = []
+        with self._new_solver("complete") as solver:
+            while self._solve(solver):
+                preferred = self._maximise(solver, self._extension(solver))
+                result.append(preferred)
+                if limit is not None and len(result) > limit:
+                    raise RuntimeError(
+                        f"Framework has more than {limit} preferred extensions, "
+                        f"exceeding the enumeration limit."
+                    )
+                blocking = [self._var[a] for a in self._args if a not in preferred]
+                if not blocking:
+                    break
+                solver.add_clause(blocking)
+        return result or [frozenset()]
+
+    # ── Acceptance queries ───────────────────────────────────────────
+
+    def _check_argument(self, arg: str) -> int:
+        if arg not in self._var:
+            raise KeyError(f"Argument '{arg}' not in framework")
+        return self._var[arg]
+
+    def is_credulously_accepted(self, arg: str, semantics: str = "preferred") -> bool:
+        """True iff ``arg`` belongs to at least one extension.
+
+        Credulous acceptance coincides for admissible, complete and preferred
+        semantics, so a single call on the complete encoding suffices.
+        """
+        x = self._check_argument(arg)
+        if semantics == "grounded":
+            return self.is_skeptically_accepted(arg, "grounded")
+        encoding = "stable" if semantics == "stable" else "complete"
+        with self._new_solver(encoding) as solver:
+            return self._solve(solver, [x])
+
+    def is_skeptically_accepted(self, arg: str, semantics: str = "preferred") -> bool:
+        """True iff ``arg`` belongs to every extension.
+
+        - ``complete``/``grounded``: no complete extension omits ``arg``, i.e.
+          membership in the grounded (least complete) extension;
+        - ``stable``: no stable extension omits ``arg`` (vacuously true when
+          the framework has no stable extension);
+        - ``preferred``: CEGAR loop — look for a complete extension without
+          ``arg``, maximise it, and stop at the first preferred counter-example;
+          otherwise block the subsets of the preferred extension just found.
+        """
+        x = self._check_argument(arg)
+        if semantics in ("complete", "grounded", "stable"):
+            encoding = "stable" if semantics == "stable" else "complete"
+            with self._new_solver(encoding) as solver:
+                return not self._solve(solver, [-x])
+        with self._new_solver("complete") as solver:
+            while self._solve(solver, [-x]):
+                preferred = self._maximise(solver, self._extension(solver))
+                if arg not in preferred:
+                    return False
+                blocking = [self._var[a] for a in self._args if a not in preferred]
+                if not blocking:
+                    return True
+                solver.add_clause(blocking)
+        return True
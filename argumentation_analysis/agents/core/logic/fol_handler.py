@@ -7,6 +7,7 @@ import time
 # La configuration du logging (appel à setup_logging()) est supposée être faite globalement.
 from argumentation_analysis.core.utils.logging_utils import setup_logging
 from .tweety_initializer import TweetyInitializer
+from .formula_cache import FormulaCache, normalize_formula_text
 from argumentation_analysis.core.prover9_runner import run_prover9
 from argumentation_analysis.core.mace4_runner import (
     MACE4_EXECUTABLE,
@@ -226,6 +227,8 @@ class FOLHandler:
         """
         self.logger = logging.getLogger(__name__)
         self._initializer_instance = initializer_instance
+        # Parsed formulas / belief bases, keyed by text (and signature).
+        self._parse_cache = FormulaCache("fol")
 
         # Le parser et autres composants Tweety ne sont chargés que si nécessaire.
         self._fol_parser = None
@@ -241,11 +244,17 @@ class FOLHandler:
                         "FOLHandler initialized before TweetyInitializer completed FOL setup."
                     )
 
-    def parse_fol_formula(self, formula_str: str, custom_parser=None):
+    def parse_fol_formula(
+        self, formula_str: str, custom_parser=None, signature_key=None
+    ):
         """
         Parses a single FOL formula string.
         If a custom_parser (with a specific signature) is provided, it uses it.
         Otherwise, it uses the default FOL parser.
+
+        Parses with the default parser are memoised. A custom parser's result
+        depends on its signature, so it is memoised only when the caller
+        passes a hashable ``signature_key`` identifying that signature.
         """
         if not isinstance(formula_str, str):
             raise TypeError("Input formula must be a string.")
@@ -271,7 +280,15 @@ class FOLHandler:
         formula_str = sanitized
 
         parser_to_use = custom_parser if custom_parser else self._fol_parser
+        if custom_parser is None or signature_key is not None:
+            key = ("formula", signature_key, normalize_formula_text(formula_str))
+            return self._parse_cache.get_or_create(
+                key, lambda: self._parse_fol_with(parser_to_use, formula_str)
+            )
+        return self._parse_fol_with(parser_to_use, formula_str)
 
+    def _parse_fol_with(self, parser_to_use, formula_str: str):
+        """Uncached parse of a sanitised formula (see parse_fol_formula)."""
         logger.debug(f"Attempting to parse FOL formula: {formula_str}")
         try:
             java_formula_str = jpype.JClass("java.lang.String")(formula_str)
@@ -329,6 +346,18 @@ class FOLHandler:
             )
             raise ValueError(f"Erreur de parsing Tweety: {e.getMessage()}") from e
 
+    def _belief_set_from_string(self, tweety_syntax: str):
+        """Memoised :meth:`create_belief_set_from_string` for read-only use.
+
+        The consistency / query paths only reason over the parsed base, so
+        the same KB text (one formula re-checked across documents, a KB
+        queried repeatedly) is parsed once. Callers must not mutate it.
+        """
+        return self._parse_cache.get_or_create(
+            ("kb", tweety_syntax),
+            lambda: self.create_belief_set_from_string(tweety_syntax),
+        )
+
     def create_belief_set_programmatically(self, builder_plugin_data: dict):
         """
         Crée un FolBeliefSet Java en mémoire à partir des données accumulées
@@ -451,11 +480,15 @@ class FOLHandler:
         FolParser = jpype.JClass("org.tweetyproject.logics.fol.parser.FolParser")
         parser = FolParser()
         parser.setSignature(signature)
+        signature_key = (
+            tuple(sorted((k, tuple(v)) for k, v in sorts_data.items())),
+            tuple(sorted((k, tuple(v)) for k, v in final_predicates_data.items())),
+        )
 
         for formula_str in formulas:
             try:
                 parsed_formula = self.parse_fol_formula(
-                    formula_str, custom_parser=parser
+                    formula_str, custom_parser=parser, signature_key=signature_key
                 )
                 if parsed_formula:
                     belief_set.add(parsed_formula)
@@ -863,9 +896,7 @@ class FOLHandler:
         try:
             # If it's a string, parse it into a Java belief set first
             if isinstance(belief_set_input, str):
-                java_belief_set = self.create_belief_set_from_string(
-                    belief_set_input.strip()
-                )
+                java_belief_set = self._belief_set_from_string(belief_set_input.strip())
             else:
                 # Assume it's already a Java FolBeliefSet
                 java_belief_set = belief_set_input
@@ -1031,9 +1062,7 @@ class FOLHandler:
         """
         # Build the Java belief set ONCE — every backend reasons over the same KB.
         if isinstance(belief_set_input, str):
-            java_belief_set = self.create_belief_set_from_string(
-                belief_set_input.strip()
-            )
+            java_belief_set = self._belief_set_from_string(belief_set_input.strip())
         else:
             java_belief_set = belief_set_input
 
@@ -1136,9 +1165,7 @@ class FOLHandler:
         try:
             # Parse belief set if string
             if isinstance(belief_set_input, str):
-                java_belief_set = self.create_belief_set_from_string(
-                    belief_set_input.strip()
-                )
+                java_belief_set = self._belief_set_from_string(belief_set_input.strip())
             else:
                 java_belief_set = belief_set_input
 
@@ -0,0 +1,97 @@
+"""Bounded memo caches for parsed formulas and their clause encodings.
+
+The corpus repeats the same atoms and sub-formulas from one document to the
+next, so the PL, FOL and QBF paths kept re-tokenising and re-parsing identical
+strings. :class:`FormulaCache` is the shared building block: an LRU keyed by
+normalised formula text, with hit/miss/eviction counters. Every cache
+registers under a family name (``"pl"``, ``"fol"``, ``"qbf"``, ``"tseitin"``)
+and :func:`formula_cache_stats` aggregates the counters per family, so the
+invoke callables can report whether parsing still costs anything in their
+hot loops.
+
+Only successful results are stored: a formula that fails to parse raises again
+on the next attempt, so a cache never turns an error into a silent ``None``.
+"""
+
+import threading
+import weakref
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable
+
+DEFAULT_MAXSIZE = 4096
+
+_REGISTRY: Dict[str, "weakref.WeakSet[FormulaCache]"] = {}
+_REGISTRY_LOCK = threading.Lock()
+
+
+def normalize_formula_text(text: str) -> str:
+    """Whitespace-insensitive cache key for a formula string."""
+    return " ".join(text.split())
+
+
+class FormulaCache:
+    """Thread-safe LRU memo of ``key -> parsed value``."""
+
+    def __init__(self, family: str, maxsize: int = DEFAULT_MAXSIZE) -> None:
+        self.family = family
+        self.maxsize = maxsize
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        with _REGISTRY_LOCK:
+            _REGISTRY.setdefault(family, weakref.WeakSet()).add(self)
+
+    def get_or_create(self, key: Hashable, factory: Callable[[], Any]) -> Any:
+        """Return the cached value for ``key``, computing it on a miss.
+
+        ``factory`` runs outside the lock (parsers may recurse into the same
+        cache for sub-formulas); exceptions propagate and nothing is stored.
+        """
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+        value = factory()
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return value
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "size": len(self._entries),
+        }
+
+
+def formula_cache_stats() -> Dict[str, Dict[str, Any]]:
+    """Counters of every live cache, summed per family, with the hit rate."""
+    result: Dict[str, Dict[str, Any]] = {}
+    with _REGISTRY_LOCK:
+        families = {name: list(caches) for name, caches in _REGISTRY.items()}
+    for family, caches in sorted(families.items()):
+        total = {"hits": 0, "misses": 0, "evictions": 0, "size": 0}
+        for cache in caches:
+            for counter, value in cache.stats.items():
+                total[counter] += value
+        lookups = total["hits"] + total["misses"]
+        total["hit_rate"] = round(total["hits"] / lookups, 4) if lookups else 0.0
+        result[family] = total
+    return result
@@ -9,6 +9,7 @@ from argumentation_analysis.core.utils.logging_utils import setup_logging
 
 # Import TweetyInitializer to access its static methods for parser/reasoner
 from .tweety_initializer import TweetyInitializer
+from .formula_cache import FormulaCache
 
 from argumentation_analysis.core.config import settings, PLSolverChoice
 
@@ -31,6 +32,8 @@ class PLHandler:
             "org.tweetyproject.logics.pl.reasoner.SimplePlReasoner"
         )
         self._pl_reasoner = SimplePlReasoner()
+        # Parsed PlFormula objects by (normalised text, constants).
+        self._parse_cache = FormulaCache("pl")
 
         if self._pl_parser is None or self._pl_reasoner is None:
             logger.error(
@@ -117,6 +120,21 @@ class PLHandler:
             return None
 
         normalized_formula = self._normalize_formula(formula_str)
+        key = (normalized_formula, tuple(constants) if constants else ())
+        return self._parse_cache.get_or_create(
+            key,
+            lambda: self._parse_normalized_pl_formula(
+                formula_str, normalized_formula, constants
+            ),
+        )
+
+    def _parse_normalized_pl_formula(
+        self,
+        formula_str: str,
+        normalized_formula: str,
+        constants: Optional[List[str]] = None,
+    ):
+        """Uncached parse of an already-normalised formula (see parse_pl_formula)."""
         logger.debug(f"Attempting to parse normalized PL formula: {normalized_formula}")
 
         # Pre-validation via PLFormulaSanitizer (#537)
@@ -510,6 +528,25 @@ class PLHandler:
         handler = self._get_sat_handler()
         return handler.query(normalized_kb, normalized_query, settings.pysat_solver)
 
+    def pl_query_batch_sat(
+        self, knowledge_base_str: str, query_formula_strs: List[str]
+    ) -> List[bool]:
+        """Check several PL entailments against one KB in a single SAT session.
+
+        The KB is encoded once; each query is decided under a solver
+        assumption, so the batch scales with query size rather than KB size.
+        """
+        formula_strings = [
+            f.strip().rstrip("%")
+            for f in knowledge_base_str.split("\n")
+            if f.strip() and f.strip() != "```"
+        ]
+        normalized_kb = [self._normalize_formula(f) for f in formula_strings]
+        session = self._get_sat_handler().session(normalized_kb, settings.pysat_solver)
+        return session.entails_all(
+            self._normalize_formula(q.rstrip("%").strip()) for q in query_formula_strs
+        )
+
     # ── Multi-backend comparison (FP-20 #1244, mandate R468) ──────────
 
     # PySAT backends that DECIDE firsthand (probe 2026-06-23, synthetic atoms):
@@ -1,7 +1,9 @@
 """Pure-Python QBF (Quantified Boolean Formula) solver — JVM-free fallback.
 
 Provides basic QBF reasoning without requiring Tweety/JPype:
-- Naive truth-table enumeration for small formulas
+- Compilation to prenex CNF (QDIMACS) and a QDPLL search with unit
+  propagation, pure literals and clause/cube learning
+- Optional hand-off of the compiled form to an external QDIMACS solver
 - Argumentation-to-QBF conversion (credulous/skeptical acceptance)
 - Formula construction and evaluation
 
@@ -11,7 +13,12 @@ Java is not available.
 
 import itertools
 import logging
-from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
+import os
+import subprocess
+from dataclasses import dataclass
+from typing import Any, Dict, FrozenSet, List, Optional, Sequence, Set, Tuple
+
+from .formula_cache import FormulaCache, normalize_formula_text
 
 logger = logging.getLogger(__name__)
 
@@ -175,13 +182,26 @@ def _evaluate_exists(
 # ── Formula parser ───────────────────────────────────────────
 
 
+# Parsed sub-formulas by normalised text. Nodes are never mutated after
+# parsing, so identical sub-formulas are shared between formulas.
+_PARSE_CACHE = FormulaCache("qbf")
+
+
 def parse_formula(s: str) -> QBFFormula:
     """Parse a simple propositional formula string.
 
     Supports: ! (negation), & (and), | (or), => (implies).
     Operator precedence: ! > & > | > =>
     No parentheses support (keep formulas simple).
+
+    Results are memoised (see :mod:`formula_cache`); do not mutate the
+    returned nodes.
     """
+    key = normalize_formula_text(s)
+    return _PARSE_CACHE.get_or_create(key, lambda: _parse_formula(key))
+
+
+def _parse_formula(s: str) -> QBFFormula:
     s = s.strip()
     # Implication (lowest precedence, right-associative)
     if "=>" in s:
@@ -208,6 +228,501 @@ def parse_formula(s: str) -> QBFFormula:
     return Var(s.strip())
 
 
+# ── Prenex CNF compilation ──────────────────────────────────
+
+
+@dataclass
+class CompiledQBF:
+    """A QBF in prenex CNF, numbered as in QDIMACS.
+
+    ``prefix`` lists the quantifier blocks outermost first as ``("a", vars)``
+    or ``("e", vars)``; ``clauses`` are lists of non-zero DIMACS literals.
+    Auxiliary encoding variables live in the innermost existential block.
+    """
+
+    prefix: List[Tuple[str, List[int]]]
+    clauses: List[List[int]]
+    variable_ids: Dict[str, int]
+    aux_count: int = 0
+
+    @property
+    def num_vars(self) -> int:
+        return len(self.variable_ids) + self.aux_count
+
+    def to_qdimacs(self) -> str:
+        """Render the formula in QDIMACS, the input format of QBF solvers."""
+        lines = [f"c {name} {var}" for name, var in self.variable_ids.items()]
+        lines.append(f"p cnf {self.num_vars} {len(self.clauses)}")
+        for kind, block in self.prefix:
+            lines.append(f"{kind} {' '.join(map(str, block))} 0")
+        for clause in self.clauses:
+            lines.append(f"{' '.join(map(str, clause))} 0")
+        return "\n".join(lines) + "\n"
+
+
+class _PrenexEncoder:
+    """Polarity-aware (Plaisted–Greenbaum) clausal encoding of a matrix.
+
+    Conjunctions and disjunctions are flattened through negations and
+    implications, so a matrix that is already clausal yields its clauses
+    directly. Every other sub-formula gets one auxiliary variable ``t`` with
+    ``t -> sub-formula`` clauses only; with the auxiliaries quantified
+    innermost-existentially this preserves the QBF's truth value. Shared
+    sub-formula nodes (see the parse cache) are encoded once.
+    """
+
+    def __init__(self, variable_ids: Dict[str, int]) -> None:
+        self.variable_ids = variable_ids
+        self.next_var = len(variable_ids)
+        self.clauses: List[List[int]] = []
+        self._aux: Dict[Tuple[int, bool], int] = {}
+        self._nodes: List[QBFFormula] = []  # keeps memo keys (ids) alive
+
+    def encode(self, matrix: QBFFormula) -> None:
+        for conjunct, positive in self._flatten(matrix, True, conjunctive=True):
+            clause = [
+                self._literal(disjunct, sign)
+                for disjunct, sign in self._flatten(conjunct, positive, False)
+            ]
+            self._add_clause(clause)
+
+    @staticmethod
+    def _flatten(
+        node: QBFFormula, positive: bool, conjunctive: bool
+    ) -> List[Tuple[QBFFormula, bool]]:
+        """Operands of the n-ary And (or Or) that ``node`` is under ``positive``."""
+        operands = []
+        stack = [(node, positive)]
+        while stack:
+            current, sign = stack.pop()
+            if isinstance(current, Not):
+                stack.append((current.inner, not sign))
+            elif isinstance(current, (And, Or)) and (
+                isinstance(current, And) == (sign == conjunctive)
+            ):
+                stack.append((current.right, sign))
+                stack.append((current.left, sign))
+            elif isinstance(current, Implies) and sign != conjunctive:
+                stack.append((current.right, sign))
+                stack.append((current.left, not sign))
+            else:
+                operands.append((current, sign))
+        return operands
+
+    def _literal(self, node: QBFFormula, positive: bool) -> int:
+        if isinstance(node, Var):
+            var = self.variable_ids[node.name]
+            return var if positive else -var
+        key = (id(node), positive)
+        if key not in self._aux:
+            self.next_var += 1
+            aux = self.next_var
+            self._aux[key] = aux
+            self._nodes.append(node)
+            # ``node`` is not a literal, so under this polarity it is a
+            # conjunction (flattened with conjunctive=True) or a disjunction.
+            conjuncts = self._flatten(node, positive, conjunctive=True)
+            if len(conjuncts) > 1:
+                for sub, sign in conjuncts:
+                    self._add_clause([-aux, self._literal(sub, sign)])
+            else:
+                disjuncts = self._flatten(node, positive, conjunctive=False)
+                self._add_clause(
+                    [-aux] + [self._literal(sub, sign) for sub, sign in disjuncts]
+                )
+        return self._aux[key]
+
+    def _add_clause(self, literals: List[int]) -> None:
+        clause = list(dict.fromkeys(literals))
+        if not any(-lit in clause for lit in clause):
+            self.clauses.append(clause)
+
+
+def _matrix_variables(matrix: QBFFormula) -> List[str]:
+    """Variable names of a (possibly DAG-shaped) matrix, in first-seen order."""
+    names: Dict[str, None] = {}
+    seen: Set[int] = set()
+    stack = [matrix]
+    while stack:
+        node = stack.pop()
+        if id(node) in seen:
+            continue
+        seen.add(id(node))
+        if isinstance(node, Var):
+            names.setdefault(node.name)
+        elif isinstance(node, Not):
+            stack.append(node.inner)
+        elif isinstance(node, (And, Or, Implies)):
+            stack.extend((node.right, node.left))
+    return list(names)
+
+
+def compile_qbf(quantifiers: List[Dict[str, Any]], formula_str: str) -> CompiledQBF:
+    """Compile a quantifier list and matrix to prenex CNF.
+
+    Quantifier semantics follow :class:`ForAll`/:class:`Exists`: when a
+    variable is bound twice the innermost binding wins, and matrix variables
+    that no quantifier binds keep the evaluator's default of False.
+    """
+    matrix = parse_formula(formula_str)
+    innermost: Dict[str, int] = {}
+    for index, q in enumerate(quantifiers):
+        for name in q.get("vars", []):
+            innermost[name] = index
+
+    variable_ids: Dict[str, int] = {}
+    prefix: List[Tuple[str, List[int]]] = []
+    free = [name for name in _matrix_variables(matrix) if name not in innermost]
+    for name in free:
+        variable_ids[name] = len(variable_ids) + 1
+    if free:
+        prefix.append(("e", [variable_ids[name] for name in free]))
+    for index, q in enumerate(quantifiers):
+        kind = "e" if q.get("type", "forall") == "exists" else "a"
+        block = []
+        for name in q.get("vars", []):
+            if innermost[name] == index and name not in variable_ids:
+                variable_ids[name] = len(variable_ids) + 1
+                block.append(variable_ids[name])
+        if not block:
+            continue
+        if prefix and prefix[-1][0] == kind:
+            prefix[-1][1].extend(block)
+        else:
+            prefix.append((kind, block))
+
+    encoder = _PrenexEncoder(variable_ids)
+    encoder.encode(matrix)
+    clauses = [[-variable_ids[name]] for name in free] + encoder.clauses
+    aux_vars = list(range(len(variable_ids) + 1, encoder.next_var + 1))
+    if aux_vars:
+        if prefix and prefix[-1][0] == "e":
+            prefix[-1][1].extend(aux_vars)
+        else:
+            prefix.append(("e", aux_vars))
+    return CompiledQBF(prefix, clauses, variable_ids, len(aux_vars))
+
+
+# ── QDPLL search ─────────────────────────────────────────────
+
+
+class QDPLLSolver:
+    """Search-based QBF solver over a :class:`CompiledQBF`.
+
+    Branches on variables in prefix order. At every node it runs
+    unit propagation (a clause whose only unassigned existential literal
+    ``e`` has no unassigned universal outer to ``e`` forces ``e``; one with
+    no unassigned existential left is a conflict) and pure-literal
+    elimination (existentials set to satisfy, universals to falsify).
+
+    Conflicts are analysed by Q-resolution over the propagation reasons of
+    the current level and the learned clause joins the matrix. Satisfied
+    leaves yield a cube (one true literal per original clause, existentially
+    reduced) that is combined by term resolution and learned as well. A
+    learned clause already falsified above a decision (a learned cube
+    already satisfied) prunes the other branch. Resolvents that would be
+    tautological are dropped rather than learned, which keeps every learned
+    constraint sound.
+    """
+
+    def __init__(self, compiled: CompiledQBF, max_learned: int = 10000) -> None:
+        self.compiled = compiled
+        self.max_learned = max_learned
+        n = compiled.num_vars
+        self.level = [0] * (n + 1)
+        self.universal = [False] * (n + 1)
+        self.order: List[int] = []
+        for index, (kind, block) in enumerate(compiled.prefix):
+            for var in block:
+                self.level[var] = index
+                self.universal[var] = kind == "a"
+                self.order.append(var)
+        self.clauses: List[List[int]] = [
+            self._reduce_clause(clause) for clause in compiled.clauses
+        ]
+        self.original_count = len(self.clauses)
+        self.cubes: List[List[int]] = []
+        self.value: List[Optional[bool]] = [None] * (n + 1)
+        self.depth = [0] * (n + 1)
+        self.reason: List[Optional[int]] = [None] * (n + 1)
+        self.position = [0] * (n + 1)
+        self.trail: List[int] = []
+        self.stats = {
+            "decisions": 0,
+            "propagations": 0,
+            "pure_literals": 0,
+            "conflicts": 0,
+            "learned_clauses": 0,
+            "learned_cubes": 0,
+            "backjumps": 0,
+        }
+
+    # ── Public API ──
+
+    def solve(self) -> bool:
+        """Truth value of the compiled QBF."""
+        if any(not clause for clause in self.clauses):
+            return False
+        result, _ = self._search(0)
+        self._undo(0)
+        return result
+
+    # ── Assignment trail ──
+
+    def _lit_value(self, lit: int) -> Optional[bool]:
+        value = self.value[abs(lit)]
+        if value is None:
+            return None
+        return value if lit > 0 else not value
+
+    def _assign(self, lit: int, depth: int, reason: Optional[int]) -> None:
+        var = abs(lit)
+        self.value[var] = lit > 0
+        self.depth[var] = depth
+        self.reason[var] = reason
+        self.position[var] = len(self.trail)
+        self.trail.append(var)
+
+    def _undo(self, mark: int) -> None:
+        while len(self.trail) > mark:
+            self.value[self.trail.pop()] = None
+
+    # ── Reductions ──
+
+    def _reduce_clause(self, clause: List[int]) -> List[int]:
+        """Universal reduction: drop universals inner to every existential."""
+        existential_levels = [
+            self.level[abs(lit)] for lit in clause if not self.universal[abs(lit)]
+        ]
+        bound = max(existential_levels, default=-1)
+        return [
+            lit
+            for lit in clause
+            if not self.universal[abs(lit)] or self.level[abs(lit)] < bound
+        ]
+
+    def _reduce_cube(self, cube: List[int]) -> List[int]:
+        """Existential reduction: drop existentials inner to every universal."""
+        universal_levels = [
+            self.level[abs(lit)] for lit in cube if self.universal[abs(lit)]
+        ]
+        bound = max(universal_levels, default=-1)
+        return [
+            lit
+            for lit in cube
+            if self.universal[abs(lit)] or self.level[abs(lit)] < bound
+        ]
+
+    @staticmethod
+    def _resolve(first: List[int], second: List[int], var: int) -> Optional[List[int]]:
+        merged = {lit for lit in first if abs(lit) != var}
+        merged.update(lit for lit in second if abs(lit) != var)
+        if any(-lit in merged for lit in merged):
+            return None
+        return sorted(merged, key=abs)
+
+    # ── Propagation ──
+
+    def _propagate(self, depth: int) -> Tuple[str, Optional[int]]:
+        """Run units and pure literals to fixpoint.
+
+        Returns ``("conflict", clause_index)``, ``("sat", None)`` when every
+        original clause is satisfied, or ``("open", None)``.
+        """
+        while True:
+            unit_found = False
+            all_satisfied = True
+            occurs: Set[int] = set()
+            for index, clause in enumerate(self.clauses):
+                satisfied = False
+                existential = 0
+                unassigned: List[int] = []
+                for lit in clause:
+                    value = self._lit_value(lit)
+                    if value is True:
+                        satisfied = True
+                        break
+                    if value is None:
+                        unassigned.append(lit)
+                        if not self.universal[abs(lit)]:
+                            existential += 1
+                if satisfied:
+                    continue
+                if index < self.original_count:
+                    all_satisfied = False
+                if existential == 0:
+                    self.stats["conflicts"] += 1
+                    return "conflict", index
+                if existential == 1:
+                    unit = next(l for l in unassigned if not self.universal[abs(l)])
+                    if all(
+                        self.level[abs(lit)] > self.level[abs(unit)]
+                        for lit in unassigned
+                        if lit != unit
+                    ):
+                        self._assign(unit, depth, index)
+                        self.stats["propagations"] += 1
+                        unit_found = True
+                        continue
+                occurs.update(unassigned)
+            if unit_found:
+                continue
+            if all_satisfied:
+                return "sat", None
+            pure_found = False
+            for var in self.order:
+                if self.value[var] is not None:
+                    continue
+                if var in occurs and -var in occurs:
+                    continue
+                positive = var in occurs
+                if self.universal[var]:
+                    positive = not positive
+                self._assign(var if positive else -var, depth, None)
+                self.stats["pure_literals"] += 1
+                pure_found = True
+            if not pure_found:
+                return "open", None
+
+    # ── Learning ──
+
+    def _analyze_conflict(self, index: int, depth: int) -> Optional[List[int]]:
+        """Q-resolve the conflict clause against this level's unit reasons."""
+        clause = set(self.clauses[index])
+        while True:
+            pivots = [
+                lit
+                for lit in clause
+                if self.value[abs(lit)] is not None
+                and self.reason[abs(lit)] is not None
+                and self.depth[abs(lit)] == depth
+            ]
+            if not pivots:
+                break
+            pivot = max(pivots, key=lambda lit: self.position[abs(lit)])
+            resolvent = self._resolve(
+                list(clause), self.clauses[self.reason[abs(pivot)]], abs(pivot)
+            )
+            if resolvent is None:
+                return None
+            clause = set(self._reduce_clause(resolvent))
+        return self._learn_clause(sorted(clause, key=abs))
+
+    def _initial_cube(self) -> List[int]:
+        """True literals covering every original clause, existentially reduced."""
+        cube: Set[int] = set()
+        for clause in self.clauses[: self.original_count]:
+            true_lits = [lit for lit in clause if self._lit_value(lit) is True]
+            if any(lit in cube for lit in true_lits):
+                continue
+            cube.add(
+                max(
+                    true_lits,
+                    key=lambda lit: (
+                        not self.universal[abs(lit)],
+                        self.level[abs(lit)],
+                    ),
+                )
+            )
+        return self._learn_cube(self._reduce_cube(sorted(cube, key=abs)))
+
+    def _learn_clause(self, clause: Optional[List[int]]) -> Optional[List[int]]:
+        if clause is not None and self.stats["learned_clauses"] < self.max_learned:
+            self.clauses.append(clause)
+            self.stats["learned_clauses"] += 1
+        return clause
+
+    def _learn_cube(self, cube: Optional[List[int]]) -> Optional[List[int]]:
+        if cube is not None and self.stats["learned_cubes"] < self.max_learned:
+            self.cubes.append(cube)
+            self.stats["learned_cubes"] += 1
+        return cube
+
+    def _satisfied_cube(self) -> Optional[List[int]]:
+        for cube in self.cubes:
+            if all(self._lit_value(lit) is True for lit in cube):
+                return cube
+        return None
+
+    # ── Search ──
+
+    def _search(self, depth: int) -> Tuple[bool, Optional[List[int]]]:
+        status, index = self._propagate(depth)
+        if status == "conflict":
+            return False, self._analyze_conflict(index, depth)
+        if status == "sat":
+            return True, self._initial_cube()
+        cube = self._satisfied_cube()
+        if cube is not None:
+            return True, cube
+        var = next(v for v in self.order if self.value[v] is None)
+        return self._branch(var, depth)
+
+    def _branch(self, var: int, depth: int) -> Tuple[bool, Optional[List[int]]]:
+        universal = self.universal[var]
+        learned: List[Optional[List[int]]] = []
+        for decision in (-var, var) if universal else (var, -var):
+            mark = len(self.trail)
+            self._assign(decision, depth + 1, None)
+            self.stats["decisions"] += 1
+            result, constraint = self._search(depth + 1)
+            self._undo(mark)
+            if result != universal:
+                # Existential found a winning value / universal a refutation.
+                return result, constraint
+            learned.append(constraint)
+            # A learned clause already falsified (cube already satisfied)
+            # without ``var`` decides this node: skip the other branch.
+            if constraint is not None and all(
+                self._lit_value(lit) is universal for lit in constraint
+            ):
+                self.stats["backjumps"] += 1
+                return result, constraint
+        resolvent = None
+        if learned[0] is not None and learned[1] is not None:
+            resolvent = self._resolve(learned[0], learned[1], var)
+        if resolvent is None:
+            return universal, None
+        if universal:
+            return True, self._learn_cube(self._reduce_cube(resolvent))
+        return False, self._learn_clause(self._reduce_clause(resolvent))
+
+
+def solve_qbf(compiled: CompiledQBF) -> Tuple[bool, Dict[str, int]]:
+    """Decide ``compiled`` with :class:`QDPLLSolver`; return (valid, stats)."""
+    solver = QDPLLSolver(compiled)
+    return solver.solve(), dict(solver.stats)
+
+
+# ── External solvers ─────────────────────────────────────────
+
+
+def run_external_qbf_solver(
+    compiled: CompiledQBF, command: Sequence[str], timeout: float = 60
+) -> Optional[bool]:
+    """Decide ``compiled`` with an external QDIMACS solver (DepQBF, CAQE, ...).
+
+    The QDIMACS text is piped on stdin. The verdict is read from the
+    QBFEVAL exit code (10 true, 20 false) or an ``s cnf 1``/``s cnf 0``
+    line; anything else returns None (undetermined, never a guess).
+    """
+    completed = subprocess.run(
+        list(command),
+        input=compiled.to_qdimacs(),
+        capture_output=True,
+        text=True,
+        timeout=timeout,
+    )
+    if completed.returncode in (10, 20):
+        return completed.returncode == 10
+    for line in completed.stdout.splitlines():
+        fields = line.split()
+        if fields[:2] == ["s", "cnf"] and len(fields) > 2 and fields[2] in ("0", "1"):
+            return fields[2] == "1"
+    logger.warning(f"External QBF solver gave no verdict (exit {completed.returncode})")
+    return None
+
+
 # ── QBF solver ───────────────────────────────────────────────
 
 
@@ -215,7 +730,7 @@ def check_qbf(
     quantifiers: List[Dict[str, Any]],
     formula_str: str,
 ) -> Tuple[bool, str]:
-    """Check QBF validity using naive enumeration.
+    """Check QBF validity with the QDPLL engine.
 
     Args:
         quantifiers: List of {"type": "forall"|"exists", "vars": ["x","y"]}.
@@ -224,36 +739,40 @@ def check_qbf(
     Returns:
         (is_valid, message)
     """
-    matrix = parse_formula(formula_str)
-
-    # Build nested quantified formula (outermost first)
-    formula = matrix
-    for q in reversed(quantifiers):
-        q_type = q.get("type", "forall")
-        q_vars = q.get("vars", [])
-        if q_type == "exists":
-            formula = Exists(q_vars, formula)
-        else:
-            formula = ForAll(q_vars, formula)
-
-    result = formula.evaluate({})
+    result, _ = solve_qbf(compile_qbf(quantifiers, formula_str))
     return result, f"QBF {'VALID' if result else 'INVALID'}: {formula_str}"
 
 
 def analyze_qbf(
     quantifiers: List[Dict[str, Any]],
     formula_str: str,
+    external_solver: Optional[Sequence[str]] = None,
 ) -> Dict[str, Any]:
     """Full QBF analysis with statistics.
 
     Args:
         quantifiers: List of {"type": "forall"|"exists", "vars": ["x","y"]}.
         formula_str: The matrix formula.
+        external_solver: Optional QDIMACS solver command; when it fails or
+            gives no verdict the QDPLL engine decides instead.
 
     Returns:
         Dict with validity result and statistics.
     """
-    is_valid, message = check_qbf(quantifiers, formula_str)
+    compiled = compile_qbf(quantifiers, formula_str)
+    is_valid: Optional[bool] = None
+    reasoner = "qdpll"
+    search_stats: Dict[str, int] = {}
+    if external_solver:
+        try:
+            is_valid = run_external_qbf_solver(compiled, external_solver)
+            reasoner = f"external:{os.path.basename(external_solver[0])}"
+        except (OSError, subprocess.SubprocessError) as e:
+            logger.warning(f"External QBF solver failed ({e}), using QDPLL")
+    if is_valid is None:
+        reasoner = "qdpll"
+        is_valid, search_stats = solve_qbf(compiled)
+    message = f"QBF {'VALID' if is_valid else 'INVALID'}: {formula_str}"
     all_vars = []
     for q in quantifiers:
         all_vars.extend(q.get("vars", []))
@@ -266,8 +785,11 @@ def analyze_qbf(
             "quantifier_count": len(quantifiers),
             "variable_count": len(all_vars),
             "search_space": 2 ** len(all_vars),
+            "clause_count": len(compiled.clauses),
+            "aux_variable_count": compiled.aux_count,
             "handler": "qbf_native",
-            "reasoner": "naive_enumeration",
+            "reasoner": reasoner,
+            **search_stats,
         },
     }
 
@@ -6,7 +6,11 @@ backends (CaDiCaL, Glucose, MiniSat, etc.), MUS/MCS analysis, and MaxSAT.
 
 import logging
 import re
-from typing import Any, Dict, List, Optional, Tuple
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from .formula_cache import FormulaCache
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +50,131 @@ RECOMMENDED_SOLVERS = [
 ]
 
 
+class _TseitinTemplate(NamedTuple):
+    """Handler-independent Tseitin encoding of one formula.
+
+    Local variable ``i`` (1-based) is ``allocations[i - 1]``: an atom name,
+    or ``None`` for an auxiliary variable, listed in allocation order.
+    """
+
+    allocations: Tuple[Optional[str], ...]
+    root: int
+    clauses: Tuple[Tuple[int, ...], ...]
+
+
+def _tseitin_template(tokens: List[str]) -> _TseitinTemplate:
+    """Tseitin-encode a token sequence over local variable numbers."""
+    pos = [0]
+    clauses: List[List[int]] = []
+    allocations: List[Optional[str]] = []
+    atoms: Dict[str, int] = {}
+
+    def new_aux() -> int:
+        allocations.append(None)
+        return len(allocations)
+
+    def atom(name: str) -> int:
+        if name not in atoms:
+            allocations.append(name)
+            atoms[name] = len(allocations)
+        return atoms[name]
+
+    def parse_equiv():
+        left = parse_implies()
+        while pos[0] < len(tokens) and tokens[pos[0]] == "<=>":
+            pos[0] += 1
+            right = parse_implies()
+            aux = new_aux()
+            # aux <=> (left <=> right)
+            # Encoded as: (aux => (left => right)) & (aux => (right => left)) &
+            #              ((left => right) & (right => left) => aux)
+            # Simplified CNF:
+            clauses.extend(
+                [
+                    [-aux, -left, right],
+                    [-aux, left, -right],
+                    [aux, left, right],
+                    [aux, -left, -right],
+                ]
+            )
+            left = aux
+        return left
+
+    def parse_implies():
+        left = parse_or()
+        while pos[0] < len(tokens) and tokens[pos[0]] == "=>":
+            pos[0] += 1
+            right = parse_or()
+            aux = new_aux()
+            # aux <=> (left => right) i.e. aux <=> (!left | right)
+            clauses.extend(
+                [
+                    [-aux, -left, right],
+                    [aux, left],
+                    [aux, -right],
+                ]
+            )
+            left = aux
+        return left
+
+    def parse_or():
+        left = parse_and()
+        or_lits = [left]
+        while pos[0] < len(tokens) and tokens[pos[0]] == "|":
+            pos[0] += 1
+            or_lits.append(parse_and())
+        if len(or_lits) == 1:
+            return left
+        aux = new_aux()
+        # aux <=> (l1 | l2 | ...)
+        clauses.append([-aux] + or_lits)
+        for lit in or_lits:
+            clauses.append([aux, -lit])
+        return aux
+
+    def parse_and():
+        left = parse_not()
+        and_lits = [left]
+        while pos[0] < len(tokens) and tokens[pos[0]] == "&":
+            pos[0] += 1
+            and_lits.append(parse_not())
+        if len(and_lits) == 1:
+            return left
+        aux = new_aux()
+        # aux <=> (l1 & l2 & ...)
+        clauses.append([aux] + [-lit for lit in and_lits])
+        for lit in and_lits:
+            clauses.append([-aux, lit])
+        return aux
+
+    def parse_not():
+        if pos[0] < len(tokens) and tokens[pos[0]] == "!":
+            pos[0] += 1
+            inner = parse_not()
+            return -inner
+        return parse_atom()
+
+    def parse_atom():
+        if pos[0] >= len(tokens):
+            raise ValueError("Unexpected end of formula")
+        token = tokens[pos[0]]
+        if token == "(":
+            pos[0] += 1
+            result = parse_equiv()
+            if pos[0] < len(tokens) and tokens[pos[0]] == ")":
+                pos[0] += 1
+            return result
+        pos[0] += 1
+        return atom(token)
+
+    root = parse_equiv()
+    return _TseitinTemplate(tuple(allocations), root, tuple(map(tuple, clauses)))
+
+
+# Shared by every handler and session: templates carry no variable numbers.
+_TSEITIN_CACHE = FormulaCache("tseitin")
+
+
 class SATHandler:
     """SAT/MaxSAT/MUS solver using PySAT and Z3-MARCO.
 
@@ -54,12 +183,16 @@ class SATHandler:
     as strings into CNF via Tseitin transformation.
     """
 
+    # Sessions kept alive for repeated queries against the same KB.
+    MAX_SESSIONS = 8
+
     def __init__(self, default_solver: str = "cadical195"):
         if not PYSAT_AVAILABLE:
             raise RuntimeError("PySAT is not installed. Run: pip install python-sat")
         self._default_solver = default_solver
         self._var_map: Dict[str, int] = {}
         self._next_var = 1
+        self._sessions: "OrderedDict[tuple, SATSession]" = OrderedDict()
 
     # ── Variable management ──────────────────────────────────────────
 
@@ -135,101 +268,27 @@ class SATHandler:
         return [t for t in formula.split() if t]
 
     def _tseitin(self, formula: str) -> Tuple[int, List[List[int]]]:
-        """Tseitin transformation: returns (root_literal, cnf_clauses)."""
-        tokens = self._tokenize(formula)
-        pos = [0]
-        clauses: List[List[int]] = []
-
-        def parse_equiv():
-            left = parse_implies()
-            while pos[0] < len(tokens) and tokens[pos[0]] == "<=>":
-                pos[0] += 1
-                right = parse_implies()
-                aux = self._new_aux_var()
-                # aux <=> (left <=> right)
-                # Encoded as: (aux => (left => right)) & (aux => (right => left)) &
-                #              ((left => right) & (right => left) => aux)
-                # Simplified CNF:
-                clauses.extend(
-                    [
-                        [-aux, -left, right],
-                        [-aux, left, -right],
-                        [aux, left, right],
-                        [aux, -left, -right],
-                    ]
-                )
-                left = aux
-            return left
+        """Tseitin transformation: returns (root_literal, cnf_clauses).
 
-        def parse_implies():
-            left = parse_or()
-            while pos[0] < len(tokens) and tokens[pos[0]] == "=>":
-                pos[0] += 1
-                right = parse_or()
-                aux = self._new_aux_var()
-                # aux <=> (left => right) i.e. aux <=> (!left | right)
-                clauses.extend(
-                    [
-                        [-aux, -left, right],
-                        [aux, left],
-                        [aux, -right],
-                    ]
-                )
-                left = aux
-            return left
+        The encoding is memoised per normalised token sequence as a template
+        over local variable numbers, then renumbered into this handler's
+        variables in the order a fresh parse would have allocated them.
+        """
+        tokens = self._tokenize(formula)
+        template = _TSEITIN_CACHE.get_or_create(
+            " ".join(tokens), lambda: _tseitin_template(tokens)
+        )
+        mapping = [0]
+        for name in template.allocations:
+            mapping.append(
+                self._get_var(name) if name is not None else self._new_aux_var()
+            )
 
-        def parse_or():
-            left = parse_and()
-            or_lits = [left]
-            while pos[0] < len(tokens) and tokens[pos[0]] == "|":
-                pos[0] += 1
-                or_lits.append(parse_and())
-            if len(or_lits) == 1:
-                return left
-            aux = self._new_aux_var()
-            # aux <=> (l1 | l2 | ...)
-            clauses.append([-aux] + or_lits)
-            for lit in or_lits:
-                clauses.append([aux, -lit])
-            return aux
-
-        def parse_and():
-            left = parse_not()
-            and_lits = [left]
-            while pos[0] < len(tokens) and tokens[pos[0]] == "&":
-                pos[0] += 1
-                and_lits.append(parse_not())
-            if len(and_lits) == 1:
-                return left
-            aux = self._new_aux_var()
-            # aux <=> (l1 & l2 & ...)
-            clauses.append([aux] + [-lit for lit in and_lits])
-            for lit in and_lits:
-                clauses.append([-aux, lit])
-            return aux
-
-        def parse_not():
-            if pos[0] < len(tokens) and tokens[pos[0]] == "!":
-                pos[0] += 1
-                inner = parse_not()
-                return -inner
-            return parse_atom()
-
-        def parse_atom():
-            if pos[0] >= len(tokens):
-                raise ValueError("Unexpected end of formula")
-            token = tokens[pos[0]]
-            if token == "(":
-                pos[0] += 1
-                result = parse_equiv()
-                if pos[0] < len(tokens) and tokens[pos[0]] == ")":
-                    pos[0] += 1
-                return result
-            pos[0] += 1
-            return self._get_var(token)
+        def rename(lit: int) -> int:
+            return mapping[lit] if lit > 0 else -mapping[-lit]
 
-        root = parse_equiv()
-        return root, clauses
+        clauses = [[rename(lit) for lit in clause] for clause in template.clauses]
+        return rename(template.root), clauses
 
     # ── SAT solving ──────────────────────────────────────────────────
 
@@ -244,7 +303,6 @@ class SATHandler:
         Returns (is_sat, model_or_none, statistics).
         """
         solver_name = solver_name or self._default_solver
-        import time
 
         stats = {
             "solver": solver_name,
@@ -295,11 +353,16 @@ class SATHandler:
         formulas: List[str],
         solver_name: Optional[str] = None,
     ) -> Tuple[bool, str]:
-        """Check if a set of propositional formulas is consistent (satisfiable)."""
-        is_sat, model, stats = self.solve_formulas(formulas, solver_name)
+        """Check if a set of propositional formulas is consistent (satisfiable).
+
+        Runs on the cached :class:`SATSession` of the belief set, so a later
+        :meth:`query` against the same formulas reuses its solver.
+        """
+        session = self.session(formulas, solver_name)
+        is_sat, model = session.solve()
         if is_sat:
             return True, f"Consistent (SAT). Model: {model}"
-        return False, f"Inconsistent (UNSAT). Solver: {stats.get('solver')}"
+        return False, f"Inconsistent (UNSAT). Solver: {session.solver_name}"
 
     def query(
         self,
@@ -307,11 +370,48 @@ class SATHandler:
         query_formula: str,
         solver_name: Optional[str] = None,
     ) -> bool:
-        """Check if KB entails query (KB ∧ ¬query is UNSAT)."""
-        negated = f"! ( {query_formula} )"
-        all_formulas = list(kb_formulas) + [negated]
-        is_sat, _, _ = self.solve_formulas(all_formulas, solver_name)
-        return not is_sat  # entails iff negation is UNSAT
+        """Check if KB entails query (KB ∧ ¬query is UNSAT).
+
+        The KB is encoded once per session; each query only adds its own
+        Tseitin definition and is decided under the assumption ``¬query``.
+        """
+        return self.session(kb_formulas, solver_name).entails(query_formula)
+
+    def session(
+        self, kb_formulas: Iterable[str], solver_name: Optional[str] = None
+    ) -> "SATSession":
+        """Return the live :class:`SATSession` for a belief set.
+
+        Sessions are cached per (solver, KB) — least recently used first out —
+        so hundreds of queries against one KB pay its encoding once. A caller
+        that closes the session or adds formulas/clauses to it takes it out of
+        the cache: the next call for the KB gets a fresh session.
+        """
+        solver_name = solver_name or self._default_solver
+        kb = tuple(f.strip() for f in kb_formulas if f and f.strip())
+        key = (solver_name, kb)
+        session = self._sessions.get(key)
+        if session is not None:
+            self._sessions.move_to_end(key)
+            return session
+        session = SATSession(kb, solver_name)
+        session._release = lambda: self._forget_session(key, session)
+        self._sessions[key] = session
+        while len(self._sessions) > self.MAX_SESSIONS:
+            _, evicted = self._sessions.popitem(last=False)
+            evicted.close()
+        return session
+
+    def _forget_session(self, key: tuple, session: "SATSession") -> None:
+        if self._sessions.get(key) is session:
+            del self._sessions[key]
+
+    def close_sessions(self) -> None:
+        """Release the native solvers held by cached sessions."""
+        sessions = list(self._sessions.values())
+        self._sessions.clear()
+        for session in sessions:
+            session.close()
 
     def enumerate_solutions(
         self,
@@ -439,7 +539,6 @@ class SATHandler:
         self, clauses: List[List[int]], timeout: float = 10.0
     ) -> Dict[str, dict]:
         """Benchmark all available solvers on a problem."""
-        import time
 
         results = {}
         for solver_name in RECOMMENDED_SOLVERS:
@@ -459,6 +558,149 @@ class SATHandler:
         return results
 
 
+class SATSession:
+    """One live SAT solver over a belief set, queried incrementally.
+
+    The KB is Tseitin-encoded once into a persistent PySAT solver. Further
+    formulas and clauses are added in place, and entailment queries are
+    answered under solver assumptions (``solve(assumptions=[-q])``) instead of
+    rebuilding ``KB ∧ ¬q``: only the query's own definition clauses are new,
+    and learnt clauses carry over from one query to the next. Definitions are
+    cached by normalised formula text, so a repeated formula or query costs
+    no encoding at all.
+
+    ``stats`` accumulates per-session counts and timings (seconds). A session
+    handed out by :meth:`SATHandler.session` leaves the handler's cache as
+    soon as it is modified or closed, so the cache only holds the KB it was
+    keyed by.
+    """
+
+    def __init__(
+        self, kb_formulas: Iterable[str] = (), solver_name: str = "cadical195"
+    ):
+        if not PYSAT_AVAILABLE:
+            raise RuntimeError("PySAT is not installed. Run: pip install python-sat")
+        self.solver_name = solver_name
+        self._encoder = SATHandler(solver_name)
+        self._solver = Solver(name=solver_name)
+        self._definitions: Dict[str, int] = {}
+        self._kb: List[str] = []
+        self._release: Optional[Callable[[], None]] = None
+        self.stats: Dict[str, Any] = {
+            "solver": solver_name,
+            "kb_formulas": 0,
+            "clauses": 0,
+            "queries": 0,
+            "solver_calls": 0,
+            "definition_hits": 0,
+            "definition_misses": 0,
+            "encode_time": 0.0,
+            "solve_time": 0.0,
+            "last_query_time": 0.0,
+        }
+        self.add_formulas(kb_formulas)
+
+    # ── Building the KB ──────────────────────────────────────────────
+
+    @property
+    def variable_map(self) -> Dict[str, int]:
+        """Proposition→DIMACS mapping shared by every query of the session."""
+        return self._encoder.variable_map
+
+    @property
+    def formulas(self) -> List[str]:
+        return list(self._kb)
+
+    def add_formula(self, formula: str) -> None:
+        """Assert one more formula in the KB."""
+        formula = formula.strip()
+        if not formula:
+            return
+        self.add_clause([self._define(formula)])
+        self._kb.append(formula)
+        self.stats["kb_formulas"] += 1
+
+    def add_formulas(self, formulas: Iterable[str]) -> None:
+        for formula in formulas:
+            self.add_formula(formula)
+
+    def add_clause(self, clause: List[int]) -> None:
+        """Add a raw DIMACS clause over the session's variables."""
+        self._detach()
+        self._solver.add_clause(clause)
+        self.stats["clauses"] += 1
+
+    def _define(self, formula: str) -> int:
+        """Literal equivalent to ``formula``, encoding it on first sight."""
+        key = " ".join(self._encoder._tokenize(formula))
+        literal = self._definitions.get(key)
+        if literal is not None:
+            self.stats["definition_hits"] += 1
+            return literal
+        self.stats["definition_misses"] += 1
+        start = time.perf_counter()
+        literal, clauses = self._encoder._tseitin(formula)
+        self._solver.append_formula(clauses)
+        self.stats["clauses"] += len(clauses)
+        self.stats["encode_time"] += time.perf_counter() - start
+        self._definitions[key] = literal
+        return literal
+
+    # ── Queries ──────────────────────────────────────────────────────
+
+    def solve(
+        self, assumptions: Optional[List[int]] = None
+    ) -> Tuple[bool, Optional[Dict[str, bool]]]:
+        """Satisfiability of the KB (under ``assumptions``) and a named model."""
+        start = time.perf_counter()
+        is_sat = self._solver.solve(assumptions=assumptions or [])
+        self.stats["solve_time"] += time.perf_counter() - start
+        self.stats["solver_calls"] += 1
+        if not is_sat:
+            return False, None
+        model = set(self._solver.get_model() or [])
+        return True, {
+            name: var in model for name, var in self._encoder._var_map.items()
+        }
+
+    def is_consistent(self) -> bool:
+        return self.solve()[0]
+
+    def entails(self, query_formula: str) -> bool:
+        """True iff the KB entails ``query_formula`` (KB ∧ ¬query is UNSAT)."""
+        start = time.perf_counter()
+        literal = self._define(query_formula)
+        is_sat, _ = self.solve([-literal])
+        elapsed = time.perf_counter() - start
+        self.stats["queries"] += 1
+        self.stats["last_query_time"] = elapsed
+        return not is_sat
+
+    def entails_all(self, query_formulas: Iterable[str]) -> List[bool]:
+        """Batch of entailment queries against the same KB."""
+        return [self.entails(q) for q in query_formulas]
+
+    # ── Lifecycle ────────────────────────────────────────────────────
+
+    def _detach(self) -> None:
+        """Leave the handler cache: this session no longer matches its key."""
+        release, self._release = self._release, None
+        if release is not None:
+            release()
+
+    def close(self) -> None:
+        self._detach()
+        if self._solver is not None:
+            self._solver.delete()
+            self._solver = None
+
+    def __enter__(self) -> "SATSession":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
 async def compare_pl_backends(formulas: List[str]) -> Dict[str, Any]:
     """Run ALL available PL/SAT backends on the same formula set and compare.
 
@@ -267,6 +267,7 @@ async def add_justification(
             timestamp=datetime.now().isoformat(),
             justification=justification_info,
             conclusion_status=result["conclusion_status"],
+            changes=result["changes"],
         )
 
     except Exception as e:
@@ -320,6 +321,7 @@ async def set_belief_validity(
             old_value=result["old_value"],
             new_value=result["new_value"],
             propagation_occurred=result["propagation_occurred"],
+            changes=result["changes"],
         )
 
     except Exception as e:
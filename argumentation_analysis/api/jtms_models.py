@@ -177,6 +177,10 @@ class AddJustificationResponse(JTMSResponse):
     conclusion_status: Optional[bool] = Field(
         None, description="Nouveau statut de la conclusion"
     )
+    changes: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Croyances basculées par la propagation (in/out/unknown)",
+    )
 
 
 class ExplainBeliefResponse(JTMSResponse):
@@ -255,6 +259,10 @@ class SetBeliefValidityResponse(JTMSResponse):
     propagation_occurred: bool = Field(
         True, description="Indique si propagation effectuée"
     )
+    changes: Dict[str, List[str]] = Field(
+        default_factory=dict,
+        description="Croyances basculées par la propagation (in/out/unknown)",
+    )
 
 
 # Modèles de réponses pour les sessions
@@ -0,0 +1,341 @@
+"""Asynchronous execution service for the LADR provers (Prover9 and Mace4).
+
+The sync runners (:mod:`prover9_runner`, :mod:`mace4_runner`) block a thread
+for the whole search and are called one prover at a time. This service is the
+asyncio front-end used by the orchestration layer:
+
+* **Bounded pool.** At most ``max_workers`` LADR processes run at once; extra
+  queries wait for a slot on the event loop instead of oversubscribing the
+  CPU. The LADR binaries are one-shot programs (read the input to EOF, search,
+  exit), so the pool bounds concurrent *processes* rather than keeping
+  long-lived workers around.
+* **stdin delivery.** Input is piped to the binary — no temp file per query.
+* **Racing.** A consistency check runs Prover9 (refutation side) and Mace4
+  (model side) on the same belief set concurrently. The first *definitive*
+  answer wins and the other process is killed: a Prover9 proof of the empty
+  clause (inconsistent), a Prover9 saturated search (consistent) or a Mace4
+  model (consistent). Mace4's ``exhausted`` exit is only a bounded search,
+  not a refutation proof: when Prover9 decided nothing it yields a degraded
+  (``None``) verdict whose note carries the Mace4 outcome.
+* **Content-addressed cache.** Decided verdicts are kept in an LRU keyed by
+  the SHA-256 of the normalised LADR input, so the same belief set checked
+  again (another document, another phase) costs nothing. Degraded outcomes
+  (``None``, timeouts, errors) are never cached (#1019).
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+
+from argumentation_analysis.core.mace4_runner import (
+    MACE4_BIN_DIR,
+    MACE4_DEFAULT_MAX_DOMAIN,
+    MACE4_DEFAULT_TIMEOUT,
+    MACE4_EXECUTABLE,
+    check_mace4_output,
+    interpret_mace4_output,
+    mace4_command,
+)
+from argumentation_analysis.core.prover9_runner import (
+    PROVER9_BIN_DIR,
+    PROVER9_DEFAULT_TIMEOUT,
+    PROVER9_EXECUTABLE,
+    check_prover9_output,
+    decode_ladr_output,
+    encode_ladr_input,
+    prover9_command,
+)
+
+logger = logging.getLogger("LADRSolverService")
+
+Runner = Callable[[str], Awaitable[str]]
+
+
+@dataclass(frozen=True)
+class LADRVerdict:
+    """Outcome of a raced consistency check.
+
+    ``consistent`` is tri-state: ``None`` means no prover reached a verdict.
+    """
+
+    consistent: Optional[bool]
+    solver: str
+    note: str
+    raw_output: str = ""
+    cached: bool = False
+
+
+def interpret_prover9_refutation(stdout: str) -> Optional[bool]:
+    """Consistency verdict of Prover9 on a goal-less assumption list.
+
+    Without a goal, a proof IS the derivation of the empty clause:
+    "THEOREM PROVED" means inconsistent and "SEARCH FAILED" (the search
+    saturated) means consistent. Neither marker means nothing was decided.
+    """
+    if "THEOREM PROVED" in stdout or "Proof found" in stdout:
+        return False
+    if "SEARCH FAILED" in stdout:
+        return True
+    return None
+
+
+async def run_ladr_process(
+    command: List[str], input_content: str, cwd: str, timeout: float, name: str
+) -> Tuple[str, str]:
+    """Run one LADR binary with ``input_content`` on stdin.
+
+    The process is killed on timeout (re-raised as ``RuntimeError``, like the
+    sync runners) and on cancellation, so a lost race never leaves a search
+    running in the background.
+    """
+    process = await asyncio.create_subprocess_exec(
+        *command,
+        stdin=asyncio.subprocess.PIPE,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        cwd=cwd,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(
+            process.communicate(encode_ladr_input(input_content)), timeout
+        )
+    except asyncio.TimeoutError as e:
+        await _kill(process)
+        raise RuntimeError(
+            f"{name} timed out after {timeout}s — surfacing instead of hanging "
+            "the pipeline (#1019)."
+        ) from e
+    except asyncio.CancelledError:
+        await _kill(process)
+        raise
+    return decode_ladr_output(stdout), decode_ladr_output(stderr)
+
+
+async def _kill(process) -> None:
+    if process.returncode is None:
+        try:
+            process.kill()
+        except ProcessLookupError:
+            pass
+        await process.wait()
+
+
+class LADRSolverService:
+    """Bounded, cached, racing front-end for Prover9 and Mace4.
+
+    ``prover9_runner`` / ``mace4_runner`` are ``async (ladr_input) -> stdout``
+    callables; by default they spawn the bundled binaries. Passing
+    ``mace4_runner=False`` disables the model-finder side of the race.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        cache_size: int = 1024,
+        prover9_runner: Optional[Runner] = None,
+        mace4_runner=None,
+        prover9_timeout: float = PROVER9_DEFAULT_TIMEOUT,
+        mace4_timeout: float = MACE4_DEFAULT_TIMEOUT,
+        max_domain: int = MACE4_DEFAULT_MAX_DOMAIN,
+    ) -> None:
+        if max_workers is not None and max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        # Two slots at least, so both sides of a race can run at once; with a
+        # single slot the provers run one after the other (each bounded by
+        # its own timeout).
+        self.max_workers = max_workers or max(2, min(4, os.cpu_count() or 1))
+        self.cache_size = cache_size
+        self.prover9_timeout = prover9_timeout
+        self.mace4_timeout = mace4_timeout
+        self.max_domain = max_domain
+        self._runners: Dict[str, Runner] = {
+            "prover9": prover9_runner or self._spawn_prover9,
+        }
+        if mace4_runner is not False:
+            self._runners["mace4"] = mace4_runner or self._spawn_mace4
+        self._cache: "OrderedDict[str, LADRVerdict]" = OrderedDict()
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._slots_loop = None
+        self.stats: Dict[str, int] = {
+            "cache_hits": 0,
+            "cache_misses": 0,
+            "prover9_runs": 0,
+            "mace4_runs": 0,
+            "prover9_wins": 0,
+            "mace4_wins": 0,
+            "cancelled": 0,
+        }
+
+    # ── Single prover runs ───────────────────────────────────────────
+
+    async def prove(self, input_content: str) -> str:
+        """Run Prover9 on ``input_content`` in a pool slot; return its stdout."""
+        return await self._run("prover9", input_content)
+
+    async def find_model(self, input_content: str) -> str:
+        """Run a bounded Mace4 search in a pool slot; return its stdout."""
+        return await self._run("mace4", input_content)
+
+    async def _run(self, solver: str, input_content: str) -> str:
+        async with self._pool():
+            self.stats[f"{solver}_runs"] += 1
+            return await self._runners[solver](input_content)
+
+    def _pool(self) -> asyncio.Semaphore:
+        # A semaphore binds to the loop it first waits on; each asyncio.run()
+        # (CLI calls, tests) gets its own.
+        loop = asyncio.get_running_loop()
+        if self._slots is None or self._slots_loop is not loop:
+            self._slots = asyncio.Semaphore(self.max_workers)
+            self._slots_loop = loop
+        return self._slots
+
+    async def _spawn_prover9(self, input_content: str) -> str:
+        if not PROVER9_EXECUTABLE.is_file():
+            raise FileNotFoundError(
+                f"Prover9 executable not found at {PROVER9_EXECUTABLE}"
+            )
+        stdout, _ = await run_ladr_process(
+            prover9_command(),
+            input_content,
+            str(PROVER9_BIN_DIR),
+            self.prover9_timeout,
+            "Prover9",
+        )
+        return check_prover9_output(stdout)
+
+    async def _spawn_mace4(self, input_content: str) -> str:
+        if not MACE4_EXECUTABLE.is_file():
+            raise FileNotFoundError(f"Mace4 executable not found at {MACE4_EXECUTABLE}")
+        stdout, stderr = await run_ladr_process(
+            mace4_command(self.max_domain),
+            input_content,
+            str(MACE4_BIN_DIR),
+            self.mace4_timeout,
+            "Mace4",
+        )
+        return check_mace4_output(stdout, stderr)
+
+    # ── Raced consistency check ──────────────────────────────────────
+
+    async def check_consistency(self, formulas: str) -> LADRVerdict:
+        """Decide the consistency of LADR ``formulas`` (one clause per line).
+
+        Raises the first prover error when every prover failed to run, so the
+        caller can fall back; returns a ``consistent=None`` verdict when the
+        provers ran but decided nothing.
+        """
+        body = formulas.replace("\r\n", "\n").strip()
+        key = self.cache_key(body)
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return replace(cached, cached=True)
+        self.stats["cache_misses"] += 1
+
+        inputs = {
+            "prover9": f"formulas(sos).\n{body}\nend_of_list.\n",
+            "mace4": f"formulas(assumptions).\n{body}\nend_of_list.\n",
+        }
+        tasks = {
+            asyncio.ensure_future(self._run(solver, inputs[solver])): solver
+            for solver in self._runners
+        }
+        outputs: Dict[str, str] = {}
+        errors: Dict[str, BaseException] = {}
+        verdict: Optional[LADRVerdict] = None
+        pending = set(tasks)
+        try:
+            while pending and verdict is None:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    solver = tasks[task]
+                    if task.exception() is not None:
+                        errors[solver] = task.exception()
+                        logger.info(f"{solver} failed: {task.exception()}")
+                        continue
+                    outputs[solver] = task.result()
+                    verdict = verdict or self._definitive(solver, outputs[solver])
+        finally:
+            for task in pending:
+                task.cancel()
+                self.stats["cancelled"] += 1
+            if pending:
+                await asyncio.gather(*pending, return_exceptions=True)
+
+        if verdict is None:
+            if not outputs:
+                raise next(iter(errors.values()))
+            verdict = self._fallback(outputs)
+        else:
+            self.stats[f"{verdict.solver}_wins"] += 1
+        if verdict.consistent is not None:
+            self._remember(key, verdict)
+        return verdict
+
+    @staticmethod
+    def cache_key(formulas: str) -> str:
+        """Content address of a belief set (SHA-256 of its LADR text)."""
+        return hashlib.sha256(formulas.encode("utf-8")).hexdigest()
+
+    def _definitive(self, solver: str, stdout: str) -> Optional[LADRVerdict]:
+        if solver == "prover9":
+            consistent = interpret_prover9_refutation(stdout)
+            if consistent is None:
+                return None
+            note = (
+                "Prover9: empty clause derived (inconsistent)."
+                if consistent is False
+                else "Prover9: search saturated without proof (consistent)."
+            )
+            return LADRVerdict(consistent, "prover9", note, stdout)
+        consistent, note = interpret_mace4_output(stdout)
+        if consistent is True:
+            return LADRVerdict(True, "mace4", note, stdout)
+        return None
+
+    def _fallback(self, outputs: Dict[str, str]) -> LADRVerdict:
+        """Best answer once every prover has finished without a definitive one.
+
+        Only a Mace4 model is accepted; an exhausted bounded search is not a
+        refutation, so it stays a degraded verdict (never cached, #1019).
+        """
+        note = "No LADR prover reached a verdict (degraded)."
+        if "mace4" in outputs:
+            consistent, mace4_note = interpret_mace4_output(outputs["mace4"])
+            if consistent is True:
+                self.stats["mace4_wins"] += 1
+                return LADRVerdict(True, "mace4", mace4_note, outputs["mace4"])
+            note = f"{note} {mace4_note}"
+        solver = "prover9" if "prover9" in outputs else next(iter(outputs))
+        return LADRVerdict(None, solver, note, outputs[solver])
+
+    def _remember(self, key: str, verdict: LADRVerdict) -> None:
+        if self.cache_size <= 0:
+            return
+        self._cache[key] = verdict
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+
+# Singleton instance
+_global_ladr_solver_service: Optional[LADRSolverService] = None
+
+
+def get_ladr_solver_service() -> LADRSolverService:
+    """Shared service instance, so the verdict cache spans documents."""
+    global _global_ladr_solver_service
+    if _global_ladr_solver_service is None:
+        _global_ladr_solver_service = LADRSolverService()
+    return _global_ladr_solver_service
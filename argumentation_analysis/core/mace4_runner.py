@@ -34,10 +34,14 @@ falls back honestly — never a fabricated verdict on degraded execution.
 
 import os
 import subprocess
-import tempfile
 from pathlib import Path
 from typing import Optional, Tuple
 
+from argumentation_analysis.core.prover9_runner import (
+    decode_ladr_output,
+    encode_ladr_input,
+)
+
 MACE4_BIN_DIR = Path(__file__).parent.parent.parent / "libs" / "prover9" / "bin"
 MACE4_EXECUTABLE = MACE4_BIN_DIR / "mace4.exe"
 
@@ -79,55 +83,48 @@ def run_mace4(
     if not MACE4_EXECUTABLE.is_file():
         raise FileNotFoundError(f"Mace4 executable not found at {MACE4_EXECUTABLE}")
 
-    temp_input_path = None
     try:
-        # ASCII + Unix newlines, mirroring the Prover9 runner (the cygwin binary
-        # expects LF, not CRLF).
-        with tempfile.NamedTemporaryFile(
-            mode="w+", delete=False, suffix=".in", encoding="ascii", newline="\n"
-        ) as temp_input_file:
-            temp_input_file.write(input_content)
-            temp_input_path = temp_input_file.name
-
-        # Mace4 needs cygwin1.dll resolvable → run with cwd = the bin dir; the
-        # input path is absolute so it is found regardless of cwd.
-        executable_path = os.path.normpath(os.path.abspath(MACE4_EXECUTABLE))
-        command = [
-            executable_path,
-            "-n",
-            "2",
-            "-N",
-            str(max_domain),
-            "-f",
-            os.path.abspath(temp_input_path),
-        ]
-
-        try:
-            process = subprocess.run(
-                command,
-                capture_output=True,
-                text=True,
-                cwd=str(MACE4_BIN_DIR),
-                encoding="cp1252",
-                timeout=timeout,
-            )
-        except subprocess.TimeoutExpired as e:
-            raise RuntimeError(
-                f"Mace4 timed out after {e.timeout}s (unbounded/large model "
-                "search) — surfacing instead of hanging the pipeline (#1019/#1240)."
-            ) from e
-
-        stdout = process.stdout or ""
-        # A genuine parse error must surface, not be read as "no model".
-        if "Fatal error" in stdout or "Fatal error" in (process.stderr or ""):
-            raise RuntimeError(
-                "Mace4 reported a fatal error (likely malformed LADR input):\n"
-                f"{stdout}\n{process.stderr or ''}"
-            )
-        return stdout
-    finally:
-        if temp_input_path is not None and os.path.exists(temp_input_path):
-            os.remove(temp_input_path)
+        process = subprocess.run(
+            mace4_command(max_domain),
+            input=encode_ladr_input(input_content),
+            capture_output=True,
+            cwd=str(MACE4_BIN_DIR),
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise RuntimeError(
+            f"Mace4 timed out after {e.timeout}s (unbounded/large model "
+            "search) — surfacing instead of hanging the pipeline (#1019/#1240)."
+        ) from e
+    return check_mace4_output(
+        decode_ladr_output(process.stdout), decode_ladr_output(process.stderr)
+    )
+
+
+def mace4_command(max_domain: int = MACE4_DEFAULT_MAX_DOMAIN) -> list:
+    """Argument vector running a bounded Mace4 search on its standard input.
+
+    Mace4 needs cygwin1.dll resolvable, so callers run it with cwd = the bin
+    dir. Without ``-f`` the input is read from stdin.
+    """
+    return [
+        os.path.normpath(os.path.abspath(MACE4_EXECUTABLE)),
+        "-n",
+        "2",
+        "-N",
+        str(max_domain),
+    ]
+
+
+def check_mace4_output(stdout: str, stderr: str = "") -> str:
+    """Return ``stdout`` unless Mace4 reported a fatal (parse) error."""
+    # A genuine parse error must surface, not be read as "no model".
+    if "Fatal error" in stdout or "Fatal error" in stderr:
+        raise RuntimeError(
+            "Mace4 reported a fatal error (likely malformed LADR input):\n"
+            f"{stdout}\n{stderr}"
+        )
+    return stdout
 
 
 def interpret_mace4_output(stdout: str) -> Tuple[Optional[bool], str]:
@@ -1,17 +1,63 @@
 import subprocess
 import os
-import tempfile
 from pathlib import Path
 
 PROVER9_BIN_DIR = Path(__file__).parent.parent.parent / "libs" / "prover9" / "bin"
 PROVER9_EXECUTABLE = PROVER9_BIN_DIR / "prover9.bat"
+# The binary itself: stdin delivery bypasses the .bat wrapper, whose only job
+# is to turn a no-argument call into ``--help`` (the no-args deadlock happened
+# on an inherited, never-closed console stdin — a pipe is closed after write).
+PROVER9_BINARY = PROVER9_BIN_DIR / "prover9.exe"
+PROVER9_DEFAULT_TIMEOUT = 60
+
+
+def encode_ladr_input(input_content: str) -> bytes:
+    """LADR input as ASCII bytes with Unix newlines.
+
+    Piped as bytes rather than text: a text-mode pipe would translate ``\\n``
+    to ``os.linesep`` on Windows, and the cygwin binaries expect LF.
+    """
+    return input_content.replace("\r\n", "\n").encode("ascii", errors="replace")
+
+
+def decode_ladr_output(raw) -> str:
+    """Decode LADR stdout/stderr (the Windows builds print in cp1252)."""
+    if raw is None:
+        return ""
+    if isinstance(raw, str):
+        return raw
+    return raw.decode("cp1252", errors="replace")
+
+
+def prover9_command() -> list:
+    """Argument vector running Prover9 on its standard input."""
+    return [os.path.normpath(os.path.abspath(PROVER9_BINARY))]
+
+
+def check_prover9_output(stdout: str) -> str:
+    """Return ``stdout`` unless it carries Prover9's fatal-error marker."""
+    # FP-8 verify-the-verification: Prover9's exit code is SEMANTIC, not a
+    # success/failure signal. Exit 2 with "SEARCH FAILED" is the NORMAL
+    # outcome for a consistency check on a CONSISTENT KB (no proof of $F
+    # found) — using ``check=True`` made the runner raise on exactly the
+    # case the caller wants, so a consistent KB could never be reported.
+    # Only a *parser* failure is a real error: it carries the "Fatal error"
+    # marker in stdout and must be surfaced (anti-théâtre #1019: a malformed
+    # input must not masquerade as a consistency verdict). Everything else
+    # (proof found / search failed) is returned to the caller, which
+    # interprets the proof markers.
+    if "Fatal error" in stdout:
+        raise RuntimeError(
+            "Prover9 reported a fatal error (likely malformed input):\n" f"{stdout}"
+        )
+    return stdout
 
 
 def run_prover9(input_content: str) -> str:
     """
     Exécute Prover9 dans un processus externe avec le contenu d'entrée fourni.
-    Utilise désormais un fichier temporaire pour passer l'entrée, conformément
-    au fonctionnement du wrapper prover9.bat.
+    L'entrée est transmise sur l'entrée standard du binaire (plus de fichier
+    temporaire à écrire puis supprimer à chaque requête).
 
     Args:
         input_content: Une chaîne de caractères contenant la logique à envoyer à Prover9.
@@ -29,63 +75,24 @@ def run_prover9(input_content: str) -> str:
     if not PROVER9_EXECUTABLE.is_file():
         raise FileNotFoundError(f"Prover9 executable not found at {PROVER9_EXECUTABLE}")
 
+    # R467: a hard timeout is mandatory. ``subprocess.run`` with no timeout
+    # hangs the whole pipeline indefinitely if Prover9 deadlocks. An infinite
+    # hang is a *silent* failure — anti-théâtre #1019 demands it surface.
+    # A genuine consistency check on a small KB returns in well under 1s;
+    # 60s is a generous ceiling. A timeout is re-raised as RuntimeError so
+    # the caller falls back to the Tweety reasoner (honest, labelled) instead
+    # of blocking forever.
     try:
-        # Créer un fichier temporaire pour l'entrée
-        # Créer un fichier temporaire en ASCII avec des fins de ligne Unix (\n) pour Prover9
-        with tempfile.NamedTemporaryFile(
-            mode="w+", delete=False, suffix=".in", encoding="ascii", newline="\n"
-        ) as temp_input_file:
-            temp_input_file.write(input_content)
-            temp_input_path = temp_input_file.name
-
-        # La commande inclut maintenant le chemin du fichier d'entrée
-        # Normaliser le chemin pour garantir la compatibilité avec Windows
-        executable_path = os.path.normpath(os.path.abspath(PROVER9_EXECUTABLE))
-        # Forcer les guillemets autour des chemins pour le shell
-        executable_path_quoted = f'"{executable_path}"'
-        temp_input_path_quoted = f'"{temp_input_path}"'
-        command_str = f"{executable_path_quoted} -f {temp_input_path_quoted}"
-
-        # R467: a hard timeout is mandatory. ``subprocess.run`` with no timeout
-        # hangs the whole pipeline indefinitely if Prover9 deadlocks (the
-        # prover9.bat wrapper itself documents a no-args deadlock). An infinite
-        # hang is a *silent* failure — anti-théâtre #1019 demands it surface.
-        # A genuine consistency check on a small KB returns in well under 1s;
-        # 60s is a generous ceiling. A timeout is re-raised as RuntimeError so
-        # the caller falls back to the Tweety reasoner (honest, labelled) instead
-        # of blocking forever.
-        try:
-            process = subprocess.run(
-                command_str,
-                capture_output=True,
-                text=True,
-                cwd=str(PROVER9_BIN_DIR),
-                encoding="cp1252",
-                shell=True,
-                timeout=60,
-            )
-        except subprocess.TimeoutExpired as e:
-            raise RuntimeError(
-                f"Prover9 timed out after {e.timeout}s (deadlock or runaway "
-                "search) — surfacing instead of hanging the pipeline."
-            ) from e
-        # FP-8 verify-the-verification: Prover9's exit code is SEMANTIC, not a
-        # success/failure signal. Exit 2 with "SEARCH FAILED" is the NORMAL
-        # outcome for a consistency check on a CONSISTENT KB (no proof of $F
-        # found) — using ``check=True`` made the runner raise on exactly the
-        # case the caller wants, so a consistent KB could never be reported.
-        # Only a *parser* failure is a real error: it carries the "Fatal error"
-        # marker in stdout and must be surfaced (anti-théâtre #1019: a malformed
-        # input must not masquerade as a consistency verdict). Everything else
-        # (proof found / search failed) is returned to the caller, which
-        # interprets the proof markers.
-        stdout = process.stdout
-        if "Fatal error" in stdout:
-            raise RuntimeError(
-                "Prover9 reported a fatal error (likely malformed input):\n" f"{stdout}"
-            )
-        return stdout
-    finally:
-        # S'assurer que le fichier temporaire est supprimé
-        if "temp_input_path" in locals() and os.path.exists(temp_input_path):
-            os.remove(temp_input_path)
+        process = subprocess.run(
+            prover9_command(),
+            input=encode_ladr_input(input_content),
+            capture_output=True,
+            cwd=str(PROVER9_BIN_DIR),
+            timeout=PROVER9_DEFAULT_TIMEOUT,
+        )
+    except subprocess.TimeoutExpired as e:
+        raise RuntimeError(
+            f"Prover9 timed out after {e.timeout}s (deadlock or runaway "
+            "search) — surfacing instead of hanging the pipeline."
+        ) from e
+    return check_prover9_output(decode_ladr_output(process.stdout))
@@ -4,6 +4,8 @@ from dataclasses import dataclass, field, asdict
 from typing import Dict, List, Any, Optional, cast
 import logging
 
+from .state_versions import StateDiff, StateSnapshot, StateVersionStore
+
 # Logger spécifique pour l'état
 state_logger = logging.getLogger("RhetoricalAnalysisState")
 # Assurer qu'un handler de base est présent si non configuré globalement tôt
@@ -149,6 +151,12 @@ class RhetoricalAnalysisState:
         # {site: {"status": ..., "offset": ..., "window": ...}}. Écrit par
         # reading_window.selected_text, lu par le rapport (build_narrative).
         self.reading_window_status: Dict[str, Dict[str, Any]] = {}
+        # Copies figées par champ et compteurs de version des snapshots.
+        # Conservé par reset_state (__init__ rappelé) pour que les versions
+        # restent croissantes.
+        self._versions: StateVersionStore = (
+            getattr(self, "_versions", None) or StateVersionStore()
+        )
         state_logger.debug(
             f"Nouvelle instance RhetoricalAnalysisState créée (id: {id(self)}) avec texte (longueur: {len(initial_text)})."
         )
@@ -443,15 +451,40 @@ class RhetoricalAnalysisState:
                 ),
             }
         else:
-            return cast(Dict[str, Any], json.loads(self.to_json(indent=None)))
+            try:
+                return self.snapshot().to_dict()
+            except TypeError:
+                # Champ non sérialisable : même enveloppe d'erreur qu'avant.
+                return cast(Dict[str, Any], json.loads(self.to_json(indent=None)))
 
-    def to_json(self, indent: Optional[int] = 2) -> str:
-        """Sérialise l'état actuel en chaîne JSON."""
-        state_dict = {
+    def _serializable_fields(self) -> Dict[str, Any]:
+        return {
             k: v
             for k, v in self.__dict__.items()
-            if not callable(v) and not k.startswith("_logger")
+            if not callable(v) and not k.startswith("_logger") and k != "_versions"
         }
+
+    def snapshot(self) -> StateSnapshot:
+        """Snapshot immuable et versionné de l'état complet.
+
+        Seuls les champs modifiés depuis le snapshot précédent sont
+        re-sérialisés ; les autres sont partagés avec lui (voir
+        ``state_versions``). Chaque lecture d'un champ en renvoie une copie.
+        """
+        return self._versions.snapshot(self._serializable_fields())
+
+    @property
+    def state_version(self) -> int:
+        """Version du dernier snapshot (incrémentée à chaque changement observé)."""
+        return self._versions.version
+
+    def diff(self, since: StateSnapshot) -> StateDiff:
+        """Changements entre ``since`` et l'état actuel."""
+        return since.diff(self.snapshot())
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Sérialise l'état actuel en chaîne JSON."""
+        state_dict = self._serializable_fields()
         try:
             return json.dumps(
                 state_dict, indent=indent, ensure_ascii=False, default=str
@@ -1656,6 +1689,8 @@ class UnifiedAnalysisState(RhetoricalAnalysisState):
                 }
             )
         else:
+            # Dimensions unifiées : objets vivants, pas les copies figées du
+            # snapshot versionné (contrat historique de summarize=False).
             base.update(
                 {
                     "counter_arguments": self.counter_arguments,
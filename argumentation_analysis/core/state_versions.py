@@ -0,0 +1,239 @@
+"""Versioned, structurally shared snapshots of the analysis state.
+
+``get_state_snapshot(summarize=False)`` used to serialise the whole state
+to JSON and parse it back on every call, and the conversational
+orchestrator calls it at every phase boundary. ``StateVersionStore`` keeps
+the JSON-native copy ("frozen" value) of each field from one snapshot to
+the next and re-serialises only the fields whose live value no longer
+compares equal to it. The equality check runs in C and is an order of
+magnitude cheaper than a JSON round trip; unchanged fields are shared, as
+the same objects, by every snapshot that contains them.
+
+Each field carries the store version at which it last changed, so two
+``StateSnapshot`` objects are diffed field by field without comparing the
+unchanged ones. The frozen values stay private to the store: reading a
+snapshot field (``snap[name]``, ``to_dict``) returns a fresh copy, made by
+``marshal`` (several times cheaper than the JSON round trip), so a caller
+editing it cannot alter other snapshots or the store's reference copy.
+
+Change detection is by value: an in-place edit of a nested dict is seen
+like a reassignment, but values that compare equal (``1`` and ``1.0``
+inside a container) count as unchanged.
+"""
+
+import json
+import marshal
+import threading
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+def freeze(value: Any) -> Any:
+    """JSON-native copy of ``value`` (non-JSON objects become ``str``).
+
+    Raises ``TypeError`` when ``value`` cannot be serialised (e.g. tuple
+    dictionary keys).
+    """
+    return json.loads(json.dumps(value, ensure_ascii=False, default=str))
+
+
+# Immutable JSON-native values: they are their own frozen copy.
+_SCALARS = (str, int, float, bool, type(None))
+
+
+def _thaw(frozen: Any) -> Any:
+    """Private mutable copy of a frozen (JSON-native) value."""
+    if type(frozen) in _SCALARS:
+        return frozen
+    return marshal.loads(marshal.dumps(frozen))
+
+
+def _unchanged(live: Any, frozen: Any) -> bool:
+    if type(live) in _SCALARS:
+        # Exact types keep True, 1 and 1.0 apart.
+        return type(live) is type(frozen) and live == frozen
+    if not isinstance(live, (dict, list)):
+        return False
+    try:
+        return bool(live == frozen)
+    except Exception:  # exotic __eq__ (arrays, ...): treat as changed
+        return False
+
+
+class StateSnapshot(Mapping[str, Any]):
+    """Immutable view of the state at one store version.
+
+    Field values are returned as copies; the frozen values are shared with
+    the store and the other snapshots.
+    """
+
+    __slots__ = ("version", "_fields", "_versions")
+
+    def __init__(
+        self, version: int, fields: Dict[str, Any], versions: Dict[str, int]
+    ) -> None:
+        self.version = version
+        self._fields = fields
+        self._versions = versions
+
+    def __getitem__(self, key: str) -> Any:
+        return _thaw(self._fields[key])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def field_version(self, key: str) -> int:
+        """Store version at which ``key`` last changed."""
+        return self._versions[key]
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Copy of every field value, detached from the snapshot."""
+        return {name: _thaw(value) for name, value in self._fields.items()}
+
+    def diff(self, later: "StateSnapshot") -> "StateDiff":
+        """Changes from this snapshot to ``later``."""
+        return diff_snapshots(self, later)
+
+
+class StateDiff:
+    """Field-level changes between two snapshots.
+
+    ``changes`` maps each changed field to a description:
+
+    - dicts: ``{"added": [...], "removed": [...], "changed": [...]}`` keys;
+    - lists: ``{"appended": n}`` when the old list is a prefix of the new
+      one, ``{"before_len": a, "after_len": b}`` otherwise;
+    - added / removed fields: ``{"added": True}`` / ``{"removed": True}``;
+    - anything else: ``{"before": old, "after": new}``.
+    """
+
+    __slots__ = ("from_version", "to_version", "changes")
+
+    def __init__(
+        self, from_version: int, to_version: int, changes: Dict[str, Dict[str, Any]]
+    ) -> None:
+        self.from_version = from_version
+        self.to_version = to_version
+        self.changes = changes
+
+    def __bool__(self) -> bool:
+        return bool(self.changes)
+
+    def summary(self) -> Dict[str, int]:
+        """Per changed field, the number of entries added/changed/removed."""
+        out: Dict[str, int] = {}
+        for name, change in self.changes.items():
+            if "appended" in change:
+                out[name] = change["appended"]
+            elif "changed" in change:
+                out[name] = sum(len(change[k]) for k in ("added", "removed", "changed"))
+            else:
+                out[name] = 1
+        return out
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "from_version": self.from_version,
+            "to_version": self.to_version,
+            "changes": self.changes,
+        }
+
+
+def _describe(before: Any, after: Any) -> Dict[str, Any]:
+    if isinstance(before, dict) and isinstance(after, dict):
+        return {
+            "added": [k for k in after if k not in before],
+            "removed": [k for k in before if k not in after],
+            "changed": [k for k in after if k in before and after[k] != before[k]],
+        }
+    if isinstance(before, list) and isinstance(after, list):
+        if len(after) >= len(before) and after[: len(before)] == before:
+            return {"appended": len(after) - len(before)}
+        return {"before_len": len(before), "after_len": len(after)}
+    return {"before": _thaw(before), "after": _thaw(after)}
+
+
+def diff_snapshots(before: StateSnapshot, after: StateSnapshot) -> StateDiff:
+    """Compare two snapshots of the same state, skipping unchanged fields."""
+    changes: Dict[str, Dict[str, Any]] = {}
+    for name in after:
+        if name not in before:
+            changes[name] = {"added": True}
+        elif after.field_version(name) != before.field_version(name):
+            old, new = before._fields[name], after._fields[name]
+            if old is not new and (type(old) is not type(new) or old != new):
+                changes[name] = _describe(old, new)
+    for name in before:
+        if name not in after:
+            changes[name] = {"removed": True}
+    return StateDiff(before.version, after.version, changes)
+
+
+class StateVersionStore:
+    """Per-field frozen values and version counters of one state object."""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._frozen: Dict[str, Any] = {}
+        self._field_versions: Dict[str, int] = {}
+        self._last: Optional[StateSnapshot] = None
+        self._lock = threading.Lock()
+        # Fields re-serialised by the last ``snapshot`` call (diagnostics).
+        self.last_refrozen: List[str] = []
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The lock is process-local: drop it when the state is copied/pickled.
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    def snapshot(self, fields: Dict[str, Any]) -> StateSnapshot:
+        """Snapshot of ``fields`` (live name -> value), bumping the version
+        if any field changed since the previous call.
+
+        Raises ``TypeError`` if a changed field cannot be serialised.
+        """
+        with self._lock:
+            refrozen, updates = [], []
+            for name, live in fields.items():
+                known = name in self._frozen
+                if known and _unchanged(live, self._frozen[name]):
+                    continue
+                frozen = live if type(live) in _SCALARS else freeze(live)
+                refrozen.append(name)
+                previous = self._frozen.get(name)
+                if known and type(frozen) is type(previous) and frozen == previous:
+                    continue  # equal once frozen (tuples, ...): keep the shared copy
+                updates.append((name, frozen))
+            removed = [name for name in self._frozen if name not in fields]
+            self.last_refrozen = refrozen
+            if updates or removed:
+                self.version += 1
+                self._apply(updates, removed)
+            if (
+                self._last is None
+                or updates
+                or removed
+                or list(self._last) != list(fields)
+            ):
+                self._last = StateSnapshot(
+                    self.version,
+                    {name: self._frozen[name] for name in fields},
+                    {name: self._field_versions[name] for name in fields},
+                )
+            return self._last
+
+    def _apply(self, updates: List[Tuple[str, Any]], removed: List[str]) -> None:
+        for name, frozen in updates:
+            self._frozen[name] = frozen
+            self._field_versions[name] = self.version
+        for name in removed:
+            del self._frozen[name]
+            del self._field_versions[name]
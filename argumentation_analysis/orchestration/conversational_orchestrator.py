@@ -51,6 +51,7 @@ from argumentation_analysis.core.state_manager_plugin import StateManagerPlugin
 from argumentation_analysis.orchestration.trace_analyzer import (
     ConversationalTraceAnalyzer,
 )
+from argumentation_analysis.services.llm_cache import llm_cache_phase
 
 logger = logging.getLogger("ConversationalOrchestrator")
 
@@ -1184,23 +1185,24 @@ async def _run_conversational_analysis_inner(
 
         # Trace: capture state before phase
         try:
-            trace.begin_phase(phase_name, state.get_state_snapshot(summarize=False))
+            trace.begin_phase(phase_name, state.snapshot())
         except Exception:
             trace.begin_phase(phase_name)
 
-        phase_log = await _run_phase(
-            room_agents,
-            phase_cfg["initial_prompt"],
-            max_turns=effective_max_turns,
-            phase_name=phase_name,
-            state=state,
-            enable_growth_validation=enable_growth_validation,
-            growth_re_prompt_limit=growth_re_prompt_limit,
-            reprompt_extractor=reprompt_extractor,
-            deadline=wall.deadline,
-            execution_path_recorder=phase_execution_paths,
-            absorption_reprompt_limit=absorption_reprompt_limit,
-        )
+        with llm_cache_phase(phase_name):
+            phase_log = await _run_phase(
+                room_agents,
+                phase_cfg["initial_prompt"],
+                max_turns=effective_max_turns,
+                phase_name=phase_name,
+                state=state,
+                enable_growth_validation=enable_growth_validation,
+                growth_re_prompt_limit=growth_re_prompt_limit,
+                reprompt_extractor=reprompt_extractor,
+                deadline=wall.deadline,
+                execution_path_recorder=phase_execution_paths,
+                absorption_reprompt_limit=absorption_reprompt_limit,
+            )
         conversation_log.extend(phase_log)
 
         # CONV-C #1334 §6: accumulate turns consumed (highest turn index in the
@@ -1250,7 +1252,7 @@ async def _run_conversational_analysis_inner(
                 content=msg.get("content", ""),
             )
         try:
-            trace.end_phase(phase_name, state.get_state_snapshot(summarize=False))
+            trace.end_phase(phase_name, state.snapshot())
         except Exception:
             trace.end_phase(phase_name)
 
@@ -1358,25 +1360,24 @@ async def _run_conversational_analysis_inner(
                     )
 
                     try:
-                        trace.begin_phase(
-                            phase_name, state.get_state_snapshot(summarize=False)
-                        )
+                        trace.begin_phase(phase_name, state.snapshot())
                     except Exception:
                         trace.begin_phase(phase_name)
 
-                    phase_log = await _run_phase(
-                        reanalysis_room,
-                        reanalysis_cfg["initial_prompt"],
-                        max_turns=reanalysis_effective,
-                        phase_name=phase_name,
-                        state=state,
-                        enable_growth_validation=enable_growth_validation,
-                        growth_re_prompt_limit=growth_re_prompt_limit,
-                        reprompt_extractor=reprompt_extractor,
-                        deadline=wall.deadline,
-                        execution_path_recorder=phase_execution_paths,
-                        absorption_reprompt_limit=absorption_reprompt_limit,
-                    )
+                    with llm_cache_phase(phase_name):
+                        phase_log = await _run_phase(
+                            reanalysis_room,
+                            reanalysis_cfg["initial_prompt"],
+                            max_turns=reanalysis_effective,
+                            phase_name=phase_name,
+                            state=state,
+                            enable_growth_validation=enable_growth_validation,
+                            growth_re_prompt_limit=growth_re_prompt_limit,
+                            reprompt_extractor=reprompt_extractor,
+                            deadline=wall.deadline,
+                            execution_path_recorder=phase_execution_paths,
+                            absorption_reprompt_limit=absorption_reprompt_limit,
+                        )
                     conversation_log.extend(phase_log)
 
                     turns_used += max(
@@ -1397,9 +1398,7 @@ async def _run_conversational_analysis_inner(
                             content=msg.get("content", ""),
                         )
                     try:
-                        trace.end_phase(
-                            phase_name, state.get_state_snapshot(summarize=False)
-                        )
+                        trace.end_phase(phase_name, state.snapshot())
                     except Exception:
                         trace.end_phase(phase_name)
 
@@ -402,6 +402,12 @@ def _safe_float_env(key: str, default: float) -> float:
 
 _LLM_CALL_TIMEOUT_S = _safe_float_env("LLM_CALL_TIMEOUT_S", 300.0)
 
+# With the LLM scheduler on, _LLM_CALL_TIMEOUT_S bounds each provider
+# round-trip; the whole scheduled call (queueing, shared 429 back-off and
+# retries) is bounded by this multiple of it, so a call stuck in the funnel
+# still ends (#708 / #730-bis). Ignored when _LLM_CALL_TIMEOUT_S is 0.
+_LLM_SCHEDULED_DEADLINE_FACTOR = _safe_float_env("LLM_SCHEDULED_DEADLINE_FACTOR", 2.0)
+
 # Dung extension computation timeout (seconds). Preferred/stable semantics on
 # large attack graphs can hang indefinitely.  On timeout, falls back to
 # pure-Python grounded-only computation with degraded=True.  Set
@@ -440,6 +446,42 @@ except (ValueError, TypeError):
     _EXTRACTION_MAX_TOKENS = 8192
 
 
+class _ScheduledClient:
+    """OpenAI-style client view whose ``chat.completions.create`` goes through
+    an ``LLMScheduler``, so only the calls the raw cache lets through (live
+    calls) are scheduled."""
+
+    def __init__(self, client: Any, scheduler: Any, timeout: float) -> None:
+        self._client = client
+        self._scheduler = scheduler
+        self._timeout = timeout
+        self.chat = self
+        self.completions = self
+
+    async def create(self, **kwargs: Any) -> Any:
+        from argumentation_analysis.services.llm_cache import compute_raw_cache_key
+        from argumentation_analysis.services.llm_scheduler import (
+            estimate_request_tokens,
+        )
+
+        async def call() -> Any:
+            request = self._client.chat.completions.create(**kwargs)
+            if self._timeout > 0:
+                return await asyncio.wait_for(request, timeout=self._timeout)
+            return await request
+
+        scheduled = self._scheduler.submit(
+            call,
+            key=compute_raw_cache_key(**kwargs),
+            tokens=estimate_request_tokens(kwargs),
+        )
+        if self._timeout > 0:
+            return await asyncio.wait_for(
+                scheduled, timeout=self._timeout * _LLM_SCHEDULED_DEADLINE_FACTOR
+            )
+        return await scheduled
+
+
 async def _guarded_chat_completion(client: Any, **kwargs: Any) -> Any:
     """Single funnel for every LLM chat-completion call (#708 runaway guard).
 
@@ -454,6 +496,13 @@ async def _guarded_chat_completion(client: Any, **kwargs: Any) -> Any:
     round-trip an ``asyncio.TimeoutError`` propagates and is handled by the
     callers' existing ``except`` blocks (batch dropped / coverage retry) instead
     of hanging the whole run.
+
+    Live calls (cache misses) are admitted by the event loop's
+    ``LLMScheduler`` (rate limits, adaptive concurrency, priorities, shared
+    429 back-off, coalescing of identical in-flight calls). With the scheduler
+    on, the timeout bounds each provider round-trip and
+    ``_LLM_SCHEDULED_DEADLINE_FACTOR`` times it bounds the whole call,
+    queueing and retries included.
     """
     budget = _llm_budget.get()
     if budget is not None:
@@ -475,7 +524,13 @@ async def _guarded_chat_completion(client: Any, **kwargs: Any) -> Any:
     from argumentation_analysis.services.llm_cache import (
         cached_raw_chat_completion,
     )
+    from argumentation_analysis.services.llm_scheduler import get_llm_scheduler
 
+    scheduler = get_llm_scheduler()
+    if scheduler is not None:
+        return await cached_raw_chat_completion(
+            _ScheduledClient(client, scheduler, _LLM_CALL_TIMEOUT_S), **kwargs
+        )
     if _LLM_CALL_TIMEOUT_S > 0:
         return await asyncio.wait_for(
             cached_raw_chat_completion(client, **kwargs),
@@ -1863,31 +1918,46 @@ def _aggregate_governance_votes(
         np.random.set_state(rng_state)
 
     # 5 social-choice methods (operate on the preference ballots directly).
+    # The ballots are converted once; every method reuses the rank matrix.
+    profile: Any = ballots
+    try:
+        profile = sc.PreferenceProfile(ballots, options)
+    except Exception as exc:  # noqa: BLE001 — methods convert per call
+        logger.debug("preference profile skipped: %s", exc)
     social_winners: Dict[str, Any] = {}
     try:
-        social_winners["approval"] = sc.approval_voting(ballots, options)[0]
+        social_winners["approval"] = sc.approval_voting(profile, options)[0]
     except Exception as exc:  # noqa: BLE001
         logger.debug("approval voting skipped: %s", exc)
     try:
-        stv_winners, _rounds = sc.stv(ballots, options, seats=1)
+        stv_winners, _rounds = sc.stv(profile, options, seats=1)
         social_winners["stv"] = stv_winners[0] if stv_winners else None
     except Exception as exc:  # noqa: BLE001
         logger.debug("stv skipped: %s", exc)
     try:
-        social_winners["copeland"] = sc.copeland(ballots, options)[0]
+        social_winners["copeland"] = sc.copeland(profile, options)[0]
     except Exception as exc:  # noqa: BLE001
         logger.debug("copeland skipped: %s", exc)
     try:
-        social_winners["schulze"] = sc.schulze(ballots, options)[0]
+        social_winners["schulze"] = sc.schulze(profile, options)[0]
     except Exception as exc:  # noqa: BLE001
         logger.debug("schulze skipped: %s", exc)
     try:
-        social_winners["condorcet_winner"] = sc.condorcet_winner(ballots, options)
+        social_winners["condorcet_winner"] = sc.condorcet_winner(profile, options)
     except Exception as exc:  # noqa: BLE001
         logger.debug("condorcet_winner skipped: %s", exc)
 
     winners.update(social_winners)
 
+    # Full collective ranking (exact Kemeny-Young where tractable). Reported
+    # alongside the per-method winners, not as an extra vote.
+    kemeny: Dict[str, Any] = {}
+    try:
+        ranking, score, approximate = sc.kemeny_young_safe(profile, options)
+        kemeny = {"ranking": ranking, "score": score, "approximate": approximate}
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("kemeny_young skipped: %s", exc)
+
     decided = {k: v for k, v in winners.items() if v is not None}
     distinct_winners = sorted({str(v) for v in decided.values()})
     n_decided = len(decided)
@@ -1899,6 +1969,8 @@ def _aggregate_governance_votes(
         "distinct_winners": distinct_winners,
         "inter_method_disagreement": disagreement,
         "condorcet_winner": social_winners.get("condorcet_winner"),
+        "kemeny_ranking": kemeny.get("ranking"),
+        "kemeny_approximate": kemeny.get("approximate"),
         "stochastic_methods": stochastic_methods,
         "derivation": "formal-vote-aggregation (virtue electors)",
     }
@@ -2322,12 +2394,12 @@ async def _invoke_jtms(input_text: str, context: Dict[str, Any]) -> Dict[str, An
     # ── Step 2: Arguments support claims (dependency network) ────────
     # Each argument supports related claims (not sequential chain)
     if arg_beliefs and claim_beliefs:
-        # Arguments collectively support each claim
-        for claim in claim_beliefs:
-            # All arguments are IN-list for each claim
-            session.add_justification(
-                arg_beliefs, [], claim, agent_source="unified_pipeline"
-            )
+        # Arguments collectively support each claim (all arguments are the
+        # IN-list of every claim), loaded as one batch
+        session.add_justifications(
+            [(arg_beliefs, [], claim) for claim in claim_beliefs],
+            agent_source="unified_pipeline",
+        )
     elif arg_beliefs:
         # No separate claims — arguments support a synthetic conclusion
         conclusion = "overall_argument_validity"
@@ -2664,23 +2736,19 @@ async def _invoke_atms(input_text: str, context: Dict[str, Any]) -> Dict[str, An
         hyp_assumptions = frozenset(hyp["assumptions"])
         is_consistent = atms.is_consistent(hyp_assumptions)
 
-        derivable_beliefs = []
-        for name, node in atms.nodes.items():
-            if node.is_assumption or name == "⊥":
-                continue
-            for env in node.label:
-                if env.issubset(hyp_assumptions):
-                    derivable_beliefs.append(name)
-                    break
+        derivable_beliefs = [
+            name
+            for name, node in atms.nodes.items()
+            if not node.is_assumption
+            and name != "⊥"
+            and atms.holds_in(name, hyp_assumptions)
+        ]
 
-        contradicting_beliefs = []
-        for name, node in atms.nodes.items():
-            if not name.startswith("CONTRA:"):
-                continue
-            for env in node.label:
-                if env.issubset(hyp_assumptions):
-                    contradicting_beliefs.append(name)
-                    break
+        contradicting_beliefs = [
+            name
+            for name in atms.nodes
+            if name.startswith("CONTRA:") and atms.holds_in(name, hyp_assumptions)
+        ]
 
         atms_contexts.append(
             {
@@ -2701,9 +2769,9 @@ async def _invoke_atms(input_text: str, context: Dict[str, Any]) -> Dict[str, An
         "node_count": len(atms.nodes) - 1,  # exclude ⊥
         "environments": environments,
         "consistent_derivations": consistent_envs,
-        "has_contradictions": any(
-            len(n.label) > 0 for name, n in atms.nodes.items() if name == "⊥"
-        ),
+        # ⊥ never keeps a label (nogoods are pruned everywhere): read the
+        # nogood store instead.
+        "has_contradictions": bool(atms.get_nogoods()),
         "atms_contexts": atms_contexts,
     }
 
@@ -5024,12 +5092,26 @@ async def _invoke_delp(input_text: str, context: Dict[str, Any]) -> Dict[str, An
         )
 
 
+# Above this many quantified variables the JVM NaiveQbfReasoner (2^n
+# enumeration) is skipped in favour of the native QDPLL engine.
+_QBF_JVM_MAX_VARIABLES = 16
+
+
 async def _invoke_qbf(input_text: str, context: Dict[str, Any]) -> Dict[str, Any]:
-    """Invoke QBF handler (#90) with JVM fallback."""
+    """Invoke QBF handler (#90) with JVM fallback.
+
+    Large instances go straight to the native QDPLL engine, which hands the
+    compiled QDIMACS to ``context["qbf_solver_command"]`` when one is given.
+    """
     quantifiers = context.get("quantifiers", [])
     formula = context.get("formula", input_text[:200])
+    variable_count = sum(len(q.get("vars", [])) for q in quantifiers)
 
     try:
+        if variable_count > _QBF_JVM_MAX_VARIABLES:
+            raise RuntimeError(
+                f"{variable_count} variables exceed the naive JVM reasoner limit"
+            )
         from argumentation_analysis.agents.core.logic.qbf_handler import QBFHandler
         from argumentation_analysis.agents.core.logic.tweety_initializer import (
             ready_initializer,
@@ -5043,7 +5125,12 @@ async def _invoke_qbf(input_text: str, context: Dict[str, Any]) -> Dict[str, Any
         try:
             from argumentation_analysis.agents.core.logic.qbf_native import analyze_qbf
 
-            return await asyncio.to_thread(analyze_qbf, quantifiers, formula)
+            return await asyncio.to_thread(
+                analyze_qbf,
+                quantifiers,
+                formula,
+                context.get("qbf_solver_command"),
+            )
         except Exception as e2:
             logger.warning(f"QBF native fallback also failed: {e2}")
             return {
@@ -5505,13 +5592,16 @@ async def _invoke_taxonomy_only_fallacy(
 
         fallacies = []
         for s in sophisms:
+            # Most taxonomy nodes have no nom_vulgarisé; text_fr is the name.
+            fallacy_type = s.get("nom_vulgarise") or s.get("description") or "unknown"
             fallacies.append(
                 {
-                    "fallacy_type": s.get("nom_vulgarise", s.get("type", "unknown")),
-                    "type": s.get("nom_vulgarise", s.get("type", "unknown")),
+                    "fallacy_type": fallacy_type,
+                    "type": fallacy_type,
                     "confidence": s.get("confidence", 0.0),
                     "description": s.get("description", ""),
-                    "taxonomy_pk": s.get("key", s.get("nom_vulgarise", "")),
+                    "taxonomy_pk": str(s.get("taxonomy_key", "")),
+                    "taxonomy_path": s.get("path", ""),
                 }
             )
 
@@ -5550,7 +5640,7 @@ async def _invoke_hybrid_fallacy(
             enable_self_hosted_llm=False,
             enable_camembert=False,
         )
-        result = adapter.detect(input_text)
+        result = await adapter.detect_async(input_text)
 
         fallacies = []
         if isinstance(result, dict):
@@ -6300,6 +6390,23 @@ def _parse_json_from_llm(raw: str) -> Dict[str, Any]:
     return {}
 
 
+def _with_parse_cache_stats(metrics: Dict[str, Any]) -> Dict[str, Any]:
+    """Attach the process-wide formula parse/encoding cache counters.
+
+    Lets a run confirm that repeated formulas stopped costing a parse in the
+    PL/FOL hot loops (hits grow, misses stay flat across documents).
+    """
+    try:
+        from argumentation_analysis.agents.core.logic.formula_cache import (
+            formula_cache_stats,
+        )
+
+        metrics["parse_cache"] = formula_cache_stats()
+    except Exception as e:  # metrics are best-effort, never break the verdict
+        logger.debug(f"Formula cache stats unavailable: {e}")
+    return metrics
+
+
 async def _invoke_propositional_logic(
     input_text: str, context: Dict[str, Any]
 ) -> Dict[str, Any]:
@@ -6689,7 +6796,7 @@ async def _invoke_propositional_logic(
             "message": msg,
             "logic_type": "propositional",
             "argument_mapping": argument_mapping or {_pl_atom(a): a[:60] for a in args},
-            "pl_metrics": pl_metrics,
+            "pl_metrics": _with_parse_cache_stats(pl_metrics),
             **(
                 {"pl_backend_comparison": pl_backend_comparison}
                 if pl_backend_comparison is not None
@@ -6731,7 +6838,7 @@ async def _invoke_propositional_logic(
                 or {_pl_atom(a): a[:60] for a in args},
                 "isolation_retry": True,
                 "rejected_count": len(formulas) - len(valid_formulas),
-                "pl_metrics": pl_metrics,
+                "pl_metrics": _with_parse_cache_stats(pl_metrics),
             }
 
         # All formulas failed — fail-loud (#1019, RA-8 #1053)
@@ -7201,7 +7308,7 @@ async def _invoke_fol_reasoning(
             "argument_count": len(args),
             "isolation_retry": True,
             "rejected_count": len(rejected_formulas),
-            "fol_metrics": fol_metrics,
+            "fol_metrics": _with_parse_cache_stats(fol_metrics),
             **({"strategic_objective_ids": _strat_ids_fol} if _strat_ids_fol else {}),
         }
 
@@ -7307,7 +7414,7 @@ async def _invoke_fol_reasoning(
             ),
             "logic_type": "first_order",
             "argument_count": len(args),
-            "fol_metrics": fol_metrics,
+            "fol_metrics": _with_parse_cache_stats(fol_metrics),
             **(
                 {"fol_backend_comparison": fol_backend_comparison}
                 if fol_backend_comparison is not None
@@ -9835,37 +9942,35 @@ async def _invoke_external_fol_solver(
             pass
         if prover9_available:
             try:
-                from argumentation_analysis.core.prover9_runner import run_prover9
+                from argumentation_analysis.core.ladr_solver_service import (
+                    get_ladr_solver_service,
+                )
 
                 belief_set_str = "\n".join(
                     str(f) for f in fol_signature + [""] + formulas
                 )
-                prover9_input = f"formulas(sos).\n{belief_set_str}\nend_of_list.\n"
-                result = await asyncio.to_thread(run_prover9, prover9_input)
-                # #1634: report what Prover9 actually said, and only that.
-                #
-                # The input above is a bare SOS list with NO goal, so a proof
-                # here IS the derivation of the empty clause: "THEOREM PROVED"
-                # means the KB is INCONSISTENT and "SEARCH FAILED" means it is
-                # consistent (the runner's own docstring says so — exit 2 =
-                # SEARCH FAILED on a consistent KB). The previous expression
-                # stored ``consistent = proved``, i.e. exactly backwards.
-                # Measured against the bundled binary: ``P(a). -P(a).`` →
-                # THEOREM PROVED (was stored as consistent=True), and
-                # ``P(a). Q(b).`` → SEARCH FAILED (was stored as False).
+                # The service races Prover9 against Mace4 off the event loop and
+                # answers repeated belief sets from its content-addressed cache.
                 #
-                # And when NEITHER marker is present, Prover9 decided nothing —
-                # that is the #1634 motif proper, so it yields None rather than
-                # a boolean picked by default.
-                refuted = "THEOREM PROVED" in result or "Proof found" in result
-                exhausted = "SEARCH FAILED" in result
-                consistent = False if refuted else (True if exhausted else None)
+                # #1634: report what the provers actually said, and only that.
+                # The Prover9 input is a bare SOS list with NO goal, so a proof
+                # IS the derivation of the empty clause: "THEOREM PROVED" means
+                # the KB is INCONSISTENT and "SEARCH FAILED" means it is
+                # consistent (an earlier expression stored ``consistent =
+                # proved``, i.e. exactly backwards). When no prover decided
+                # anything the verdict is None rather than a boolean picked by
+                # default.
+                verdict = await get_ladr_solver_service().check_consistency(
+                    belief_set_str
+                )
                 return {
                     "formulas": formulas,
-                    "consistent": consistent,
-                    "solver": "prover9",
-                    "degraded": consistent is None,
-                    "raw_output": result[:500],
+                    "consistent": verdict.consistent,
+                    "solver": verdict.solver,
+                    "degraded": verdict.consistent is None,
+                    "message": verdict.note,
+                    "cached": verdict.cached,
+                    "raw_output": verdict.raw_output[:500],
                     "logic_type": "first_order",
                 }
             except FileNotFoundError:
@@ -10315,7 +10420,7 @@ async def _invoke_ai_shield(input_text: str, context: Dict[str, Any]) -> Dict[st
         return {"shield_available": False, "blocked": False, "error": str(exc)}
 
     # Validate input (runs all enabled layers)
-    result = shield.validate_input(input_text)
+    result = await shield.validate_input_async(input_text)
 
     output = {
         "shield_available": True,
@@ -39,6 +39,10 @@ class PhaseTrace:
     end_time: float = 0.0
     state_before: Dict[str, int] = field(default_factory=dict)
     state_after: Dict[str, int] = field(default_factory=dict)
+    # Changed state fields -> number of entries added/changed/removed, when
+    # the phase was bracketed by versioned ``StateSnapshot`` objects.
+    state_delta: Dict[str, int] = field(default_factory=dict)
+    snapshot_before: Optional[Any] = field(default=None, repr=False)
 
     @property
     def duration(self) -> float:
@@ -138,6 +142,8 @@ class ConversationalTraceAnalyzer:
         )
         if state_snapshot:
             phase.state_before = _count_state_fields(state_snapshot)
+            if hasattr(state_snapshot, "diff"):
+                phase.snapshot_before = state_snapshot
 
         self._current_phase = phase
         self.phases.append(phase)
@@ -147,7 +153,17 @@ class ConversationalTraceAnalyzer:
         if self._current_phase and self._current_phase.name == phase_name:
             self._current_phase.end_time = time.time()
             if state_snapshot:
-                self._current_phase.state_after = _count_state_fields(state_snapshot)
+                phase = self._current_phase
+                phase.state_after = _count_state_fields(state_snapshot)
+                if phase.snapshot_before is not None and hasattr(
+                    state_snapshot, "diff"
+                ):
+                    # Versioned snapshots: record what the phase changed,
+                    # comparing only the fields whose version moved.
+                    phase.state_delta = phase.snapshot_before.diff(
+                        state_snapshot
+                    ).summary()
+                phase.snapshot_before = None
                 self._state_snapshots.append(state_snapshot)
 
     def record_turn(
@@ -224,6 +240,7 @@ class ConversationalTraceAnalyzer:
                     "total_content_chars": phase.total_content,
                     "state_before": phase.state_before,
                     "state_after": phase.state_after,
+                    "state_delta": phase.state_delta,
                 }
             )
 
@@ -113,6 +113,7 @@ async def run_unified_analysis(
     render_restitution: bool = False,
     deanonymized: bool = True,
     source_metadata: Optional[Dict[str, str]] = None,
+    scheduler: Optional[Dict[str, Any]] = None,
 ) -> Dict[str, Any]:
     """
     Run a unified analysis pipeline on input text.
@@ -147,12 +148,18 @@ async def run_unified_analysis(
               source-level metadata (speaker, arena, epoch...) threaded into
               ``state.source_metadata``. Only short metadata fields — no
               ``raw_text``/``full_text`` (privacy HARD).
+        scheduler: Optional WorkflowExecutor scheduling options
+              (``scheduling``, ``max_concurrency``, ``capability_limits``,
+              ``capability_pools``). E.g. ``{"scheduling": "eager",
+              "capability_limits": {"llm": 4}}`` starts each phase as soon as
+              its dependencies are done. Default: level-by-level execution.
 
     Returns:
         Dict with keys:
             - workflow_name: Name of the executed workflow
             - phases: Dict[str, PhaseResult] — per-phase results
-            - summary: Dict with completed/failed/skipped counts
+            - summary: Dict with completed/failed/skipped counts and the
+              ``schedule`` report (critical path, wall-clock time)
             - capabilities_used: List of capabilities that were successfully resolved
             - capabilities_missing: List of capabilities with no provider
             - unified_state: UnifiedAnalysisState (if state tracking enabled)
@@ -268,7 +275,7 @@ async def run_unified_analysis(
         except Exception as e:
             logger.warning(f"JPype warmup failed (will retry in-phase): {e}")
 
-    executor = WorkflowExecutor(registry)
+    executor = WorkflowExecutor(registry, **(scheduler or {}))
 
     # Inject shield phase if shield_config present in context (#896)
     # This adds a pre-extraction "shield" phase that validates input before
@@ -351,6 +358,7 @@ async def run_unified_analysis(
             "completed_phases": completed,
             "failed_phases": failed,
             "skipped_phases": skipped_phases,
+            "schedule": executor.last_schedule_report,
         },
         "capabilities_used": capabilities_used,
         "capabilities_degraded": capabilities_degraded,
@@ -18,6 +18,7 @@ Usage:
 """
 
 import asyncio
+import contextlib
 import logging
 import time
 import uuid
@@ -171,6 +172,28 @@ class WorkflowDefinition:
 
         return levels
 
+    def get_dependencies(self) -> Dict[str, Set[str]]:
+        """
+        Resolve the prerequisites of each phase for eager scheduling.
+
+        A phase waits for its declared ``depends_on``. Phases that
+        get_execution_order() cannot place (unknown dependency or cycle)
+        end up in its final fallback level; they wait for every phase of
+        the earlier levels, exactly as in level-by-level execution.
+        """
+        placed: Set[str] = set()
+        dependencies: Dict[str, Set[str]] = {}
+        for level in self.get_execution_order():
+            for phase_name in level:
+                phase = self.get_phase(phase_name)
+                declared = set(phase.depends_on) if phase else set()
+                if declared <= placed:
+                    dependencies[phase_name] = declared
+                else:
+                    dependencies[phase_name] = set(placed)
+            placed.update(level)
+        return dependencies
+
     def get_required_capabilities(self) -> List[str]:
         """Get list of all capabilities required by this workflow."""
         return [p.capability for p in self.phases]
@@ -338,13 +361,44 @@ class WorkflowExecutor:
     via un CapabilityRegistry.
     """
 
-    def __init__(self, registry: Any):
+    SCHEDULING_MODES = ("levels", "eager")
+
+    def __init__(
+        self,
+        registry: Any,
+        scheduling: str = "levels",
+        max_concurrency: Optional[int] = None,
+        capability_limits: Optional[Dict[str, int]] = None,
+        capability_pools: Optional[Dict[str, str]] = None,
+    ):
         """
         Args:
             registry: CapabilityRegistry instance for resolving capabilities.
+            scheduling: ``"levels"`` (default) runs get_execution_order() level
+                by level; ``"eager"`` starts each phase as soon as its
+                dependencies are done, so a slow phase only delays its own
+                dependents.
+            max_concurrency: Global cap on concurrently running phases
+                (eager mode). None means unbounded.
+            capability_limits: Per-pool caps on concurrently running phases
+                (eager mode), e.g. ``{"llm": 4, "tweety": 1}``.
+            capability_pools: Maps a capability to its pool name in
+                ``capability_limits``; a capability absent from this mapping
+                is its own pool.
         """
+        if scheduling not in self.SCHEDULING_MODES:
+            raise ValueError(
+                f"Unknown scheduling mode '{scheduling}'. "
+                f"Available: {list(self.SCHEDULING_MODES)}"
+            )
         self._registry = registry
         self._base_logger = logging.getLogger("orchestration.workflow_executor")
+        self._scheduling = scheduling
+        self._max_concurrency = max_concurrency
+        self._capability_limits = dict(capability_limits or {})
+        self._capability_pools = dict(capability_pools or {})
+        # Critical path and timing of the last run (see _schedule_report)
+        self.last_schedule_report: Dict[str, Any] = {}
 
     async def execute(
         self,
@@ -394,8 +448,9 @@ class WorkflowExecutor:
         """
         Execute a workflow definition.
 
-        Phases at the same DAG level execute concurrently via asyncio.gather().
-        Phases at different levels execute sequentially (respecting depends_on).
+        In ``"levels"`` scheduling, phases at the same DAG level execute
+        concurrently via asyncio.gather() and levels execute sequentially.
+        In ``"eager"`` scheduling, see :meth:`_execute_eager`.
 
         Args:
             workflow: The workflow to execute
@@ -408,7 +463,8 @@ class WorkflowExecutor:
                 ``(output, state, ctx) -> None`` that writes phase output
                 to the state object.
             checkpoint_callback: Optional callable invoked after each DAG level
-                with signature ``(results, ctx) -> None``.  Used for per-document
+                (after each batch of finished phases in eager mode) with
+                signature ``(results, ctx) -> None``.  Used for per-document
                 checkpointing in long batch runs.
             resume_from: Optional set of phase names to skip (already completed
                 in a previous run).  Their outputs must already be present in
@@ -446,66 +502,63 @@ class WorkflowExecutor:
             extra={"workflow": workflow.name, "phases_total": len(workflow.phases)},
         )
 
-        for level_idx, level_phases in enumerate(execution_order):
-            logger.debug(f"Level {level_idx}: executing phases {level_phases}")
-
-            # Split into skipped vs to-run
-            to_run = [p for p in level_phases if p not in skip_phases]
-            for phase_name in level_phases:
-                if phase_name in skip_phases:
-                    # Reconstruct a SKIPPED result from context if available
-                    existing_result = ctx.get(f"phase_{phase_name}_result")
-                    if existing_result is not None:
-                        # Use the output/context from checkpoint but mark as SKIPPED
-                        results[phase_name] = PhaseResult(
-                            phase_name=phase_name,
-                            status=PhaseStatus.SKIPPED,
-                            capability=existing_result.capability,
-                            component_used=existing_result.component_used,
-                            output=existing_result.output,
-                            error="Skipped (resumed from checkpoint)",
-                            duration_seconds=existing_result.duration_seconds,
+        run_start = time.time()
+        if self._scheduling == "eager":
+            await self._execute_eager(
+                workflow,
+                input_data,
+                ctx,
+                skip_phases,
+                results,
+                state,
+                state_writers,
+                checkpoint_callback,
+                slog,
+            )
+        else:
+            for level_idx, level_phases in enumerate(execution_order):
+                logger.debug(f"Level {level_idx}: executing phases {level_phases}")
+
+                to_run = [p for p in level_phases if p not in skip_phases]
+                for phase_name in level_phases:
+                    if phase_name in skip_phases:
+                        results[phase_name] = self._resumed_result(
+                            workflow, phase_name, ctx
                         )
-                    else:
-                        _skipped_phase = workflow.get_phase(phase_name)
-                        results[phase_name] = PhaseResult(
-                            phase_name=phase_name,
-                            status=PhaseStatus.SKIPPED,
-                            capability=(
-                                _skipped_phase.capability
-                                if _skipped_phase
-                                else "unknown"
-                            ),
-                            error="Skipped (resumed from checkpoint)",
+
+                phase_coros = []
+                for phase_name in to_run:
+                    phase = workflow.get_phase(phase_name)
+                    if phase:
+                        slog.info(
+                            "Starting phase",
+                            extra={
+                                "phase_name": phase_name,
+                                "capability": phase.capability,
+                            },
+                        )
+                        phase_coros.append(
+                            self._execute_phase(phase, phase_name, input_data, ctx)
                         )
 
-            phase_coros = []
-            for phase_name in to_run:
-                phase = workflow.get_phase(phase_name)
-                if phase:
-                    slog.info(
-                        "Starting phase",
-                        extra={
-                            "phase_name": phase_name,
-                            "capability": phase.capability,
-                        },
-                    )
-                    phase_coros.append(
-                        self._execute_phase(phase, phase_name, input_data, ctx)
-                    )
+                if phase_coros:
+                    level_results = await asyncio.gather(*phase_coros)
+                    for phase_name, result, output in level_results:
+                        self._store_phase_result(
+                            phase_name,
+                            result,
+                            output,
+                            results,
+                            ctx,
+                            state,
+                            state_writers,
+                        )
 
-            if phase_coros:
-                level_results = await asyncio.gather(*phase_coros)
-                for phase_name, result, output in level_results:
-                    self._store_phase_result(
-                        phase_name, result, output, results, ctx, state, state_writers
-                    )
+                self._run_checkpoint(checkpoint_callback, results, ctx)
 
-            if checkpoint_callback is not None:
-                try:
-                    checkpoint_callback(results, ctx)
-                except Exception as cb_err:
-                    logger.warning("Checkpoint callback failed: %s", cb_err)
+        self.last_schedule_report = self._schedule_report(
+            workflow, results, skip_phases, time.time() - run_start
+        )
 
         # Summary
         completed = sum(
@@ -535,6 +588,7 @@ class WorkflowExecutor:
                 "phases_total": len(results),
                 "phases_degraded": degraded_phases,
                 "structured_arg_degraded": structured_degraded_caps,
+                "critical_path": self.last_schedule_report["critical_path"],
             },
         )
 
@@ -550,6 +604,7 @@ class WorkflowExecutor:
                         "degraded_phases": degraded_phases,
                         "structured_arg_degraded": structured_degraded_caps,
                         "phases": {name: r.status.value for name, r in results.items()},
+                        "schedule": self.last_schedule_report,
                     },
                 )
             except Exception as sw_err:
@@ -557,6 +612,202 @@ class WorkflowExecutor:
 
         return results
 
+    async def _execute_eager(
+        self,
+        workflow: WorkflowDefinition,
+        input_data: Any,
+        ctx: Dict[str, Any],
+        skip_phases: Set[str],
+        results: Dict[str, PhaseResult],
+        state: Any,
+        state_writers: Optional[Dict[str, Any]],
+        checkpoint_callback: Optional[Callable[..., None]],
+        slog: Any,
+    ) -> None:
+        """Start each phase as soon as its dependencies are done.
+
+        Ready phases are launched in get_execution_order() order, then wait
+        for a slot of their capability pool and of the global limit (pool
+        first, so a phase queued on a saturated pool does not hold a global
+        slot). Results are stored as each phase finishes, which is when its
+        dependents become ready.
+        """
+        dependencies = workflow.get_dependencies()
+        rank = {
+            name: idx
+            for idx, name in enumerate(
+                name for level in workflow.get_execution_order() for name in level
+            )
+        }
+        waiting = {name: set(deps) for name, deps in dependencies.items()}
+        dependents: Dict[str, List[str]] = {name: [] for name in dependencies}
+        for name, deps in dependencies.items():
+            for dep in deps:
+                dependents[dep].append(name)
+
+        global_limit = (
+            asyncio.Semaphore(self._max_concurrency) if self._max_concurrency else None
+        )
+        pool_limits = {
+            pool: asyncio.Semaphore(limit)
+            for pool, limit in self._capability_limits.items()
+        }
+
+        ready = sorted(
+            (n for n, deps in waiting.items() if not deps), key=lambda n: rank[n]
+        )
+        running: Dict["asyncio.Future[Any]", str] = {}
+
+        def _finish(phase_name: str) -> None:
+            for dependent in dependents[phase_name]:
+                waiting[dependent].discard(phase_name)
+                if not waiting[dependent]:
+                    ready.append(dependent)
+            ready.sort(key=lambda n: rank[n])
+
+        try:
+            while ready or running:
+                while ready:
+                    phase_name = ready.pop(0)
+                    phase = workflow.get_phase(phase_name)
+                    if phase_name in skip_phases or phase is None:
+                        results[phase_name] = self._resumed_result(
+                            workflow, phase_name, ctx
+                        )
+                        _finish(phase_name)
+                        continue
+                    pool = self._capability_pools.get(
+                        phase.capability, phase.capability
+                    )
+                    task = asyncio.create_task(
+                        self._execute_phase_limited(
+                            phase,
+                            input_data,
+                            ctx,
+                            pool_limits.get(pool),
+                            global_limit,
+                            slog,
+                        )
+                    )
+                    running[task] = phase_name
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(
+                    running, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in sorted(done, key=lambda t: rank[running[t]]):
+                    running.pop(task)
+                    phase_name, result, output = task.result()
+                    self._store_phase_result(
+                        phase_name, result, output, results, ctx, state, state_writers
+                    )
+                    _finish(phase_name)
+                self._run_checkpoint(checkpoint_callback, results, ctx)
+        finally:
+            for pending in running:
+                pending.cancel()
+
+    async def _execute_phase_limited(
+        self,
+        phase: WorkflowPhase,
+        input_data: Any,
+        ctx: Dict[str, Any],
+        pool_limit: Optional[asyncio.Semaphore],
+        global_limit: Optional[asyncio.Semaphore],
+        slog: Any,
+    ) -> Tuple[str, PhaseResult, Any]:
+        """Run :meth:`_execute_phase` once a pool slot and a global slot are free."""
+        async with contextlib.AsyncExitStack() as slots:
+            if pool_limit is not None:
+                await slots.enter_async_context(pool_limit)
+            if global_limit is not None:
+                await slots.enter_async_context(global_limit)
+            slog.info(
+                "Starting phase",
+                extra={"phase_name": phase.name, "capability": phase.capability},
+            )
+            return await self._execute_phase(phase, phase.name, input_data, ctx)
+
+    def _resumed_result(
+        self,
+        workflow: WorkflowDefinition,
+        phase_name: str,
+        ctx: Dict[str, Any],
+    ) -> PhaseResult:
+        """SKIPPED result of a phase completed in a previous (resumed) run."""
+        existing_result = ctx.get(f"phase_{phase_name}_result")
+        if existing_result is not None:
+            # Use the output/context from checkpoint but mark as SKIPPED
+            return PhaseResult(
+                phase_name=phase_name,
+                status=PhaseStatus.SKIPPED,
+                capability=existing_result.capability,
+                component_used=existing_result.component_used,
+                output=existing_result.output,
+                error="Skipped (resumed from checkpoint)",
+                duration_seconds=existing_result.duration_seconds,
+            )
+        skipped_phase = workflow.get_phase(phase_name)
+        return PhaseResult(
+            phase_name=phase_name,
+            status=PhaseStatus.SKIPPED,
+            capability=skipped_phase.capability if skipped_phase else "unknown",
+            error="Skipped (resumed from checkpoint)",
+        )
+
+    @staticmethod
+    def _run_checkpoint(
+        checkpoint_callback: Optional[Callable[..., None]],
+        results: Dict[str, PhaseResult],
+        ctx: Dict[str, Any],
+    ) -> None:
+        if checkpoint_callback is not None:
+            try:
+                checkpoint_callback(results, ctx)
+            except Exception as cb_err:
+                logger.warning("Checkpoint callback failed: %s", cb_err)
+
+    def _schedule_report(
+        self,
+        workflow: WorkflowDefinition,
+        results: Dict[str, PhaseResult],
+        skip_phases: Set[str],
+        wall_clock: float,
+    ) -> Dict[str, Any]:
+        """Critical path of the run: the dependency chain with the largest
+        summed phase duration, i.e. the lower bound on wall-clock time under
+        eager scheduling. Phases resumed from a checkpoint count as 0s.
+        """
+        dependencies = workflow.get_dependencies()
+        finish: Dict[str, float] = {}
+        previous: Dict[str, Optional[str]] = {}
+        for level in workflow.get_execution_order():
+            for name in level:
+                result = results.get(name)
+                duration = (
+                    result.duration_seconds
+                    if result is not None and name not in skip_phases
+                    else 0.0
+                )
+                prev = max(dependencies[name], key=lambda n: finish[n], default=None)
+                previous[name] = prev
+                finish[name] = duration + (finish[prev] if prev else 0.0)
+
+        path: List[str] = []
+        node = max(finish, key=lambda n: finish[n]) if finish else None
+        critical_seconds = finish[node] if node else 0.0
+        while node is not None:
+            path.append(node)
+            node = previous[node]
+        path.reverse()
+        return {
+            "scheduling": self._scheduling,
+            "wall_clock_seconds": round(wall_clock, 3),
+            "critical_path": path,
+            "critical_path_seconds": round(critical_seconds, 3),
+        }
+
     async def _invoke_with_retry(
         self,
         phase: WorkflowPhase,
@@ -626,7 +877,23 @@ class WorkflowExecutor:
         input_data: Any,
         ctx: Dict[str, Any],
     ) -> Tuple[str, PhaseResult, Any]:
-        """Execute a single workflow phase, returning (name, result, output)."""
+        """Execute a single workflow phase, returning (name, result, output).
+
+        The phase's LLM cache traffic is attributed to ``phase_name`` in the
+        per-phase cache stats (``llm_cache.get_cache_phase_stats``).
+        """
+        from argumentation_analysis.services.llm_cache import llm_cache_phase
+
+        with llm_cache_phase(phase_name):
+            return await self._run_phase(phase, phase_name, input_data, ctx)
+
+    async def _run_phase(
+        self,
+        phase: WorkflowPhase,
+        phase_name: str,
+        input_data: Any,
+        ctx: Dict[str, Any],
+    ) -> Tuple[str, PhaseResult, Any]:
         start = time.time()
 
         # Condition check
@@ -154,7 +154,7 @@ class GovernancePlugin:
             }
             if approximate:
                 result["fallback"] = (
-                    "Copeland approximation — Kemeny-Young unavailable "
+                    "Approximate ranking — exact Kemeny-Young unavailable "
                     f"for {len(options)} candidates (#971)"
                 )
             return json.dumps(result)
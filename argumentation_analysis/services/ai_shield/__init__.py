@@ -15,6 +15,7 @@ Usage:
 
     shield = load_preset("basic")  # heuristic only
     result = shield.validate_input("some user input")
+    # or, from async code: await shield.validate_input_async(...)
     if result.blocked:
         print(f"Blocked: {result.reason}")
 """
@@ -23,7 +24,18 @@ from argumentation_analysis.services.ai_shield.shield import (
     Shield,
     ShieldResult,
     ShieldLayer,
+    VerdictCache,
+)
+from argumentation_analysis.services.ai_shield.presets import (
+    get_verdict_cache,
+    load_preset,
 )
-from argumentation_analysis.services.ai_shield.presets import load_preset
 
-__all__ = ["Shield", "ShieldResult", "ShieldLayer", "load_preset"]
+__all__ = [
+    "Shield",
+    "ShieldResult",
+    "ShieldLayer",
+    "VerdictCache",
+    "get_verdict_cache",
+    "load_preset",
+]
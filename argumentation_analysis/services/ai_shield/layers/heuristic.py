@@ -10,7 +10,13 @@ Detects:
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+try:  # Python >= 3.11
+    from re import _constants as sre_constants, _parser as sre_parse
+except ImportError:  # pragma: no cover
+    import sre_constants
+    import sre_parse
 
 from argumentation_analysis.services.ai_shield.shield import ShieldLayer, LayerResult
 
@@ -56,13 +62,94 @@ MANIPULATION_PATTERNS = [
 ]
 
 
+# Score contribution of one matching pattern, per category.
+CATEGORY_WEIGHTS = {
+    "injection": 0.4,
+    "bias": 0.3,
+    "manipulation": 0.5,
+    "custom": 0.3,
+}
+
+# Shortest literal worth gating a pattern on.
+MIN_ANCHOR_LENGTH = 3
+
+
+def _literal_runs(items) -> List[str]:
+    """Maximal runs of consecutive ASCII literals in a parsed sequence."""
+    runs, run = [], ""
+    for op, av in items:
+        if op is sre_constants.LITERAL and av < 128:
+            run += chr(av)
+        else:
+            runs.append(run)
+            run = ""
+    runs.append(run)
+    return [r for r in runs if r]
+
+
+def _pattern_anchors(pattern: str, flags: int) -> Optional[Tuple[str, ...]]:
+    """Literals of which every match of ``pattern`` contains at least one.
+
+    Only mandatory top-level items are considered: a literal run, or a
+    group whose alternatives each contain a literal run (``(bomb|weapon)``).
+    The alternative with the longest shortest-literal wins. Returns ``None``
+    when no anchor of ``MIN_ANCHOR_LENGTH`` characters can be proven, in
+    which case the pattern is always searched.
+    """
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return None
+    candidates = [(run,) for run in _literal_runs(parsed)]
+    for op, av in parsed:
+        if op is not sre_constants.SUBPATTERN:
+            continue
+        body = list(av[-1])
+        if len(body) == 1 and body[0][0] is sre_constants.BRANCH:
+            branches = body[0][1][1]
+        else:
+            branches = [body]
+        options = []
+        for branch in branches:
+            runs = _literal_runs(branch)
+            if not runs:
+                break
+            options.append(max(runs, key=len))
+        else:
+            candidates.append(tuple(options))
+    candidates = [c for c in candidates if min(map(len, c)) >= MIN_ANCHOR_LENGTH]
+    if not candidates:
+        return None
+    best = max(candidates, key=lambda c: min(map(len, c)))
+    return tuple(a.casefold() for a in best)
+
+
+def _fold(text: str) -> str:
+    """Case-fold ``text`` so that it contains every anchor a match contains.
+
+    ``casefold`` covers every non-ASCII character ``re.IGNORECASE`` equates
+    with an ASCII letter except the dotless i.
+    """
+    return text.casefold().replace("\u0131", "i")
+
+
 class HeuristicLayer(ShieldLayer):
     """Fast regex/keyword-based validation layer.
 
     Scans input for known prompt injection, jailbreak, bias,
     and manipulation patterns. Zero LLM cost.
+
+    Every pattern is gated by the literals it cannot match without (its
+    anchors, derived from the parsed regex): the text is case-folded once,
+    the anchors are looked up with C-level substring searches, and only the
+    patterns whose anchors occur are searched. A clean text therefore costs
+    one pass plus a few ``in`` checks instead of one backtracking regex
+    scan per pattern, and the reported matches are the same as searching
+    every pattern.
     """
 
+    cost = 0
+
     def __init__(
         self,
         threshold: float = 0.5,
@@ -70,14 +157,32 @@ class HeuristicLayer(ShieldLayer):
         custom_patterns: Optional[List[str]] = None,
     ):
         super().__init__(name="heuristic", threshold=threshold, enabled=enabled)
-        self._injection_re = [re.compile(p, re.IGNORECASE) for p in INJECTION_PATTERNS]
-        self._bias_re = [re.compile(p, re.IGNORECASE) for p in BIAS_KEYWORDS]
-        self._manipulation_re = [
-            re.compile(p, re.IGNORECASE) for p in MANIPULATION_PATTERNS
-        ]
-        self._custom_re = [
-            re.compile(p, re.IGNORECASE) for p in (custom_patterns or [])
-        ]
+        categorized = (
+            [("injection", p) for p in INJECTION_PATTERNS]
+            + [("bias", p) for p in BIAS_KEYWORDS]
+            + [("manipulation", p) for p in MANIPULATION_PATTERNS]
+            + [("custom", p) for p in (custom_patterns or [])]
+        )
+        self._custom_patterns = tuple(custom_patterns or ())
+        self._types = [kind for kind, _ in categorized]
+        self._patterns = [re.compile(p, re.IGNORECASE) for _, p in categorized]
+        self._anchors = [_pattern_anchors(p, re.IGNORECASE) for _, p in categorized]
+
+    def cache_signature(self) -> Tuple:
+        return super().cache_signature() + (self._custom_patterns,)
+
+    def _scan(self, text: str) -> Dict[int, str]:
+        """Return the first match of every pattern that occurs in ``text``."""
+        folded = _fold(text)
+        found = {}
+        for index, pattern in enumerate(self._patterns):
+            anchors = self._anchors[index]
+            if anchors is not None and not any(a in folded for a in anchors):
+                continue
+            m = pattern.search(text)
+            if m:
+                found[index] = m.group()
+        return found
 
     def validate(self, text: str, **kwargs) -> LayerResult:
         """Scan text for heuristic threat patterns.
@@ -92,45 +197,17 @@ class HeuristicLayer(ShieldLayer):
         matches = []
         score = 0.0
 
-        for pattern in self._injection_re:
-            m = pattern.search(text)
-            if m:
-                matches.append(
-                    {
-                        "type": "injection",
-                        "match": m.group(),
-                        "pattern": pattern.pattern,
-                    }
-                )
-                score += 0.4
-
-        for pattern in self._bias_re:
-            m = pattern.search(text)
-            if m:
-                matches.append(
-                    {"type": "bias", "match": m.group(), "pattern": pattern.pattern}
-                )
-                score += 0.3
-
-        for pattern in self._manipulation_re:
-            m = pattern.search(text)
-            if m:
-                matches.append(
-                    {
-                        "type": "manipulation",
-                        "match": m.group(),
-                        "pattern": pattern.pattern,
-                    }
-                )
-                score += 0.5
-
-        for pattern in self._custom_re:
-            m = pattern.search(text)
-            if m:
-                matches.append(
-                    {"type": "custom", "match": m.group(), "pattern": pattern.pattern}
-                )
-                score += 0.3
+        found = self._scan(text)
+        for index in sorted(found):
+            kind = self._types[index]
+            matches.append(
+                {
+                    "type": kind,
+                    "match": found[index],
+                    "pattern": self._patterns[index].pattern,
+                }
+            )
+            score += CATEGORY_WEIGHTS[kind]
 
         score = min(score, 1.0)
 
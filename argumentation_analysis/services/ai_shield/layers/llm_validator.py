@@ -7,7 +7,7 @@ that regex cannot catch. More expensive but higher accuracy.
 import json
 import logging
 import os
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 from argumentation_analysis.services.ai_shield.shield import ShieldLayer, LayerResult
 from argumentation_analysis.core.reading_window import selected_text
@@ -26,8 +26,13 @@ class LLMValidatorLayer(ShieldLayer):
 
     Requires an OpenAI-compatible API endpoint.
     Falls back to pass-through if no API key is available.
+
+    Its high ``cost`` makes the shield run it last, and only on inputs
+    the cheaper layers let through.
     """
 
+    cost = 10
+
     def __init__(
         self,
         threshold: float = 0.6,
@@ -55,6 +60,9 @@ class LLMValidatorLayer(ShieldLayer):
                 "OPENAI_BASE_URL", "https://api.openai.com/v1"
             )
 
+    def cache_signature(self) -> Tuple:
+        return super().cache_signature() + (self._model, self._base_url)
+
     def validate(self, text: str, **kwargs) -> LayerResult:
         """Validate input using LLM analysis.
 
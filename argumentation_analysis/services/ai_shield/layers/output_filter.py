@@ -8,7 +8,7 @@ Scans LLM output for patterns that suggest the model is leaking:
 """
 
 import re
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from argumentation_analysis.services.ai_shield.shield import ShieldLayer, LayerResult
 
@@ -59,6 +59,8 @@ class OutputFilterLayer(ShieldLayer):
     Detects system prompt leaks, credentials, PII, and file paths.
     """
 
+    cost = 0
+
     def __init__(
         self,
         threshold: float = 0.4,
@@ -79,6 +81,14 @@ class OutputFilterLayer(ShieldLayer):
         self._pii_re = [re.compile(p) for p in PII_PATTERNS]
         self._path_re = [re.compile(p) for p in PATH_PATTERNS]
 
+    def cache_signature(self) -> Tuple:
+        return super().cache_signature() + (
+            self._check_pii,
+            self._check_credentials,
+            self._check_system_leaks,
+            self._check_paths,
+        )
+
     def validate(self, text: str, **kwargs) -> LayerResult:
         """Scan output for sensitive information leaks.
 
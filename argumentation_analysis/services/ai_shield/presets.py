@@ -4,11 +4,17 @@ Based on soutenance description:
 - basic: Heuristic only (fast, zero cost)
 - advanced: All layers (heuristic + LLM + output filter)
 - output_only: Output filter only (for post-LLM validation)
+
+Preset shields are rebuilt per request by their callers, so they all share
+one module-level ``VerdictCache`` (sized by ``SHIELD_VERDICT_CACHE_SIZE``,
+default 1024; 0 disables it). Cache keys include the layer configuration,
+so presets never see each other's verdicts.
 """
 
+import os
 from typing import Optional
 
-from argumentation_analysis.services.ai_shield.shield import Shield
+from argumentation_analysis.services.ai_shield.shield import Shield, VerdictCache
 from argumentation_analysis.services.ai_shield.layers.heuristic import HeuristicLayer
 from argumentation_analysis.services.ai_shield.layers.llm_validator import (
     LLMValidatorLayer,
@@ -17,6 +23,15 @@ from argumentation_analysis.services.ai_shield.layers.output_filter import (
     OutputFilterLayer,
 )
 
+_verdict_cache = VerdictCache(
+    max_entries=int(os.environ.get("SHIELD_VERDICT_CACHE_SIZE", "1024"))
+)
+
+
+def get_verdict_cache() -> VerdictCache:
+    """Verdict cache shared by all preset shields."""
+    return _verdict_cache
+
 
 def load_preset(
     preset_name: str = "basic",
@@ -37,6 +52,7 @@ def load_preset(
         return Shield(
             name="basic",
             fail_open=fail_open,
+            cache=_verdict_cache,
             layers=[
                 HeuristicLayer(threshold=0.5),
             ],
@@ -46,6 +62,7 @@ def load_preset(
         return Shield(
             name="advanced",
             fail_open=fail_open,
+            cache=_verdict_cache,
             layers=[
                 HeuristicLayer(threshold=0.5),
                 LLMValidatorLayer(threshold=0.6, api_key=api_key),
@@ -57,6 +74,7 @@ def load_preset(
         return Shield(
             name="output_only",
             fail_open=fail_open,
+            cache=_verdict_cache,
             layers=[
                 OutputFilterLayer(threshold=0.4),
             ],
@@ -66,6 +84,7 @@ def load_preset(
         return Shield(
             name="strict",
             fail_open=False,
+            cache=_verdict_cache,
             layers=[
                 HeuristicLayer(threshold=0.3),  # Lower threshold = stricter
                 LLMValidatorLayer(threshold=0.4, api_key=api_key),
@@ -3,12 +3,21 @@
 The Shield processes input through a sequence of validation layers,
 each producing a score (0.0-1.0). If any layer score exceeds its
 threshold, the input is blocked.
+
+Layers run cheapest first (``ShieldLayer.cost``), so an input the regex
+layers already block never reaches the LLM validator, and verdicts are
+memoized in a bounded ``VerdictCache`` keyed by a hash of the content.
 """
 
+import asyncio
+import dataclasses
+import hashlib
 import logging
+import threading
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -32,14 +41,76 @@ class ShieldResult:
     overall_score: float  # Max score across all layers
     layer_results: List[LayerResult] = field(default_factory=list)
     reason: str = ""
+    cached: bool = False  # True when served from the verdict cache
 
     @property
     def passed(self) -> bool:
         return not self.blocked
 
 
+class VerdictCache:
+    """Bounded, thread-safe LRU of shield verdicts.
+
+    Keys are SHA-256 digests, so the cache never holds the validated text
+    itself. Only complete verdicts should be stored: a result produced by
+    a layer that errored or fell back (e.g. LLM unavailable) must be
+    recomputed next time rather than replayed.
+    """
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, ShieldResult]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[ShieldResult]:
+        with self._lock:
+            result = self._entries.get(key)
+            if result is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return dataclasses.replace(
+            result, layer_results=list(result.layer_results), cached=True
+        )
+
+    def put(self, key: str, result: ShieldResult) -> None:
+        if self.max_entries <= 0:
+            return
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
 class ShieldLayer(ABC):
-    """Abstract base class for shield validation layers."""
+    """Abstract base class for shield validation layers.
+
+    ``cost`` orders the pipeline: layers run by increasing cost, so the
+    expensive ones (LLM calls) only see inputs the cheap ones let through.
+    Layers with a non-zero cost are run off the event loop by
+    ``validate_async``.
+    """
+
+    cost: int = 0
 
     def __init__(self, name: str, threshold: float = 0.7, enabled: bool = True):
         self.name = name
@@ -59,6 +130,24 @@ class ShieldLayer(ABC):
         """
         ...
 
+    def cache_signature(self) -> Tuple:
+        """Configuration that determines this layer's verdicts.
+
+        Part of the shield's verdict-cache key: layers whose verdicts depend
+        on more than the type, name and threshold extend it.
+        """
+        return (type(self).__name__, self.name, self.threshold)
+
+    async def validate_async(self, text: str, **kwargs) -> LayerResult:
+        """Async variant of ``validate``.
+
+        Cheap layers run inline; costly ones run in a worker thread so a
+        blocking call does not stall the event loop.
+        """
+        if self.cost <= 0:
+            return self.validate(text, **kwargs)
+        return await asyncio.to_thread(self.validate, text, **kwargs)
+
     def _make_result(
         self, score: float, details: Optional[Dict] = None, reason: str = ""
     ) -> LayerResult:
@@ -76,8 +165,8 @@ class ShieldLayer(ABC):
 class Shield:
     """Configurable multi-layer input/output validation shield.
 
-    Processes text through a pipeline of ShieldLayer instances.
-    Blocks input if any layer score exceeds its configured threshold.
+    Processes text through a pipeline of ShieldLayer instances, cheapest
+    first. Blocks input if any layer score exceeds its configured threshold.
 
     Example:
         shield = Shield(layers=[HeuristicLayer(), LLMValidatorLayer()])
@@ -91,24 +180,109 @@ class Shield:
         layers: Optional[List[ShieldLayer]] = None,
         name: str = "default",
         fail_open: bool = False,
+        cache: Optional[VerdictCache] = None,
     ):
         """Initialize shield with validation layers.
 
         Args:
-            layers: Ordered list of validation layers.
+            layers: Validation layers (run by increasing ``cost``, then in
+                    the given order).
             name: Shield configuration name.
             fail_open: If True, allow input when a layer errors.
                        If False (default), block on layer errors.
+            cache: Verdict cache, possibly shared between shields (keys
+                   include the layer configuration). None disables caching.
         """
         self.layers = layers or []
         self.name = name
         self.fail_open = fail_open
+        self.cache = cache
 
     def add_layer(self, layer: ShieldLayer) -> "Shield":
         """Add a layer to the pipeline (fluent API)."""
         self.layers.append(layer)
         return self
 
+    # ── Pipeline ──
+
+    def _pipeline(self) -> List[ShieldLayer]:
+        """Enabled layers, cheapest first (stable for equal costs)."""
+        return sorted(
+            (layer for layer in self.layers if layer.enabled),
+            key=lambda layer: layer.cost,
+        )
+
+    def _cache_key(self, text: str, kwargs: Dict[str, Any]) -> str:
+        config: Tuple = (
+            self.fail_open,
+            tuple(layer.cache_signature() for layer in self._pipeline()),
+            tuple(sorted((k, repr(v)) for k, v in kwargs.items())),
+        )
+        digest = hashlib.sha256(repr(config).encode("utf-8"))
+        digest.update(b"\0")
+        digest.update(text.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def _cached(self, text: str, kwargs: Dict[str, Any]):
+        if self.cache is None:
+            return None, None
+        key = self._cache_key(text, kwargs)
+        return key, self.cache.get(key)
+
+    def _store(self, key: Optional[str], result: ShieldResult) -> ShieldResult:
+        """Cache ``result`` unless a layer errored or fell back."""
+        if key is not None and not any(
+            "error" in lr.details or "fallback" in lr.details
+            for lr in result.layer_results
+        ):
+            self.cache.put(key, result)
+        return result
+
+    def _layer_error(
+        self, layer: ShieldLayer, exc: Exception, layer_results: List[LayerResult]
+    ) -> Optional[ShieldResult]:
+        """Record a layer failure; blocking ShieldResult unless fail-open."""
+        logger.warning(f"Shield layer {layer.name} error: {exc}")
+        layer_results.append(
+            LayerResult(
+                layer_name=layer.name,
+                score=0.0 if self.fail_open else 1.0,
+                passed=self.fail_open,
+                details={"error": str(exc)},
+                reason=f"Layer error: {exc}",
+            )
+        )
+        if self.fail_open:
+            return None
+        return ShieldResult(
+            blocked=True,
+            overall_score=1.0,
+            layer_results=layer_results,
+            reason=f"Layer {layer.name} error: {exc}",
+        )
+
+    def _verdict(
+        self,
+        layer: ShieldLayer,
+        result: LayerResult,
+        layer_results: List[LayerResult],
+        max_score: float,
+    ) -> Optional[ShieldResult]:
+        """Record a layer result; blocking ShieldResult if it fails."""
+        layer_results.append(result)
+        if not result.passed:
+            logger.info(
+                f"Shield[{self.name}] blocked by {layer.name}: "
+                f"score={result.score:.2f} > threshold={layer.threshold:.2f}"
+            )
+            return ShieldResult(
+                blocked=True,
+                overall_score=max_score,
+                layer_results=layer_results,
+                reason=result.reason or f"Blocked by {layer.name}",
+            )
+        return None
+
     def validate_input(self, text: str, **kwargs) -> ShieldResult:
         """Validate input text through all enabled layers.
 
@@ -119,52 +293,73 @@ class Shield:
         Returns:
             ShieldResult with aggregate pass/fail and per-layer details.
         """
+        key, cached = self._cached(text, kwargs)
+        if cached is not None:
+            return cached
+
         layer_results = []
         max_score = 0.0
 
-        for layer in self.layers:
-            if not layer.enabled:
-                continue
-
+        for layer in self._pipeline():
             try:
                 result = layer.validate(text, **kwargs)
-                layer_results.append(result)
+            except Exception as e:
+                verdict = self._layer_error(layer, e, layer_results)
+            else:
                 max_score = max(max_score, result.score)
+                verdict = self._verdict(layer, result, layer_results, max_score)
+            if verdict is not None:
+                return self._store(key, verdict)
+
+        return self._store(
+            key,
+            ShieldResult(
+                blocked=False,
+                overall_score=max_score,
+                layer_results=layer_results,
+            ),
+        )
 
-                if not result.passed:
-                    logger.info(
-                        f"Shield[{self.name}] blocked by {layer.name}: "
-                        f"score={result.score:.2f} > threshold={layer.threshold:.2f}"
-                    )
-                    return ShieldResult(
-                        blocked=True,
-                        overall_score=max_score,
-                        layer_results=layer_results,
-                        reason=result.reason or f"Blocked by {layer.name}",
-                    )
+    async def validate_input_async(self, text: str, **kwargs) -> ShieldResult:
+        """Async ``validate_input``: same pipeline, costly layers off-loop.
 
-            except Exception as e:
-                logger.warning(f"Shield layer {layer.name} error: {e}")
-                error_result = LayerResult(
-                    layer_name=layer.name,
-                    score=0.0 if self.fail_open else 1.0,
-                    passed=self.fail_open,
-                    details={"error": str(e)},
-                    reason=f"Layer error: {e}",
-                )
-                layer_results.append(error_result)
-                if not self.fail_open:
-                    return ShieldResult(
-                        blocked=True,
-                        overall_score=1.0,
-                        layer_results=layer_results,
-                        reason=f"Layer {layer.name} error: {e}",
-                    )
+        Layers of equal cost run concurrently; the next (more expensive)
+        tier only starts when the current one let the input through, so
+        the LLM validator is never called for an input the heuristics
+        already block.
+        """
+        key, cached = self._cached(text, kwargs)
+        if cached is not None:
+            return cached
 
-        return ShieldResult(
-            blocked=False,
-            overall_score=max_score,
-            layer_results=layer_results,
+        layer_results = []
+        max_score = 0.0
+
+        tiers: "OrderedDict[int, List[ShieldLayer]]" = OrderedDict()
+        for layer in self._pipeline():
+            tiers.setdefault(layer.cost, []).append(layer)
+
+        for tier in tiers.values():
+            outcomes = await asyncio.gather(
+                *(layer.validate_async(text, **kwargs) for layer in tier),
+                return_exceptions=True,
+            )
+            for layer, outcome in zip(tier, outcomes):
+                if isinstance(outcome, Exception):
+                    verdict = self._layer_error(layer, outcome, layer_results)
+                else:
+                    max_score = max(max_score, outcome.score)
+                    verdict = self._verdict(layer, outcome, layer_results, max_score)
+                if verdict is not None:
+                    return self._store(key, verdict)
+
+        return self._store(
+            key,
+            ShieldResult(
+                blocked=False,
+                overall_score=max_score,
+                layer_results=layer_results,
+            ),
         )
 
     def validate_output(self, text: str, **kwargs) -> ShieldResult:
@@ -175,6 +370,10 @@ class Shield:
         """
         return self.validate_input(text, direction="output", **kwargs)
 
+    async def validate_output_async(self, text: str, **kwargs) -> ShieldResult:
+        """Async variant of ``validate_output``."""
+        return await self.validate_input_async(text, direction="output", **kwargs)
+
     def get_config(self) -> Dict[str, Any]:
         """Return shield configuration summary."""
         return {
@@ -186,6 +385,7 @@ class Shield:
                     "threshold": layer.threshold,
                     "enabled": layer.enabled,
                     "type": type(layer).__name__,
+                    "cost": layer.cost,
                 }
                 for layer in self.layers
             ],
@@ -17,6 +17,7 @@ ConflictResolver: 5-strategy conflict resolution for multi-agent scenarios.
 
 from argumentation_analysis.services.jtms.jtms_core import (
     Belief,
+    ChangeSet,
     Justification,
     JTMS,
 )
@@ -35,6 +36,7 @@ from argumentation_analysis.services.jtms.conflict_resolution import (
 
 __all__ = [
     "Belief",
+    "ChangeSet",
     "Justification",
     "JTMS",
     "ATMSNode",
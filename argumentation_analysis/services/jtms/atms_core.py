@@ -7,6 +7,12 @@ Provides assumption-based reasoning via environment tracking.
 Unlike JTMS which tracks a single truth value per belief, ATMS tracks
 the set of minimal assumption environments under which each node can be derived.
 
+Environments are encoded as integer bitsets: every assumption gets a bit
+position, an environment is the OR of its assumptions' bits, and subset
+tests become ``a & b == a``. Labels are kept minimal (no environment is a
+superset of another) and nogood-free; new environments are propagated
+incrementally to the justifications that consume the node (de Kleer 1986).
+
 Classes:
     ATMSNode — A node with a label (set of valid environments)
     ATMSJustification — A rule relating in-nodes and out-nodes to a conclusion
@@ -14,35 +20,131 @@ Classes:
 """
 
 import logging
-from itertools import product
-from typing import Dict, FrozenSet, List, Optional, Set
+from collections import deque
+from typing import Callable, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set
 
 logger = logging.getLogger("ATMS")
 
 CONTRADICTION_SYMBOL = "\u22a5"  # ⊥
 
+# Default maximum number of environments kept in a single label. Past this
+# budget, the largest environments are dropped (logged and counted in
+# ATMS.stats["truncated_labels"]) to cap the combinatorial explosion.
+DEFAULT_LABEL_BUDGET = 1024
+
+
+def _bits(mask: int) -> Iterator[int]:
+    """Yield the positions of the set bits of a mask."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class AssumptionIndex:
+    """Bidirectional mapping between assumption names and bit positions."""
+
+    def __init__(self) -> None:
+        self._bit: Dict[str, int] = {}
+        self._names: List[str] = []
+
+    def bit(self, name: str) -> int:
+        """Single-bit mask of an assumption, allocating a position if needed."""
+        if name not in self._bit:
+            self._bit[name] = len(self._names)
+            self._names.append(name)
+        return 1 << self._bit[name]
+
+    def encode(self, env: Iterable[str], create: bool = True) -> int:
+        """Mask of an environment. Unknown names are skipped unless ``create``."""
+        mask = 0
+        for name in env:
+            if create or name in self._bit:
+                mask |= self.bit(name)
+        return mask
+
+    def decode(self, mask: int) -> FrozenSet[str]:
+        return frozenset(self._names[i] for i in _bits(mask))
+
 
 class ATMSNode:
     """A node in the ATMS, representing a proposition.
 
     Each node has a label: a set of minimal environments (frozensets of
-    assumption names) under which this node can be derived.
+    assumption names) under which this node can be derived. Internally the
+    label is a list of bitmasks; ``label`` decodes it on demand.
     """
 
-    def __init__(self, name: str, is_assumption: bool = False) -> None:
+    def __init__(
+        self,
+        name: str,
+        is_assumption: bool = False,
+        index: Optional[AssumptionIndex] = None,
+        on_insert: Optional[Callable[["ATMSNode", int], None]] = None,
+    ) -> None:
         self.name = name
-        self.label: Set[FrozenSet[str]] = set()
         self.justifications: List["ATMSJustification"] = []
+        # Justifications using this node as an in-node (forward propagation)
+        self.consumers: List["ATMSJustification"] = []
         self.is_assumption = is_assumption
+        self._index = index or AssumptionIndex()
+        self._on_insert = on_insert
+        self._masks: List[int] = []
+        self._label_cache: Optional[Set[FrozenSet[str]]] = None
         if is_assumption:
-            self.label.add(frozenset({name}))
+            self.add_mask(self._index.bit(name))
+
+    @property
+    def label(self) -> Set[FrozenSet[str]]:
+        """Minimal environments of this node, as frozensets of assumption names."""
+        if self._label_cache is None:
+            self._label_cache = {self._index.decode(m) for m in self._masks}
+        return self._label_cache
+
+    @label.setter
+    def label(self, envs: Iterable[FrozenSet[str]]) -> None:
+        self._masks = []
+        self._label_cache = None
+        for env in envs:
+            self.add_mask(self._index.encode(env))
+
+    @property
+    def masks(self) -> List[int]:
+        """Bitmask form of the label (read-only view)."""
+        return list(self._masks)
 
     def add_env(self, env: FrozenSet[str]) -> bool:
         """Add an environment to this node's label. Returns True if new."""
-        if env not in self.label:
-            self.label.add(env)
-            return True
-        return False
+        return self.add_mask(self._index.encode(env))
+
+    def add_mask(self, mask: int) -> bool:
+        """Insert an environment mask, keeping the label minimal.
+
+        Returns False when an existing environment is a subset of ``mask``
+        (subsumed); otherwise drops the supersets of ``mask`` and adds it.
+        """
+        for existing in self._masks:
+            if existing & mask == existing:
+                return False
+        self._masks = [m for m in self._masks if m & mask != mask]
+        self._masks.append(mask)
+        self._label_cache = None
+        if self._on_insert is not None:
+            self._on_insert(self, mask)
+        return True
+
+    def remove_supersets(self, mask: int) -> int:
+        """Drop every environment containing ``mask``. Returns how many."""
+        kept = [m for m in self._masks if m & mask != mask]
+        removed = len(self._masks) - len(kept)
+        if removed:
+            self._masks = kept
+            self._label_cache = None
+        return removed
+
+    def holds_in(self, mask: int) -> bool:
+        """True if some environment of the label is a subset of ``mask``."""
+        return any(m & mask == m for m in self._masks)
 
     def __repr__(self) -> str:
         return self.name
@@ -73,6 +175,12 @@ class ATMS:
     Tracks which combinations of assumptions (environments) support each node.
     Unlike JTMS, ATMS maintains all possible derivation paths simultaneously.
 
+    Nogoods (environments deriving ⊥) are stored as minimal bitmasks indexed
+    by their lowest assumption bit, so consistency checks only look at the
+    nogoods that can possibly be contained in the environment. Out-nodes are
+    evaluated when an environment is propagated through a justification;
+    later growth of an out-node label does not retract derived environments.
+
     Usage:
         atms = ATMS()
         atms.add_assumption("a")
@@ -82,14 +190,28 @@ class ATMS:
         envs = atms.get_environments("c")  # {frozenset({"a", "b"})}
     """
 
-    def __init__(self) -> None:
+    def __init__(self, label_budget: Optional[int] = DEFAULT_LABEL_BUDGET) -> None:
+        self.label_budget = label_budget
+        self._index = AssumptionIndex()
+        self._nogoods_by_bit: Dict[int, List[int]] = {}
+        self._empty_nogood = False
+        # bit position → nodes whose label holds an environment with that bit
+        self._nodes_by_bit: Dict[int, Set[ATMSNode]] = {}
+        self.stats: Dict[str, int] = {
+            "propagations": 0,
+            "nogoods": 0,
+            "pruned_environments": 0,
+            "truncated_labels": 0,
+        }
         self.nodes: Dict[str, ATMSNode] = {}
         self.contradiction_node = self.add_node(CONTRADICTION_SYMBOL)
 
     def add_node(self, name: str, is_assumption: bool = False) -> ATMSNode:
         """Add a node to the ATMS. Returns existing node if name already exists."""
         if name not in self.nodes:
-            self.nodes[name] = ATMSNode(name, is_assumption)
+            self.nodes[name] = ATMSNode(
+                name, is_assumption, index=self._index, on_insert=self._on_insert
+            )
             logger.debug(
                 "Added %s node '%s'",
                 "assumption" if is_assumption else "regular",
@@ -109,9 +231,10 @@ class ATMS:
     ) -> None:
         """Add a justification rule and propagate environments.
 
-        Computes the Cartesian product of in-node labels, merges environments,
-        filters by out-node blocking and consistency, then adds valid
-        environments to the conclusion's label.
+        Combines in-node labels one node at a time, pruning nogood and
+        subsumed environments at each step, filters by out-node blocking,
+        then adds the surviving environments to the conclusion and forwards
+        them to every justification consuming the conclusion.
         """
         for name in in_names + out_names + [conclusion_name]:
             if name not in self.nodes:
@@ -126,46 +249,143 @@ class ATMS:
 
         justification = ATMSJustification(in_nodes, out_nodes, conclusion)
         conclusion.justifications.append(justification)
+        for node in in_nodes:
+            if justification not in node.consumers:
+                node.consumers.append(justification)
 
-        # Empty in-list: conclusion derivable under empty environment
-        if not in_nodes:
-            empty_env = frozenset()
-            blocked = any(
-                any(env.issubset(empty_env) for env in out_node.label)
-                for out_node in out_nodes
-            )
-            if not blocked and self.is_consistent(empty_env):
-                conclusion.add_env(empty_env)
-            return
+        self._propagate(conclusion, self._combine(justification))
 
-        in_env_lists = [node.label for node in in_nodes]
-        if any(len(envs) == 0 for envs in in_env_lists):
-            return  # Some in-node has no valid environments
+    # ── Label computation ────────────────────────────────────────────
 
-        for combination in product(*in_env_lists):
-            merged_env = frozenset().union(*combination)
+    def _combine(
+        self,
+        justification: ATMSJustification,
+        trigger: Optional[ATMSNode] = None,
+        delta: Optional[List[int]] = None,
+    ) -> List[int]:
+        """Minimal consistent environments produced by a justification.
+
+        With ``trigger``/``delta``, only combinations using one of the new
+        environments of ``trigger`` are produced (incremental propagation).
+        """
+        use_delta = trigger is not None and justification.in_nodes.count(trigger) == 1
+        envs = [0]
+        for node in justification.in_nodes:
+            source = delta if use_delta and node is trigger else node._masks
+            combined: List[int] = []
+            for env in envs:
+                for node_env in source or ():
+                    merged = env | node_env
+                    if self._is_nogood(merged):
+                        continue
+                    self._insert_minimal(combined, merged)
+            envs = combined
+            if not envs:
+                return []
+
+        # Out-node blocking: skip if any out-node is derivable under a
+        # subset of the merged environment
+        return [
+            env
+            for env in envs
+            if not any(out.holds_in(env) for out in justification.out_nodes)
+        ]
 
-            # Out-node blocking: skip if any out-node is derivable under a
-            # subset of the merged environment
-            if any(
-                any(env.issubset(merged_env) for env in out_node.label)
-                for out_node in out_nodes
-            ):
+    @staticmethod
+    def _insert_minimal(envs: List[int], mask: int) -> None:
+        for existing in envs:
+            if existing & mask == existing:
+                return
+        envs[:] = [m for m in envs if m & mask != mask]
+        envs.append(mask)
+
+    def _propagate(self, node: ATMSNode, masks: List[int]) -> None:
+        """Worklist propagation of new environments to dependent nodes."""
+        queue = deque([(node, masks)])
+        while queue:
+            node, masks = queue.popleft()
+            added = [m for m in masks if not self._is_nogood(m) and node.add_mask(m)]
+            if not added:
+                continue
+            self.stats["propagations"] += 1
+            self._enforce_budget(node)
+            if node is self.contradiction_node:
+                for mask in added:
+                    self._register_nogood(mask)
                 continue
+            added = [m for m in added if m in node._masks]
+            for justification in node.consumers:
+                envs = self._combine(justification, trigger=node, delta=added)
+                if envs:
+                    queue.append((justification.conclusion, envs))
+
+    def _on_insert(self, node: ATMSNode, mask: int) -> None:
+        for bit in _bits(mask):
+            self._nodes_by_bit.setdefault(bit, set()).add(node)
+
+    def _enforce_budget(self, node: ATMSNode) -> None:
+        if self.label_budget is None or len(node._masks) <= self.label_budget:
+            return
+        node._masks.sort(key=lambda m: (bin(m).count("1"), m))
+        del node._masks[self.label_budget :]
+        node._label_cache = None
+        self.stats["truncated_labels"] += 1
+        logger.warning(
+            "ATMS label of '%s' truncated to %d environments (label budget)",
+            node.name,
+            self.label_budget,
+        )
+
+    # ── Nogoods ──────────────────────────────────────────────────────
+
+    def _is_nogood(self, mask: int) -> bool:
+        if self._empty_nogood:
+            return True
+        for bit in _bits(mask):
+            for nogood in self._nogoods_by_bit.get(bit, ()):
+                if nogood & mask == nogood:
+                    return True
+        return False
 
-            if self.is_consistent(merged_env):
-                conclusion.add_env(merged_env)
-                if conclusion.name == CONTRADICTION_SYMBOL:
-                    self.invalidate_environment(merged_env)
+    def _register_nogood(self, mask: int) -> None:
+        """Record a minimal nogood and prune every label containing it."""
+        # An already-covered nogood still prunes labels (e.g. the ⊥ label)
+        if not self._is_nogood(mask):
+            for bit, nogoods in self._nogoods_by_bit.items():
+                self._nogoods_by_bit[bit] = [n for n in nogoods if n & mask != mask]
+            if mask == 0:
+                self._empty_nogood = True
+            else:
+                low = (mask & -mask).bit_length() - 1
+                self._nogoods_by_bit.setdefault(low, []).append(mask)
+            self.stats["nogoods"] = int(self._empty_nogood) + sum(
+                len(b) for b in self._nogoods_by_bit.values()
+            )
+        if mask == 0:
+            candidates: Iterable[ATMSNode] = list(self.nodes.values())
+        else:
+            buckets = [self._nodes_by_bit.get(bit, set()) for bit in _bits(mask)]
+            smallest = min(buckets, key=len)
+            candidates = [
+                n for n in smallest if all(n in b for b in buckets if b is not smallest)
+            ]
+        for node in candidates:
+            self.stats["pruned_environments"] += node.remove_supersets(mask)
 
     def invalidate_environment(self, env: FrozenSet[str]) -> None:
         """Remove an inconsistent environment and all its supersets from all nodes."""
-        for node in self.nodes.values():
-            node.label = {
-                node_env for node_env in node.label if not env.issubset(node_env)
-            }
+        self._register_nogood(self._index.encode(env))
         logger.debug("Invalidated environment %s and its supersets", set(env))
 
+    def get_nogoods(self) -> List[FrozenSet[str]]:
+        """Minimal inconsistent environments recorded so far."""
+        nogoods = [frozenset()] if self._empty_nogood else []
+        for bucket in self._nogoods_by_bit.values():
+            nogoods.extend(self._index.decode(m) for m in bucket)
+        return nogoods
+
+    # ── Queries ──────────────────────────────────────────────────────
+
     def get_environments(self, node_name: str) -> Set[FrozenSet[str]]:
         """Get all valid environments for a node."""
         if node_name not in self.nodes:
@@ -173,8 +393,14 @@ class ATMS:
         return self.nodes[node_name].label
 
     def is_consistent(self, env: FrozenSet[str]) -> bool:
-        """Check whether an environment is consistent (not contradictory)."""
-        return frozenset(env) not in self.nodes[CONTRADICTION_SYMBOL].label
+        """Check whether an environment is consistent (contains no nogood)."""
+        return not self._is_nogood(self._index.encode(env, create=False))
+
+    def holds_in(self, node_name: str, env: FrozenSet[str]) -> bool:
+        """Check whether a node is derivable under the given assumptions."""
+        if node_name not in self.nodes:
+            raise KeyError(f"Node '{node_name}' not found in ATMS.")
+        return self.nodes[node_name].holds_in(self._index.encode(env, create=False))
 
     def get_node(self, name: str) -> Optional[ATMSNode]:
         """Get a node by name, or None if not found."""
@@ -8,7 +8,7 @@ Used by agents (Sherlock, Watson) and by _invoke_jtms for enriched pipeline outp
 import json
 import logging
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from argumentation_analysis.services.jtms.jtms_core import JTMS, Belief, Justification
 
@@ -175,6 +175,48 @@ class JTMSSession:
         self.total_inferences += 1
         self.last_modified = datetime.now()
 
+    def add_justifications(
+        self,
+        rules: List[Tuple[List[str], List[str], str]],
+        agent_source: str = "unknown",
+    ):
+        """Add several ``(in_list, out_list, conclusion)`` rules in one batch.
+
+        Same bookkeeping as :meth:`add_justification`, but the rules and
+        their contradiction rules reach the JTMS through a single
+        :meth:`JTMS.add_justifications` call.
+        """
+        batch = []
+        for in_list, out_list, conclusion in rules:
+            for belief_name in set(in_list + out_list + [conclusion]):
+                if belief_name not in self.extended_beliefs:
+                    self.add_belief(belief_name, agent_source, {"auto_created": True})
+            batch.append((in_list, out_list, conclusion))
+            if out_list:
+                contradiction_belief = "_CONTRADICTION_"
+                if contradiction_belief not in self.extended_beliefs:
+                    self.add_belief(
+                        contradiction_belief, "system", {"auto_created": True}
+                    )
+                for out_item in out_list:
+                    batch.append(
+                        (list(set(in_list + [out_item])), [], contradiction_belief)
+                    )
+
+        self.jtms.add_justifications(batch)
+
+        for in_list, out_list, conclusion in rules:
+            self.extended_beliefs[conclusion].record_modification(
+                "justification_added",
+                {
+                    "in_list": in_list,
+                    "out_list": out_list,
+                    "agent_source": agent_source,
+                },
+            )
+        self.total_inferences += len(rules)
+        self.last_modified = datetime.now()
+
     def set_fact(self, name: str, is_true: bool = True):
         """Declare a belief as ground truth."""
         if name not in self.jtms.beliefs:
@@ -5,24 +5,23 @@ This module provides a Justification-based Truth Maintenance System (JTMS)
 with support for non-monotonic reasoning via strongly-connected component
 detection.
 
+Cycles in the statement → conclusion dependency graph are tracked online
+(Pearce & Kelly 2006 dynamic topological order, with the components found on
+each new edge collapsed through a union-find), so adding a justification
+only visits the part of the graph between the two endpoints instead of
+rebuilding every SCC.
+
 Original author: @ThomasLeguere (student project 1.4.1-JTMS)
 Integrated into argumentation_analysis framework.
 """
 
+import heapq
 import logging
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 logger = logging.getLogger("JTMS")
 
 # Optional visualization deps — graceful degradation
-try:
-    import networkx as nx
-
-    _HAS_NETWORKX = True
-except ImportError:
-    _HAS_NETWORKX = False
-    logger.debug("networkx not available, SCC detection disabled")
-
 try:
     from pyvis.network import Network
 
@@ -32,6 +31,46 @@ except ImportError:
     logger.debug("pyvis not available, visualization disabled")
 
 
+class ChangeSet:
+    """Beliefs whose truth value changed during one propagation wave.
+
+    Maps each belief name to its ``(old, new)`` validity; beliefs that end
+    the wave with their original value are dropped.
+    """
+
+    def __init__(self):
+        self.changes: Dict[str, Tuple[Optional[bool], Optional[bool]]] = {}
+
+    def record(self, belief: "Belief", old_valid: Optional[bool]):
+        first_old = self.changes.get(belief.name, (old_valid, None))[0]
+        if first_old == belief.valid:
+            self.changes.pop(belief.name, None)
+        else:
+            self.changes[belief.name] = (first_old, belief.valid)
+
+    def merge(self, other: "ChangeSet"):
+        for name, (old, new) in other.changes.items():
+            first_old = self.changes.get(name, (old, None))[0]
+            if first_old == new:
+                self.changes.pop(name, None)
+            else:
+                self.changes[name] = (first_old, new)
+
+    def __bool__(self):
+        return bool(self.changes)
+
+    def __len__(self):
+        return len(self.changes)
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Compact delta: belief names grouped by their new status."""
+        delta: Dict[str, List[str]] = {"in": [], "out": [], "unknown": []}
+        for name, (_, new) in sorted(self.changes.items()):
+            key = "unknown" if new is None else ("in" if new else "out")
+            delta[key].append(name)
+        return delta
+
+
 class Belief:
     """A named belief with tri-state truth value and justification support."""
 
@@ -41,7 +80,7 @@ class Belief:
         self.non_monotonic: bool = False
         self.justifications: List["Justification"] = []
         self.implications: List["Justification"] = []
-        self._propagating: bool = False  # Guard against re-entrant propagation cycles
+        self._jtms_ref: Optional["JTMS"] = None
 
     def __str__(self):
         status = (
@@ -52,13 +91,15 @@ class Belief:
     def __repr__(self):
         return f"{self.name}"
 
-    def add_justification(self, justification: "Justification"):
+    def add_justification(self, justification: "Justification") -> ChangeSet:
         self.justifications.append(justification)
-        self.compute_truth_statement()
+        if self._jtms_ref is not None:
+            self._jtms_ref._track_dependencies(justification)
+        return self.compute_truth_statement()
 
-    def remove_justification(self, justification: "Justification"):
+    def remove_justification(self, justification: "Justification") -> ChangeSet:
         self.justifications.remove(justification)
-        self.compute_truth_statement()
+        return self.compute_truth_statement()
 
     def add_implication(self, justification: "Justification"):
         self.implications.append(justification)
@@ -66,50 +107,122 @@ class Belief:
     def remove_implication(self, justification: "Justification"):
         self.implications.remove(justification)
 
-    def set_truth_value(self, value: Optional[bool]):
+    def set_truth_value(self, value: Optional[bool]) -> ChangeSet:
+        old_valid = self.valid
         self.valid = value
-        self.propagate()
-
-    def compute_truth_statement(self):
-        if self.non_monotonic:
-            self.valid = None
-            return
-        if self._propagating:
-            return  # Break re-entrant cycle
+        changes = self.propagate()
+        changes.record(self, old_valid)
+        return changes
 
+    def evaluate(self) -> bool:
+        """Recompute the truth value from the justifications, without
+        propagating. Returns True if the value changed."""
         old_valid = self.valid
         self.valid = None
-        for justification in self.justifications:
-            if all(b.valid for b in justification.in_list) and not any(
-                b.valid for b in justification.out_list
-            ):
-                self.valid = True
-                break
-
-        if self.valid != old_valid:
-            self.propagate()
-
-    def propagate(self):
-        self._propagating = True
-        try:
-            for justification in self.implications:
-                conclusion = justification.conclusion
-                old_valid = conclusion.valid
-                conclusion.compute_truth_statement()
-                # Track cascade: conclusion was valid, now retracted
-                if (
-                    hasattr(self, "_jtms_ref")
-                    and self._jtms_ref is not None
-                    and self._jtms_ref._tracing_enabled
-                    and old_valid is True
-                    and conclusion.valid is not True
-                    and self._jtms_ref._retraction_trace
+        if not self.non_monotonic:
+            for justification in self.justifications:
+                if all(b.valid for b in justification.in_list) and not any(
+                    b.valid for b in justification.out_list
                 ):
-                    self._jtms_ref._retraction_trace[-1]["cascaded"].append(
-                        conclusion.name
-                    )
-        finally:
-            self._propagating = False
+                    self.valid = True
+                    break
+        return self.valid != old_valid
+
+    def compute_truth_statement(self) -> ChangeSet:
+        """Re-evaluate this belief and, if it changed, its consequences."""
+        return self._wave([], [self])
+
+    def propagate(self) -> ChangeSet:
+        """Re-evaluate every belief downstream of this one."""
+        return self._wave([self], [])
+
+    def _wave(self, changed: List["Belief"], pending: List["Belief"]) -> ChangeSet:
+        if self._jtms_ref is not None:
+            return self._jtms_ref._propagate(changed, pending)
+        return propagate_wave(changed, _local_order(changed + pending), pending=pending)
+
+
+def _consumers(belief: Belief):
+    for justification in belief.implications:
+        yield justification.conclusion
+
+
+def _local_order(sources: List[Belief]):
+    """Topological position over the region downstream of ``sources``.
+
+    Used for beliefs outside a :class:`JTMS`; reverse DFS post-order puts
+    premises before conclusions (cycles get an arbitrary order, which the
+    at-most-once rule of :func:`propagate_wave` keeps finite).
+    """
+    position: Dict[int, int] = {}
+    postorder: List[Belief] = []
+    seen = set()
+    for source in sources:
+        if id(source) in seen:
+            continue
+        seen.add(id(source))
+        stack = [(source, _consumers(source))]
+        while stack:
+            node, successors = stack[-1]
+            for succ in successors:
+                if id(succ) not in seen:
+                    seen.add(id(succ))
+                    stack.append((succ, _consumers(succ)))
+                    break
+            else:
+                stack.pop()
+                postorder.append(node)
+    for rank, belief in enumerate(reversed(postorder)):
+        position[id(belief)] = rank
+    return lambda belief: position.get(id(belief), len(position))
+
+
+def propagate_wave(
+    changed: List[Belief],
+    position: Callable[[Belief], int],
+    on_change: Optional[Callable[[Belief, Optional[bool]], None]] = None,
+    pending: Iterable[Belief] = (),
+) -> ChangeSet:
+    """Worklist propagation of one wave of truth-value changes.
+
+    ``changed`` beliefs already hold their new value and are never
+    re-evaluated; ``pending`` beliefs are re-evaluated as part of the wave.
+    The worklist is ordered by topological ``position`` so that each belief
+    is evaluated at most once, after every premise that changes in the same
+    wave. Iterative, so chain depth is not bounded by the recursion limit.
+    """
+    changes = ChangeSet()
+    done = {id(b) for b in changed}
+    queued = set()
+    heap: List[Tuple[int, int, Belief]] = []
+    counter = 0
+
+    def _push(belief: Belief):
+        nonlocal counter
+        key = id(belief)
+        if key not in done and key not in queued:
+            queued.add(key)
+            heapq.heappush(heap, (position(belief), counter, belief))
+            counter += 1
+
+    def _schedule(belief: Belief):
+        for consumer in _consumers(belief):
+            _push(consumer)
+
+    for belief in changed:
+        _schedule(belief)
+    for belief in pending:
+        _push(belief)
+    while heap:
+        _, _, belief = heapq.heappop(heap)
+        done.add(id(belief))
+        old_valid = belief.valid
+        if belief.evaluate():
+            changes.record(belief, old_valid)
+            if on_change is not None:
+                on_change(belief, old_valid)
+            _schedule(belief)
+    return changes
 
 
 class Justification:
@@ -126,6 +239,129 @@ class Justification:
         self.conclusion = conclusion
 
 
+class _DependencyGraph:
+    """Online SCC tracking for the statement → conclusion graph of a JTMS.
+
+    Each component is represented by a union-find root carrying the
+    component's members, its condensed in/out edges and its position in a
+    topological order of the condensation. An edge that respects the order
+    costs O(1); otherwise only the nodes whose position lies between the two
+    endpoints are searched, and a cycle found there is merged into a single
+    component.
+    """
+
+    def __init__(self) -> None:
+        self._parent: Dict[str, str] = {}
+        self._members: Dict[str, Set[str]] = {}
+        self._succ: Dict[str, Set[str]] = {}
+        self._pred: Dict[str, Set[str]] = {}
+        self._ord: Dict[str, int] = {}
+        self._next_ord = 0
+        self._first_ord = 0
+
+    def add_node(self, name: str, first: bool = False) -> None:
+        """Register ``name``, at the end of the order or before every node.
+
+        A node entering as an edge source is placed first so that its edge
+        already respects the order (keeps backward-built chains O(1)).
+        """
+        if name in self._parent:
+            return
+        self._parent[name] = name
+        self._members[name] = {name}
+        self._succ[name] = set()
+        self._pred[name] = set()
+        if first:
+            self._first_ord -= 1
+            self._ord[name] = self._first_ord
+        else:
+            self._ord[name] = self._next_ord
+            self._next_ord += 1
+
+    def find(self, name: str) -> str:
+        root = name
+        while self._parent[root] != root:
+            root = self._parent[root]
+        while self._parent[name] != root:
+            self._parent[name], name = root, self._parent[name]
+        return root
+
+    def order(self, name: str) -> int:
+        """Topological position of the component containing ``name``."""
+        return self._ord[self.find(name)]
+
+    def add_edge(self, source: str, target: str) -> Set[str]:
+        """Insert ``source → target``; return the members of a merged cycle.
+
+        The returned set is empty unless the edge closed a cycle spanning
+        more than one node, in which case it holds every member of the
+        resulting component.
+        """
+        self.add_node(target)
+        self.add_node(source, first=True)
+        rs, rt = self.find(source), self.find(target)
+        if rs == rt or rt in self._succ[rs]:
+            return set()
+        self._succ[rs].add(rt)
+        self._pred[rt].add(rs)
+        lower, upper = self._ord[rt], self._ord[rs]
+        if upper < lower:
+            return set()
+
+        forward = self._reach(rt, self._succ, lambda o: o <= upper)
+        backward = self._reach(rs, self._pred, lambda o: o >= lower)
+        cycle = forward & backward
+        # Pool the positions of the affected nodes: what reaches the source
+        # takes the lowest ones, what the target reaches the highest ones and
+        # a merged cycle one slot in between (Pearce & Kelly's reordering).
+        slots = sorted(self._ord[r] for r in forward | backward)
+        by_ord = self._ord.__getitem__
+        before = sorted(backward - cycle, key=by_ord)
+        after = sorted(forward - cycle, key=by_ord)
+        for slot, rep in zip(slots, before):
+            self._ord[rep] = slot
+        for slot, rep in zip(slots[len(slots) - len(after) :], after):
+            self._ord[rep] = slot
+        if not cycle:
+            return set()
+        root = self._merge(cycle)
+        self._ord[root] = slots[len(before)]
+        return set(self._members[root])
+
+    def _reach(self, start: str, edges: Dict[str, Set[str]], within) -> Set[str]:
+        seen = {start}
+        stack = [start]
+        while stack:
+            node = stack.pop()
+            for nxt in edges[node]:
+                if nxt not in seen and within(self._ord[nxt]):
+                    seen.add(nxt)
+                    stack.append(nxt)
+        return seen
+
+    def _merge(self, reps: Set[str]) -> str:
+        root = min(reps, key=lambda r: self._ord[r])
+        for rep in reps:
+            if rep == root:
+                continue
+            self._parent[rep] = root
+            self._members[root] |= self._members.pop(rep)
+            for succ in self._succ.pop(rep):
+                self._pred[succ].discard(rep)
+                if succ not in reps:
+                    self._pred[succ].add(root)
+                    self._succ[root].add(succ)
+            for pred in self._pred.pop(rep):
+                self._succ[pred].discard(rep)
+                if pred not in reps:
+                    self._succ[pred].add(root)
+                    self._pred[root].add(pred)
+            del self._ord[rep]
+        self._succ[root] -= reps
+        self._pred[root] -= reps
+        return root
+
+
 class JTMS:
     """
     Justification-based Truth Maintenance System.
@@ -147,6 +383,8 @@ class JTMS:
         self.strict = strict
         self._retraction_trace: List[Dict] = []
         self._tracing_enabled: bool = False
+        self._dependencies = _DependencyGraph()
+        self._dependencies_stale = False
 
     def add_belief(self, name: str):
         """Add a new belief to the system."""
@@ -166,9 +404,17 @@ class JTMS:
             )
 
         self.beliefs.pop(belief_name)
+        # Edge deletion is not supported online: rebuild on next insertion
+        self._dependencies_stale = True
 
-    def set_belief_validity(self, belief_name: str, validity: Optional[bool]):
-        """Set the truth value of a belief and propagate."""
+    def set_belief_validity(
+        self, belief_name: str, validity: Optional[bool]
+    ) -> ChangeSet:
+        """Set the truth value of a belief and propagate.
+
+        Returns the :class:`ChangeSet` of every belief that flipped,
+        including ``belief_name`` itself.
+        """
         if belief_name not in self.beliefs:
             raise KeyError(f"Unknown belief: {belief_name}")
         belief = self.beliefs[belief_name]
@@ -182,15 +428,86 @@ class JTMS:
                     "reason": f"directly set to {validity}",
                 }
             )
-        belief.set_truth_value(validity)
+        return belief.set_truth_value(validity)
 
     def add_justification(
         self,
         in_list: List[str],
         out_list: List[str],
         conclusion_name: str,
-    ):
-        """Add a justification rule. Creates missing beliefs in non-strict mode."""
+    ) -> ChangeSet:
+        """Add a justification rule. Creates missing beliefs in non-strict mode.
+
+        Returns the :class:`ChangeSet` of the resulting propagation.
+        """
+        justification = self._register_justification(in_list, out_list, conclusion_name)
+        changes = justification.conclusion.compute_truth_statement()
+        self._track_dependencies(justification)
+        return changes
+
+    def add_justifications(self, rules: Iterable[Any]) -> ChangeSet:
+        """Add a batch of justification rules with a single propagation pass.
+
+        Each rule is either an ``(in_list, out_list, conclusion)`` tuple or a
+        dict with ``"in"``, ``"out"`` and ``"conclusion"`` keys (the belief
+        file format of 1.4.1-JTMS). All rules are registered first, cycles
+        are marked non-monotonic, then each distinct conclusion is evaluated
+        once in topological order of the dependency graph. Unlike repeated
+        :meth:`add_justification` calls, a belief inside a cycle is therefore
+        never evaluated before being marked non-monotonic. Returns the
+        :class:`ChangeSet` of the whole batch.
+        """
+        parsed = []
+        for rule in rules:
+            if isinstance(rule, dict):
+                parsed.append((rule["in"], rule["out"], rule["conclusion"]))
+            else:
+                in_list, out_list, conclusion_name = rule
+                parsed.append((in_list, out_list, conclusion_name))
+        if self.strict:
+            for in_list, out_list, conclusion_name in parsed:
+                for b in list(in_list) + list(out_list) + [conclusion_name]:
+                    if b not in self.beliefs:
+                        raise KeyError(f"Unknown belief: {b}")
+
+        conclusions: Dict[str, Belief] = {}
+        for in_list, out_list, conclusion_name in parsed:
+            justification = self._register_justification(
+                list(in_list), list(out_list), conclusion_name
+            )
+            self._track_dependencies(justification)
+            conclusions[conclusion_name] = justification.conclusion
+        return self._propagate([], conclusions.values())
+
+    def _propagate(
+        self, changed: List[Belief], pending: Iterable[Belief] = ()
+    ) -> ChangeSet:
+        """Run one :func:`propagate_wave` ordered by the dependency graph."""
+        if self._dependencies_stale:
+            self.update_non_monotonic_beliefs()
+        return propagate_wave(changed, self._position, self._trace_retraction, pending)
+
+    def _position(self, belief: Belief) -> int:
+        self._dependencies.add_node(belief.name)
+        return self._dependencies.order(belief.name)
+
+    def _trace_retraction(self, belief: Belief, old_valid: Optional[bool]):
+        """Record beliefs retracted as a consequence of a traced retraction."""
+        if (
+            self._tracing_enabled
+            and old_valid is True
+            and belief.valid is not True
+            and self._retraction_trace
+        ):
+            self._retraction_trace[-1]["cascaded"].append(belief.name)
+
+    def _register_justification(
+        self,
+        in_list: List[str],
+        out_list: List[str],
+        conclusion_name: str,
+    ) -> Justification:
+        """Create and link a justification without evaluating its conclusion."""
         for b in in_list + out_list + [conclusion_name]:
             if b not in self.beliefs:
                 if self.strict:
@@ -203,33 +520,79 @@ class JTMS:
             [self.beliefs[name] for name in out_list],
             self.beliefs[conclusion_name],
         )
-        self.beliefs[conclusion_name].add_justification(justification)
-        for in_belief in justification.in_list:
-            self.beliefs[in_belief.name].add_implication(justification)
-        for out_belief in justification.out_list:
-            self.beliefs[out_belief.name].add_implication(justification)
+        justification.conclusion.justifications.append(justification)
+        for statement in justification.in_list + justification.out_list:
+            statement.add_implication(justification)
+        return justification
+
+    def _track_dependencies(self, justification: Justification):
+        """Add the justification's edges and mark any cycle it closes."""
+        if self._dependencies_stale:
+            self.update_non_monotonic_beliefs()
+            return
+        conclusion = justification.conclusion.name
+        self._dependencies.add_node(conclusion)
+        for statement in justification.in_list + justification.out_list:
+            self._mark_non_monotonic(
+                self._dependencies.add_edge(statement.name, conclusion)
+            )
 
-        self.update_non_monotonic_beliefs()
+    def _mark_non_monotonic(self, names: Set[str]):
+        for belief_name in names:
+            if belief_name in self.beliefs:
+                self.beliefs[belief_name].non_monotonic = True
 
     def update_non_monotonic_beliefs(self):
-        """Detect strongly-connected components and mark beliefs as non-monotonic."""
-        if not _HAS_NETWORKX:
-            return
+        """Rebuild the dependency graph and mark every cycle as non-monotonic.
 
-        vertices = []
+        Justifications added through this class are tracked incrementally;
+        a full rebuild is only needed after beliefs were removed or
+        justifications were attached to beliefs directly.
+        """
+        self._dependencies = _DependencyGraph()
+        self._dependencies_stale = False
         for belief in self.beliefs.values():
             for justification in belief.justifications:
                 for statement in justification.in_list + justification.out_list:
-                    vertices.append((statement.name, belief.name))
-        if not vertices:
-            return
-        graph = nx.DiGraph(vertices)
-        sccs = nx.strongly_connected_components(graph)
-        for scc in sccs:
-            if len(scc) > 1:
-                for belief_name in scc:
-                    if belief_name in self.beliefs:
-                        self.beliefs[belief_name].non_monotonic = True
+                    self._mark_non_monotonic(
+                        self._dependencies.add_edge(statement.name, belief.name)
+                    )
+
+    def export_state(self) -> Dict[str, Any]:
+        """Exact, JSON-ready state of the network.
+
+        Unlike replaying beliefs and justifications, :meth:`from_state`
+        restores every truth value and non-monotonic flag as-is, without
+        running any propagation.
+        """
+        beliefs = list(self.beliefs.values())
+        return {
+            "strict": self.strict,
+            "beliefs": [[b.name, b.valid, b.non_monotonic] for b in beliefs],
+            "justifications": [
+                [
+                    b.name,
+                    [s.name for s in j.in_list],
+                    [s.name for s in j.out_list],
+                ]
+                for b in beliefs
+                for j in b.justifications
+            ],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "JTMS":
+        """Rebuild a network from :meth:`export_state` output."""
+        jtms = cls(strict=state.get("strict", False))
+        for name, _, _ in state["beliefs"]:
+            jtms.add_belief(name)
+        for conclusion, in_list, out_list in state["justifications"]:
+            jtms._register_justification(in_list, out_list, conclusion)
+        jtms.update_non_monotonic_beliefs()
+        for name, valid, non_monotonic in state["beliefs"]:
+            jtms.beliefs[name].valid = valid
+            jtms.beliefs[name].non_monotonic = non_monotonic
+        return jtms
 
     def show(self):
         """Print all beliefs and their truth values."""
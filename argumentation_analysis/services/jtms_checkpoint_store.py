@@ -0,0 +1,371 @@
+"""
+Stockage des checkpoints JTMS : snapshots périodiques + journal d'opérations.
+
+``JTMSSessionManager.create_checkpoint`` capturait l'état complet de chaque
+instance (``get_jtms_state``) et l'écrivait en JSON indenté, de manière
+bloquante, à chaque checkpoint. Ce module le remplace par un stockage
+incrémental, par session :
+
+- ``{session_id}.{seq}.snap`` : snapshot complet (``JTMS.export_state``) de
+  toutes les instances de la session à la position ``seq`` du journal ;
+- ``{session_id}.{seq}.wal`` : segment de journal en ajout seul, contenant
+  les opérations postérieures à ce snapshot (croyances, justifications,
+  validités, suppressions...) et les marqueurs de checkpoint.
+
+Un checkpoint n'est plus qu'une position dans le journal : le créer ajoute
+les opérations en attente et un marqueur au segment courant. Un nouveau
+snapshot n'est pris que tous les ``snapshot_interval`` opérations ; les
+snapshots et segments qui ne servent plus à aucun checkpoint conservé sont
+supprimés (compaction). La restauration charge le snapshot de base du
+checkpoint puis rejoue le journal jusqu'à sa position.
+
+L'abandon d'un checkpoint est un marqueur ``forget`` du journal. La
+compaction peut supprimer le segment qui le porte tout en gardant celui du
+checkpoint abandonné : chaque nouveau segment s'ouvre donc sur la liste
+cumulée des checkpoints abandonnés, et le segment courant n'est jamais
+supprimé.
+
+Encodage binaire compact : chaque enregistrement est du JSON compact
+compressé par zlib, préfixé par sa longueur (4 octets big-endian) ; un
+enregistrement tronqué en fin de segment (écriture interrompue) est ignoré
+à la relecture. Toutes les entrées/sorties passent par ``asyncio.to_thread``
+pour ne pas bloquer la boucle d'événements.
+"""
+
+import asyncio
+import json
+import logging
+import os
+import struct
+import tempfile
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from argumentation_analysis.services.jtms import JTMS
+
+logger = logging.getLogger(__name__)
+
+_FRAME = struct.Struct(">I")
+
+# Opérations qui ne modifient pas l'état des instances.
+_MARKERS = frozenset({"checkpoint", "forget"})
+
+
+def encode_record(record: Any) -> bytes:
+    """Enregistrement encodé : longueur + JSON compact compressé."""
+    payload = zlib.compress(
+        json.dumps(record, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    )
+    return _FRAME.pack(len(payload)) + payload
+
+
+def decode_records(data: bytes) -> List[Any]:
+    """Enregistrements d'un segment ; ignore une fin tronquée."""
+    records, offset = [], 0
+    while offset + _FRAME.size <= len(data):
+        (length,) = _FRAME.unpack_from(data, offset)
+        start = offset + _FRAME.size
+        if start + length > len(data):
+            logger.warning("Enregistrement de journal tronqué ignoré")
+            break
+        records.append(json.loads(zlib.decompress(data[start : start + length])))
+        offset = start + length
+    return records
+
+
+def apply_operation(
+    instances: Dict[str, JTMS], instance_id: str, operation: List[Any]
+) -> None:
+    """Rejoue une opération ``[op, *args]`` émise par ``JTMSService``."""
+    op, args = operation[0], operation[1:]
+    if op in _MARKERS:
+        return
+    if op == "create":
+        instances[instance_id] = JTMS(strict=args[0])
+    elif op == "load":
+        instances[instance_id] = JTMS.from_state(args[0])
+    elif op == "drop":
+        instances.pop(instance_id, None)
+    else:
+        jtms = instances[instance_id]
+        if op == "belief":
+            jtms.add_belief(args[0])
+            if args[1] is not None:
+                jtms.set_belief_validity(args[0], args[1])
+        elif op == "justify":
+            jtms.add_justification(args[0], args[1], args[2])
+        elif op == "validity":
+            jtms.set_belief_validity(args[0], args[1])
+        elif op == "remove":
+            jtms.remove_belief(args[0])
+        else:
+            raise ValueError(f"Opération de journal inconnue: {op}")
+
+
+@dataclass
+class _SessionJournal:
+    """État en mémoire du journal d'une session."""
+
+    seq: int = 0
+    # Position du snapshot ouvrant le segment courant (None : aucun).
+    base: Optional[int] = None
+    since_snapshot: int = 0
+    pending: List[List[Any]] = field(default_factory=list)
+    instances: Set[str] = field(default_factory=set)
+    # Checkpoints abandonnés, repris en tête de chaque nouveau segment.
+    forgotten: Set[str] = field(default_factory=set)
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class JTMSCheckpointStore:
+    """Snapshots + journal en ajout seul des sessions JTMS."""
+
+    def __init__(self, storage_path: Path, snapshot_interval: int = 500):
+        self.storage_path = Path(storage_path)
+        self.snapshot_interval = snapshot_interval
+        self._journals: Dict[str, _SessionJournal] = {}
+
+    # ── Journalisation ──
+
+    def _journal(self, session_id: str) -> _SessionJournal:
+        journal = self._journals.get(session_id)
+        if journal is None:
+            journal = self._journals[session_id] = _SessionJournal()
+        return journal
+
+    def record(
+        self, session_id: str, instance_id: Optional[str], operation: List[Any]
+    ) -> int:
+        """Met une opération en attente d'écriture ; renvoie sa position."""
+        journal = self._journal(session_id)
+        journal.seq += 1
+        journal.pending.append([journal.seq, instance_id, *operation])
+        if operation[0] not in _MARKERS:
+            journal.since_snapshot += 1
+            if operation[0] == "drop":
+                journal.instances.discard(instance_id)
+            else:
+                journal.instances.add(instance_id)
+        return journal.seq
+
+    def tracks(self, session_id: str, instance_id: str) -> bool:
+        """Vrai si le journal de la session couvre l'instance."""
+        journal = self._journals.get(session_id)
+        return journal is not None and instance_id in journal.instances
+
+    async def flush(self, session_id: str) -> None:
+        """Ajoute les opérations en attente au segment courant."""
+        journal = self._journal(session_id)
+        async with journal.lock:
+            await self._flush_locked(session_id, journal)
+
+    async def _flush_locked(self, session_id: str, journal: _SessionJournal) -> None:
+        # Avant le premier snapshot, les opérations restent en attente : ce
+        # snapshot capturera leur effet.
+        if not journal.pending or journal.base is None:
+            return
+        records, journal.pending = journal.pending, []
+        data = b"".join(encode_record(r) for r in records)
+        await asyncio.to_thread(
+            self._append, self._segment_path(session_id, journal.base), data
+        )
+
+    async def checkpoint(
+        self,
+        session_id: str,
+        checkpoint: Dict[str, Any],
+        live_states: Callable[[], Dict[str, Dict[str, Any]]],
+    ) -> None:
+        """Écrit un checkpoint ; ``checkpoint["journal_seq"]`` est renseigné.
+
+        ``live_states`` fournit l'état exporté des instances de la session ;
+        il n'est appelé que lorsqu'un nouveau snapshot est dû.
+        """
+        journal = self._journal(session_id)
+        async with journal.lock:
+            if journal.base is None or journal.since_snapshot >= self.snapshot_interval:
+                await self._snapshot_locked(session_id, journal, live_states())
+            checkpoint["journal_seq"] = journal.seq
+            journal.seq += 1
+            journal.pending.append([journal.seq, None, "checkpoint", checkpoint])
+            await self._flush_locked(session_id, journal)
+
+    async def _snapshot_locked(
+        self,
+        session_id: str,
+        journal: _SessionJournal,
+        states: Dict[str, Dict[str, Any]],
+    ) -> None:
+        # ``states`` reflète exactement la position courante : on bascule
+        # sur le nouveau segment avant toute attente, les opérations
+        # journalisées pendant les écritures y seront ajoutées.
+        seq, previous = journal.seq, journal.base
+        records, journal.pending = journal.pending, []
+        journal.base, journal.since_snapshot = seq, 0
+        journal.instances = set(states)
+        if journal.forgotten:
+            journal.seq += 1
+            journal.pending.append(
+                [journal.seq, None, "forget", sorted(journal.forgotten)]
+            )
+        if records and previous is not None:
+            await asyncio.to_thread(
+                self._append,
+                self._segment_path(session_id, previous),
+                b"".join(encode_record(r) for r in records),
+            )
+        await asyncio.to_thread(
+            self._write_atomic,
+            self._snapshot_path(session_id, seq),
+            encode_record({"seq": seq, "instances": states}),
+        )
+
+    def forget(self, session_id: str, checkpoint_ids: Iterable[str]) -> None:
+        """Journalise l'abandon de checkpoints (appliqué au rechargement)."""
+        checkpoint_ids = list(checkpoint_ids)
+        if checkpoint_ids:
+            self._journal(session_id).forgotten.update(checkpoint_ids)
+            self.record(session_id, None, ["forget", checkpoint_ids])
+
+    async def compact(self, session_id: str, retained: Iterable[Dict[str, Any]]):
+        """Supprime snapshots et segments inutiles aux checkpoints conservés.
+
+        Returns:
+            int: Nombre de fichiers supprimés
+        """
+        journal = self._journal(session_id)
+        async with journal.lock:
+            bases = await asyncio.to_thread(self._snapshot_bases, session_id)
+            keep = {journal.base}
+            for cp in retained:
+                if "journal_seq" in cp:
+                    keep.add(_base_for(bases, cp["journal_seq"]))
+            stale = [b for b in bases if b not in keep]
+            paths = [self._snapshot_path(session_id, b) for b in stale] + [
+                self._segment_path(session_id, b) for b in stale
+            ]
+            return await asyncio.to_thread(self._unlink, paths)
+
+    # ── Relecture ──
+
+    async def load_checkpoints(self, session_id: str) -> List[Dict[str, Any]]:
+        """Checkpoints journalisés d'une session (et reprise de sa position)."""
+        bases = await asyncio.to_thread(self._snapshot_bases, session_id)
+        segments = await asyncio.to_thread(self._read_segments, session_id, bases)
+        checkpoints: Dict[str, Dict[str, Any]] = {}
+        forgotten: Set[str] = set()
+        last = bases[-1] if bases else 0
+        for records in segments.values():
+            for seq, _, op, *args in records:
+                last = max(last, seq)
+                if op == "checkpoint":
+                    checkpoints[args[0]["checkpoint_id"]] = args[0]
+                elif op == "forget":
+                    forgotten.update(args[0])
+        journal = self._journal(session_id)
+        journal.forgotten.update(forgotten)
+        if bases and journal.base is None:
+            journal.seq = max(journal.seq, last)
+            journal.base = bases[-1]
+            journal.since_snapshot = (
+                self.snapshot_interval
+            )  # snapshot au prochain checkpoint
+        return [cp for cp_id, cp in checkpoints.items() if cp_id not in forgotten]
+
+    async def materialize(
+        self, session_id: str, seq: int, instance_ids: Iterable[str]
+    ) -> Dict[str, JTMS]:
+        """Instances telles qu'à la position ``seq`` : snapshot + rejeu."""
+        await self.flush(session_id)
+        return await asyncio.to_thread(
+            self._materialize, session_id, seq, list(instance_ids)
+        )
+
+    def _materialize(
+        self, session_id: str, seq: int, instance_ids: List[str]
+    ) -> Dict[str, JTMS]:
+        bases = self._snapshot_bases(session_id)
+        base = _base_for(bases, seq)
+        if base is None:
+            raise ValueError(
+                f"Aucun snapshot antérieur à la position {seq} pour {session_id}"
+            )
+        snapshot = decode_records(self._snapshot_path(session_id, base).read_bytes())
+        instances = {
+            iid: JTMS.from_state(state)
+            for iid, state in snapshot[0]["instances"].items()
+        }
+        segment = self._segment_path(session_id, base)
+        records = decode_records(segment.read_bytes()) if segment.exists() else []
+        for record_seq, instance_id, *operation in records:
+            if record_seq > seq:
+                break
+            apply_operation(instances, instance_id, operation)
+        return {iid: instances[iid] for iid in instance_ids if iid in instances}
+
+    async def delete(self, session_id: str) -> None:
+        self._journals.pop(session_id, None)
+        paths = list(self.storage_path.glob(f"{session_id}.*.snap")) + list(
+            self.storage_path.glob(f"{session_id}.*.wal")
+        )
+        await asyncio.to_thread(self._unlink, paths)
+
+    # ── Fichiers ──
+
+    def _snapshot_path(self, session_id: str, seq: int) -> Path:
+        return self.storage_path / f"{session_id}.{seq:010d}.snap"
+
+    def _segment_path(self, session_id: str, base: int) -> Path:
+        return self.storage_path / f"{session_id}.{base:010d}.wal"
+
+    def _snapshot_bases(self, session_id: str) -> List[int]:
+        return sorted(
+            int(path.suffixes[-2][1:])
+            for path in self.storage_path.glob(f"{session_id}.*.snap")
+        )
+
+    def _read_segments(self, session_id: str, bases: List[int]) -> Dict[int, List[Any]]:
+        segments = {}
+        for base in bases:
+            path = self._segment_path(session_id, base)
+            if path.exists():
+                segments[base] = decode_records(path.read_bytes())
+        return segments
+
+    @staticmethod
+    def _append(path: Path, data: bytes) -> None:
+        with open(path, "ab") as f:
+            f.write(data)
+
+    @staticmethod
+    def _write_atomic(path: Path, data: bytes) -> None:
+        # One temp file per write: concurrent saves of the same session
+        # must not interleave their bytes before os.replace publishes them.
+        with tempfile.NamedTemporaryFile(
+            dir=path.parent, prefix=path.name + ".", suffix=".tmp", delete=False
+        ) as f:
+            f.write(data)
+        try:
+            os.replace(f.name, path)
+        except BaseException:
+            os.unlink(f.name)
+            raise
+
+    @staticmethod
+    def _unlink(paths: Iterable[Path]) -> int:
+        removed = 0
+        for path in paths:
+            try:
+                path.unlink()
+                removed += 1
+            except FileNotFoundError:
+                pass
+        return removed
+
+
+def _base_for(bases: List[int], seq: int) -> Optional[int]:
+    """Dernier snapshot pris à la position ``seq`` ou avant."""
+    candidates = [b for b in bases if b <= seq]
+    return candidates[-1] if candidates else None
@@ -7,7 +7,7 @@ avec support de sessions, versioning et synchronisation multi-agents.
 import uuid
 import json
 import asyncio
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Callable, Dict, List, Optional, Any, Tuple
 from datetime import datetime
 from pathlib import Path
 from argumentation_analysis.services.jtms import JTMS, Belief, Justification
@@ -23,6 +23,41 @@ class JTMSService:
         self.instances: Dict[str, JTMS] = {}
         self.metadata: Dict[str, Dict] = {}
         self.session_manager = None  # Sera injecté par le SessionManager
+        self._callbacks: Dict[str, List[Callable]] = {}
+
+    def register_callback(self, event: str, callback: Callable):
+        """
+        Enregistre un callback notifié après chaque propagation.
+
+        Événements supportés :
+
+        - "beliefs_changed", appelé avec ``(session_id, instance_id, delta)``
+          où ``delta`` est le ``ChangeSet.to_dict()`` des croyances basculées
+          (in/out/unknown) ;
+        - "mutation", appelé avec ``(session_id, instance_id, operation)``
+          après chaque modification réussie d'une instance. ``operation``
+          est une liste ``[op, *args]`` rejouable (voir
+          ``jtms_checkpoint_store.apply_operation``) : c'est la source du
+          journal des checkpoints.
+        """
+        self._callbacks.setdefault(event, []).append(callback)
+
+    def _notify_mutation(self, instance_id: str, *operation: Any) -> None:
+        """Diffuse une opération rejouable aux callbacks "mutation"."""
+        callbacks = self._callbacks.get("mutation")
+        if callbacks:
+            session_id = self.metadata.get(instance_id, {}).get("session_id")
+            for callback in callbacks:
+                callback(session_id, instance_id, list(operation))
+
+    def _notify_changes(self, instance_id: str, changes) -> Dict[str, List[str]]:
+        """Diffuse le delta d'une propagation aux callbacks et le retourne."""
+        delta = changes.to_dict()
+        if changes:
+            session_id = self.metadata.get(instance_id, {}).get("session_id")
+            for callback in self._callbacks.get("beliefs_changed", []):
+                callback(session_id, instance_id, delta)
+        return delta
 
     async def create_jtms_instance(
         self, session_id: str, strict_mode: bool = False
@@ -48,6 +83,7 @@ class JTMSService:
             "justifications_count": 0,
             "last_updated": datetime.now().isoformat(),
         }
+        self._notify_mutation(instance_id, "create", strict_mode)
 
         return instance_id
 
@@ -74,8 +110,12 @@ class JTMSService:
         jtms.add_belief(belief_name)
 
         # Définir la valeur initiale si spécifiée
+        changes = None
         if initial_value is not None:
-            jtms.set_belief_validity(belief_name, initial_value)
+            changes = jtms.set_belief_validity(belief_name, initial_value)
+        self._notify_mutation(instance_id, "belief", belief_name, initial_value)
+        if changes is not None:
+            self._notify_changes(instance_id, changes)
 
         # Mettre à jour les métadonnées
         self.metadata[instance_id]["beliefs_count"] = len(jtms.beliefs)
@@ -115,7 +155,10 @@ class JTMSService:
         jtms = self.instances[instance_id]
 
         # Ajouter la justification
-        jtms.add_justification(in_beliefs, out_beliefs, conclusion)
+        changes = jtms.add_justification(in_beliefs, out_beliefs, conclusion)
+        self._notify_mutation(
+            instance_id, "justify", in_beliefs, out_beliefs, conclusion
+        )
 
         # Mettre à jour les métadonnées
         total_justifications = sum(
@@ -130,6 +173,7 @@ class JTMSService:
             "conclusion": conclusion,
             "conclusion_status": jtms.beliefs[conclusion].valid,
             "non_monotonic": jtms.beliefs[conclusion].non_monotonic,
+            "changes": self._notify_changes(instance_id, changes),
         }
 
     async def explain_belief(
@@ -318,7 +362,8 @@ class JTMSService:
         old_value = jtms.beliefs[belief_name].valid
 
         # Définir la nouvelle valeur
-        jtms.set_belief_validity(belief_name, validity)
+        changes = jtms.set_belief_validity(belief_name, validity)
+        self._notify_mutation(instance_id, "validity", belief_name, validity)
 
         # Mettre à jour les métadonnées
         self.metadata[instance_id]["last_updated"] = datetime.now().isoformat()
@@ -328,6 +373,7 @@ class JTMSService:
             "old_value": old_value,
             "new_value": validity,
             "propagation_occurred": True,
+            "changes": self._notify_changes(instance_id, changes),
             "timestamp": datetime.now().isoformat(),
         }
 
@@ -352,6 +398,7 @@ class JTMSService:
 
         # Supprimer la croyance
         jtms.remove_belief(belief_name)
+        self._notify_mutation(instance_id, "remove", belief_name)
 
         # Mettre à jour les métadonnées
         self.metadata[instance_id]["beliefs_count"] = len(jtms.beliefs)
@@ -434,6 +481,7 @@ class JTMSService:
         for belief_name, belief_info in beliefs_data.items():
             if belief_info["valid"] is not None:
                 jtms.set_belief_validity(belief_name, belief_info["valid"])
+        self._notify_mutation(instance_id, "load", jtms.export_state())
 
         return instance_id
 
@@ -467,6 +515,7 @@ class JTMSService:
             bool: True si nettoyé avec succès
         """
         if instance_id in self.instances:
+            self._notify_mutation(instance_id, "drop")
             del self.instances[instance_id]
 
         if instance_id in self.metadata:
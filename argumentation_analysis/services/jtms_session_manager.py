@@ -2,6 +2,11 @@
 Gestionnaire de Sessions JTMS
 Gère le cycle de vie des sessions JTMS avec support de versioning,
 checkpoints, rollback et synchronisation multi-agents.
+
+Les checkpoints sont des positions dans un journal d'opérations (voir
+``jtms_checkpoint_store``) : chaque modification des instances JTMS est
+journalisée, un checkpoint n'écrit que les opérations survenues depuis le
+précédent, et la restauration rejoue le journal depuis un snapshot.
 """
 
 import uuid
@@ -13,6 +18,7 @@ from pathlib import Path
 import pickle
 import os
 
+from .jtms_checkpoint_store import JTMSCheckpointStore
 from .jtms_service import JTMSService
 
 
@@ -29,6 +35,8 @@ class JTMSSessionManager:
         self.jtms_service.session_manager = self  # Injection bidirectionnelle
         self.storage_path = Path(storage_path)
         self.storage_path.mkdir(exist_ok=True)
+        self.store = JTMSCheckpointStore(self.storage_path)
+        self.jtms_service.register_callback("mutation", self._journal_mutation)
 
         # Sessions actives et métadonnées
         self.sessions: Dict[str, Dict] = {}
@@ -178,12 +186,21 @@ class JTMSSessionManager:
 
         checkpoint_id = f"cp_{session_id}_{uuid.uuid4().hex[:8]}"
 
-        # Capturer l'état de toutes les instances JTMS de la session
-        jtms_states = {}
-        for instance_id in self.sessions[session_id]["jtms_instances"]:
-            if instance_id in self.jtms_service.instances:
-                state = await self.jtms_service.get_jtms_state(instance_id)
-                jtms_states[instance_id] = state
+        # Les instances que le journal de la session ne couvre pas encore y
+        # entrent avec leur état complet ; les autres n'ajoutent que leurs
+        # opérations depuis le checkpoint précédent.
+        instance_ids = [
+            instance_id
+            for instance_id in self.sessions[session_id]["jtms_instances"]
+            if instance_id in self.jtms_service.instances
+        ]
+        for instance_id in instance_ids:
+            if not self.store.tracks(session_id, instance_id):
+                self.store.record(
+                    session_id,
+                    instance_id,
+                    ["load", self.jtms_service.instances[instance_id].export_state()],
+                )
 
         checkpoint_data = {
             "checkpoint_id": checkpoint_id,
@@ -193,7 +210,7 @@ class JTMSSessionManager:
             or f"Checkpoint automatique {datetime.now().strftime('%H:%M:%S')}",
             "auto_generated": auto_generated,
             "session_version": self.sessions[session_id]["version"],
-            "jtms_states": jtms_states,
+            "jtms_instances": instance_ids,
             "session_metadata": self.sessions[session_id]["metadata"].copy(),
         }
 
@@ -204,6 +221,7 @@ class JTMSSessionManager:
         self.checkpoints[session_id].append(checkpoint_data)
 
         # Limiter le nombre de checkpoints
+        removed: List[Dict] = []
         if len(self.checkpoints[session_id]) > self.max_checkpoints_per_session:
             # Garder toujours le premier checkpoint (création de session)
             # et supprimer les plus anciens parmi les autres
@@ -215,15 +233,16 @@ class JTMSSessionManager:
             ]
             if len(non_initial_checkpoints) > self.max_checkpoints_per_session - 1:
                 non_initial_checkpoints.sort(key=lambda x: x["created_at"])
-                to_remove = non_initial_checkpoints[
+                removed = non_initial_checkpoints[
                     : (
                         len(non_initial_checkpoints)
                         - self.max_checkpoints_per_session
                         + 1
                     )
                 ]
-                for cp_to_remove in to_remove:
+                for cp_to_remove in removed:
                     self.checkpoints[session_id].remove(cp_to_remove)
+        self.store.forget(session_id, [cp["checkpoint_id"] for cp in removed])
 
         # Mettre à jour la session
         self.sessions[session_id]["checkpoint_count"] = len(
@@ -233,6 +252,8 @@ class JTMSSessionManager:
 
         # Sauvegarder sur disque
         await self._save_checkpoint_to_disk(checkpoint_id, checkpoint_data)
+        if removed:
+            await self.store.compact(session_id, self.checkpoints[session_id])
         await self._save_session_to_disk(session_id)
 
         return checkpoint_id
@@ -264,6 +285,16 @@ class JTMSSessionManager:
         if not target_checkpoint:
             raise ValueError(f"Checkpoint non trouvé: {checkpoint_id}")
 
+        # Reconstruire l'état du checkpoint (snapshot + rejeu du journal)
+        # avant de toucher aux instances actuelles.
+        restored_states = {}
+        if "jtms_states" not in target_checkpoint:
+            restored_states = await self.store.materialize(
+                session_id,
+                target_checkpoint["journal_seq"],
+                target_checkpoint["jtms_instances"],
+            )
+
         # Nettoyer les instances actuelles
         current_instances = self.sessions[session_id]["jtms_instances"].copy()
         for instance_id in current_instances:
@@ -271,13 +302,31 @@ class JTMSSessionManager:
 
         # Restaurer les instances JTMS depuis le checkpoint
         restored_instances = []
-        for old_instance_id, state_data in target_checkpoint["jtms_states"].items():
-            # Créer une nouvelle instance avec l'état restauré
-            state_json = json.dumps(state_data)
-            new_instance_id = await self.jtms_service.import_jtms_state(
-                session_id, state_json
-            )
-            restored_instances.append(new_instance_id)
+        if "jtms_states" in target_checkpoint:
+            # Checkpoint au format historique (état complet par instance)
+            for old_instance_id, state_data in target_checkpoint["jtms_states"].items():
+                # Créer une nouvelle instance avec l'état restauré
+                state_json = json.dumps(state_data)
+                new_instance_id = await self.jtms_service.import_jtms_state(
+                    session_id, state_json
+                )
+                restored_instances.append(new_instance_id)
+        else:
+            for old_instance_id, jtms in restored_states.items():
+                new_instance_id = await self.jtms_service.create_jtms_instance(
+                    session_id, strict_mode=jtms.strict
+                )
+                self.jtms_service.instances[new_instance_id] = jtms
+                self.jtms_service.metadata[new_instance_id].update(
+                    beliefs_count=len(jtms.beliefs),
+                    justifications_count=sum(
+                        len(b.justifications) for b in jtms.beliefs.values()
+                    ),
+                )
+                self.store.record(
+                    session_id, new_instance_id, ["load", jtms.export_state()]
+                )
+                restored_instances.append(new_instance_id)
 
         # Mettre à jour la session
         self.sessions[session_id]["jtms_instances"] = restored_instances
@@ -330,6 +379,7 @@ class JTMSSessionManager:
 
         # Supprimer les fichiers sur disque
         await self._delete_session_from_disk(session_id)
+        await self.store.delete(session_id)
 
         return True
 
@@ -389,28 +439,56 @@ class JTMSSessionManager:
 
     # Méthodes privées pour la persistance
 
+    def _journal_mutation(
+        self, session_id: Optional[str], instance_id: str, operation: List[Any]
+    ):
+        """Callback "mutation" du service : journalise l'opération.
+
+        Elle va au journal de la session propriétaire de l'instance et de
+        toute autre session dont le journal couvre déjà l'instance.
+        """
+        for sid in self.sessions:
+            if sid == session_id or self.store.tracks(sid, instance_id):
+                self.store.record(sid, instance_id, operation)
+
+    def _live_states(self, session_id: str) -> Dict[str, Dict[str, Any]]:
+        """État exporté des instances vivantes de la session (snapshot)."""
+        instance_ids = set(self.sessions[session_id]["jtms_instances"])
+        instance_ids.update(
+            instance_id
+            for instance_id, metadata in self.jtms_service.metadata.items()
+            if metadata.get("session_id") == session_id
+        )
+        return {
+            instance_id: self.jtms_service.instances[instance_id].export_state()
+            for instance_id in instance_ids
+            if instance_id in self.jtms_service.instances
+        }
+
     async def _save_session_to_disk(self, session_id: str):
-        """Sauvegarde une session sur disque."""
+        """Sauvegarde une session sur disque (hors boucle d'événements)."""
         session_file = self.storage_path / f"{session_id}.json"
-        session_data = self.sessions[session_id].copy()
-
-        with open(session_file, "w", encoding="utf-8") as f:
-            json.dump(session_data, f, indent=2, ensure_ascii=False)
+        payload = json.dumps(
+            self.sessions[session_id], ensure_ascii=False, separators=(",", ":")
+        )
+        await self.store.flush(session_id)
+        await asyncio.to_thread(_write_text_atomic, session_file, payload)
 
     async def _save_checkpoint_to_disk(self, checkpoint_id: str, checkpoint_data: Dict):
-        """Sauvegarde un checkpoint sur disque."""
-        checkpoint_file = self.storage_path / f"{checkpoint_id}.cp.json"
-
-        with open(checkpoint_file, "w", encoding="utf-8") as f:
-            json.dump(checkpoint_data, f, indent=2, ensure_ascii=False)
+        """Journalise un checkpoint (et un snapshot complet quand il est dû)."""
+        session_id = checkpoint_data["session_id"]
+        await self.store.checkpoint(
+            session_id, checkpoint_data, lambda: self._live_states(session_id)
+        )
 
     async def _load_session_from_disk(self, session_id: str):
         """Charge une session depuis le disque."""
         session_file = self.storage_path / f"{session_id}.json"
 
         if session_file.exists():
-            with open(session_file, "r", encoding="utf-8") as f:
-                session_data = json.load(f)
+            session_data = json.loads(
+                await asyncio.to_thread(session_file.read_text, encoding="utf-8")
+            )
 
             self.sessions[session_id] = session_data
 
@@ -422,13 +500,18 @@ class JTMSSessionManager:
         if session_id not in self.checkpoints:
             self.checkpoints[session_id] = []
 
-        # Rechercher tous les fichiers de checkpoint pour cette session
-        checkpoint_files = list(self.storage_path.glob(f"cp_{session_id}_*.cp.json"))
+        loaded = await self.store.load_checkpoints(session_id)
 
-        for checkpoint_file in checkpoint_files:
-            with open(checkpoint_file, "r", encoding="utf-8") as f:
-                checkpoint_data = json.load(f)
+        # Checkpoints au format historique (un fichier JSON par checkpoint)
+        def read_legacy() -> List[Dict]:
+            return [
+                json.loads(path.read_text(encoding="utf-8"))
+                for path in self.storage_path.glob(f"cp_{session_id}_*.cp.json")
+            ]
 
+        loaded.extend(await asyncio.to_thread(read_legacy))
+
+        for checkpoint_data in loaded:
             # Ajouter si pas déjà présent
             if not any(
                 cp["checkpoint_id"] == checkpoint_data["checkpoint_id"]
@@ -482,3 +565,7 @@ class JTMSSessionManager:
             await self.delete_session(session_id)
 
         return len(expired_sessions)
+
+
+def _write_text_atomic(path: Path, text: str) -> None:
+    JTMSCheckpointStore._write_atomic(path, text.encode("utf-8"))
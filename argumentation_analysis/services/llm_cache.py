@@ -7,16 +7,21 @@ Supports three modes controlled by LLM_CACHE_MODE env var:
 - off: pass-through, no caching
 
 Cache key: sha256(model_id + messages_json + temperature + tools_json)
-Cache backend: diskcache (mature, cross-platform)
+Cache backend: two tiers (``llm_cache_store.TieredCache``) — an in-process LRU
+in front of a compressed, size-bounded diskcache, namespaced by model and
+shared by both layers of one directory.
 Cache location: .cache/llm_responses/ (gitignored)
 """
 
+import contextvars
 import hashlib
 import json
 import logging
 import os
+import time
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, cast
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, cast
 
 from semantic_kernel.contents.chat_history import ChatHistory
 from semantic_kernel.contents.chat_message_content import ChatMessageContent
@@ -24,6 +29,12 @@ from semantic_kernel.connectors.ai.chat_completion_client_base import (
     ChatCompletionClientBase,
 )
 
+from argumentation_analysis.services.llm_cache_store import (
+    TieredCache,
+    open_tiered_cache,
+    release_tiered_cache,
+)
+
 logger = logging.getLogger("LLMCache")
 
 CACHE_DIR = Path(os.getenv("LLM_CACHE_DIR", ".cache/llm_responses"))
@@ -60,9 +71,13 @@ class CacheStats:
 
     ``live`` is the anti-theatre metric: at replay it MUST stay 0 — any non-zero
     value means a cache miss silently fell through to the API.
+
+    The same outcomes are also broken down per pipeline phase (the phase set
+    by ``llm_cache_phase``), with the memory-tier share of the hits and the
+    time spent in cache lookups and in live calls (``phase_stats``).
     """
 
-    __slots__ = ("_lock", "hit", "miss_record", "miss_replay", "live")
+    __slots__ = ("_lock", "hit", "miss_record", "miss_replay", "live", "_phases")
 
     def __init__(self) -> None:
         self._lock = threading.Lock()
@@ -70,6 +85,7 @@ class CacheStats:
         self.miss_record = 0
         self.miss_replay = 0
         self.live = 0
+        self._phases: Dict[str, Dict[str, float]] = {}
 
     def as_dict(self) -> Dict[str, int]:
         with self._lock:
@@ -86,6 +102,82 @@ class CacheStats:
             self.miss_record = 0
             self.miss_replay = 0
             self.live = 0
+            self._phases.clear()
+
+    def _phase(self) -> Dict[str, float]:
+        name = _cache_phase.get() or _UNSCOPED_PHASE
+        counters = self._phases.get(name)
+        if counters is None:
+            counters = self._phases[name] = dict.fromkeys(_PHASE_COUNTERS, 0)
+        return counters
+
+    def count_lookup(
+        self, outcome: str, seconds: float, tier: Optional[str] = None
+    ) -> None:
+        """Count a lookup: ``outcome`` is "hit", "miss_record" or "miss_replay"."""
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+            phase = self._phase()
+            phase[outcome] += 1
+            phase["lookup_s"] += seconds
+            if tier == "memory":
+                phase["memory_hit"] += 1
+
+    def count_live(self, seconds: float) -> None:
+        """Count one API round-trip that took ``seconds``."""
+        with self._lock:
+            self.live += 1
+            phase = self._phase()
+            phase["live"] += 1
+            phase["live_s"] += seconds
+
+    def phase_stats(self) -> Dict[str, Dict[str, float]]:
+        """Per phase: outcome counts, memory hits and mean latencies (ms)."""
+        with self._lock:
+            out = {}
+            for name, c in self._phases.items():
+                lookups = c["hit"] + c["miss_record"] + c["miss_replay"]
+                out[name] = {
+                    "hit": c["hit"],
+                    "memory_hit": c["memory_hit"],
+                    "miss_record": c["miss_record"],
+                    "miss_replay": c["miss_replay"],
+                    "live": c["live"],
+                    "hit_rate": c["hit"] / lookups if lookups else 0.0,
+                    "lookup_ms_mean": (
+                        1000 * c["lookup_s"] / lookups if lookups else 0.0
+                    ),
+                    "live_ms_mean": (
+                        1000 * c["live_s"] / c["live"] if c["live"] else 0.0
+                    ),
+                }
+            return out
+
+
+_PHASE_COUNTERS = (
+    "hit",
+    "memory_hit",
+    "miss_record",
+    "miss_replay",
+    "live",
+    "lookup_s",
+    "live_s",
+)
+_UNSCOPED_PHASE = "(unscoped)"
+
+_cache_phase: "contextvars.ContextVar[Optional[str]]" = contextvars.ContextVar(
+    "llm_cache_phase", default=None
+)
+
+
+@contextmanager
+def llm_cache_phase(name: str) -> Iterator[None]:
+    """Attribute the cache traffic of the block (and its child tasks) to phase ``name``."""
+    token = _cache_phase.set(name)
+    try:
+        yield
+    finally:
+        _cache_phase.reset(token)
 
 
 _cache_stats = CacheStats()
@@ -96,6 +188,11 @@ def get_cache_stats() -> Dict[str, int]:
     return _cache_stats.as_dict()
 
 
+def get_cache_phase_stats() -> Dict[str, Dict[str, float]]:
+    """Per-phase breakdown of the shared cache counters (see ``CacheStats``)."""
+    return _cache_stats.phase_stats()
+
+
 def reset_cache_stats() -> None:
     """Zero the shared cache counters (test isolation / per-batch measurement)."""
     _cache_stats.reset()
@@ -225,12 +322,71 @@ def _deserialize_response(serialized: list) -> List[ChatMessageContent]:
     return results
 
 
+async def _timed_live_call(call: Callable[[], Awaitable[Any]]) -> Any:
+    """Off-mode / no-cache passthrough, counted as live even when it fails."""
+    start = time.perf_counter()
+    try:
+        return await call()
+    finally:
+        _cache_stats.count_live(time.perf_counter() - start)
+
+
+async def _through_cache(
+    cache: TieredCache,
+    mode: str,
+    key: str,
+    namespace: Optional[str],
+    call: Callable[[], Awaitable[Any]],
+    serialize: Callable[[Any], Any],
+    deserialize: Callable[[Any], Any],
+    label: str,
+) -> Any:
+    """Record/replay logic shared by both layers (``label`` prefixes messages)."""
+    start = time.perf_counter()
+    cached, tier = cache.lookup(key)
+    elapsed = time.perf_counter() - start
+    if tier is not None:
+        _cache_stats.count_lookup("hit", elapsed, tier)
+        logger.debug("%s HIT (%s, %s): %s...", label, mode, tier, key[:16])
+        return deserialize(cached)
+    if mode == REPLAY:
+        _cache_stats.count_lookup("miss_replay", elapsed)
+        raise LLMCacheMiss(
+            f"{label} miss in replay mode for key {key[:16]}... "
+            f"Record fixtures first with LLM_CACHE_MODE=record"
+        )
+    logger.debug("%s MISS (record): %s..., calling API", label, key[:16])
+    _cache_stats.count_lookup("miss_record", elapsed)
+    start = time.perf_counter()
+    response = await call()
+    _cache_stats.count_live(time.perf_counter() - start)
+    # Record is an observer: it must never change the caller's outcome.
+    # A response that cannot be serialized (mock responses in unit tests) is
+    # passed through unrecorded rather than failing the call — proven live by
+    # the #1603 CI record run (PicklingError on MagicMock broke 6 budget-guard
+    # tests and, swallowed upstream, emptied 16 counter/extract assertions).
+    try:
+        cache.set(key, serialize(response), namespace=namespace)
+    except Exception as exc:  # noqa: BLE001 — best-effort recording
+        logger.warning(
+            "%s RECORD: response not storable (key %s..., %s) — "
+            "passed through unrecorded",
+            label,
+            key[:16],
+            type(exc).__name__,
+        )
+    return response
+
+
 class CachedChatCompletion(ChatCompletionClientBase):
-    """Wraps a ChatCompletionClientBase with disk-backed response caching.
+    """Wraps a ChatCompletionClientBase with two-tier response caching.
 
     In 'record' mode, passes calls through to the inner service and caches results.
     In 'replay' mode, reads from cache only — raises LLMCacheMiss on unknown keys.
     In 'off' mode, passes through without caching.
+
+    Instances on the same directory (and the raw path) share one
+    ``TieredCache``; entries are namespaced by the settings' model id.
     """
 
     def __init__(
@@ -242,13 +398,10 @@ class CachedChatCompletion(ChatCompletionClientBase):
         self._inner = inner
         self._mode = mode or get_cache_mode()
         self._cache_dir = cache_dir or CACHE_DIR
-        self._cache = None
+        self._cache: Optional[TieredCache] = None
         if self._mode in (RECORD, REPLAY):
-            self._cache_dir.mkdir(parents=True, exist_ok=True)
             try:
-                import diskcache
-
-                self._cache = diskcache.Cache(str(self._cache_dir))
+                self._cache = open_tiered_cache(self._cache_dir)
             except ImportError:
                 logger.warning("diskcache not installed, caching disabled")
                 self._mode = OFF
@@ -264,64 +417,36 @@ class CachedChatCompletion(ChatCompletionClientBase):
         **kwargs,
     ) -> List[ChatMessageContent]:
         """Intercept LLM calls with caching logic."""
-        if self._mode == OFF or self._cache is None:
-            _cache_stats.live += 1
+
+        async def call() -> List[ChatMessageContent]:
             return await self._inner.get_chat_message_contents(
                 chat_history=chat_history, settings=settings, **kwargs
             )
 
-        key = compute_cache_key(chat_history, settings)
-
-        if self._mode == REPLAY:
-            cached = self._cache.get(key)
-            if cached is None:
-                _cache_stats.miss_replay += 1
-                raise LLMCacheMiss(
-                    f"Cache miss in replay mode for key {key[:16]}... "
-                    f"Record fixtures first with LLM_CACHE_MODE=record"
-                )
-            _cache_stats.hit += 1
-            logger.debug("Cache HIT (replay): %s...", key[:16])
-            return _deserialize_response(cached)
-
-        # RECORD mode: check cache, fall back to API
-        cached = self._cache.get(key)
-        if cached is not None:
-            _cache_stats.hit += 1
-            logger.debug("Cache HIT (record): %s...", key[:16])
-            return _deserialize_response(cached)
-
-        logger.debug("Cache MISS (record): %s..., calling API", key[:16])
-        _cache_stats.miss_record += 1
-        response = await self._inner.get_chat_message_contents(
-            chat_history=chat_history, settings=settings, **kwargs
+        if self._mode == OFF or self._cache is None:
+            return await _timed_live_call(call)
+        namespace = getattr(settings, "ai_model_id", None) or getattr(
+            self._inner, "ai_model_id", None
+        )
+        return await _through_cache(
+            self._cache,
+            self._mode,
+            compute_cache_key(chat_history, settings),
+            namespace if isinstance(namespace, str) else None,
+            call,
+            _serialize_response,
+            _deserialize_response,
+            "Cache",
         )
-        _cache_stats.live += 1
-        # Record is an observer: it must never change the caller's outcome.
-        # A response that cannot be serialized/pickled (mock responses in
-        # unit tests) is passed through unrecorded rather than failing the
-        # call — proven live by the #1603 CI record run (PicklingError on
-        # MagicMock broke 6 budget-guard tests and, swallowed upstream,
-        # emptied 16 counter/extract assertions).
-        try:
-            self._cache.set(key, _serialize_response(response))
-        except Exception as exc:  # noqa: BLE001 — best-effort recording
-            logger.warning(
-                "Cache RECORD: response not storable (key %s..., %s) — "
-                "passed through unrecorded",
-                key[:16],
-                type(exc).__name__,
-            )
-        return response
 
     # Delegate attribute access to inner service
     def __getattr__(self, name):
         return getattr(self._inner, name)
 
     def close(self):
-        """Close the diskcache and release resources."""
+        """Release the shared cache (closed with its last user)."""
         if self._cache is not None:
-            self._cache.close()
+            release_tiered_cache(self._cache)
             self._cache = None
 
 
@@ -389,16 +514,16 @@ def _deserialize_chat_completion(data: Any) -> Any:
     return ChatCompletion.model_validate(data)
 
 
-# Module-level singleton diskcache for the raw path (shared with CACHE_DIR).
-_raw_cache: Any = None
+# Module-level raw-path cache (a user of the shared TieredCache of CACHE_DIR).
+_raw_cache: Optional[TieredCache] = None
 _raw_cache_dir: Optional[str] = None
 
 
-def get_raw_cache(cache_dir: Optional[Path] = None) -> Any:
-    """Return the shared raw-path diskcache, or None when caching is off.
+def get_raw_cache(cache_dir: Optional[Path] = None) -> Optional[TieredCache]:
+    """Return the shared raw-path cache, or None when caching is off.
 
     Lazily initialized so importing the module never opens a cache. Reuses one
-    diskcache across calls within a process; a different ``cache_dir`` re-opens.
+    cache across calls within a process; a different ``cache_dir`` re-opens.
     """
     mode = get_cache_mode()
     if mode == OFF:
@@ -407,24 +532,22 @@ def get_raw_cache(cache_dir: Optional[Path] = None) -> Any:
     target = str(cache_dir or env_cache_dir or CACHE_DIR)
     global _raw_cache, _raw_cache_dir
     if _raw_cache is None or _raw_cache_dir != target:
-        Path(target).mkdir(parents=True, exist_ok=True)
         try:
-            import diskcache
-
-            _raw_cache = diskcache.Cache(target)
-            _raw_cache_dir = target
+            cache = open_tiered_cache(target)
         except ImportError:
             logger.warning("diskcache not installed, raw cache disabled")
             return None
+        reset_raw_cache()
+        _raw_cache, _raw_cache_dir = cache, target
     return _raw_cache
 
 
 def reset_raw_cache() -> None:
-    """Close + drop the module-level raw cache singleton (test isolation)."""
+    """Release + drop the module-level raw cache (test isolation)."""
     global _raw_cache, _raw_cache_dir
     if _raw_cache is not None:
         try:
-            _raw_cache.close()
+            release_tiered_cache(_raw_cache)
         except Exception:  # noqa: BLE001 — best-effort teardown
             pass
     _raw_cache = None
@@ -438,48 +561,25 @@ async def cached_raw_chat_completion(client: Any, **kwargs: Any) -> Any:
     mode a miss raises ``LLMCacheMiss`` (fail-loud — never a silent live call,
     BO-3 #1473 anti-theatre); in record mode a miss calls the API and caches the
     response; in off mode it passes through. The cache key is computed from the
-    deterministic kwargs only (see ``compute_raw_cache_key``).
+    deterministic kwargs only (see ``compute_raw_cache_key``); entries are
+    namespaced by ``model``.
     """
-    mode = get_cache_mode()
-    if mode == OFF:
-        _cache_stats.live += 1
-        return await client.chat.completions.create(**kwargs)
-    cache = get_raw_cache()
-    if cache is None:  # diskcache unavailable
-        _cache_stats.live += 1
+
+    async def call() -> Any:
         return await client.chat.completions.create(**kwargs)
-    key = compute_raw_cache_key(**kwargs)
-    if mode == REPLAY:
-        cached = cache.get(key)
-        if cached is None:
-            _cache_stats.miss_replay += 1
-            raise LLMCacheMiss(
-                f"Raw cache miss in replay mode for key {key[:16]}... "
-                f"Record fixtures first with LLM_CACHE_MODE=record"
-            )
-        _cache_stats.hit += 1
-        logger.debug("Raw cache HIT (replay): %s...", key[:16])
-        return _deserialize_chat_completion(cached)
-    # RECORD mode
-    cached = cache.get(key)
-    if cached is not None:
-        _cache_stats.hit += 1
-        logger.debug("Raw cache HIT (record): %s...", key[:16])
-        return _deserialize_chat_completion(cached)
-    logger.debug("Raw cache MISS (record): %s..., calling API", key[:16])
-    _cache_stats.miss_record += 1
-    response = await client.chat.completions.create(**kwargs)
-    _cache_stats.live += 1
-    # Same observer contract as the SK path: an unstorable response (mock
-    # objects in tests) passes through unrecorded instead of raising from
-    # inside the cache (#1603).
-    try:
-        cache.set(key, _serialize_chat_completion(response))
-    except Exception as exc:  # noqa: BLE001 — best-effort recording
-        logger.warning(
-            "Raw cache RECORD: response not storable (key %s..., %s) — "
-            "passed through unrecorded",
-            key[:16],
-            type(exc).__name__,
-        )
-    return response
+
+    mode = get_cache_mode()
+    cache = get_raw_cache() if mode != OFF else None
+    if cache is None:  # off, or diskcache unavailable
+        return await _timed_live_call(call)
+    model = kwargs.get("model")
+    return await _through_cache(
+        cache,
+        mode,
+        compute_raw_cache_key(**kwargs),
+        model if isinstance(model, str) else None,
+        call,
+        _serialize_chat_completion,
+        _deserialize_chat_completion,
+        "Raw cache",
+    )
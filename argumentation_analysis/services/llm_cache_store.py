@@ -0,0 +1,528 @@
+"""Storage tiers of the LLM response cache (``llm_cache``).
+
+Both cache layers (SK path and raw path) store their JSON-serialisable
+response values through ``TieredCache``:
+
+- memory tier: an in-process LRU of decoded values, bounded by entries and
+  by (uncompressed JSON) bytes, in front of
+- disk tier: a ``diskcache`` directory holding compressed JSON blobs
+  (zstd when ``zstandard`` is installed, zlib otherwise), bounded in size
+  (``LLM_CACHE_SIZE_LIMIT_MB``, diskcache eviction policy
+  ``LLM_CACHE_EVICTION``) and optionally in age (``LLM_CACHE_TTL_DAYS``).
+  Each entry is tagged with its namespace (the model id), so entries can be
+  pruned per model. Imported cassettes and entries recorded before tagging
+  get the model of the stored response when it carries one (raw path).
+
+Cache keys are unchanged (request hashes), so existing cassettes and record
+directories stay valid; entries written before compression (plain lists and
+dicts) are still read, and ``compact_cache_dir`` rewrites them.
+
+The offline maintenance helpers (``compact_cache_dir``, ``prune_cache_dir``,
+``merge_cache_dirs``) back ``scripts/cassettes/maintain.py``. They read entry
+metadata (store time, tag) from diskcache's ``Cache`` table, whose schema is
+part of diskcache's documented on-disk format.
+
+This module has no Semantic Kernel dependency so the offline tooling stays
+light.
+"""
+
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("LLMCache")
+
+try:
+    import zstandard
+except ImportError:  # optional: zlib is always available
+    zstandard = None
+
+# Blob layout: MAGIC + codec byte + compressed UTF-8 JSON.
+_MAGIC = b"LLMC"
+_CODEC_ZLIB = b"z"
+_CODEC_ZSTD = b"s"
+_CODEC_NONE = b"n"
+_CODECS = {"zlib": _CODEC_ZLIB, "zstd": _CODEC_ZSTD, "none": _CODEC_NONE}
+
+# diskcache database file inside a cache directory.
+_DB_FILE = "cache.db"
+
+
+class CacheValueError(ValueError):
+    """A stored cache entry cannot be decoded."""
+
+
+def _env_float(key: str, default: float) -> float:
+    try:
+        return float(os.environ.get(key, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+def default_compression() -> str:
+    """``LLM_CACHE_COMPRESSION``, else zstd when available, else zlib."""
+    name = os.environ.get("LLM_CACHE_COMPRESSION", "").lower()
+    if name in _CODECS and (name != "zstd" or zstandard is not None):
+        return name
+    if name:
+        logger.warning(
+            "LLM_CACHE_COMPRESSION=%r unavailable, using %s",
+            name,
+            "zstd" if zstandard is not None else "zlib",
+        )
+    return "zstd" if zstandard is not None else "zlib"
+
+
+# ──── Codec ────
+
+
+def encode_value(value: Any, compression: Optional[str] = None) -> bytes:
+    """Compressed blob of a JSON-serialisable cache value.
+
+    Raises ``TypeError``/``ValueError`` when ``value`` is not JSON
+    serialisable (e.g. a mock response): such responses are not recorded.
+    """
+    compression = compression or default_compression()
+    raw = json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    if compression == "zstd":
+        if zstandard is None:
+            raise ValueError("zstd compression requires the zstandard package")
+        body = zstandard.ZstdCompressor(level=3).compress(raw)
+    elif compression == "zlib":
+        body = zlib.compress(raw, 6)
+    elif compression == "none":
+        body = raw
+    else:
+        raise ValueError(f"Unknown compression {compression!r}")
+    return _MAGIC + _CODECS[compression] + body
+
+
+def _decode(stored: Any) -> Tuple[Any, int]:
+    """``(value, approximate size in bytes)`` of a stored entry."""
+    if not isinstance(stored, bytes) or not stored.startswith(_MAGIC):
+        # Entry written before compression: the value itself.
+        return stored, len(json.dumps(stored, ensure_ascii=False, default=str))
+    codec, body = stored[len(_MAGIC) : len(_MAGIC) + 1], stored[len(_MAGIC) + 1 :]
+    try:
+        if codec == _CODEC_ZLIB:
+            raw = zlib.decompress(body)
+        elif codec == _CODEC_ZSTD:
+            if zstandard is None:
+                raise CacheValueError(
+                    "Cache entry is zstd-compressed but zstandard is not installed"
+                )
+            raw = zstandard.ZstdDecompressor().decompress(body)
+        elif codec == _CODEC_NONE:
+            raw = body
+        else:
+            raise CacheValueError(f"Unknown cache codec {codec!r}")
+        return json.loads(raw.decode("utf-8")), len(raw)
+    except (zlib.error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise CacheValueError(f"Corrupt cache entry: {exc}") from exc
+
+
+def decode_value(stored: Any) -> Any:
+    """Value of a stored entry (compressed blob or pre-compression value)."""
+    return _decode(stored)[0]
+
+
+def is_encoded(stored: Any) -> bool:
+    return isinstance(stored, bytes) and stored.startswith(_MAGIC)
+
+
+# ──── Memory tier ────
+
+
+class MemoryLRU:
+    """Thread-safe LRU of decoded values, bounded by entries and bytes.
+
+    Values are shared between hits: callers deserialize them into fresh
+    response objects and must not mutate them.
+    """
+
+    def __init__(self, max_entries: int = 4096, max_bytes: int = 256 << 20):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self._entries: "OrderedDict[str, Tuple[Any, int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key: str, value: Any, size: int) -> None:
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= previous[1]
+            self._entries[key] = (value, size)
+            self.bytes += size
+            while len(self._entries) > self.max_entries or self.bytes > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.bytes -= evicted
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self.bytes -= entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+
+# ──── Two-tier cache ────
+
+
+class TieredCache:
+    """Memory LRU in front of a compressed, bounded diskcache directory.
+
+    Args:
+        directory: diskcache directory.
+        memory_entries / memory_bytes: Memory tier bounds (0 entries
+            disables the tier).
+        size_limit: Disk tier bound in bytes.
+        eviction_policy: diskcache eviction policy used past ``size_limit``.
+        ttl: Lifetime of stored entries in seconds (None: no expiry).
+        compression: "zstd", "zlib" or "none" (default: ``default_compression``).
+    """
+
+    def __init__(
+        self,
+        directory: Any,
+        memory_entries: int = 4096,
+        memory_bytes: int = 256 << 20,
+        size_limit: int = 1 << 30,
+        eviction_policy: str = "least-recently-stored",
+        ttl: Optional[float] = None,
+        compression: Optional[str] = None,
+    ):
+        import diskcache
+
+        self.directory = str(directory)
+        Path(self.directory).mkdir(parents=True, exist_ok=True)
+        self.disk = diskcache.Cache(
+            self.directory,
+            size_limit=size_limit,
+            eviction_policy=eviction_policy,
+            tag_index=True,
+        )
+        self.memory = MemoryLRU(memory_entries, memory_bytes)
+        self.ttl = ttl
+        self.compression = compression or default_compression()
+        self._refs = 0
+
+    @classmethod
+    def from_env(cls, directory: Any) -> "TieredCache":
+        """Cache configured from the ``LLM_CACHE_*`` environment variables."""
+        ttl_days = _env_float("LLM_CACHE_TTL_DAYS", 0.0)
+        return cls(
+            directory,
+            memory_entries=int(_env_float("LLM_CACHE_MEMORY_ENTRIES", 4096)),
+            memory_bytes=int(_env_float("LLM_CACHE_MEMORY_MB", 256) * (1 << 20)),
+            size_limit=int(_env_float("LLM_CACHE_SIZE_LIMIT_MB", 1024) * (1 << 20)),
+            eviction_policy=os.environ.get(
+                "LLM_CACHE_EVICTION", "least-recently-stored"
+            ),
+            ttl=ttl_days * 86400 if ttl_days > 0 else None,
+        )
+
+    def __len__(self) -> int:
+        return len(self.disk)
+
+    def lookup(self, key: str) -> Tuple[Any, Optional[str]]:
+        """``(value, tier)`` with tier "memory" or "disk"; ``(None, None)`` on a miss."""
+        value = self.memory.get(key)
+        if value is not None:
+            return value, "memory"
+        stored = self.disk.get(key)
+        if stored is None:
+            return None, None
+        value, size = _decode(stored)
+        self.memory.put(key, value, size)
+        return value, "disk"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        value, tier = self.lookup(key)
+        return default if tier is None else value
+
+    def set(self, key: str, value: Any, namespace: Optional[str] = None) -> None:
+        """Store ``value`` in both tiers, tagged with ``namespace``.
+
+        Raises ``TypeError``/``ValueError`` for non-JSON values (nothing is
+        stored).
+        """
+        blob = encode_value(value, self.compression)
+        self.disk.set(key, blob, expire=self.ttl, tag=namespace)
+        # Re-read through JSON so the memory tier holds what the disk holds.
+        self.memory.put(key, *_decode(blob))
+
+    def delete(self, key: str) -> bool:
+        self.memory.discard(key)
+        return bool(self.disk.delete(key))
+
+    def evict_namespace(self, namespace: str) -> int:
+        """Remove every entry of ``namespace``; returns the count removed."""
+        self.memory.clear()
+        return self.disk.evict(namespace)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        self.disk.clear()
+
+    def close(self) -> None:
+        self.memory.clear()
+        self.disk.close()
+
+
+_open_caches: Dict[str, TieredCache] = {}
+_open_lock = threading.Lock()
+
+
+def open_tiered_cache(directory: Any) -> TieredCache:
+    """Shared ``TieredCache`` of ``directory`` (one per directory per process).
+
+    Every call must be paired with ``release_tiered_cache``; the cache is
+    closed when its last user releases it. Raises ``ImportError`` when
+    diskcache is not installed.
+    """
+    target = str(directory)
+    with _open_lock:
+        cache = _open_caches.get(target)
+        if cache is None:
+            cache = _open_caches[target] = TieredCache.from_env(target)
+        cache._refs += 1
+        return cache
+
+
+def release_tiered_cache(cache: TieredCache) -> None:
+    with _open_lock:
+        cache._refs -= 1
+        if cache._refs > 0:
+            return
+        if _open_caches.get(cache.directory) is cache:
+            del _open_caches[cache.directory]
+    cache.close()
+
+
+# ──── Offline maintenance ────
+
+
+def _entries(directory: Any) -> Iterator[Tuple[str, float, Optional[str]]]:
+    """``(key, store_time, tag)`` of every string-keyed entry."""
+    path = Path(directory) / _DB_FILE
+    if not path.exists():
+        return
+    with sqlite3.connect(f"file:{path}?mode=ro", uri=True) as con:
+        rows = con.execute("SELECT key, store_time, tag FROM Cache").fetchall()
+    for key, store_time, tag in rows:
+        if isinstance(key, str):
+            yield key, store_time, tag
+
+
+def namespace_of(value: Any) -> Optional[str]:
+    """Model id recorded in a stored response, if any.
+
+    Raw-path values (serialised ``ChatCompletion``) carry the model that
+    answered; SK-path values (message lists) carry none.
+    """
+    if isinstance(value, dict) and isinstance(value.get("model"), str):
+        return value["model"]
+    return None
+
+
+def _in_namespaces(tag: Optional[str], namespaces: Iterable[str]) -> bool:
+    """``tag`` is one of ``namespaces`` or a dated snapshot of one of them.
+
+    Responses name the dated snapshot that answered (``gpt-5-mini-2025-08-07``)
+    while live entries are tagged with the requested id (``gpt-5-mini``).
+    """
+    if tag is None:
+        return False
+    return any(
+        tag == name or re.fullmatch(re.escape(name) + r"-\d{4}-\d{2}-\d{2}", tag)
+        for name in namespaces
+    )
+
+
+def _open_disk(directory: Any) -> Any:
+    import diskcache
+
+    return diskcache.Cache(str(directory), tag_index=True)
+
+
+def compact_cache_dir(
+    directory: Any, compression: Optional[str] = None
+) -> Dict[str, int]:
+    """Re-encode, tag, expire, cull and vacuum one cache directory.
+
+    Entries stored before compression (or with another codec) are rewritten
+    with ``compression``, keeping their expiry; untagged entries get the
+    model of their response (``namespace_of``) when it names one. Expired
+    entries are dropped and the size limit is enforced. Returns counts and
+    sizes.
+    """
+    compression = compression or default_compression()
+    codec = _CODECS[compression]
+    db_file = Path(directory) / _DB_FILE
+    before = db_file.stat().st_size if db_file.exists() else 0
+    rewritten = tagged = 0
+    with _open_disk(directory) as disk:
+        expired = disk.expire()
+        for key, _, tag in list(_entries(directory)):
+            stored, expire_time = disk.get(key, expire_time=True)
+            if stored is None:
+                continue
+            current = (
+                is_encoded(stored) and stored[len(_MAGIC) : len(_MAGIC) + 1] == codec
+            )
+            value = None if current and tag is not None else decode_value(stored)
+            new_tag = tag if tag is not None else namespace_of(value)
+            if current and new_tag == tag:
+                continue
+            remaining = (
+                None if expire_time is None else max(0.0, expire_time - time.time())
+            )
+            disk.set(
+                key,
+                stored if current else encode_value(value, compression),
+                expire=remaining,
+                tag=new_tag,
+            )
+            if not current:
+                rewritten += 1
+            if new_tag != tag:
+                tagged += 1
+        culled = disk.cull()
+    with sqlite3.connect(str(db_file)) as con:
+        con.execute("VACUUM")
+    return {
+        "rewritten": rewritten,
+        "tagged": tagged,
+        "expired": expired,
+        "culled": culled,
+        "bytes_before": before,
+        "bytes_after": db_file.stat().st_size,
+    }
+
+
+def prune_cache_dir(
+    directory: Any,
+    max_age_s: Optional[float] = None,
+    namespaces: Optional[Iterable[str]] = None,
+    keep_namespaces: Optional[Iterable[str]] = None,
+    dry_run: bool = False,
+) -> Dict[str, int]:
+    """Remove entries older than ``max_age_s`` and/or by namespace (model).
+
+    ``namespaces`` drops the listed namespaces; ``keep_namespaces`` drops
+    every other one. A namespace also covers its dated snapshots
+    (``gpt-5-mini`` covers ``gpt-5-mini-2025-08-07``). Untagged entries
+    (SK-path responses name no model) are only removed by age. Returns the
+    number of entries examined and removed.
+    """
+    cutoff = None if max_age_s is None else time.time() - max_age_s
+    drop = list(namespaces or ())
+    keep = None if keep_namespaces is None else list(keep_namespaces)
+    doomed: List[str] = []
+    examined = 0
+    for key, store_time, tag in _entries(directory):
+        examined += 1
+        if (
+            (cutoff is not None and store_time < cutoff)
+            or _in_namespaces(tag, drop)
+            or (keep is not None and tag is not None and not _in_namespaces(tag, keep))
+        ):
+            doomed.append(key)
+    if doomed and not dry_run:
+        with _open_disk(directory) as disk:
+            for key in doomed:
+                disk.delete(key)
+    return {"examined": examined, "removed": len(doomed)}
+
+
+def merge_cache_dirs(
+    sources: Iterable[Any],
+    target: Any,
+    prefer: str = "existing",
+    compression: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Merge the entries of several cache directories into ``target``.
+
+    On a key present in several places, ``prefer="existing"`` keeps the first
+    value seen (target first, then sources in order) and ``prefer="newest"``
+    the most recently stored one. Keys whose values differ are reported in
+    ``conflicts``: the same request recorded with different responses makes
+    replay depend on the merge order. Merged entries keep their source record
+    time and remaining expiry, so successive merges compare record times.
+    """
+    if prefer not in ("existing", "newest"):
+        raise ValueError("prefer must be 'existing' or 'newest'")
+    compression = compression or default_compression()
+    report: Dict[str, Any] = {
+        "added": 0,
+        "replaced": 0,
+        "identical": 0,
+        "conflicts": [],
+    }
+    merged: Dict[str, float] = {}
+    with _open_disk(target) as out:
+        stored_at = {key: t for key, t, _ in _entries(target)}
+        for source in sources:
+            with _open_disk(source) as src:
+                for key, store_time, tag in _entries(source):
+                    stored, expire_time = src.get(key, expire_time=True)
+                    if stored is None:
+                        continue
+                    value = decode_value(stored)
+                    current = out.get(key) if key in stored_at else None
+                    if current is not None:
+                        if decode_value(current) == value:
+                            report["identical"] += 1
+                            continue
+                        report["conflicts"].append(key)
+                        if prefer == "existing" or store_time <= stored_at[key]:
+                            continue
+                        report["replaced"] += 1
+                    else:
+                        report["added"] += 1
+                    remaining = (
+                        None
+                        if expire_time is None
+                        else max(0.0, expire_time - time.time())
+                    )
+                    out.set(
+                        key,
+                        encode_value(value, compression),
+                        expire=remaining,
+                        tag=tag if tag is not None else namespace_of(value),
+                    )
+                    stored_at[key] = merged[key] = store_time
+    if merged:
+        # diskcache stamps writes with the current time: restore record times.
+        with sqlite3.connect(str(Path(target) / _DB_FILE)) as con:
+            con.executemany(
+                "UPDATE Cache SET store_time = ? WHERE key = ? AND raw = 1",
+                [(store_time, key) for key, store_time in merged.items()],
+            )
+    return report
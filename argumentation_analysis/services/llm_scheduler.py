@@ -0,0 +1,556 @@
+"""Central scheduler for direct-path LLM calls.
+
+``_guarded_chat_completion`` sends every live chat-completion (cache misses
+and cache-off calls) through the scheduler of the running event loop, so the
+concurrent phases of a run (fact extraction, PL batches, counter-arguments,
+quality, governance) share one view of the provider instead of bursting at
+it independently:
+
+- rate limiting: token buckets for requests and tokens per minute
+  (``LLM_RATE_LIMIT_RPM`` / ``LLM_RATE_LIMIT_TPM``, 0 = unlimited). The token
+  cost of a call is estimated from its prompt plus ``max_tokens`` and
+  reconciled with the reported ``usage`` once the response arrives;
+- adaptive concurrency (AIMD): the in-flight limit grows by one per window of
+  successful calls and is halved on a 429, or on a call slower than
+  ``LLM_LATENCY_TARGET_S``; at most once per window, so the calls already in
+  flight when the limit was cut do not cut it again;
+- shared back-off: a 429 pauses admission for every caller (``Retry-After``
+  when the provider sends one, exponential otherwise, capped at
+  ``max_backoff_s`` either way) and the call is retried through the queue,
+  instead of each phase retrying on its own;
+- priorities: waiting calls are admitted by class, ``PRIORITY_INTERACTIVE``
+  (API requests) before ``PRIORITY_DEFAULT`` before ``PRIORITY_BATCH``
+  (benchmarks), FIFO within a class. The class is taken from
+  ``llm_priority_scope``;
+- single-flight: a call identical to one already in flight (same cache key)
+  waits for that call's response instead of issuing a second request.
+
+Schedulers are per event loop (``get_llm_scheduler``): their futures cannot be
+shared across loops, and a process normally runs one (API server, CLI or
+benchmark run). ``LLM_SCHEDULER=off`` bypasses scheduling entirely.
+"""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import logging
+import math
+import os
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger("LLMScheduler")
+
+PRIORITY_INTERACTIVE = 0
+PRIORITY_DEFAULT = 1
+PRIORITY_BATCH = 2
+
+_PRIORITY_NAMES = {
+    "interactive": PRIORITY_INTERACTIVE,
+    "default": PRIORITY_DEFAULT,
+    "batch": PRIORITY_BATCH,
+}
+
+# Completion size assumed when a call does not set max_tokens.
+_DEFAULT_COMPLETION_TOKENS = 512
+
+_llm_priority: "contextvars.ContextVar[int]" = contextvars.ContextVar(
+    "llm_priority", default=PRIORITY_DEFAULT
+)
+
+
+@contextmanager
+def llm_priority_scope(priority: Any) -> Iterator[int]:
+    """Schedule the LLM calls of the block (and its child tasks) at ``priority``.
+
+    ``priority`` is a ``PRIORITY_*`` constant or its name ("interactive",
+    "default", "batch"). Nested scopes override the enclosing one.
+    """
+    if isinstance(priority, str):
+        if priority not in _PRIORITY_NAMES:
+            raise ValueError(
+                f"Unknown LLM priority {priority!r}; "
+                f"expected one of {sorted(_PRIORITY_NAMES)}"
+            )
+        priority = _PRIORITY_NAMES[priority]
+    token = _llm_priority.set(int(priority))
+    try:
+        yield int(priority)
+    finally:
+        _llm_priority.reset(token)
+
+
+def current_llm_priority() -> int:
+    """Priority class of the calls made from the current context."""
+    return _llm_priority.get()
+
+
+# ──── Provider signals ────
+
+
+def is_rate_limit_error(exc: BaseException) -> bool:
+    """Whether ``exc`` is a provider 429 (OpenAI ``RateLimitError`` or alike)."""
+    if type(exc).__name__ == "RateLimitError":
+        return True
+    status = getattr(exc, "status_code", None)
+    if status is None:
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    return status == 429
+
+
+def retry_after_seconds(exc: BaseException) -> Optional[float]:
+    """Delay requested by the provider's ``Retry-After`` headers, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers is None:
+        return None
+    for name, scale in (("retry-after-ms", 0.001), ("retry-after", 1.0)):
+        try:
+            value = headers.get(name)
+            if value is not None:
+                return max(0.0, float(value) * scale)
+        except (AttributeError, TypeError, ValueError):
+            continue  # HTTP-date form or exotic header container
+    return None
+
+
+def estimate_request_tokens(kwargs: Dict[str, Any]) -> int:
+    """Rough token cost of a ``chat.completions.create`` call (prompt + completion).
+
+    Four characters per prompt token, plus ``max_tokens`` (or
+    ``max_completion_tokens``) for the completion.
+    """
+    chars = 0
+    for message in kwargs.get("messages") or []:
+        content = message.get("content") if isinstance(message, dict) else None
+        if isinstance(content, str):
+            chars += len(content)
+        elif isinstance(content, list):
+            chars += sum(
+                len(part.get("text") or "")
+                for part in content
+                if isinstance(part, dict)
+            )
+    completion = kwargs.get("max_tokens") or kwargs.get("max_completion_tokens")
+    if not isinstance(completion, int) or isinstance(completion, bool):
+        completion = _DEFAULT_COMPLETION_TOKENS
+    return chars // 4 + 1 + completion
+
+
+def _usage_tokens(response: Any) -> Optional[int]:
+    total = getattr(getattr(response, "usage", None), "total_tokens", None)
+    if isinstance(total, int) and not isinstance(total, bool):
+        return total
+    return None
+
+
+# ──── Building blocks ────
+
+
+class TokenBucket:
+    """Budget refilled at ``rate_per_minute`` units, holding at most ``capacity``.
+
+    The capacity defaults to one minute's worth. A take larger than the
+    current level drives it negative, which delays the following takes.
+    """
+
+    def __init__(
+        self,
+        rate_per_minute: float,
+        capacity: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = float(capacity if capacity is not None else rate_per_minute)
+        self.level = self.capacity
+        self._clock = clock
+        self._stamp = clock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self.level = min(self.capacity, self.level + (now - self._stamp) * self.rate)
+        self._stamp = now
+
+    def delay(self, amount: float) -> float:
+        """Seconds until ``amount`` can be taken (0 when it can be now).
+
+        Amounts above the capacity only wait for a full bucket.
+        """
+        self._refill()
+        missing = min(amount, self.capacity) - self.level
+        return missing / self.rate if missing > 0 else 0.0
+
+    def take(self, amount: float) -> None:
+        self._refill()
+        self.level -= amount
+
+    def credit(self, amount: float) -> None:
+        """Give back ``amount`` units (negative to charge more)."""
+        self._refill()
+        self.level = min(self.capacity, self.level + amount)
+
+
+class AdaptiveConcurrency:
+    """AIMD limit on the number of calls in flight."""
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int = 1,
+        maximum: int = 64,
+        decrease_factor: float = 0.5,
+    ):
+        if not 1 <= minimum <= maximum:
+            raise ValueError("Expected 1 <= minimum <= maximum")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease_factor = decrease_factor
+        self.value = float(min(max(initial, minimum), maximum))
+        self._last_decrease = -math.inf
+
+    @property
+    def limit(self) -> int:
+        return max(self.minimum, int(self.value))
+
+    def on_success(self) -> None:
+        """Additive increase: +1 once ``limit`` calls have succeeded."""
+        self.value = min(float(self.maximum), self.value + 1.0 / self.limit)
+
+    def on_congestion(self, started_at: float, now: float) -> bool:
+        """Multiplicative decrease, unless the call started before the last one.
+
+        Returns whether the limit was decreased.
+        """
+        if started_at < self._last_decrease:
+            return False
+        self.value = max(float(self.minimum), self.value * self.decrease_factor)
+        self._last_decrease = now
+        return True
+
+
+class SchedulerStats:
+    """Counters of one scheduler.
+
+    - ``submitted``: calls handed to the scheduler
+    - ``coalesced``: calls answered by an identical call already in flight
+    - ``admitted``: provider round-trips started (retries included)
+    - ``completed``: round-trips that returned a response
+    - ``rate_limited``: round-trips rejected with a 429
+    - ``retries``: 429s retried through the queue
+    - ``decreases``: times the concurrency limit was cut
+    """
+
+    __slots__ = (
+        "submitted",
+        "coalesced",
+        "admitted",
+        "completed",
+        "rate_limited",
+        "retries",
+        "decreases",
+    )
+
+    def __init__(self) -> None:
+        for name in self.__slots__:
+            setattr(self, name, 0)
+
+    def as_dict(self) -> Dict[str, int]:
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class _LeaderCancelled(Exception):
+    """The call a follower was waiting on was cancelled: issue it again."""
+
+
+# ──── Scheduler ────
+
+
+class LLMScheduler:
+    """Admission control for provider calls; see the module docstring.
+
+    Args:
+        requests_per_minute: Request rate limit (0 = unlimited).
+        tokens_per_minute: Token rate limit (0 = unlimited).
+        max_concurrency: Upper bound of the adaptive in-flight limit.
+        initial_concurrency: Starting in-flight limit (default: the maximum).
+        min_concurrency: Lower bound of the adaptive in-flight limit.
+        latency_target_s: Calls slower than this count as congestion
+            (0 = latency is ignored).
+        max_rate_limit_retries: 429s retried per call before the error is
+            raised to the caller.
+        backoff_s: First back-off after a 429 without ``Retry-After``;
+            doubles with each retry of the same call.
+        max_backoff_s: Longest pause after a 429, ``Retry-After`` included:
+            a single response cannot stall every caller for longer.
+        request_burst / token_burst: Bucket capacities (default: one
+            minute's worth).
+        single_flight: Coalesce identical in-flight calls.
+    """
+
+    def __init__(
+        self,
+        requests_per_minute: float = 0,
+        tokens_per_minute: float = 0,
+        max_concurrency: int = 16,
+        initial_concurrency: Optional[int] = None,
+        min_concurrency: int = 1,
+        latency_target_s: float = 0.0,
+        max_rate_limit_retries: int = 3,
+        backoff_s: float = 1.0,
+        max_backoff_s: float = 60.0,
+        request_burst: Optional[float] = None,
+        token_burst: Optional[float] = None,
+        single_flight: bool = True,
+    ):
+        self.requests = (
+            TokenBucket(requests_per_minute, request_burst)
+            if requests_per_minute > 0
+            else None
+        )
+        self.tokens = (
+            TokenBucket(tokens_per_minute, token_burst)
+            if tokens_per_minute > 0
+            else None
+        )
+        self.concurrency = AdaptiveConcurrency(
+            initial_concurrency or max_concurrency,
+            minimum=min_concurrency,
+            maximum=max_concurrency,
+        )
+        self.latency_target_s = latency_target_s
+        self.max_rate_limit_retries = max_rate_limit_retries
+        self.backoff_s = backoff_s
+        self.max_backoff_s = max_backoff_s
+        self.single_flight = single_flight
+        self.stats = SchedulerStats()
+        self.in_flight = 0
+        self.paused_until = -math.inf
+        # (priority, sequence, tokens, admission future)
+        self._waiters: List[Tuple[int, int, float, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._leaders: Dict[str, asyncio.Future] = {}
+
+    @classmethod
+    def from_env(cls) -> "LLMScheduler":
+        """Scheduler configured from the ``LLM_*`` environment variables."""
+        return cls(
+            requests_per_minute=_env_float("LLM_RATE_LIMIT_RPM", 0.0),
+            tokens_per_minute=_env_float("LLM_RATE_LIMIT_TPM", 0.0),
+            max_concurrency=max(1, int(_env_float("LLM_MAX_CONCURRENCY", 16))),
+            latency_target_s=_env_float("LLM_LATENCY_TARGET_S", 0.0),
+            max_rate_limit_retries=max(0, int(_env_float("LLM_RATE_LIMIT_RETRIES", 3))),
+        )
+
+    def status(self) -> Dict[str, Any]:
+        """Counters plus the current limit, in-flight and queued calls."""
+        return {
+            **self.stats.as_dict(),
+            "limit": self.concurrency.limit,
+            "in_flight": self.in_flight,
+            "queued": sum(1 for *_, fut in self._waiters if not fut.done()),
+        }
+
+    async def submit(
+        self,
+        call: Callable[[], Awaitable[Any]],
+        *,
+        key: Optional[str] = None,
+        priority: Optional[int] = None,
+        tokens: float = 0,
+    ) -> Any:
+        """Run ``call()`` once admitted and return its result.
+
+        Args:
+            call: Zero-argument coroutine function issuing one provider call;
+                called again when a 429 is retried.
+            key: Identity of the call for single-flight coalescing (None:
+                never coalesced).
+            priority: ``PRIORITY_*`` class (default: ``current_llm_priority``).
+            tokens: Estimated token cost, for the token bucket.
+        """
+        self.stats.submitted += 1
+        if priority is None:
+            priority = _llm_priority.get()
+        if key is None or not self.single_flight:
+            return await self._run(call, priority, tokens)
+        while key in self._leaders:
+            self.stats.coalesced += 1
+            try:
+                return await asyncio.shield(self._leaders[key])
+            except _LeaderCancelled:
+                self.stats.coalesced -= 1
+        return await self._lead(key, call, priority, tokens)
+
+    async def _lead(
+        self, key: str, call: Callable[[], Awaitable[Any]], priority: int, tokens: float
+    ) -> Any:
+        leader = asyncio.get_running_loop().create_future()
+        self._leaders[key] = leader
+        try:
+            result = await self._run(call, priority, tokens)
+        except asyncio.CancelledError:
+            leader.set_exception(_LeaderCancelled())
+            raise
+        except BaseException as exc:
+            leader.set_exception(exc)
+            raise
+        else:
+            leader.set_result(result)
+            return result
+        finally:
+            if self._leaders.get(key) is leader:
+                del self._leaders[key]
+            if leader.done() and not leader.cancelled():
+                leader.exception()  # followers are optional: mark it retrieved
+
+    async def _run(
+        self, call: Callable[[], Awaitable[Any]], priority: int, tokens: float
+    ) -> Any:
+        attempt = 0
+        while True:
+            await self._acquire(priority, tokens)
+            started = time.monotonic()
+            try:
+                result = await call()
+            except Exception as exc:
+                rate_limited = is_rate_limit_error(exc)
+                if rate_limited:
+                    self._on_rate_limited(exc, started, attempt)
+                self._release()
+                if not rate_limited or attempt >= self.max_rate_limit_retries:
+                    raise
+                attempt += 1
+                self.stats.retries += 1
+                continue
+            except BaseException:
+                self._release()
+                raise
+            self._on_success(started, tokens, result)
+            self._release()
+            return result
+
+    # ── Admission ──
+
+    async def _acquire(self, priority: int, tokens: float) -> None:
+        admitted = asyncio.get_running_loop().create_future()
+        heapq.heappush(
+            self._waiters, (priority, next(self._sequence), tokens, admitted)
+        )
+        self._dispatch()
+        try:
+            await admitted
+        except asyncio.CancelledError:
+            if admitted.done() and not admitted.cancelled():
+                self._release()  # admitted just before the cancellation
+            raise
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        self._dispatch()
+
+    def _admission_delay(self, tokens: float) -> float:
+        delay = self.paused_until - time.monotonic()
+        if self.requests is not None:
+            delay = max(delay, self.requests.delay(1))
+        if self.tokens is not None and tokens:
+            delay = max(delay, self.tokens.delay(tokens))
+        return delay
+
+    def _dispatch(self) -> None:
+        """Admit waiters in priority order while the limits allow it."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        while self._waiters:
+            _, _, tokens, admitted = self._waiters[0]
+            if admitted.done():  # cancelled while queued
+                heapq.heappop(self._waiters)
+                continue
+            if self.in_flight >= self.concurrency.limit:
+                return  # the next release dispatches again
+            delay = self._admission_delay(tokens)
+            if delay > 0:
+                self._timer = admitted.get_loop().call_later(delay, self._dispatch)
+                return
+            heapq.heappop(self._waiters)
+            if self.requests is not None:
+                self.requests.take(1)
+            if self.tokens is not None and tokens:
+                self.tokens.take(tokens)
+            self.in_flight += 1
+            self.stats.admitted += 1
+            admitted.set_result(None)
+
+    # ── Feedback ──
+
+    def _on_success(self, started: float, tokens: float, result: Any) -> None:
+        self.stats.completed += 1
+        now = time.monotonic()
+        if self.latency_target_s > 0 and now - started > self.latency_target_s:
+            if self.concurrency.on_congestion(started, now):
+                self.stats.decreases += 1
+        else:
+            self.concurrency.on_success()
+        actual = _usage_tokens(result)
+        if actual is not None and self.tokens is not None and tokens:
+            self.tokens.credit(tokens - actual)
+
+    def _on_rate_limited(
+        self, exc: BaseException, started: float, attempt: int
+    ) -> None:
+        self.stats.rate_limited += 1
+        now = time.monotonic()
+        if self.concurrency.on_congestion(started, now):
+            self.stats.decreases += 1
+        delay = retry_after_seconds(exc)
+        if delay is None:
+            delay = self.backoff_s * 2**attempt
+        delay = min(self.max_backoff_s, delay)
+        self.paused_until = max(self.paused_until, now + delay)
+        logger.warning(
+            "LLM provider rate limit (429): pausing admission %.1fs, "
+            "concurrency limit now %d",
+            delay,
+            self.concurrency.limit,
+        )
+
+
+def _env_float(key: str, default: float) -> float:
+    try:
+        return float(os.environ.get(key, str(default)))
+    except (TypeError, ValueError):
+        return default
+
+
+# One scheduler per running event loop.
+_schedulers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LLMScheduler]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_llm_scheduler() -> Optional[LLMScheduler]:
+    """Scheduler of the running event loop, or None when ``LLM_SCHEDULER=off``.
+
+    Created from the environment on first use in each loop.
+    """
+    if os.environ.get("LLM_SCHEDULER", "on").lower() == "off":
+        return None
+    loop = asyncio.get_running_loop()
+    scheduler = _schedulers.get(loop)
+    if scheduler is None:
+        scheduler = _schedulers[loop] = LLMScheduler.from_env()
+    return scheduler
+
+
+def set_llm_scheduler(scheduler: Optional[LLMScheduler]) -> None:
+    """Install ``scheduler`` for the running event loop (None: back to default)."""
+    loop = asyncio.get_running_loop()
+    if scheduler is None:
+        _schedulers.pop(loop, None)
+    else:
+        _schedulers[loop] = scheduler
@@ -4,30 +4,100 @@ Provides:
 - AnalysisWebSocketManager: manages per-session WebSocket connections
 - Broadcast helpers for phase results, debate turns, vote updates, JTMS changes
 - Connection lifecycle (connect, disconnect, cleanup)
+- Per-connection outbound queues with backpressure and fan-out metrics
+
+A broadcast is JSON-encoded once and handed to every connection's bounded
+outbound queue; each queue is drained by its own writer task, so clients are
+written concurrently and a slow one only delays itself. Queued ``status``
+messages are superseded by newer ones (a late viewer does not need every
+intermediate progress update), and a client whose queue overflows with
+non-coalescible messages is evicted.
 """
 
 import asyncio
+import contextlib
 import json
 import logging
 import time
-from typing import Any, Dict, List, Optional, Set
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set
 
 from starlette.websockets import WebSocket, WebSocketState
 
 logger = logging.getLogger(__name__)
 
+# Message types where only the latest queued instance matters.
+COALESCED_TYPES = frozenset({"status"})
+
+# Close code sent to evicted slow consumers ("Try Again Later").
+SLOW_CONSUMER_CLOSE_CODE = 1013
+
+
+@dataclass
+class _Outbound:
+    """One encoded message waiting in a connection's queue."""
+
+    text: str
+    kind: Optional[str]
+    enqueued_at: float
+    delivered: asyncio.Future
+
+
+@dataclass
+class _Outbox:
+    """Outbound queue and writer task of a single connection."""
+
+    websocket: Any
+    queue: Deque[_Outbound] = field(default_factory=deque)
+    writer: Optional[asyncio.Task] = None
+
+    @property
+    def backlogged(self) -> bool:
+        """True while a previous message is still queued or being sent."""
+        return bool(self.queue) or (self.writer is not None and not self.writer.done())
+
+    def release(self) -> None:
+        """Resolve every pending delivery (dropped, superseded or evicted)."""
+        while self.queue:
+            entry = self.queue.popleft()
+            if not entry.delivered.done():
+                entry.delivered.set_result(False)
+
 
 class AnalysisWebSocketManager:
     """Manages WebSocket connections grouped by session ID.
 
     Each session can have multiple connected clients (e.g., multiple browser tabs).
-    Messages are JSON-serialized and broadcast to all clients in a session.
+    Messages are JSON-serialized once and fanned out to all clients in a session.
+
+    Args:
+        max_queue: Outbound messages a connection may have pending before
+            it is treated as a slow consumer.
+        flush_timeout: How long a broadcast waits for delivery to clients
+            that were idle when it started. Clients already backlogged are
+            never waited on.
     """
 
-    def __init__(self):
+    def __init__(self, max_queue: int = 256, flush_timeout: float = 1.0):
         # session_id -> set of WebSocket connections
         self._connections: Dict[str, Set[WebSocket]] = {}
         self._lock = asyncio.Lock()
+        self.max_queue = max(1, max_queue)
+        self.flush_timeout = flush_timeout
+        self._outboxes: Dict[Any, _Outbox] = {}
+        self._metrics: Dict[str, float] = {
+            "broadcasts": 0,
+            "messages_sent": 0,
+            "messages_coalesced": 0,
+            "send_errors": 0,
+            "evicted": 0,
+            "max_queue_depth": 0,
+            "send_seconds_total": 0.0,
+            "send_seconds_max": 0.0,
+            "queue_seconds_total": 0.0,
+            "queue_seconds_max": 0.0,
+        }
 
     async def connect(self, session_id: str, websocket: WebSocket):
         """Accept a WebSocket connection and register it under a session."""
@@ -48,28 +118,168 @@ class AnalysisWebSocketManager:
                 conns.discard(websocket)
                 if not conns:
                     del self._connections[session_id]
+        self._close_outbox(websocket)
         logger.info(f"WS disconnected: session={session_id}")
 
     async def _send_to_session(self, session_id: str, message: Dict[str, Any]):
-        """Send a JSON message to all connections in a session."""
+        """Encode ``message`` once and queue it for every connection in a session."""
         conns = self._connections.get(session_id, set()).copy()
-        dead = []
+        if not conns:
+            return
+        self._metrics["broadcasts"] += 1
+        text = json.dumps(
+            message, ensure_ascii=False, separators=(",", ":"), default=str
+        )
+        kind = message.get("type")
+        loop = asyncio.get_running_loop()
+        dead, evicted, waits = [], [], []
         for ws in conns:
+            if ws.client_state != WebSocketState.CONNECTED:
+                dead.append(ws)
+                continue
+            outbox = self._outbox(ws, loop)
+            backlogged = outbox.backlogged
+            entry = self._enqueue(outbox, text, kind, loop)
+            if entry is None:
+                evicted.append(ws)
+                continue
+            if outbox.writer is None or outbox.writer.done():
+                outbox.writer = loop.create_task(self._drain(session_id, outbox))
+            if not backlogged:
+                waits.append(entry.delivered)
+        if dead or evicted:
+            await self._remove(session_id, dead + evicted)
+        for ws in evicted:
+            await self._evict(session_id, ws)
+        if waits and self.flush_timeout > 0:
+            await asyncio.wait(waits, timeout=self.flush_timeout)
+
+    # ── Outbound queues ──
+
+    def _outbox(self, websocket: Any, loop: asyncio.AbstractEventLoop) -> _Outbox:
+        outbox = self._outboxes.get(websocket)
+        if outbox is None or (
+            outbox.writer is not None and outbox.writer.get_loop() is not loop
+        ):
+            outbox = self._outboxes[websocket] = _Outbox(websocket)
+        return outbox
+
+    def _enqueue(
+        self,
+        outbox: _Outbox,
+        text: str,
+        kind: Optional[str],
+        loop: asyncio.AbstractEventLoop,
+    ) -> Optional[_Outbound]:
+        """Queue ``text``; ``None`` when the connection must be evicted."""
+        queue = outbox.queue
+        if kind in COALESCED_TYPES:
+            stale = [entry for entry in queue if entry.kind == kind]
+            for entry in stale:
+                queue.remove(entry)
+                entry.delivered.set_result(False)
+            self._metrics["messages_coalesced"] += len(stale)
+        if len(queue) >= self.max_queue:
+            oldest = next((e for e in queue if e.kind in COALESCED_TYPES), None)
+            if oldest is None:
+                return None
+            queue.remove(oldest)
+            oldest.delivered.set_result(False)
+            self._metrics["messages_coalesced"] += 1
+        entry = _Outbound(text, kind, time.monotonic(), loop.create_future())
+        queue.append(entry)
+        if len(queue) > self._metrics["max_queue_depth"]:
+            self._metrics["max_queue_depth"] = len(queue)
+        return entry
+
+    async def _drain(self, session_id: str, outbox: _Outbox) -> None:
+        """Writer task: send queued messages of one connection in order."""
+        ws = outbox.websocket
+        while outbox.queue:
+            entry = outbox.queue.popleft()
+            started = time.monotonic()
             try:
-                if ws.client_state == WebSocketState.CONNECTED:
-                    await ws.send_json(message)
-                else:
-                    dead.append(ws)
+                await ws.send_text(entry.text)
             except Exception as e:
                 logger.warning(f"WS send error: {e}")
-                dead.append(ws)
-        # Cleanup dead connections
-        if dead:
-            async with self._lock:
-                s = self._connections.get(session_id)
-                if s:
-                    for ws in dead:
-                        s.discard(ws)
+                self._metrics["send_errors"] += 1
+                entry.delivered.set_result(False)
+                outbox.release()
+                await self._remove(session_id, [ws])
+                return
+            finished = time.monotonic()
+            self._record(finished - started, finished - entry.enqueued_at)
+            if not entry.delivered.done():
+                entry.delivered.set_result(True)
+
+    def _record(self, send_seconds: float, queue_seconds: float) -> None:
+        metrics = self._metrics
+        metrics["messages_sent"] += 1
+        metrics["send_seconds_total"] += send_seconds
+        metrics["send_seconds_max"] = max(metrics["send_seconds_max"], send_seconds)
+        metrics["queue_seconds_total"] += queue_seconds
+        metrics["queue_seconds_max"] = max(metrics["queue_seconds_max"], queue_seconds)
+
+    def _close_outbox(self, websocket: Any) -> None:
+        outbox = self._outboxes.pop(websocket, None)
+        if outbox is None:
+            return
+        outbox.release()
+        if outbox.writer is not None and outbox.writer is not asyncio.current_task():
+            outbox.writer.cancel()
+
+    async def _remove(self, session_id: str, websockets: Iterable[Any]) -> None:
+        """Unregister dead or evicted connections."""
+        websockets = list(websockets)
+        async with self._lock:
+            s = self._connections.get(session_id)
+            if s:
+                for ws in websockets:
+                    s.discard(ws)
+        for ws in websockets:
+            self._close_outbox(ws)
+
+    async def _evict(self, session_id: str, websocket: Any) -> None:
+        self._metrics["evicted"] += 1
+        logger.warning(
+            f"WS slow consumer evicted: session={session_id}, "
+            f"queue limit={self.max_queue}"
+        )
+        with contextlib.suppress(Exception):
+            await asyncio.wait_for(
+                websocket.close(code=SLOW_CONSUMER_CLOSE_CODE),
+                timeout=self.flush_timeout or None,
+            )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """Fan-out counters, current queue depths and send latencies (ms)."""
+        m = self._metrics
+        sent = m["messages_sent"]
+        depths = [len(outbox.queue) for outbox in self._outboxes.values()]
+        return {
+            "sessions": len(self._connections),
+            "connections": sum(len(c) for c in self._connections.values()),
+            "broadcasts": m["broadcasts"],
+            "messages_sent": sent,
+            "messages_coalesced": m["messages_coalesced"],
+            "send_errors": m["send_errors"],
+            "evicted": m["evicted"],
+            "queue_depth": sum(depths),
+            "queue_depth_max_connection": max(depths, default=0),
+            "max_queue_depth": m["max_queue_depth"],
+            "send_latency_ms": {
+                "mean": (
+                    round(1000 * m["send_seconds_total"] / sent, 3) if sent else 0.0
+                ),
+                "max": round(1000 * m["send_seconds_max"], 3),
+            },
+            "queue_latency_ms": {
+                "mean": (
+                    round(1000 * m["queue_seconds_total"] / sent, 3) if sent else 0.0
+                ),
+                "max": round(1000 * m["queue_seconds_max"], 3),
+            },
+        }
 
     def get_session_count(self, session_id: str) -> int:
         """Return the number of active connections for a session."""
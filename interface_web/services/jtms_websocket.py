@@ -31,6 +31,7 @@ class MessageType(Enum):
     BELIEF_ADDED = "belief_added"
     BELIEF_UPDATED = "belief_updated"
     BELIEF_REMOVED = "belief_removed"
+    BELIEFS_CHANGED = "beliefs_changed"
     JUSTIFICATION_ADDED = "justification_added"
     JUSTIFICATION_UPDATED = "justification_updated"
     NETWORK_UPDATED = "network_updated"
@@ -209,6 +210,16 @@ class JTMSWebSocketManager:
             },
         )
 
+    def broadcast_belief_changes(
+        self, session_id: str, instance_id: str, changes: Dict[str, List[str]]
+    ):
+        """Diffuse le delta d'une propagation (croyances basculées)."""
+        self.broadcast_to_session(
+            session_id,
+            MessageType.BELIEFS_CHANGED,
+            {"instance_id": instance_id, "changes": changes, "action": "delta"},
+        )
+
     def broadcast_justification_added(
         self, session_id: str, justification_data: Dict[str, Any]
     ):
@@ -405,14 +416,11 @@ def setup_websocket_callbacks(jtms_service=None):
     if not jtms_service:
         return
 
-    # Exemples de callbacks (à adapter selon l'API réelle du JTMS)
-    def on_belief_change(
-        belief_name: str, old_status: str, new_status: str, session_id: str
+    def on_beliefs_changed(
+        session_id: str, instance_id: str, changes: Dict[str, List[str]]
     ):
-        """Callback appelé lors du changement d'une croyance."""
-        websocket_manager.broadcast_belief_updated(
-            session_id, belief_name, old_status, new_status
-        )
+        """Callback appelé après chaque propagation : diffuse le delta."""
+        websocket_manager.broadcast_belief_changes(session_id, instance_id, changes)
 
     def on_network_change(session_id: str, network_data: Dict[str, Any]):
         """Callback appelé lors du changement du réseau."""
@@ -420,7 +428,7 @@ def setup_websocket_callbacks(jtms_service=None):
 
     # Enregistrer les callbacks si l'API le permet
     if hasattr(jtms_service, "register_callback"):
-        jtms_service.register_callback("belief_changed", on_belief_change)
+        jtms_service.register_callback("beliefs_changed", on_beliefs_changed)
         jtms_service.register_callback("network_changed", on_network_change)
         logger.info("Callbacks WebSocket enregistrés avec le service JTMS")
 
@@ -32,6 +32,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 import diskcache
 
+from argumentation_analysis.services.llm_cache_store import decode_value
+
 
 def analyze(db_dir: Path) -> Dict[str, Any]:
     """Return the spend summary for a record-mode diskcache DB."""
@@ -43,7 +45,7 @@ def analyze(db_dir: Path) -> Dict[str, Any]:
         prompt_tokens = 0
         completion_tokens = 0
         for key in db.iterkeys():
-            value = db[key]
+            value = decode_value(db[key])
             if isinstance(value, list):
                 sk_path += 1
             elif isinstance(value, dict):
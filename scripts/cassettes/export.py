@@ -11,7 +11,8 @@ Source DB layout (produced by `llm_cache.CachedChatCompletion` at runtime):
 Each entry has:
 - key: hex sha256 string (32 chars)
 - value: JSON list-of-dicts (SK-path: `_serialize_response`)
-       OR JSON dict (raw-path: `_serialize_chat_completion`)
+       OR JSON dict (raw-path: `_serialize_chat_completion`),
+       stored compressed (``llm_cache_store.encode_value``) by current runs
 
 The fixtures layout is:
 
@@ -39,6 +40,7 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 import diskcache  # type: ignore[import-not-found]
 
+from argumentation_analysis.services.llm_cache_store import decode_value
 from scripts.cassettes.privacy import assert_safe, audit_value
 
 
@@ -113,7 +115,7 @@ def main(argv: list[str] | None = None) -> int:
         unsafe_keys: list[str] = []
         degraded_keys: list[str] = []
         for key in db.iterkeys():
-            value = db[key]
+            value = decode_value(db[key])
             status = export_one(
                 db, key, value, args.fixtures_dir, allow_unsafe=args.allow_unsafe
             )
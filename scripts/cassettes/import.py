@@ -13,6 +13,11 @@ Each fixture file `<sha256>.json` holds ``{"key": sha256, "value": ...}``
 `_serialize_chat_completion`. Round-tripped through the matching
 `_deserialize_*` at replay.
 
+Values are written as-is (uncompressed); the cache reads them like its
+own compressed entries, and ``maintain.py compact`` re-encodes them. Each
+entry is tagged with the model its response names (raw path), so
+``maintain.py prune --drop-model/--keep-model`` covers imported cassettes.
+
 This is the inverse of ``export.py``. No privacy audit is run on import
 because the audit ran at export time and any new cassette written to the
 fixtures dir would have failed it. Re-running the export after an import
@@ -30,6 +35,8 @@ sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 
 import diskcache  # type: ignore[import-not-found]
 
+from argumentation_analysis.services.llm_cache_store import namespace_of
+
 
 def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
@@ -79,7 +86,7 @@ def main(argv: list[str] | None = None) -> int:
             if key in existing:
                 skipped += 1
                 continue
-            db.set(key, value)
+            db.set(key, value, tag=namespace_of(value))
             written += 1
     finally:
         db.close()
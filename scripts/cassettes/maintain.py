@@ -0,0 +1,105 @@
+"""Offline maintenance of runtime LLM cache directories.
+
+Usage::
+
+    python scripts/cassettes/maintain.py compact <db_dir> [--compression zlib]
+    python scripts/cassettes/maintain.py prune <db_dir> [--max-age-days N]
+        [--drop-model M ...] [--keep-model M ...] [--dry-run]
+    python scripts/cassettes/maintain.py merge <target_dir> <source_dir> ...
+        [--prefer existing|newest]
+
+- ``compact`` re-encodes uncompressed entries (imported cassettes, caches
+  recorded before compression) with the current codec, tags untagged
+  entries with the model their response names, drops expired entries,
+  enforces the size limit and vacuums the SQLite file.
+- ``prune`` removes entries older than ``--max-age-days`` and/or by model
+  namespace (a model also covers its dated snapshots). Entries naming no
+  model (SK-path responses) are only pruned by age.
+- ``merge`` folds the caches of several record runs into one. Keys recorded
+  with different responses are listed as conflicts and make the command exit
+  with code 2: replay would depend on the merge order.
+
+Prints a JSON report. The work is done by ``llm_cache_store``
+(``compact_cache_dir``, ``prune_cache_dir``, ``merge_cache_dirs``).
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+# Allow `python scripts/cassettes/maintain.py` invocation from the repo root.
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+from argumentation_analysis.services.llm_cache_store import (  # noqa: E402
+    compact_cache_dir,
+    merge_cache_dirs,
+    prune_cache_dir,
+)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    p = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    sub = p.add_subparsers(dest="command", required=True)
+
+    compact = sub.add_parser("compact", help="Re-encode, expire, cull and vacuum")
+    compact.add_argument("db_dir", type=Path)
+    compact.add_argument("--compression", choices=("zstd", "zlib", "none"))
+
+    prune = sub.add_parser("prune", help="Remove entries by age and/or model")
+    prune.add_argument("db_dir", type=Path)
+    prune.add_argument("--max-age-days", type=float)
+    prune.add_argument("--drop-model", action="append", default=[])
+    prune.add_argument("--keep-model", action="append")
+    prune.add_argument("--dry-run", action="store_true")
+
+    merge = sub.add_parser("merge", help="Merge several cache directories")
+    merge.add_argument("target_dir", type=Path)
+    merge.add_argument("source_dirs", type=Path, nargs="+")
+    merge.add_argument("--prefer", choices=("existing", "newest"), default="existing")
+    return p.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+
+    if args.command == "merge":
+        missing = [str(d) for d in args.source_dirs if not d.exists()]
+        if missing:
+            print(f"Source dir(s) do not exist: {missing}", file=sys.stderr)
+            return 1
+        report = merge_cache_dirs(args.source_dirs, args.target_dir, prefer=args.prefer)
+        print(json.dumps({**report, "conflicts": len(report["conflicts"])}, indent=2))
+        if report["conflicts"]:
+            print(
+                f"Conflicting keys (first 16 chars): "
+                f"{[key[:16] for key in report['conflicts']]}",
+                file=sys.stderr,
+            )
+            return 2
+        return 0
+
+    if not args.db_dir.exists():
+        print(f"DB dir does not exist: {args.db_dir}", file=sys.stderr)
+        return 1
+    if args.command == "compact":
+        report = compact_cache_dir(args.db_dir, compression=args.compression)
+    else:
+        if args.max_age_days is None and not args.drop_model and not args.keep_model:
+            print("Nothing to prune: give --max-age-days or a model", file=sys.stderr)
+            return 1
+        report = prune_cache_dir(
+            args.db_dir,
+            max_age_s=None if args.max_age_days is None else args.max_age_days * 86400,
+            namespaces=args.drop_model,
+            keep_namespaces=args.keep_model,
+            dry_run=args.dry_run,
+        )
+    print(json.dumps(report, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -17,7 +17,7 @@ domain-public chess-club budget proposition, so the broadcast ``winner`` and
 ``governance_decided_firsthand`` are the genuine LLM-decided verdict.
 
 Note on the WS transport: a ``_FakeSocket`` registered in the real manager's
-connection set is the capture point. ``_send_to_session`` calls ``ws.send_json``
+connection set is the capture point. The manager's writer calls ``ws.send_text``
 on it identically to a live socket (the cable is manager-side), and the genuine
 proof is that the *real* pipeline verdict reaches it. The HTTP POST -> WS
 concurrent flow is unreachable under FastAPI TestClient (BackgroundTasks run
@@ -25,6 +25,7 @@ synchronously), so ``run_deliberation_workflow`` is awaited directly with a
 pre-registered socket.
 """
 
+import json
 import pytest
 from starlette.websockets import WebSocketState
 
@@ -49,8 +50,8 @@ class _FakeSocket:
         self.client_state = WebSocketState.CONNECTED
         self.received: list[dict] = []
 
-    async def send_json(self, message):
-        self.received.append(message)
+    async def send_text(self, data):
+        self.received.append(json.loads(data))
 
 
 @pytest.mark.requires_api
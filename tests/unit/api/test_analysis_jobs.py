@@ -0,0 +1,218 @@
+# -*- coding: utf-8 -*-
+"""Tests for the analysis job subsystem behind /api/analyze.
+
+Validates:
+- identical in-flight texts are deduplicated onto one job
+- admission control raises QueueSaturatedError (429) past capacity
+- awaiting a job does not block the event loop
+- state changes are streamed through the WebSocket notifier
+- HTTP surface: submit (202), poll, 404, 429 envelope, /analyze contract
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+import api.analysis_jobs as analysis_jobs
+from api.analysis_jobs import (
+    JOB_FAILED,
+    JOB_SUCCEEDED,
+    AnalysisJobManager,
+)
+from api.errors import QueueSaturatedError, install_error_handlers
+
+
+def _blocking_fn(release, calls):
+    def fn(text):
+        calls.append(text)
+        release.wait(5)
+        return {"text": text}
+
+    return fn
+
+
+def _wait_done(job, timeout=5.0):
+    assert job.future.result(timeout) is job
+    return job
+
+
+class TestAnalysisJobManager:
+    def test_identical_texts_share_one_job(self):
+        release, calls = threading.Event(), []
+        manager = AnalysisJobManager(max_workers=2)
+        fn = _blocking_fn(release, calls)
+        first = manager.submit("même texte", fn)
+        second = manager.submit("même texte", fn)
+        other = manager.submit("autre texte", fn)
+        release.set()
+
+        assert second is first and other is not first
+        assert _wait_done(first).result == {"text": "même texte"}
+        _wait_done(other)
+        assert sorted(calls) == ["autre texte", "même texte"]
+        assert first.submissions == 2
+        assert manager.stats()["deduplicated"] == 1
+        # Once finished, the same text starts a fresh job.
+        assert manager.submit("même texte", fn) is not first
+        manager.shutdown(wait=True)
+
+    def test_admission_control_rejects_past_capacity(self):
+        release, calls = threading.Event(), []
+        manager = AnalysisJobManager(max_workers=1, max_pending=1)
+        fn = _blocking_fn(release, calls)
+        jobs = [manager.submit(f"texte {i}", fn) for i in range(2)]
+        with pytest.raises(QueueSaturatedError) as err:
+            manager.submit("texte 2", fn)
+        assert err.value.status_code == 429
+        assert err.value.context == {"in_flight": 2, "capacity": 2}
+        # Deduplicated submissions are still admitted when saturated.
+        assert manager.submit("texte 0", fn) is jobs[0]
+
+        release.set()
+        for job in jobs:
+            _wait_done(job)
+        assert manager.submit("texte 2", fn).job_id
+        assert manager.stats()["rejected"] == 1
+        manager.shutdown(wait=True)
+
+    def test_failures_are_recorded_on_the_job(self):
+        def broken(text):
+            raise TimeoutError("too slow")
+
+        manager = AnalysisJobManager()
+        job = manager.submit("x", broken)
+        with pytest.raises(TimeoutError):
+            job.future.result(5)
+        assert job.status == JOB_FAILED
+        assert isinstance(job.error, TimeoutError)
+        assert job.to_dict()["duration"] >= 0
+        manager.shutdown(wait=True)
+
+    def test_finished_jobs_expire(self):
+        manager = AnalysisJobManager(retention=0.0)
+        job = _wait_done(manager.submit("a", lambda t: {}))
+        job.finished_at -= 1
+        manager.submit("b", lambda t: {})
+        assert manager.get(job.job_id) is None
+        manager.shutdown(wait=True)
+
+    async def test_waiting_does_not_block_the_event_loop(self):
+        release, calls = threading.Event(), []
+        manager = AnalysisJobManager()
+        job = manager.submit("lent", _blocking_fn(release, calls))
+
+        ticks = 0
+        waiter = asyncio.ensure_future(job.wait())
+        while ticks < 5:
+            await asyncio.sleep(0.01)
+            ticks += 1
+        assert not waiter.done()
+        release.set()
+        assert (await waiter).status == JOB_SUCCEEDED
+        manager.shutdown(wait=True)
+
+    async def test_state_changes_are_streamed(self):
+        events = []
+
+        class Notifier:
+            async def broadcast_status(self, session_id, status, detail=""):
+                events.append((session_id, "status", status))
+
+            async def broadcast_phase_result(self, session_id, phase, result):
+                events.append((session_id, "phase_result", result))
+
+            async def broadcast_error(self, session_id, error):
+                events.append((session_id, "error", error))
+
+        manager = AnalysisJobManager(notifier=Notifier())
+        job = await manager.submit("x", lambda t: {"ok": True}).wait()
+        for _ in range(20):
+            if len(events) == 4:
+                break
+            await asyncio.sleep(0.01)
+        assert events == [
+            (job.job_id, "status", "queued"),
+            (job.job_id, "status", "running"),
+            (job.job_id, "phase_result", {"ok": True}),
+            (job.job_id, "status", "succeeded"),
+        ]
+        manager.shutdown(wait=True)
+
+
+@pytest.fixture
+def manager(monkeypatch):
+    manager = AnalysisJobManager(max_workers=1, max_pending=0)
+    monkeypatch.setattr(analysis_jobs, "_manager", manager)
+    yield manager
+    manager.shutdown(wait=True)
+
+
+@pytest.fixture
+def client(manager):
+    from api.endpoints import router
+
+    app = FastAPI()
+    install_error_handlers(app)
+    app.include_router(router, prefix="/api")
+    ctx = Mock()
+    ctx.jvm_initialized = True
+    kb = Mock()
+    kb.getArguments.return_value = ["p1", "c1"]
+    ctx.tweety_classes = {"AspicParser": Mock()}
+    ctx.tweety_classes["AspicParser"].parseBeliefBase.return_value = kb
+    app.state.project_context = ctx
+    return TestClient(app)
+
+
+class TestAnalysisJobRoutes:
+    def test_submit_then_poll(self, client):
+        response = client.post("/api/analyze/jobs", json={"text": "A donc B"})
+        assert response.status_code == 202
+        job_id = response.json()["job_id"]
+        assert response.json()["stream_url"] == f"/ws/analysis/{job_id}"
+
+        for _ in range(100):
+            data = client.get(f"/api/analyze/jobs/{job_id}").json()
+            if data["status"] == JOB_SUCCEEDED:
+                break
+            time.sleep(0.01)
+        assert data["results"]["argument_structure"] == {
+            "premises": ["p1"],
+            "conclusion": "c1",
+        }
+
+    def test_unknown_job_is_404(self, client):
+        response = client.get("/api/analyze/jobs/nope")
+        assert response.status_code == 404
+        assert response.json()["error_code"] == "not_found"
+
+    def test_saturated_pool_returns_429(self, client, manager):
+        release = threading.Event()
+        manager.submit("occupe", lambda t: release.wait(5) and {})
+        try:
+            response = client.post("/api/analyze/jobs", json={"text": "autre"})
+        finally:
+            release.set()
+        assert response.status_code == 429
+        assert response.json()["error_code"] == "queue_saturated"
+
+    def test_analyze_keeps_its_synchronous_contract(self, client, manager):
+        data = client.post("/api/analyze", json={"text": "A donc B"}).json()
+        assert data["status"] == "success"
+        assert data["results"]["metadata"]["duration"] >= 0
+        assert manager.get(data["analysis_id"]).status == JOB_SUCCEEDED
+
+    def test_analyze_failure_keeps_error_envelope(self, client):
+        client.app.state.project_context.jvm_initialized = False
+        response = client.post("/api/analyze", json={"text": "A donc B"})
+        assert response.status_code == 502
+        body = response.json()
+        assert body["error_code"] == "upstream_error"
+        assert body["context"]["exception_type"] == "ValueError"
+        poll = client.get(f"/api/analyze/jobs/{body['context']['analysis_id']}")
+        assert poll.json()["error"]["error_code"] == "upstream_error"
@@ -16,10 +16,11 @@ real verdict broadcast) lives in
 ``tests/integration/api/test_websocket_deliberation_genuine.py`` (requires_api+slow).
 
 A ``FakeSocket`` registered in the real manager's connection set stands in for a
-connected client: ``_send_to_session`` calls ``ws.send_json`` on it exactly as on
-a live socket, so capturing on it proves the manager actually broadcast.
+connected client: the manager's writer calls ``ws.send_text`` (the broadcast
+encoded once) on it exactly as on a live socket, so capturing on it proves the manager actually broadcast.
 """
 
+import json
 import pytest
 from unittest.mock import AsyncMock, patch
 
@@ -40,8 +41,8 @@ class _FakeSocket:
         self.client_state = WebSocketState.CONNECTED
         self.received: list[dict] = []
 
-    async def send_json(self, message):
-        self.received.append(message)
+    async def send_text(self, data):
+        self.received.append(json.loads(data))
 
 
 def _sanitized_result_shape() -> dict:
@@ -0,0 +1,223 @@
+"""Tests for batched inference of the transformer fallacy tiers.
+
+Validates:
+- MicroBatcher coalesces concurrent requests and propagates errors
+- length_buckets groups similar lengths
+- NLIFallacyDetector.detect_batch: one classification pass per stage
+- FrenchFallacyAdapter.detect_batch routes NLI through a single batch call
+- NLIBatchScorer matches per-pair scoring (when torch is installed)
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from argumentation_analysis.adapters.batch_inference import (
+    MicroBatcher,
+    length_buckets,
+)
+from argumentation_analysis.adapters.french_fallacy_adapter import (
+    FallacyDetection,
+    FrenchFallacyAdapter,
+    NLIFallacyDetector,
+)
+
+
+class TestMicroBatcher:
+    def test_concurrent_requests_share_batches(self):
+        calls = []
+
+        def batch_fn(items):
+            calls.append(list(items))
+            return [item * 2 for item in items]
+
+        batcher = MicroBatcher(batch_fn, max_batch_size=8, max_wait=0.05)
+        results = {}
+
+        def worker(i):
+            results[i] = batcher.submit(i)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        batcher.close()
+
+        assert results == {i: i * 2 for i in range(8)}
+        assert len(calls) < 8
+        assert sum(len(c) for c in calls) == 8
+
+    def test_submit_many_respects_max_batch_size(self):
+        sizes = []
+        batcher = MicroBatcher(
+            lambda items: sizes.append(len(items)) or items, max_batch_size=3
+        )
+        assert batcher.submit_many(list(range(7))) == list(range(7))
+        assert max(sizes) <= 3 and sum(sizes) == 7
+
+    def test_errors_reach_every_caller(self):
+        def broken(items):
+            raise ValueError("model crashed")
+
+        batcher = MicroBatcher(broken)
+        with pytest.raises(ValueError):
+            batcher.submit_many(["a", "b"])
+        # The worker survives a failed batch.
+        batcher._batch_fn = lambda items: items
+        assert batcher.submit("c") == "c"
+
+    def test_length_buckets(self):
+        buckets = length_buckets([5, 1, 4, 2, 3], batch_size=2)
+        assert buckets == [[1, 3], [4, 2], [0]]
+
+
+def _fake_classifier(calls):
+    def classify(text, candidate_labels, **kw):
+        calls.append((text, tuple(candidate_labels), kw["multi_label"]))
+        scores = [0.9 if "pente" in text else 0.1] + [0.05] * (
+            len(candidate_labels) - 1
+        )
+        return {"labels": list(candidate_labels), "scores": scores}
+
+    return classify
+
+
+class TestNLIDetectBatch:
+    def test_flat_batch_matches_single_detect(self):
+        calls = []
+        det = NLIFallacyDetector(threshold=0.5)
+        det._available = True
+        det._classifier = _fake_classifier(calls)
+
+        texts = ["une pente glissante", "rien", "encore une pente"]
+        batch = det.detect_batch(texts)
+        singles = [det.detect(t) for t in texts]
+        assert [[d.fallacy_type for d in r] for r in batch] == [
+            [d.fallacy_type for d in r] for r in singles
+        ]
+        assert [len(r) for r in batch] == [1, 0, 1]
+
+    def test_hierarchical_batch_runs_stage1_before_stage2(self):
+        calls = []
+        det = NLIFallacyDetector(threshold=0.5)
+        det._available = True
+        det._classifier = _fake_classifier(calls)
+
+        texts = ["une pente glissante", "rien", "encore une pente"]
+        batch = det.detect_batch(texts, hierarchical=True)
+        assert len(batch) == 3 and batch[1] == []
+        assert all(d.source == "nli_hierarchical" for d in batch[0])
+        # All stage-1 family requests precede the stage-2 drill-downs.
+        stage1 = [c for c in calls if c[2] is True]
+        assert calls[: len(stage1)] == stage1 and len(stage1) == 3
+
+    def test_unavailable_returns_empty_lists(self):
+        det = NLIFallacyDetector()
+        det._available = False
+        assert det.detect_batch(["a", "b"]) == [[], []]
+
+
+class TestAdapterDetectBatch:
+    def test_nli_tier_classifies_all_texts_at_once(self):
+        adapter = FrenchFallacyAdapter(
+            enable_symbolic=False,
+            enable_nli=True,
+            enable_llm=False,
+            enable_self_hosted_llm=False,
+        )
+        mock_nli = MagicMock()
+        mock_nli.is_available.return_value = True
+        mock_nli.detect_batch.return_value = [
+            [FallacyDetection("Pente glissante", 0.8, "nli")],
+            [],
+        ]
+        adapter._nli = mock_nli
+
+        results = adapter.detect_batch(["arg 1", "arg 2"])
+        mock_nli.detect_batch.assert_called_once_with(
+            ["arg 1", "arg 2"], hierarchical=False
+        )
+        mock_nli.detect.assert_not_called()
+        assert results[0]["tiers_used"] == ["nli"]
+        assert results[1]["tiers_used"] == ["none"]
+        assert "nli" in results[1]["tier_latencies_ms"]
+
+
+try:
+    import torch
+
+    TORCH_AVAILABLE = True
+except ImportError:
+    TORCH_AVAILABLE = False
+
+
+class _WordTokenizer:
+    """Minimal tokenizer exposing the methods NLIBatchScorer relies on."""
+
+    model_input_names = ["input_ids", "attention_mask"]
+    model_max_length = 64
+    pad_token_id = 0
+
+    def __init__(self):
+        self.vocab = {}
+
+    def __call__(self, text, add_special_tokens=False):
+        ids = [self.vocab.setdefault(w, len(self.vocab) + 3) for w in text.split()]
+        return {"input_ids": ids}
+
+    def num_special_tokens_to_add(self, pair=False):
+        return 3
+
+    def build_inputs_with_special_tokens(self, first, second):
+        return [1] + first + [2] + second + [2]
+
+
+class _BagOfWordsNLI(torch.nn.Module if TORCH_AVAILABLE else object):
+    def __init__(self):
+        super().__init__()
+        torch.manual_seed(0)
+        self.embedding = torch.nn.EmbeddingBag(200, 3, mode="sum")
+        self.config = MagicMock(
+            label2id={"contradiction": 0, "neutral": 1, "entailment": 2}
+        )
+
+    def forward(self, input_ids, attention_mask):
+        logits = self.embedding(input_ids, per_sample_weights=attention_mask.float())
+        return MagicMock(logits=logits)
+
+
+@pytest.mark.skipif(not TORCH_AVAILABLE, reason="torch not installed")
+class TestNLIBatchScorer:
+    def test_matches_unbatched_scoring(self):
+        from argumentation_analysis.adapters.batch_inference import NLIBatchScorer
+
+        tokenizer, model = _WordTokenizer(), _BagOfWordsNLI()
+        scorer = NLIBatchScorer(model, tokenizer, "type {}", batch_size=2)
+        labels = ["pente glissante", "homme de paille", "ad hominem"]
+        texts = ["un texte court", "un texte nettement plus long que l'autre"]
+        requests = [(t, labels, multi) for t in texts for multi in (True, False)]
+
+        batched = scorer.classify(requests)
+        passes = scorer.forward_passes
+        for (text, _, multi), result in zip(requests, batched):
+            premise = tokenizer(text)["input_ids"]
+            logits = []
+            for label in labels:
+                ids = tokenizer.build_inputs_with_special_tokens(
+                    premise, tokenizer(f"type {label}")["input_ids"]
+                )
+                out = model(torch.tensor([ids]), torch.ones(1, len(ids))).logits[0]
+                logits.append(out[[0, 2]])
+            logits = torch.stack(logits)
+            if multi:
+                expected = torch.softmax(logits, dim=-1)[:, 1]
+            else:
+                expected = torch.softmax(logits[:, 1], dim=0)
+            got = dict(zip(result["labels"], result["scores"]))
+            for label, score in zip(labels, expected.tolist()):
+                assert got[label] == pytest.approx(score, abs=1e-5)
+            assert result["scores"] == sorted(result["scores"], reverse=True)
+        # 12 pairs in batches of 2, hypotheses encoded once each.
+        assert passes == 6 and len(scorer._hypotheses) == 3
@@ -9,6 +9,7 @@ Tests validate:
 - Ensemble merging logic
 - FallacyAnalysisResult data class
 - Adapter detect() returns correct structure
+- Concurrent detect_async(): timeouts, latency budget, early exit
 - CapabilityRegistry registration
 - Graceful degradation when no tiers available
 """
@@ -413,6 +414,119 @@ class TestFrenchFallacyAdapter:
         assert "aucun" in result["explanation"].lower()
 
 
+def _slow_adapter(**kwargs):
+    """Adapter with symbolic + NLI + remote LLM tiers replaced by fakes."""
+    import asyncio
+    import time
+
+    from argumentation_analysis.adapters.french_fallacy_adapter import (
+        FallacyDetection,
+        FrenchFallacyAdapter,
+    )
+
+    adapter = FrenchFallacyAdapter(
+        enable_symbolic=True,
+        enable_self_hosted_llm=False,
+        enable_nli=True,
+        enable_llm=True,
+        **kwargs,
+    )
+
+    def symbolic_detect(text):
+        time.sleep(0.05)
+        return [FallacyDetection("Ad Hominem", 1.0, "symbolic", "tu es nul")]
+
+    def nli_detect(text, hierarchical=False):
+        time.sleep(0.05)
+        return [FallacyDetection("Ad Hominem", 0.9, "nli")]
+
+    async def llm_detect_async(text):
+        await asyncio.sleep(5)
+        return [FallacyDetection("Pente glissante", 0.9, "llm")]
+
+    adapter._symbolic._available = True
+    adapter._symbolic.detect = symbolic_detect
+    adapter._symbolic.mine_arguments = MagicMock(
+        return_value={"claims": ["x"], "premises": []}
+    )
+    adapter._nli._available = True
+    adapter._nli.detect = nli_detect
+    adapter._llm._available = True
+    adapter._llm.detect_async = llm_detect_async
+    return adapter
+
+
+class TestDetectAsync:
+    """Concurrent cascade: timeouts, latency budget and early exit."""
+
+    async def test_matches_sequential_detect(self):
+        adapter = _slow_adapter()
+        adapter._llm._available = False
+        sequential = adapter.detect("tu es nul")
+        concurrent = await adapter.detect_async("tu es nul")
+        for key in ("detected_fallacies", "tiers_used", "arguments", "tier_status"):
+            assert concurrent[key] == sequential[key]
+        assert set(concurrent["tier_latencies_ms"]) == {"symbolic", "nli"}
+
+    async def test_tiers_run_concurrently(self):
+        import time
+
+        adapter = _slow_adapter()
+        adapter._llm._available = False
+        adapter._nli.detect = lambda text, hierarchical=False: time.sleep(0.3) or []
+        adapter._symbolic.detect = lambda text: time.sleep(0.3) or []
+        started = time.perf_counter()
+        await adapter.detect_async("texte")
+        assert time.perf_counter() - started < 0.55
+
+    async def test_per_tier_timeout_is_reported(self):
+        adapter = _slow_adapter(tier_timeouts={"llm": 0.1})
+        result = await adapter.detect_async("tu es nul")
+        assert result["tier_status"] == {
+            "symbolic": "ok",
+            "nli": "ok",
+            "llm": "timeout",
+        }
+        assert "llm" not in result["tier_latencies_ms"]
+        assert "Pente glissante" not in result["detected_fallacies"]
+
+    async def test_latency_budget_cancels_slow_tiers(self):
+        import time
+
+        adapter = _slow_adapter()
+        started = time.perf_counter()
+        result = await adapter.detect_async("tu es nul", latency_budget=0.3)
+        assert time.perf_counter() - started < 1.0
+        assert result["tier_status"]["llm"] == "timeout"
+        assert result["tiers_used"] == ["symbolic", "nli"]
+
+    async def test_early_exit_when_tiers_agree(self):
+        import time
+
+        adapter = _slow_adapter(min_agreeing_tiers=2)
+        started = time.perf_counter()
+        result = await adapter.detect_async("tu es nul")
+        assert time.perf_counter() - started < 1.0
+        assert result["tier_status"]["llm"] == "skipped"
+        fallacy = result["detected_fallacies"]["Ad Hominem"]
+        assert fallacy["source"] == "symbolic+nli"
+
+    async def test_low_confidence_does_not_short_circuit(self):
+        adapter = _slow_adapter(
+            min_agreeing_tiers=2, agreement_confidence=0.95, latency_budget=0.3
+        )
+        result = await adapter.detect_async("tu es nul")
+        assert result["tier_status"]["llm"] == "timeout"
+
+    async def test_failing_tier_does_not_sink_the_cascade(self):
+        adapter = _slow_adapter()
+        adapter._llm._available = False
+        adapter._nli.detect = MagicMock(side_effect=RuntimeError("model crashed"))
+        result = await adapter.detect_async("tu es nul")
+        assert result["tier_status"]["nli"] == "error"
+        assert result["tiers_used"] == ["symbolic"]
+
+
 class TestCapabilityRegistration:
     """Test CapabilityRegistry integration."""
 
@@ -519,9 +633,50 @@ class TestG4RestoredSubRules:
             )
 
 
+class TestSymbolicSingleParse:
+    """Compiled matchers, one parse per text, nlp.pipe batching."""
+
+    TEXTS = [
+        "Pierre est malhonnête, donc son argument est faux.",
+        "C'est la tradition, il ne faut rien changer. Je pense que c'est vrai.",
+        "",
+    ]
+
+    @pytest.fixture
+    def det(self):
+        from argumentation_analysis.adapters.french_fallacy_adapter import (
+            SymbolicFallacyDetector,
+        )
+
+        det = SymbolicFallacyDetector()
+        if not det.is_available():
+            pytest.skip("spaCy French model unavailable")
+        return det
+
+    def test_ner_is_not_loaded(self, det):
+        assert "ner" not in det._nlp.pipe_names
+
+    def test_mining_and_detection_share_one_parse(self, det):
+        calls = []
+        nlp = det._nlp
+        det._nlp = MagicMock(side_effect=lambda t: calls.append(t) or nlp(t))
+        det._nlp.vocab = nlp.vocab
+        det.mine_arguments(self.TEXTS[0])
+        det.detect(self.TEXTS[0])
+        assert calls == [self.TEXTS[0]]
+
+    def test_analyze_batch_matches_per_text(self, det):
+        batch = det.analyze_batch(self.TEXTS, batch_size=2)
+        for text, (arguments, detections) in zip(self.TEXTS, batch):
+            assert arguments == det.mine_arguments(text)
+            assert [d.fallacy_type for d in detections] == [
+                d.fallacy_type for d in det.detect(text)
+            ]
+
+
 class TestG5FrenchExplanationTemplates:
     """G5 (#1186): 4 per-family FR explanation templates restored from student
-    2.3.2-detection-sophismes/fallacy_pipeline.py:279-288, collapsed to generic
+    2.3.2-detection-sophismes/fallacy_pipeline.py:401-410, collapsed to generic
     at #35. ``justify_fallacy`` is fail-loud (#1019): unknown → None."""
 
     def test_four_templates_present(self):
@@ -149,3 +149,137 @@ class TestGetAll:
     def test_empty_gets(self, kb):
         assert kb.get_all_propositions() == []
         assert kb.get_all_arguments() == []
+
+
+class TestIndexes:
+    def test_dependent_arguments(self, kb, props):
+        arg1 = FormalArgument(premises=[props["rain"]], conclusion=props["wet"])
+        arg2 = FormalArgument(
+            premises=[props["rain"], props["cold"]], conclusion=props["wet"]
+        )
+        kb.add_argument(arg1)
+        kb.add_argument(arg2)
+        assert kb.find_dependent_arguments(props["rain"]) == [arg1, arg2]
+        assert kb.find_dependent_arguments(props["cold"]) == [arg2]
+        assert kb.find_dependent_arguments(props["wet"]) == []
+
+    def test_replacing_an_argument_reindexes_it(self, kb, props):
+        arg = FormalArgument(premises=[props["rain"]], conclusion=props["wet"], id="a")
+        kb.add_argument(arg)
+        moved = FormalArgument(
+            premises=[props["cold"]], conclusion=props["not_rain"], id="a"
+        )
+        kb.add_argument(moved)
+        assert kb.find_supporting_arguments(props["wet"]) == []
+        assert kb.find_attacking_arguments(props["rain"]) == [moved]
+        assert kb.find_dependent_arguments(props["rain"]) == []
+
+    def test_re_adding_an_argument_keeps_its_position(self, kb, props):
+        first = FormalArgument(
+            premises=[props["rain"]], conclusion=props["wet"], id="a"
+        )
+        second = FormalArgument(
+            premises=[props["cold"]], conclusion=props["wet"], id="b"
+        )
+        kb.add_argument(first)
+        kb.add_argument(second)
+        stronger = FormalArgument(
+            premises=[props["rain"]], conclusion=props["wet"], strength=2.0, id="a"
+        )
+        kb.add_argument(stronger)
+        assert kb.find_supporting_arguments(props["wet"]) == [stronger, second]
+        # Moved into an existing bucket: placed as in ``arguments``.
+        moved = FormalArgument(
+            premises=[props["cold"]], conclusion=props["wet"], id="a"
+        )
+        kb.add_argument(moved)
+        assert kb.find_dependent_arguments(props["cold"]) == [moved, second]
+        assert kb.find_dependent_arguments(props["rain"]) == []
+
+    def test_queries_match_a_full_scan(self, kb):
+        atoms = [Proposition(content=f"p{i}") for i in range(5)]
+        literals = atoms + [Proposition(content=f"¬{a.content}") for a in atoms]
+        for i in range(60):
+            kb.add_argument(
+                FormalArgument(
+                    premises=[literals[(i * 3) % 10]],
+                    conclusion=literals[(i * 7) % 10],
+                )
+            )
+        for p in literals:
+            assert kb.find_supporting_arguments(p) == [
+                a for a in kb.arguments.values() if a.conclusion.content == p.content
+            ]
+            assert kb.find_attacking_arguments(p) == [
+                a
+                for a in kb.arguments.values()
+                if a.conclusion.content == f"¬{p.content}"
+            ]
+
+    def test_contradictions(self, kb, props):
+        kb.add_proposition(props["not_rain"])
+        assert kb.is_consistent()
+        kb.add_proposition(props["rain"])
+        assert not kb.is_consistent()
+        assert kb.get_contradictions() == [(props["rain"], props["not_rain"])]
+
+    def test_double_negation_is_a_contradiction(self, kb):
+        kb.add_proposition(Proposition(content="¬A"))
+        kb.add_proposition(Proposition(content="¬¬A"))
+        assert not kb.is_consistent()
+
+
+class TestSnapshots:
+    def test_lookahead_restores_everything(self, kb, props):
+        base = FormalArgument(premises=[props["rain"]], conclusion=props["wet"])
+        kb.add_argument(base)
+        with kb.lookahead():
+            kb.add_argument(
+                FormalArgument(premises=[props["cold"]], conclusion=props["not_rain"])
+            )
+            kb.add_proposition(Proposition(content="It is raining", truth_value=False))
+            assert not kb.is_consistent()
+        assert kb.is_consistent()
+        assert list(kb.propositions) == ["It is raining", "The ground is wet"]
+        assert kb.propositions["It is raining"].truth_value is None
+        assert kb.get_all_arguments() == [base]
+        assert kb.find_attacking_arguments(props["rain"]) == []
+        assert kb.find_dependent_arguments(props["cold"]) == []
+
+    def test_rollback_restores_replaced_argument(self, kb, props):
+        arg = FormalArgument(premises=[props["rain"]], conclusion=props["wet"], id="a")
+        kb.add_argument(arg)
+        token = kb.snapshot()
+        kb.add_argument(FormalArgument(premises=[], conclusion=props["cold"], id="a"))
+        kb.rollback(token)
+        assert kb.arguments["a"] is arg
+        assert kb.find_supporting_arguments(props["wet"]) == [arg]
+        assert kb.find_supporting_arguments(props["cold"]) == []
+
+    def test_rollback_keeps_replaced_argument_position(self, kb, props):
+        first = FormalArgument(premises=[], conclusion=props["wet"], id="a")
+        second = FormalArgument(premises=[], conclusion=props["wet"], id="b")
+        kb.add_argument(first)
+        kb.add_argument(second)
+        with kb.lookahead():
+            kb.add_argument(
+                FormalArgument(premises=[], conclusion=props["cold"], id="a")
+            )
+        assert kb.find_supporting_arguments(props["wet"]) == [first, second]
+
+    def test_nested_snapshots(self, kb, props):
+        outer = kb.snapshot()
+        kb.add_proposition(props["rain"])
+        inner = kb.snapshot()
+        kb.add_proposition(props["cold"])
+        kb.release(inner)
+        assert len(kb.propositions) == 2
+        kb.rollback(outer)
+        assert kb.propositions == {}
+        with pytest.raises(ValueError):
+            kb.rollback(inner)
+
+    def test_no_journal_without_snapshot(self, kb, props):
+        kb.add_proposition(props["rain"])
+        kb.add_proposition(props["not_rain"])
+        assert kb._journal == []
@@ -0,0 +1,180 @@
+# tests/unit/argumentation_analysis/agents/core/governance/test_experiments.py
+"""Tests for the governance experiment engine — seeds, streaming, resume, CIs."""
+
+import csv
+import pickle
+
+import pytest
+
+from argumentation_analysis.agents.core.governance.experiments import (
+    RunningStats,
+    build_tasks,
+    run_experiment,
+    task_seed,
+)
+from argumentation_analysis.agents.core.governance.governance_agent import (
+    AgentFactory,
+)
+from argumentation_analysis.agents.core.governance.simulation import (
+    MANIPULATION_SUITE,
+    Manipulation,
+    manipulability_analysis,
+    simulate_manipulation,
+)
+
+OPTIONS = ["A", "B", "C"]
+SCENARIO = {
+    "options": OPTIONS,
+    "agents": [
+        {"name": f"Agent{i+1}", "personality": "random", "options": OPTIONS}
+        for i in range(6)
+    ],
+}
+
+
+def _rows(path):
+    with open(path, newline="") as f:
+        return sorted(
+            (tuple(row.values()) for row in csv.DictReader(f)), key=lambda r: r[:3]
+        )
+
+
+def failing_task(scenario_data, task):
+    if task.run == 1:
+        raise RuntimeError("boom")
+    return {"score": float(task.run)}
+
+
+class TestSeeds:
+    def test_seed_is_independent_of_grid(self):
+        small = build_tasks(2, ["majority"], [Manipulation("none")], base_seed=7)
+        large = build_tasks(5, ["borda", "majority"], MANIPULATION_SUITE, base_seed=7)
+        seeds = {t.key: t.seed for t in large}
+        for task in small:
+            assert seeds[task.key] == task.seed
+
+    def test_seeds_differ_across_cells_and_base(self):
+        tasks = build_tasks(10, ["majority", "borda"], MANIPULATION_SUITE)
+        assert len({t.seed for t in tasks}) == len(tasks)
+        assert task_seed(0, 0, "majority", "none") != task_seed(
+            1, 0, "majority", "none"
+        )
+
+
+class TestManipulationPickling:
+    @pytest.mark.parametrize("manipulation", MANIPULATION_SUITE[1:])
+    def test_manipulated_agents_pickle(self, manipulation):
+        agents = AgentFactory.create_agents(SCENARIO["agents"], seed=0)
+        simulate_manipulation(
+            agents,
+            SCENARIO,
+            "majority",
+            manipulation.kind,
+            noise_level=manipulation.noise_level,
+            bribery_budget=manipulation.bribery_budget,
+        )
+        restored = pickle.loads(pickle.dumps(agents))
+        for agent in restored:
+            assert agent.decide(OPTIONS) in OPTIONS
+
+    def test_analysis_does_not_leak_manipulations(self):
+        agents = AgentFactory.create_agents(SCENARIO["agents"], seed=0)
+        results = manipulability_analysis(agents, SCENARIO, "majority")
+        assert [r["manipulation_type"] for r in results] == [
+            m.kind for m in MANIPULATION_SUITE
+        ]
+        assert all("decide" not in vars(a) for a in agents)
+        assert all(a.memory == [] for a in agents)
+
+
+class TestRunExperiment:
+    def test_parallel_matches_inline(self, tmp_path):
+        inline, pooled = tmp_path / "inline.csv", tmp_path / "pooled.csv"
+        kwargs = dict(n_runs=4, manipulations=MANIPULATION_SUITE[:4], base_seed=3)
+        run_experiment(SCENARIO, ["majority"], output=str(inline), workers=1, **kwargs)
+        report = run_experiment(
+            SCENARIO, ["majority"], output=str(pooled), workers=2, **kwargs
+        )
+        assert report.completed == 16 and not report.failures
+        assert _rows(inline) == _rows(pooled)
+
+    def test_resume_skips_recorded_tasks(self, tmp_path):
+        out = str(tmp_path / "sweep.csv")
+        first = run_experiment(
+            SCENARIO,
+            ["majority"],
+            n_runs=3,
+            output=out,
+            workers=1,
+            progress=lambda report: report.done >= 2,
+            chunk_size=2,
+        )
+        assert first.stopped_early and first.completed == 2
+        # Simulate a row cut short by the interruption.
+        with open(out, "a") as f:
+            f.write("2,majority,none,12")
+
+        second = run_experiment(SCENARIO, ["majority"], n_runs=3, output=out, workers=1)
+        assert second.resumed == 2
+        assert second.completed == second.total - 2
+        full = str(tmp_path / "full.csv")
+        run_experiment(SCENARIO, ["majority"], n_runs=3, output=full, workers=1)
+        assert _rows(out) == _rows(full)
+        assert second.summary() and all(r["n"] == 3 for r in second.summary())
+
+    def test_resume_rejects_other_base_seed(self, tmp_path):
+        out = str(tmp_path / "sweep.csv")
+        run_experiment(SCENARIO, ["majority"], n_runs=1, output=out, workers=1)
+        with pytest.raises(ValueError, match="base_seed"):
+            run_experiment(
+                SCENARIO, ["majority"], n_runs=1, output=out, workers=1, base_seed=9
+            )
+
+    def test_failures_are_reported_not_written(self, tmp_path):
+        out = str(tmp_path / "sweep.csv")
+        report = run_experiment(
+            {},
+            ["m"],
+            n_runs=3,
+            manipulations=[Manipulation("none")],
+            output=out,
+            workers=1,
+            task_fn=failing_task,
+        )
+        assert report.completed == 2
+        assert report.failures == [((1, "m", "none"), "RuntimeError: boom")]
+        assert [r[0] for r in _rows(out)] == ["0", "2"]
+
+    def test_confidence_intervals(self):
+        report = run_experiment(
+            {},
+            ["m"],
+            n_runs=50,
+            manipulations=[Manipulation("none")],
+            workers=1,
+            task_fn=failing_task,
+        )
+        (row,) = report.summary()
+        assert row["n"] == 49
+        assert row["score"] == pytest.approx((sum(range(50)) - 1) / 49)
+        assert 0 < row["score_ci"] == report.max_half_width("score")
+
+
+class TestRunningStats:
+    def test_matches_batch_statistics(self):
+        import numpy as np
+
+        values = np.random.default_rng(0).normal(2.0, 3.0, 1000)
+        stats = RunningStats()
+        for v in values:
+            stats.update(v)
+        assert stats.mean == pytest.approx(values.mean())
+        assert stats.variance == pytest.approx(values.var(ddof=1))
+        assert stats.half_width(0.95) == pytest.approx(
+            1.959964 * values.std(ddof=1) / np.sqrt(1000), rel=1e-5
+        )
+
+    def test_single_sample_has_unbounded_interval(self):
+        stats = RunningStats()
+        stats.update(1.0)
+        assert stats.half_width() == float("inf")
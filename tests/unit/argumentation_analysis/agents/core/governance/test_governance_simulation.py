@@ -207,6 +207,24 @@ class TestSimulateGovernance:
         assert "conflicts" in result
         assert "resolved_conflicts" in result
 
+    def test_coalition_power_for_many_agents(self):
+        agents = [
+            make_sim_agent(f"a{i}", preferences=["X", "Y"] if i % 3 else ["Y", "X"])
+            for i in range(30)
+        ]
+        for i in range(0, 30, 3):  # ten trusting triples
+            for j in range(i, i + 3):
+                agents[j].trust = {agents[k].name: 0.9 for k in range(i, i + 3)}
+        scenario = {"options": ["X", "Y"], "context": {}}
+        result = simulate_governance(agents, scenario, "majority")
+        assert len(result["coalitions"]) == 10
+        power = result["coalition_power"]
+        assert set(power) == {f"coalition_{i}" for i in range(1, 11)}
+        assert sum(power.values()) == pytest.approx(1.0)
+        # Ten equal blocs: symmetric power.
+        assert all(v == pytest.approx(0.1) for v in power.values())
+        assert result["coalition_power_estimate"]["method"] == "exact"
+
     def test_result_has_options(self):
         agents = [make_sim_agent("A", decision="X", preferences=["X"])]
         scenario = {"options": ["X", "Y"], "context": {"adjacency": [[0]]}}
@@ -0,0 +1,107 @@
+"""Tests for the Shapley subsystem — exact subset formula and sampling."""
+
+import itertools
+import math
+
+import numpy as np
+import pytest
+
+from argumentation_analysis.agents.core.governance.shapley import (
+    shapley_exact,
+    shapley_monte_carlo,
+    shapley_values,
+    weighted_voting_power,
+)
+
+WEIGHTS = {"A": 4, "B": 3, "C": 2, "D": 1, "E": 1}
+QUOTA = 6
+
+
+def weighted_payoff(names):
+    return 1.0 if sum(WEIGHTS[n] for n in names) >= QUOTA else 0.0
+
+
+def by_permutations(names, payoff):
+    """Reference: average marginal contribution over all orders."""
+    values = {n: 0.0 for n in names}
+    for order in itertools.permutations(names):
+        prefix = frozenset()
+        for name in order:
+            values[name] += payoff(prefix | {name}) - payoff(prefix)
+            prefix = prefix | {name}
+    return {n: v / math.factorial(len(names)) for n, v in values.items()}
+
+
+class TestExact:
+    def test_matches_permutation_definition(self):
+        names = list(WEIGHTS)
+        expected = by_permutations(names, weighted_payoff)
+        result = shapley_exact(names, weighted_payoff)
+        assert result.values == pytest.approx(expected)
+        assert result.evaluations == 2 ** len(names)
+
+    def test_each_coalition_evaluated_once(self):
+        seen = []
+
+        def payoff(names):
+            seen.append(names)
+            return float(len(names))
+
+        shapley_exact(["a", "b", "c", "d"], payoff)
+        assert len(seen) == len(set(seen)) == 16
+
+    def test_batch_payoff_matches_scalar(self):
+        names = list(WEIGHTS)
+        batch = weighted_voting_power([WEIGHTS[n] for n in names], QUOTA)
+        scalar = shapley_exact(names, weighted_payoff).values
+        assert shapley_exact(names, batch_payoff=batch).values == pytest.approx(scalar)
+
+
+class TestMonteCarlo:
+    def test_converges_within_epsilon(self):
+        names = list(WEIGHTS)
+        expected = by_permutations(names, weighted_payoff)
+        result = shapley_monte_carlo(names, weighted_payoff, epsilon=0.01, seed=1)
+        assert result.converged
+        assert result.max_half_width <= 0.01
+        for name in names:
+            assert abs(result.values[name] - expected[name]) < 0.02
+        # Only 2^5 distinct coalitions exist; payoffs are memoised.
+        assert result.evaluations <= 32
+
+    def test_budget_exhausted_is_reported(self):
+        result = shapley_monte_carlo(
+            list(WEIGHTS),
+            weighted_payoff,
+            epsilon=1e-6,
+            max_permutations=200,
+            seed=0,
+        )
+        assert result.permutations == 200
+        assert result.converged is False
+
+    def test_seed_makes_it_reproducible(self):
+        run = lambda: shapley_monte_carlo(list(WEIGHTS), weighted_payoff, seed=7)
+        assert run().values == run().values
+
+
+class TestShapleyValues:
+    def test_auto_switches_to_sampling_for_large_games(self):
+        rng = np.random.default_rng(0)
+        weights = rng.integers(1, 10, size=40)
+        names = [f"agent_{i}" for i in range(40)]
+        result = shapley_values(
+            names,
+            batch_payoff=weighted_voting_power(weights, weights.sum() // 2 + 1),
+            epsilon=0.005,
+            seed=0,
+        )
+        assert result.method == "monte_carlo" and result.converged
+        # Efficiency: the values sum to v(N) - v(empty) exactly per order.
+        assert sum(result.values.values()) == pytest.approx(1.0)
+        power = np.array([result.values[n] for n in names])
+        assert power[weights == weights.max()].mean() > 3 * power[weights == 1].mean()
+
+    def test_unknown_method(self):
+        with pytest.raises(ValueError):
+            shapley_values(["a"], payoff=len, method="magic")
@@ -11,10 +11,16 @@ Validates:
 - GovernancePlugin social choice integration
 """
 
+import itertools
 import json
+import random
+
 import pytest
 
 from argumentation_analysis.agents.core.governance.social_choice import (
+    _MAX_KEMENY_CANDIDATES,
+    _MAX_KEMENY_DP_CANDIDATES,
+    PreferenceProfile,
     approval_voting,
     stv,
     copeland,
@@ -22,6 +28,7 @@ from argumentation_analysis.agents.core.governance.social_choice import (
     schulze,
     condorcet_winner,
     pairwise_matrix,
+    kemeny_young_safe,
     SOCIAL_CHOICE_METHODS,
 )
 
@@ -170,10 +177,57 @@ class TestKemenyYoung:
         assert ranking == ["A", "B", "C"]
 
     def test_too_many_candidates_raises(self):
-        big_options = [f"C{i}" for i in range(9)]
+        big_options = [f"C{i}" for i in range(_MAX_KEMENY_CANDIDATES + 1)]
         with pytest.raises(ValueError, match="impractical"):
             kemeny_young([], big_options)
 
+    def test_matches_brute_force_enumeration(self):
+        rng = random.Random(7)
+        options = [f"C{i}" for i in range(6)]
+        for _ in range(20):
+            ballots = [
+                rng.sample(options, rng.randint(2, 6)) for _ in range(rng.randint(1, 9))
+            ]
+            d = pairwise_matrix(ballots, options)
+            best = max(
+                itertools.permutations(options),
+                key=lambda perm: sum(
+                    d[perm[i]][perm[j]]
+                    for i in range(len(perm))
+                    for j in range(i + 1, len(perm))
+                ),
+            )
+            ranking, score = kemeny_young(ballots, options)
+            # First optimal permutation in enumeration order, as before.
+            assert ranking == list(best)
+            assert kemeny_young(ballots, options, "branch_and_bound")[1] == score
+
+    def test_twenty_options_thousands_of_ballots(self):
+        rng = random.Random(3)
+        options = [f"C{i}" for i in range(20)]
+        ballots = []
+        for _ in range(2000):
+            ballot = list(options)
+            for _ in range(6):
+                i = rng.randrange(len(ballot) - 1)
+                ballot[i], ballot[i + 1] = ballot[i + 1], ballot[i]
+            ballots.append(ballot)
+        profile = PreferenceProfile(ballots, options)
+        ranking, score = kemeny_young(profile, options)
+        assert ranking == options  # adjacent swaps keep the consensus order
+        assert kemeny_young(profile, options, "branch_and_bound") == (
+            ranking,
+            score,
+        )
+        assert kemeny_young_safe(profile, options)[2] is False
+
+    def test_dp_rejects_too_many_candidates(self):
+        options = [f"C{i}" for i in range(_MAX_KEMENY_DP_CANDIDATES + 1)]
+        with pytest.raises(ValueError, match="branch_and_bound"):
+            kemeny_young([options], options, method="dp")
+        ranking, _ = kemeny_young([options], options)
+        assert ranking == options
+
     def test_two_candidates(self):
         ballots = [["X", "Y"], ["X", "Y"], ["Y", "X"]]
         ranking, score = kemeny_young(ballots, ["X", "Y"])
@@ -248,6 +302,45 @@ class TestPairwiseMatrix:
         assert matrix["B"]["A"] == 1
 
 
+# ──── Preference Profile Tests ────
+
+
+class TestPreferenceProfile:
+    def test_identical_ballots_are_merged(self):
+        profile = PreferenceProfile(BALLOTS, OPTIONS)
+        assert len(profile.ranks) == 4
+        assert profile.weights.tolist() == [2, 1, 1, 1]
+        assert profile.n_ballots == 5
+
+    def test_unranked_candidates(self):
+        ballots = [["A", "X"], ["B", "A", "C"]]
+        profile = PreferenceProfile(ballots, OPTIONS)
+        strict = profile.pairwise()
+        # Ballot 1 ranks neither B nor C: only ballot 2 counts for them.
+        assert strict[0, 1] == 0 and strict[1, 0] == 1
+        # Copeland convention: ranked A beats unranked B on ballot 1.
+        assert profile.pairwise(unranked_last=True)[0, 1] == 1
+
+    def test_repeated_candidates_count_per_occurrence(self):
+        # Schulze, pairwise_matrix and approval count every occurrence of a
+        # repeated candidate; the rank-based methods only its first one.
+        ballots = [["A", "B", "A"], ["B", "A"], ["A"]]
+        assert pairwise_matrix(ballots, ["A", "B"]) == {
+            "A": {"B": 1},
+            "B": {"A": 2},
+        }
+        assert schulze(ballots, ["A", "B"])[0] == "B"
+        assert condorcet_winner(ballots, ["A", "B"]) is None
+        assert approval_voting([["A", "A", "B"]], ["A", "B"])[1] == {"A": 2, "B": 0}
+
+    def test_methods_accept_a_profile(self):
+        profile = PreferenceProfile(CONDORCET_BALLOTS, OPTIONS)
+        assert copeland(profile, OPTIONS) == copeland(CONDORCET_BALLOTS, OPTIONS)
+        assert schulze(profile, OPTIONS) == schulze(CONDORCET_BALLOTS, OPTIONS)
+        assert stv(profile, OPTIONS) == stv(CONDORCET_BALLOTS, OPTIONS)
+        assert condorcet_winner(profile, OPTIONS) == "A"
+
+
 # ──── Registry Tests ────
 
 
@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""Tests for the precompiled taxonomy matcher (Aho-Corasick + hierarchy indexes)."""
+
+import random
+
+import pandas as pd
+import pytest
+
+from argumentation_analysis.agents.core.informal.taxonomy_matcher import (
+    AhoCorasick,
+    TaxonomyMatcher,
+    fold_text,
+)
+
+
+def _taxonomy() -> pd.DataFrame:
+    rows = [
+        (0, "0", 0, float("nan"), "Argument fallacieux"),
+        (1, "1", 1, float("nan"), "Insuffisance des preuves"),
+        (2, "1.1", 2, "Pente glissante", "Enchaînement causal exagéré"),
+        (3, "1.2", 2, float("nan"), "Argument d'autorité douteuse"),
+        (4, "1.2.1", 3, "Parce que c'est comme ça", "Autorité personnelle"),
+        (5, "1.3", 2, "Homme de paille", "Déformation de la position adverse"),
+    ]
+    df = pd.DataFrame(
+        rows, columns=["PK", "path", "depth", "nom_vulgarisé", "text_fr"]
+    ).set_index("PK")
+    df["Famille"] = "Famille test"
+    return df
+
+
+class TestAhoCorasick:
+    def test_matches_agree_with_substring_search(self):
+        rng = random.Random(3)
+        for _ in range(200):
+            patterns = [
+                "".join(rng.choice("abc") for _ in range(rng.randint(1, 4)))
+                for _ in range(rng.randint(1, 8))
+            ]
+            text = "".join(rng.choice("abcd") for _ in range(rng.randint(0, 30)))
+            found = AhoCorasick(patterns).find_all(text)
+            assert found == {i for i, p in enumerate(patterns) if p in text}
+
+    def test_fold_text_strips_accents_and_quotes(self):
+        assert fold_text("Déformation d’Autorité") == "deformation d'autorite"
+
+
+class TestTaxonomyMatcher:
+    def test_scan_scores_like_the_lexical_heuristic(self):
+        matcher = TaxonomyMatcher(_taxonomy())
+        results = {
+            entry.pk: (round(confidence, 2), matches)
+            for entry, confidence, matches in matcher.scan(
+                "C'est une PENTE GLISSANTE, un enchainement causal exagere !"
+            )
+        }
+        assert results[2] == (
+            1.0,
+            [
+                "Nom vulgarisé: 'pente glissante'",
+                "Mot-clé: 'enchaînement'",
+                "Mot-clé: 'causal'",
+                "Mot-clé: 'exagéré'",
+            ],
+        )
+
+    def test_empty_cells_are_never_matched(self):
+        matcher = TaxonomyMatcher(_taxonomy())
+        assert matcher.scan("nan nan nan") == []
+
+    def test_hierarchy_indexes(self):
+        matcher = TaxonomyMatcher(_taxonomy())
+        assert matcher.children[1] == [2, 3, 5]
+        assert matcher.children[3] == [4]
+        assert matcher.siblings(2) == ("1", [3, 4, 5])
+        assert matcher.siblings(1) == (None, [])
+
+
+class TestDetectorUsesMatcher:
+    @pytest.fixture
+    def detector(self, monkeypatch):
+        from argumentation_analysis.agents.core.informal import (
+            taxonomy_sophism_detector,
+        )
+
+        detector = taxonomy_sophism_detector.TaxonomySophismDetector()
+        monkeypatch.setattr(detector, "_taxonomy_cache", _taxonomy())
+        return detector
+
+    def test_detection_with_context(self, detector):
+        sophisms = detector.detect_sophisms_from_taxonomy(
+            "Voilà un homme de paille et une pente glissante."
+        )
+        assert [s["taxonomy_key"] for s in sophisms] == [2, 5]
+        assert sophisms[0]["related_sophisms"][0]["taxonomy_key"] == 3
+        assert sophisms[0]["branch_context"]["current_node"]["path"] == "1.1"
+
+    def test_explore_branch_recurses_through_index(self, detector):
+        branch = detector.explore_branch(1, max_depth=2)
+        assert [c["pk"] for c in branch["children"]] == [2, 3, 5]
+        assert branch["children"][1]["has_children"] is True
+        assert branch["children"][1]["sub_branches"]["children"][0]["pk"] == 4
+        assert detector.explore_branch(99)["error"]
@@ -0,0 +1,97 @@
+"""Tests for the grounded labelling engine (dung_labelling) behind DungFramework.
+
+Validates:
+- IN/OUT/UNDEC labels on canonical frameworks
+- SCC decomposition in topological order
+- Parity with the characteristic-function fixpoint
+- Incremental relabelling after add_argument / add_attack
+"""
+
+import random
+
+from argumentation_analysis.agents.core.logic.dung_labelling import IN, OUT, UNDEC
+from argumentation_analysis.agents.core.logic.dung_native import DungFramework
+
+
+def _fixpoint_grounded(fw):
+    current = frozenset()
+    while True:
+        nxt = fw.characteristic_function(current)
+        if nxt == current:
+            return current
+        current = nxt
+
+
+class TestGroundedLabelling:
+    def test_reinstatement(self):
+        fw = DungFramework.reinstatement()
+        assert fw.grounded_labelling() == {"a": IN, "b": OUT, "c": IN}
+        assert fw.grounded_extension() == frozenset({"a", "c"})
+
+    def test_triangle_is_undecided(self):
+        fw = DungFramework.triangle()
+        assert set(fw.grounded_labelling().values()) == {UNDEC}
+
+    def test_undec_attacker_blocks_downstream(self):
+        fw = DungFramework.from_args_and_attacks(
+            ["a", "b", "c"], [["a", "b"], ["b", "a"], ["b", "c"]]
+        )
+        assert fw.grounded_labelling() == {"a": UNDEC, "b": UNDEC, "c": UNDEC}
+
+    def test_self_attack(self):
+        fw = DungFramework.from_args_and_attacks(["a", "b"], [["a", "a"], ["a", "b"]])
+        assert fw.grounded_labelling() == {"a": UNDEC, "b": UNDEC}
+
+    def test_matches_characteristic_fixpoint(self):
+        rng = random.Random(11)
+        for _ in range(200):
+            n = rng.randint(1, 10)
+            args = [f"a{i}" for i in range(n)]
+            fw = DungFramework()
+            for a in args:
+                fw.add_argument(a)
+            for _ in range(rng.randint(0, 3 * n)):
+                fw.add_attack(rng.choice(args), rng.choice(args))
+                assert fw.grounded_extension() == _fixpoint_grounded(fw)
+
+
+class TestSCCDecomposition:
+    def test_components_in_topological_order(self):
+        fw = DungFramework.from_args_and_attacks(
+            ["a", "b", "c", "d"], [["a", "b"], ["b", "c"], ["c", "b"], ["c", "d"]]
+        )
+        assert fw.strongly_connected_components() == [["a"], ["b", "c"], ["d"]]
+
+
+class TestIncrementalUpdates:
+    def _chain(self, n):
+        fw = DungFramework()
+        for i in range(n):
+            fw.add_argument(f"a{i}")
+        for i in range(1, n):
+            fw.add_attack(f"a{i-1}", f"a{i}")
+        return fw
+
+    def test_add_attack_relabels_only_downstream(self):
+        fw = self._chain(200)
+        fw.grounded_extension()
+        before = fw._labelling.stats["relabelled"]
+        fw.add_attack("a195", "a197")
+        labels = fw.grounded_labelling()
+        assert fw._labelling.stats["relabelled"] - before == 3
+        assert labels["a197"] == OUT
+        assert fw.grounded_extension() == _fixpoint_grounded(fw)
+
+    def test_add_argument_labels_new_node_only(self):
+        fw = self._chain(50)
+        fw.grounded_extension()
+        before = fw._labelling.stats["relabelled"]
+        fw.add_argument("isolated")
+        assert fw.grounded_labelling()["isolated"] == IN
+        assert fw._labelling.stats["relabelled"] - before == 1
+
+    def test_direct_mutation_is_detected(self):
+        fw = DungFramework.reinstatement()
+        assert fw.grounded_extension() == frozenset({"a", "c"})
+        fw.attacks.add(("c", "a"))
+        assert fw.grounded_extension() == frozenset()
@@ -0,0 +1,120 @@
+"""Tests for the SAT-backed Dung extension engine (dung_sat).
+
+Validates:
+- CNF encodings of admissible / complete / stable semantics
+- PrefSAT-style preferred extension maximisation
+- Credulous / skeptical acceptance queries without enumeration
+- Parity with the subset-enumeration fallback of DungFramework
+- Large frameworks beyond the enumeration threshold
+"""
+
+import random
+
+import pytest
+
+from argumentation_analysis.agents.core.logic import dung_native
+from argumentation_analysis.agents.core.logic.dung_native import DungFramework
+from argumentation_analysis.agents.core.logic.dung_sat import (
+    SAT_ENGINE_AVAILABLE,
+    DungSATEngine,
+)
+
+pytestmark = pytest.mark.skipif(not SAT_ENGINE_AVAILABLE, reason="PySAT not installed")
+
+
+def _sorted(exts):
+    return sorted(sorted(e) for e in exts)
+
+
+class TestEncodings:
+    def test_nixon_diamond(self):
+        fw = DungFramework.nixon_diamond()
+        engine = DungSATEngine(fw.arguments, fw.attacks)
+        assert _sorted(engine.stable_extensions()) == [
+            ["quaker", "republican"],
+        ]
+        assert _sorted(engine.complete_extensions()) == [["quaker", "republican"]]
+
+    def test_triangle_has_only_empty_complete(self):
+        fw = DungFramework.triangle()
+        engine = DungSATEngine(fw.arguments, fw.attacks)
+        assert _sorted(engine.complete_extensions()) == [[]]
+        assert engine.stable_extensions() == []
+        assert engine.preferred_extensions() == [frozenset()]
+
+    def test_reciprocal_preferred(self):
+        engine = DungSATEngine(["a", "b"], [("a", "b"), ("b", "a")])
+        assert _sorted(engine.preferred_extensions()) == [["a"], ["b"]]
+        assert _sorted(engine.admissible_sets()) == [[], ["a"], ["b"]]
+
+    def test_self_attack_excluded(self):
+        engine = DungSATEngine(["a", "b"], [("a", "a")])
+        assert _sorted(engine.preferred_extensions()) == [["b"]]
+
+    def test_empty_framework(self):
+        engine = DungSATEngine([], [])
+        assert engine.complete_extensions() == [frozenset()]
+        assert engine.preferred_extensions() == [frozenset()]
+
+    def test_enumeration_limit(self):
+        engine = DungSATEngine([f"a{i}" for i in range(6)], [])
+        with pytest.raises(RuntimeError, match="enumeration limit"):
+            engine.admissible_sets(limit=10)
+
+
+class TestAcceptance:
+    def test_credulous_vs_skeptical_on_reciprocal(self):
+        engine = DungSATEngine(["a", "b", "c"], [("a", "b"), ("b", "a"), ("b", "c")])
+        assert engine.is_credulously_accepted("a")
+        assert not engine.is_skeptically_accepted("a")
+        assert not engine.is_skeptically_accepted("c")
+        assert engine.is_credulously_accepted("c", "stable")
+
+    def test_floating_acceptance(self):
+        """d is in every preferred extension but not in the grounded one."""
+        attacks = [("a", "b"), ("b", "a"), ("a", "c"), ("b", "c"), ("c", "d")]
+        engine = DungSATEngine(["a", "b", "c", "d"], attacks)
+        assert engine.is_skeptically_accepted("d")
+        assert not engine.is_skeptically_accepted("d", "grounded")
+
+    def test_unknown_argument_raises(self):
+        engine = DungSATEngine(["a"], [])
+        with pytest.raises(KeyError):
+            engine.is_credulously_accepted("zz")
+
+    def test_stats_count_solver_calls(self):
+        engine = DungSATEngine(["a", "b"], [("a", "b")])
+        engine.preferred_extensions()
+        assert engine.stats["solver_calls"] >= 2
+
+
+class TestParityWithEnumeration:
+    def test_random_frameworks_match_fallback(self, monkeypatch):
+        rng = random.Random(7)
+        for _ in range(60):
+            n = rng.randint(1, 7)
+            args = [f"a{i}" for i in range(n)]
+            attacks = [
+                [rng.choice(args), rng.choice(args)]
+                for _ in range(rng.randint(0, 2 * n))
+            ]
+            fw = DungFramework.from_args_and_attacks(args, attacks)
+            with_sat = fw.get_all_extensions()
+            statuses = [fw.get_argument_status(a) for a in args]
+            monkeypatch.setattr(dung_native, "SAT_ENGINE_AVAILABLE", False)
+            assert fw.get_all_extensions() == with_sat
+            assert [fw.get_argument_status(a) for a in args] == statuses
+            monkeypatch.setattr(dung_native, "SAT_ENGINE_AVAILABLE", True)
+
+
+class TestLargeFrameworks:
+    def test_hundreds_of_arguments(self):
+        rng = random.Random(3)
+        args = [f"a{i}" for i in range(300)]
+        attacks = [(rng.choice(args), rng.choice(args)) for _ in range(600)]
+        fw = DungFramework.from_args_and_attacks(args, [list(a) for a in attacks])
+        preferred = fw.preferred_extensions()
+        assert preferred
+        for ext in preferred:
+            assert fw.is_conflict_free(ext)
+        assert isinstance(fw.is_skeptically_accepted("a0"), bool)
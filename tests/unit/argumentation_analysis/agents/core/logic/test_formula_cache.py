@@ -0,0 +1,102 @@
+"""Tests for the shared formula parse/encoding caches (formula_cache).
+
+Validates:
+- LRU behaviour, hit/miss/eviction counters and per-family aggregation
+- Failed parses are never cached
+- QBF parse memoisation with shared sub-formulas
+- Tseitin templates reproduce the uncached variable numbering
+"""
+
+import random
+
+import pytest
+
+from argumentation_analysis.agents.core.logic import qbf_native
+from argumentation_analysis.agents.core.logic.formula_cache import (
+    FormulaCache,
+    formula_cache_stats,
+    normalize_formula_text,
+)
+
+try:
+    from argumentation_analysis.agents.core.logic import sat_handler
+    from argumentation_analysis.agents.core.logic.sat_handler import (
+        PYSAT_AVAILABLE,
+        SATHandler,
+    )
+except ImportError:
+    PYSAT_AVAILABLE = False
+
+
+class TestFormulaCache:
+    def test_hits_misses_and_eviction(self):
+        cache = FormulaCache("test_family", maxsize=2)
+        calls = []
+        for key in ["a", "b", "a", "c", "b"]:
+            cache.get_or_create(key, lambda key=key: calls.append(key) or key.upper())
+        assert calls == ["a", "b", "c", "b"]
+        assert cache.stats == {"hits": 1, "misses": 4, "evictions": 2, "size": 2}
+
+    def test_errors_are_not_cached(self):
+        cache = FormulaCache("test_family")
+
+        def broken():
+            raise ValueError("bad formula")
+
+        for _ in range(2):
+            with pytest.raises(ValueError):
+                cache.get_or_create("x", broken)
+        assert cache.stats["misses"] == 2 and len(cache) == 0
+
+    def test_stats_aggregated_per_family(self):
+        first = FormulaCache("test_aggregate")
+        second = FormulaCache("test_aggregate")
+        first.get_or_create("k", lambda: 1)
+        first.get_or_create("k", lambda: 1)
+        second.get_or_create("k", lambda: 1)
+        stats = formula_cache_stats()["test_aggregate"]
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (1, 2, 0.3333)
+
+    def test_normalization_ignores_whitespace(self):
+        assert normalize_formula_text("  a &\n b ") == normalize_formula_text("a & b")
+
+
+class TestQBFParseCache:
+    def test_identical_formulas_share_nodes(self):
+        first = qbf_native.parse_formula("x & y | !z")
+        second = qbf_native.parse_formula("x  &  y | !z")
+        assert first is second
+        conj = qbf_native.parse_formula("q => x & y")
+        assert conj.right is first.left
+
+    def test_results_unchanged(self):
+        formula = qbf_native.parse_formula("a & b => c")
+        assert formula.evaluate({"a": True, "b": True, "c": False}) is False
+        assert formula.evaluate({"a": True, "b": False, "c": False}) is True
+
+
+@pytest.mark.skipif(not PYSAT_AVAILABLE, reason="PySAT not installed")
+class TestTseitinTemplates:
+    def test_cached_encoding_matches_fresh_encoding(self, monkeypatch):
+        rng = random.Random(5)
+        ops = ["&", "|", "=>", "<=>"]
+
+        def formula(depth):
+            if depth == 0 or rng.random() < 0.3:
+                return ("! " if rng.random() < 0.3 else "") + rng.choice("pqrs")
+            return f"( {formula(depth - 1)} {rng.choice(ops)} {formula(depth - 1)} )"
+
+        kbs = [[formula(3) for _ in range(4)] for _ in range(30)]
+        cached = [SATHandler().formulas_to_cnf(kb) for kb in kbs]
+        fresh = []
+        for kb in kbs:
+            monkeypatch.setattr(sat_handler, "_TSEITIN_CACHE", FormulaCache("tseitin"))
+            fresh.append(SATHandler().formulas_to_cnf(kb))
+        assert cached == fresh
+
+    def test_repeated_formula_hits_the_cache(self, monkeypatch):
+        cache = FormulaCache("tseitin")
+        monkeypatch.setattr(sat_handler, "_TSEITIN_CACHE", cache)
+        SATHandler().formulas_to_cnf(["a & b => c"])
+        SATHandler().formulas_to_cnf(["x", "a && b => c"])
+        assert cache.stats["hits"] == 1
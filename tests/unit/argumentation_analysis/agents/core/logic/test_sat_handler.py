@@ -5,6 +5,7 @@ Validates:
 - SATHandler: variable mapping, Tseitin CNF conversion
 - SAT solving (satisfiable / unsatisfiable)
 - Entailment queries via SAT
+- Incremental SAT sessions (assumption-based queries)
 - Solution enumeration
 - MaxSAT solving
 - MUS/MCS analysis (MARCO, if Z3 available)
@@ -349,6 +350,77 @@ class TestEntailmentQuery:
         assert result is True
 
 
+@pytest.mark.skipif(not PYSAT_AVAILABLE, reason="PySAT not installed")
+class TestSATSession:
+    """Tests for incremental sessions: one live solver per belief set."""
+
+    def test_queries_answered_under_assumptions(self):
+        handler = SATHandler()
+        session = handler.session(["A", "A => B", "B => C"])
+        assert session.entails_all(["C", "A & B", "D", "! C"]) == [
+            True,
+            True,
+            False,
+            False,
+        ]
+        assert session.is_consistent()
+        assert session.stats["queries"] == 4
+
+    def test_kb_encoded_once_across_queries(self):
+        handler = SATHandler()
+        kb = [f"a{i} => a{i + 1}" for i in range(200)] + ["a0"]
+        handler.query(kb, "a200")
+        clauses = handler.session(kb).stats["clauses"]
+        assert handler.query(kb, "a150") is True
+        session = handler.session(kb)
+        assert session.stats["clauses"] == clauses  # a bare atom adds no clause
+        assert session.stats["solver_calls"] == 2
+
+    def test_repeated_query_hits_definition_cache(self):
+        session = SATHandler().session(["A | B"])
+        session.entails("A  |  B")
+        assert session.stats["definition_hits"] == 1
+        assert session.entails("( A | B )") is True
+
+    def test_incremental_additions(self):
+        with SATHandler().session(["A => B"]) as session:
+            assert not session.entails("B")
+            session.add_formula("A")
+            assert session.entails("B")
+            b = session.variable_map["B"]
+            session.add_clause([-b])
+            assert not session.is_consistent()
+
+    def test_closed_session_leaves_the_cache(self):
+        handler = SATHandler()
+        with handler.session(["A => B"]) as session:
+            assert not session.entails("B")
+        assert not handler._sessions
+        assert handler.query(["A => B"], "A => B") is True
+
+    def test_modified_session_leaves_the_cache(self):
+        handler = SATHandler()
+        session = handler.session(["A => B"])
+        session.add_formula("A")
+        assert session.entails("B")
+        assert handler.query(["A => B"], "B") is False
+        assert handler.session(["A => B"]) is not session
+
+    def test_consistency_and_query_share_session(self):
+        handler = SATHandler()
+        handler.check_consistency(["A", "A => B"])
+        handler.query(["A", "A => B"], "B")
+        assert len(handler._sessions) == 1
+
+    def test_session_cache_is_bounded(self):
+        handler = SATHandler()
+        for i in range(SATHandler.MAX_SESSIONS + 3):
+            handler.query([f"p{i}"], f"p{i}")
+        assert len(handler._sessions) == SATHandler.MAX_SESSIONS
+        handler.close_sessions()
+        assert not handler._sessions
+
+
 # ──── Solution Enumeration Tests ────
 
 
@@ -512,6 +584,10 @@ class TestPLHandlerSATDispatch:
         result = mock_pl_handler.pl_query_sat("A | B", "A")
         assert result is False
 
+    def test_pl_query_batch_sat(self, mock_pl_handler):
+        result = mock_pl_handler.pl_query_batch_sat("A\nA => B", ["B", "C", "A | C"])
+        assert result == [True, False, True]
+
 
 # ──── FP-3 #1192 DoD tests ────
 
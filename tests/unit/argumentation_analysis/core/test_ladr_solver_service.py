@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+Tests for argumentation_analysis.core.ladr_solver_service
+Covers the Prover9/Mace4 race, the verdict cache and the bounded pool.
+"""
+
+import asyncio
+import sys
+
+import pytest
+
+from argumentation_analysis.core.ladr_solver_service import (
+    LADRSolverService,
+    run_ladr_process,
+)
+
+MODEL = "============================== MODEL =================\nexit (max_models)"
+EXHAUSTED = "exit (exhausted)"
+
+
+def _runner(stdout, delay=0.0, calls=None):
+    async def run(input_content):
+        if calls is not None:
+            calls.append(input_content)
+        await asyncio.sleep(delay)
+        return stdout
+
+    return run
+
+
+class TestRace:
+    def test_first_definitive_answer_wins_and_cancels_the_other(self):
+        cancelled = []
+
+        async def slow_prover9(_input):
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+            return "THEOREM PROVED"
+
+        service = LADRSolverService(
+            prover9_runner=slow_prover9, mace4_runner=_runner(MODEL)
+        )
+        verdict = asyncio.run(service.check_consistency("P(a)."))
+        assert (verdict.consistent, verdict.solver) == (True, "mace4")
+        assert cancelled == [True]
+        assert service.stats["cancelled"] == 1
+
+    def test_inconclusive_answer_waits_for_the_other_prover(self):
+        service = LADRSolverService(
+            prover9_runner=_runner("THEOREM PROVED", delay=0.05),
+            mace4_runner=_runner(EXHAUSTED),
+        )
+        verdict = asyncio.run(service.check_consistency("P(a).\n-P(a)."))
+        assert (verdict.consistent, verdict.solver) == (False, "prover9")
+
+    def test_exhausted_mace4_search_is_degraded_not_a_refutation(self):
+        calls = []
+        service = LADRSolverService(
+            prover9_runner=_runner("nothing", calls=calls),
+            mace4_runner=_runner(EXHAUSTED),
+        )
+        verdict = asyncio.run(service.check_consistency("P(a).\n-P(a)."))
+        assert verdict.consistent is None
+        assert "exhausted" in verdict.note
+        # Degraded verdicts are not cached: the provers run again.
+        asyncio.run(service.check_consistency("P(a).\n-P(a)."))
+        assert len(calls) == 2
+
+    def test_one_failing_prover_does_not_hide_the_other(self):
+        async def broken(_input):
+            raise FileNotFoundError("no mace4")
+
+        service = LADRSolverService(
+            prover9_runner=_runner("SEARCH FAILED"), mace4_runner=broken
+        )
+        assert asyncio.run(service.check_consistency("P(a).")).consistent is True
+
+    def test_all_provers_failing_raises(self):
+        async def broken(_input):
+            raise RuntimeError("timed out")
+
+        service = LADRSolverService(prover9_runner=broken, mace4_runner=broken)
+        with pytest.raises(RuntimeError, match="timed out"):
+            asyncio.run(service.check_consistency("P(a)."))
+
+
+class TestCache:
+    def test_repeated_belief_set_is_served_from_cache(self):
+        calls = []
+        service = LADRSolverService(
+            prover9_runner=_runner("SEARCH FAILED", calls=calls), mace4_runner=False
+        )
+        first = asyncio.run(service.check_consistency("P(a).\r\nQ(b).\n"))
+        second = asyncio.run(service.check_consistency("P(a).\nQ(b)."))
+        assert len(calls) == 1
+        assert not first.cached and second.cached
+        assert second.consistent is True
+        assert service.stats["cache_hits"] == 1
+
+    def test_degraded_verdict_is_not_cached(self):
+        calls = []
+        service = LADRSolverService(
+            prover9_runner=_runner("nothing", calls=calls), mace4_runner=False
+        )
+        for _ in range(2):
+            assert asyncio.run(service.check_consistency("P(a).")).consistent is None
+        assert len(calls) == 2
+
+    def test_lru_eviction(self):
+        service = LADRSolverService(
+            cache_size=1, prover9_runner=_runner("SEARCH FAILED"), mace4_runner=False
+        )
+        asyncio.run(service.check_consistency("P(a)."))
+        asyncio.run(service.check_consistency("Q(a)."))
+        assert not asyncio.run(service.check_consistency("P(a).")).cached
+
+
+class TestPool:
+    def test_concurrent_runs_bounded_by_max_workers(self):
+        running = []
+        peak = []
+
+        async def tracked(_input):
+            running.append(1)
+            peak.append(len(running))
+            await asyncio.sleep(0.01)
+            running.pop()
+            return "SEARCH FAILED"
+
+        service = LADRSolverService(
+            max_workers=2, prover9_runner=tracked, mace4_runner=False
+        )
+
+        async def many():
+            await asyncio.gather(
+                *(service.check_consistency(f"P(a{i}).") for i in range(6))
+            )
+
+        asyncio.run(many())
+        assert max(peak) == 2
+
+    def test_process_receives_input_on_stdin(self):
+        stdout, _ = asyncio.run(
+            run_ladr_process(
+                [sys.executable, "-c", "import sys; print(sys.stdin.read().upper())"],
+                "p.\r\n",
+                ".",
+                10,
+                "echo",
+            )
+        )
+        assert stdout.strip() == "P."
+
+    def test_process_timeout_raises_runtime_error(self):
+        with pytest.raises(RuntimeError, match="timed out"):
+            asyncio.run(
+                run_ladr_process(
+                    [sys.executable, "-c", "import time; time.sleep(10)"],
+                    "",
+                    ".",
+                    0.2,
+                    "sleeper",
+                )
+            )
@@ -37,13 +37,16 @@ class TestRunProver9:
 
     @patch("argumentation_analysis.core.prover9_runner.subprocess.run")
     @patch("argumentation_analysis.core.prover9_runner.PROVER9_EXECUTABLE")
-    def test_called_with_shell_true(self, mock_executable, mock_run):
+    def test_input_piped_on_stdin(self, mock_executable, mock_run):
+        """The input goes to the binary's stdin — no temp file, no shell."""
         mock_executable.is_file.return_value = True
-        mock_run.return_value = MagicMock(stdout="ok", returncode=0)
+        mock_run.return_value = MagicMock(stdout=b"ok", returncode=0)
 
-        run_prover9("test input")
-        call_kwargs = mock_run.call_args
-        assert call_kwargs.kwargs.get("shell") is True
+        run_prover9("p.\r\n-p.\n")
+        call = mock_run.call_args
+        assert call.kwargs.get("input") == b"p.\n-p.\n"
+        assert call.kwargs.get("shell") is not True
+        assert not any("-f" == arg for arg in call.args[0])
 
     @patch("argumentation_analysis.core.prover9_runner.subprocess.run")
     @patch("argumentation_analysis.core.prover9_runner.PROVER9_EXECUTABLE")
@@ -76,48 +79,15 @@ class TestRunProver9:
             run_prover9("bad input")
         assert exc_info.value.returncode == 2
 
-    @patch("argumentation_analysis.core.prover9_runner.subprocess.run")
-    @patch("argumentation_analysis.core.prover9_runner.PROVER9_EXECUTABLE")
-    @patch(
-        "argumentation_analysis.core.prover9_runner.os.path.exists", return_value=True
-    )
-    @patch("argumentation_analysis.core.prover9_runner.os.remove")
-    def test_temp_file_cleaned_up_on_success(
-        self, mock_remove, mock_exists, mock_executable, mock_run
-    ):
-        mock_executable.is_file.return_value = True
-        mock_run.return_value = MagicMock(stdout="ok", returncode=0)
-
-        run_prover9("test")
-        mock_remove.assert_called_once()
-
-    @patch("argumentation_analysis.core.prover9_runner.subprocess.run")
-    @patch("argumentation_analysis.core.prover9_runner.PROVER9_EXECUTABLE")
-    @patch(
-        "argumentation_analysis.core.prover9_runner.os.path.exists", return_value=True
-    )
-    @patch("argumentation_analysis.core.prover9_runner.os.remove")
-    def test_temp_file_cleaned_up_on_error(
-        self, mock_remove, mock_exists, mock_executable, mock_run
-    ):
-        mock_executable.is_file.return_value = True
-        mock_run.side_effect = subprocess.CalledProcessError(
-            returncode=1, cmd="prover9", output="", stderr="error"
-        )
-
-        with pytest.raises(subprocess.CalledProcessError):
-            run_prover9("test")
-        mock_remove.assert_called_once()
-
     @patch("argumentation_analysis.core.prover9_runner.subprocess.run")
     @patch("argumentation_analysis.core.prover9_runner.PROVER9_EXECUTABLE")
     def test_uses_cp1252_encoding(self, mock_executable, mock_run):
         mock_executable.is_file.return_value = True
-        mock_run.return_value = MagicMock(stdout="ok", returncode=0)
+        mock_run.return_value = MagicMock(stdout="caf\xe9".encode("cp1252"))
 
-        run_prover9("test")
-        call_kwargs = mock_run.call_args
-        assert call_kwargs.kwargs.get("encoding") == "cp1252"
+        assert run_prover9("test") == "caf\xe9"
+        # Bytes on the pipe: a text-mode pipe would write CRLF on Windows.
+        assert "text" not in mock_run.call_args.kwargs
 
     @patch("argumentation_analysis.core.prover9_runner.subprocess.run")
     @patch("argumentation_analysis.core.prover9_runner.PROVER9_EXECUTABLE")
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+"""Tests for versioned state snapshots (core/state_versions.py)."""
+
+import copy
+import json
+import pickle
+
+import pytest
+
+from argumentation_analysis.core.shared_state import UnifiedAnalysisState
+from argumentation_analysis.core.state_versions import StateVersionStore
+
+
+class Opaque:
+    def __str__(self):
+        return "opaque"
+
+
+@pytest.fixture
+def state():
+    s = UnifiedAnalysisState("Un texte à analyser.")
+    s.add_argument("premier argument")
+    s.counter_arguments.append({"id": "c1", "text": "contre"})
+    return s
+
+
+class TestSnapshot:
+    def test_full_snapshot_keeps_its_contract(self, state):
+        state.analysis_tasks["t"] = {"obj": Opaque(), "n": (1, 2)}
+        state.jtms_beliefs["b"] = {"valid": True, "obj": Opaque(), "n": (1, 2)}
+        expected = json.loads(state.to_json(indent=None))
+        for _ in range(2):
+            snap = state.get_state_snapshot(summarize=False)
+            # Base fields: JSON-native copies, as with a JSON round trip.
+            assert snap["analysis_tasks"] == expected["analysis_tasks"]
+            # Unified fields: the live objects.
+            assert snap["jtms_beliefs"] is state.jtms_beliefs
+            assert snap["counter_arguments"] is state.counter_arguments
+        state.counter_arguments.append({"id": "c2"})
+        assert snap["counter_arguments"][-1] == {"id": "c2"}
+
+    def test_snapshots_are_detached_from_live_state(self, state):
+        snap = state.snapshot()
+        state.counter_arguments[0]["text"] = "modifié"
+        assert snap["counter_arguments"][0]["text"] == "contre"
+        assert state.snapshot()["counter_arguments"][0]["text"] == "modifié"
+
+    def test_editing_returned_values_leaves_snapshots_intact(self, state):
+        before = state.snapshot()
+        returned = state.get_state_snapshot(summarize=False)
+        returned["analysis_tasks"]["t1"] = "ajoutée"
+        before["identified_arguments"]["arg_x"] = "ajouté"
+        assert "t1" not in before["analysis_tasks"]
+        assert "t1" not in state.snapshot()["analysis_tasks"]
+        state.analysis_tasks["t1"] = "ajoutée"
+        assert state.diff(before).changes["analysis_tasks"] == {
+            "added": ["t1"],
+            "removed": [],
+            "changed": [],
+        }
+
+    def test_unchanged_fields_are_shared_not_reserialised(self, state):
+        first = state.snapshot()
+        state.identified_fallacies["f1"] = {"type": "ad hominem"}
+        second = state.snapshot()
+        assert state._versions.last_refrozen == ["identified_fallacies"]
+        assert second._fields["counter_arguments"] is first._fields["counter_arguments"]
+        assert second.version == first.version + 1
+        assert state.snapshot() is second  # nothing changed since
+
+    def test_nested_in_place_edit_is_detected(self, state):
+        state.dung_frameworks["df"] = {"extensions": []}
+        before = state.snapshot()
+        state.dung_frameworks["df"]["formalism_specific"] = {"k": 1}
+        after = state.snapshot()
+        assert after.field_version("dung_frameworks") > before.field_version(
+            "dung_frameworks"
+        )
+        assert after["dung_frameworks"]["df"]["formalism_specific"] == {"k": 1}
+
+    def test_scalar_type_changes_are_versioned(self, state):
+        state.deanonymized = 1
+        before = state.snapshot()
+        state.deanonymized = True
+        assert state.snapshot()["deanonymized"] is True
+        assert state.diff(before).changes["deanonymized"] == {
+            "before": 1,
+            "after": True,
+        }
+
+    def test_unserialisable_state_keeps_error_envelope(self, state):
+        state.workflow_results[("tuple", "key")] = 1
+        snap = state.get_state_snapshot(summarize=False)
+        assert "safe_state_repr" in snap
+        assert snap["counter_arguments"] is state.counter_arguments
+
+    def test_state_can_be_copied_and_pickled(self, state):
+        state.snapshot()
+        for clone in (copy.deepcopy(state), pickle.loads(pickle.dumps(state))):
+            clone.add_argument("second")
+            assert len(clone.snapshot()["identified_arguments"]) == 2
+        assert len(state.snapshot()["identified_arguments"]) == 1
+
+    def test_reset_keeps_versions_increasing(self, state):
+        version = state.snapshot().version
+        state.reset_state()
+        assert state.snapshot().version > version
+
+
+class TestDiff:
+    def test_structural_changes(self, state):
+        state.argument_quality_scores = {"a": {"s": 1}, "b": {"s": 2}}
+        before = state.snapshot()
+        state.argument_quality_scores["a"]["s"] = 5
+        del state.argument_quality_scores["b"]
+        state.argument_quality_scores["c"] = {"s": 3}
+        state.counter_arguments.append({"id": "c2"})
+        state.fol_signature = ["b"]
+        diff = state.diff(before)
+        assert diff.changes["argument_quality_scores"] == {
+            "added": ["c"],
+            "removed": ["b"],
+            "changed": ["a"],
+        }
+        assert diff.changes["counter_arguments"] == {"appended": 1}
+        assert diff.changes["fol_signature"] == {"appended": 1}
+        assert diff.summary() == {
+            "argument_quality_scores": 3,
+            "counter_arguments": 1,
+            "fol_signature": 1,
+        }
+
+    def test_no_change_is_an_empty_diff(self, state):
+        before = state.snapshot()
+        assert not state.diff(before)
+
+    def test_added_and_removed_fields(self):
+        store = StateVersionStore()
+        before = store.snapshot({"a": [1], "b": 2})
+        after = store.snapshot({"a": [1, 2], "c": "x"})
+        assert before.diff(after).changes == {
+            "a": {"appended": 1},
+            "c": {"added": True},
+            "b": {"removed": True},
+        }
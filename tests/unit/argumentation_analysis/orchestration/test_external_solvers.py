@@ -464,12 +464,17 @@ class TestParseFailureIsNotAVerdict:
             _invoke_external_fol_solver,
         )
 
+        from argumentation_analysis.core import ladr_solver_service
+
         def run(prover9_stdout):
-            fake_runner = MagicMock()
-            fake_runner.run_prover9.return_value = prover9_stdout
-            with patch.dict(
-                "sys.modules",
-                {"argumentation_analysis.core.prover9_runner": fake_runner},
+            async def fake_prover9(_input):
+                return prover9_stdout
+
+            service = ladr_solver_service.LADRSolverService(
+                prover9_runner=fake_prover9, mace4_runner=False
+            )
+            with patch.object(
+                ladr_solver_service, "get_ladr_solver_service", return_value=service
             ), patch.object(mod.shutil, "which", return_value=None), patch(
                 "pathlib.Path.is_file", return_value=True
             ):
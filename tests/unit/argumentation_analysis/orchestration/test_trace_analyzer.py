@@ -313,3 +313,31 @@ class TestGenerateReport:
         assert "Phase: Extraction" in md
         assert "Convergence" in md
         assert "Arguments: 2" in md
+
+
+class TestVersionedSnapshots:
+    def test_phase_records_state_delta(self):
+        from argumentation_analysis.core.shared_state import UnifiedAnalysisState
+
+        state = UnifiedAnalysisState("texte")
+        analyzer = ConversationalTraceAnalyzer()
+        analyzer.start()
+        analyzer.begin_phase("Extraction", state.snapshot())
+        state.add_argument("arg")
+        state.counter_arguments.extend([{"id": 1}, {"id": 2}])
+        analyzer.end_phase("Extraction", state.snapshot())
+        analyzer.stop()
+
+        phase = analyzer.generate_report()["phases"][0]
+        assert phase["state_delta"] == {
+            "identified_arguments": 1,
+            "counter_arguments": 2,
+        }
+        assert phase["state_after"]["populated"] > phase["state_before"]["populated"]
+
+    def test_plain_dict_snapshots_have_no_delta(self):
+        analyzer = ConversationalTraceAnalyzer()
+        analyzer.start()
+        analyzer.begin_phase("P1", {"a": 1})
+        analyzer.end_phase("P1", {"a": 2})
+        assert analyzer.phases[0].state_delta == {}
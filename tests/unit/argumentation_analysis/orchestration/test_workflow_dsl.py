@@ -6,13 +6,17 @@ These tests validate:
 - Workflow validation (dependencies, duplicates)
 - Execution order computation
 - WorkflowExecutor with CapabilityRegistry integration
+- Eager dependency-driven scheduling, concurrency limits, critical path
 """
 
+import asyncio
+
 import pytest
 from argumentation_analysis.orchestration.workflow_dsl import (
     WorkflowBuilder,
     WorkflowDefinition,
     WorkflowExecutor,
+    WorkflowPhase,
     PhaseStatus,
 )
 from argumentation_analysis.core.capability_registry import (
@@ -286,6 +290,122 @@ class TestWorkflowExecutor:
         assert "No provider" in results["a"].error
 
 
+class TestEagerScheduling:
+    """Tests for the eager (dependency-driven) scheduling mode."""
+
+    def _registry(self, delays, log):
+        registry = CapabilityRegistry()
+        active = {"now": 0, "peak": 0}
+
+        def _make(cap, delay):
+            async def invoke(text, ctx):
+                log.append(("start", cap))
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+                await asyncio.sleep(delay)
+                active["now"] -= 1
+                log.append(("end", cap))
+                return f"{cap}-out"
+
+            return invoke
+
+        for cap, delay in delays.items():
+            registry.register(
+                name=f"comp_{cap}",
+                component_type=ComponentType.AGENT,
+                capabilities=[cap],
+                invoke=_make(cap, delay),
+            )
+        return registry, active
+
+    @pytest.mark.asyncio
+    async def test_slow_phase_does_not_block_unrelated_dependent(self):
+        log = []
+        registry, _ = self._registry({"slow": 0.2, "fast": 0.0, "next": 0.0}, log)
+        workflow = (
+            WorkflowBuilder("eager")
+            .add_phase("slow", capability="slow")
+            .add_phase("fast", capability="fast")
+            .add_phase("next", capability="next", depends_on=["fast"])
+            .build()
+        )
+        executor = WorkflowExecutor(registry, scheduling="eager")
+        results = await executor.execute(workflow, "text")
+
+        assert log.index(("start", "next")) < log.index(("end", "slow"))
+        assert all(r.status == PhaseStatus.COMPLETED for r in results.values())
+
+    @pytest.mark.asyncio
+    async def test_same_results_as_level_scheduling(self):
+        delays = {"a": 0.0, "b": 0.01, "c": 0.0, "d": 0.0}
+        workflow = (
+            WorkflowBuilder("diamond")
+            .add_phase("a", capability="a")
+            .add_phase("b", capability="b", depends_on=["a"])
+            .add_phase("c", capability="c", depends_on=["a"])
+            .add_phase("d", capability="d", depends_on=["b", "c"])
+            .build()
+        )
+        outputs = {}
+        for mode in ("levels", "eager"):
+            registry, _ = self._registry(delays, [])
+            results = await WorkflowExecutor(registry, scheduling=mode).execute(
+                workflow, "text"
+            )
+            outputs[mode] = {n: (r.status, r.output) for n, r in results.items()}
+        assert outputs["eager"] == outputs["levels"]
+
+    @pytest.mark.asyncio
+    async def test_pool_limit_caps_concurrency(self):
+        registry, active = self._registry({"llm_a": 0.01, "llm_b": 0.01}, [])
+        builder = WorkflowBuilder("pooled")
+        for i in range(4):
+            builder.add_phase(f"p{i}", capability="llm_a" if i % 2 else "llm_b")
+        executor = WorkflowExecutor(
+            registry,
+            scheduling="eager",
+            capability_limits={"llm": 1},
+            capability_pools={"llm_a": "llm", "llm_b": "llm"},
+        )
+        results = await executor.execute(builder.build(), "text")
+        assert active["peak"] == 1
+        assert len(results) == 4
+
+    @pytest.mark.asyncio
+    async def test_critical_path_report(self):
+        registry, _ = self._registry({"a": 0.0, "b": 0.05, "c": 0.0}, [])
+        workflow = (
+            WorkflowBuilder("cp")
+            .add_phase("a", capability="a")
+            .add_phase("b", capability="b", depends_on=["a"])
+            .add_phase("c", capability="c", depends_on=["a"])
+            .build()
+        )
+        executor = WorkflowExecutor(registry, scheduling="eager")
+        await executor.execute(workflow, "text")
+        report = executor.last_schedule_report
+        assert report["critical_path"] == ["a", "b"]
+        assert report["critical_path_seconds"] >= 0.05
+        assert report["scheduling"] == "eager"
+
+    def test_unknown_scheduling_mode_rejected(self):
+        with pytest.raises(ValueError):
+            WorkflowExecutor(CapabilityRegistry(), scheduling="greedy")
+
+    def test_unplaceable_phase_waits_for_earlier_levels(self):
+        """Phases on a cycle fall back to waiting for all earlier levels."""
+        workflow = WorkflowDefinition(
+            name="cyclic",
+            phases=[
+                WorkflowPhase(name="a", capability="a"),
+                WorkflowPhase(name="b", capability="b", depends_on=["c"]),
+                WorkflowPhase(name="c", capability="c", depends_on=["b"]),
+            ],
+        )
+        deps = workflow.get_dependencies()
+        assert deps == {"a": set(), "b": {"a"}, "c": {"a"}}
+
+
 class TestLegoWorkflowExamples:
     """Tests for the example workflows from the plan."""
 
@@ -0,0 +1,111 @@
+"""
+Tests for the bitset ATMS engine (services/jtms/atms_core.py).
+
+Tests validate:
+- Minimal labels with subsumption pruning
+- Forward propagation through justifications added earlier
+- Nogood index: superset consistency checks and label pruning
+- Label budget truncation
+- Mask-level queries (holds_in) with dozens of assumptions
+"""
+
+import itertools
+
+from argumentation_analysis.services.jtms.atms_core import (
+    ATMS,
+    CONTRADICTION_SYMBOL,
+)
+
+
+def _atms(assumptions, nodes=(), **kwargs):
+    atms = ATMS(**kwargs)
+    for name in assumptions:
+        atms.add_assumption(name)
+    for name in nodes:
+        atms.add_node(name)
+    return atms
+
+
+class TestMinimalLabels:
+    def test_superset_environment_is_subsumed(self):
+        atms = _atms(["a", "b"], ["c"])
+        atms.add_justification(["a", "b"], [], "c")
+        atms.add_justification(["a"], [], "c")
+        assert atms.get_environments("c") == {frozenset({"a"})}
+
+    def test_subsumed_environment_is_not_added(self):
+        atms = _atms(["a", "b"], ["c"])
+        atms.add_justification(["a"], [], "c")
+        atms.add_justification(["a", "b"], [], "c")
+        assert atms.get_environments("c") == {frozenset({"a"})}
+
+
+class TestForwardPropagation:
+    def test_new_environment_reaches_existing_consumers(self):
+        atms = _atms(["a", "b"], ["c", "d"])
+        atms.add_justification(["c"], [], "d")
+        assert atms.get_environments("d") == set()
+        atms.add_justification(["a"], [], "c")
+        atms.add_justification(["b"], [], "c")
+        assert atms.get_environments("d") == {frozenset({"a"}), frozenset({"b"})}
+
+    def test_labels_independent_of_insertion_order(self):
+        rules = [(["a", "x"], "y"), (["b"], "x"), (["y", "c"], "z"), (["a"], "x")]
+        results = set()
+        for order in itertools.permutations(rules):
+            atms = _atms(["a", "b", "c"], ["x", "y", "z"])
+            for ins, concl in order:
+                atms.add_justification(ins, [], concl)
+            results.add(frozenset(atms.get_environments("z")))
+        assert results == {frozenset({frozenset({"a", "c"})})}
+
+
+class TestNogoods:
+    def test_contradiction_makes_supersets_inconsistent(self):
+        atms = _atms(["a", "b", "c"], ["d"])
+        atms.add_justification(["a", "b"], [], CONTRADICTION_SYMBOL)
+        assert not atms.is_consistent(frozenset({"a", "b", "c"}))
+        assert atms.is_consistent(frozenset({"a", "c"}))
+        assert atms.get_nogoods() == [frozenset({"a", "b"})]
+
+    def test_nogood_blocks_later_derivations(self):
+        atms = _atms(["a", "b"], ["d"])
+        atms.add_justification(["a", "b"], [], CONTRADICTION_SYMBOL)
+        atms.add_justification(["a", "b"], [], "d")
+        assert atms.get_environments("d") == set()
+
+    def test_nogood_prunes_existing_labels(self):
+        atms = _atms(["a", "b", "c"], ["d"])
+        atms.add_justification(["a", "b"], [], "d")
+        atms.add_justification(["c"], [], "d")
+        atms.add_justification(["b"], [], CONTRADICTION_SYMBOL)
+        assert atms.get_environments("d") == {frozenset({"c"})}
+        assert atms.get_environments("b") == set()
+
+    def test_smaller_nogood_replaces_larger(self):
+        atms = _atms(["a", "b"])
+        atms.invalidate_environment(frozenset({"a", "b"}))
+        atms.invalidate_environment(frozenset({"a"}))
+        assert atms.get_nogoods() == [frozenset({"a"})]
+
+
+class TestLabelBudget:
+    def test_label_truncated_to_budget(self):
+        names = [f"a{i}" for i in range(6)]
+        atms = _atms(names, ["c"], label_budget=3)
+        for name in names:
+            atms.add_justification([name], [], "c")
+        assert len(atms.get_environments("c")) == 3
+        assert atms.stats["truncated_labels"] > 0
+
+
+class TestScaling:
+    def test_dozens_of_assumptions(self):
+        names = [f"a{i}" for i in range(64)]
+        atms = _atms(names, ["pair", "goal"])
+        for left, right in zip(names[::2], names[1::2]):
+            atms.add_justification([left, right], [], "pair")
+        atms.add_justification(["pair", "a63"], [], "goal")
+        assert atms.holds_in("goal", frozenset({"a0", "a1", "a63"}))
+        assert not atms.holds_in("goal", frozenset({"a0", "a63"}))
+        assert len(atms.get_environments("pair")) == 32
@@ -5,7 +5,8 @@ Tests validate:
 - Module import without errors
 - Belief creation and truth value management
 - Justification propagation
-- Non-monotonic SCC detection
+- Worklist propagation and change sets
+- Non-monotonic SCC detection (incremental and bulk)
 - JTMS explain and visualize APIs
 - CapabilityRegistry registration
 """
@@ -254,6 +255,147 @@ class TestNonMonotonic:
         assert jtms.beliefs["B"].non_monotonic is False
 
 
+class TestPropagationWave:
+    """Test worklist propagation and the returned change sets."""
+
+    def test_change_set_lists_flipped_beliefs(self):
+        from argumentation_analysis.services.jtms import JTMS
+
+        jtms = JTMS()
+        jtms.add_justification(["A"], [], "B")
+        jtms.add_justification(["B"], ["C"], "D")
+        jtms.add_justification(["X"], [], "E")
+        changes = jtms.set_belief_validity("A", True)
+        assert changes.to_dict() == {"in": ["A", "B", "D"], "out": [], "unknown": []}
+        changes = jtms.set_belief_validity("C", True)
+        assert changes.to_dict() == {"in": ["C"], "out": [], "unknown": ["D"]}
+
+    def test_unchanged_validity_gives_empty_change_set(self):
+        from argumentation_analysis.services.jtms import JTMS
+
+        jtms = JTMS()
+        jtms.add_justification(["A"], [], "B")
+        jtms.set_belief_validity("A", True)
+        assert not jtms.set_belief_validity("A", True)
+
+    def test_shared_descendant_evaluated_once(self):
+        """A diamond fan-in re-evaluates its sink once per wave."""
+        from argumentation_analysis.services.jtms import JTMS, Belief
+
+        jtms = JTMS()
+        mids = [f"m{i}" for i in range(20)]
+        for mid in mids:
+            jtms.add_justification(["root"], [], mid)
+        jtms.add_justification(mids, [], "sink")
+        calls = []
+        original = Belief.evaluate
+
+        def counting(belief):
+            calls.append(belief.name)
+            return original(belief)
+
+        Belief.evaluate = counting
+        try:
+            jtms.set_belief_validity("root", True)
+        finally:
+            Belief.evaluate = original
+        assert calls.count("sink") == 1
+        assert jtms.beliefs["sink"].valid is True
+
+    def test_deep_chain_beyond_recursion_limit(self):
+        import sys
+
+        from argumentation_analysis.services.jtms import JTMS
+
+        depth = sys.getrecursionlimit() * 2
+        jtms = JTMS()
+        jtms.add_justifications([([f"b{i}"], [], f"b{i+1}") for i in range(depth)])
+        changes = jtms.set_belief_validity("b0", True)
+        assert jtms.beliefs[f"b{depth}"].valid is True
+        assert len(changes) == depth + 1
+
+
+class TestIncrementalSCC:
+    """Test online cycle tracking and the bulk add_justifications API."""
+
+    def test_cycle_closed_late_marks_whole_component(self):
+        """Closing a long loop marks every belief on it, nothing else."""
+        from argumentation_analysis.services.jtms import JTMS
+
+        jtms = JTMS()
+        for i in range(10):
+            jtms.add_justification([f"b{i}"], [], f"b{i+1}")
+        jtms.add_justification(["b10"], [], "tail")
+        assert not any(b.non_monotonic for b in jtms.beliefs.values())
+        jtms.add_justification(["b10"], [], "b3")
+        marked = {n for n, b in jtms.beliefs.items() if b.non_monotonic}
+        assert marked == {f"b{i}" for i in range(3, 11)}
+
+    def test_backward_built_chain_stays_monotonic(self):
+        from argumentation_analysis.services.jtms import JTMS
+
+        jtms = JTMS()
+        for i in range(200, 0, -1):
+            jtms.add_justification([f"b{i-1}"], [], f"b{i}")
+        jtms.set_belief_validity("b0", True)
+        assert jtms.beliefs["b200"].valid is True
+        assert not any(b.non_monotonic for b in jtms.beliefs.values())
+
+    def test_rebuild_after_removal(self):
+        """Removing a belief forgets the cycles it was part of."""
+        from argumentation_analysis.services.jtms import JTMS
+
+        jtms = JTMS()
+        jtms.add_justification(["A"], [], "B")
+        jtms.remove_belief("A")
+        jtms.add_justification(["B"], [], "A")
+        assert jtms.beliefs["A"].non_monotonic is False
+
+    def test_bulk_matches_sequential_on_acyclic_rules(self):
+        from argumentation_analysis.services.jtms import JTMS
+
+        rules = [
+            (["A"], [], "B"),
+            (["B"], ["C"], "D"),
+            (["A", "D"], [], "E"),
+            (["X"], [], "C"),
+        ]
+        sequential, bulk = JTMS(), JTMS()
+        for jtms in (sequential, bulk):
+            jtms.add_belief("A")
+            jtms.set_belief_validity("A", True)
+        for rule in rules:
+            sequential.add_justification(*rule)
+        bulk.add_justifications(reversed(rules))
+        assert {n: b.valid for n, b in bulk.beliefs.items()} == {
+            n: b.valid for n, b in sequential.beliefs.items()
+        }
+        assert bulk.beliefs["E"].valid is True
+
+    def test_bulk_accepts_belief_file_dicts(self):
+        from argumentation_analysis.services.jtms import JTMS
+
+        jtms = JTMS()
+        jtms.add_justifications(
+            [
+                {"in": ["A"], "out": [], "conclusion": "B"},
+                {"in": ["B"], "out": [], "conclusion": "A"},
+            ]
+        )
+        assert jtms.beliefs["A"].non_monotonic is True
+        assert jtms.beliefs["B"].valid is None
+
+    def test_bulk_strict_mode_is_all_or_nothing(self):
+        from argumentation_analysis.services.jtms import JTMS
+
+        jtms = JTMS(strict=True)
+        jtms.add_belief("A")
+        jtms.add_belief("B")
+        with pytest.raises(KeyError):
+            jtms.add_justifications([(["A"], [], "B"), (["missing"], [], "A")])
+        assert jtms.beliefs["B"].justifications == []
+
+
 class TestExplainAndVisualize:
     """Test explain and visualize APIs."""
 
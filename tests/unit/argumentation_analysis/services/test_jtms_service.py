@@ -292,6 +292,18 @@ class TestSetBeliefValidity:
         assert result["new_value"] is True
         assert result["propagation_occurred"] is True
 
+    @pytest.mark.asyncio
+    async def test_returns_delta_and_notifies_callbacks(self, service):
+        iid = await service.create_jtms_instance("s1")
+        await service.add_justification(iid, ["X"], [], "Y")
+        received = []
+        service.register_callback(
+            "beliefs_changed", lambda sid, inst, delta: received.append((sid, delta))
+        )
+        result = await service.set_belief_validity(iid, "X", True)
+        assert sorted(result["changes"]["in"]) == ["X", "Y"]
+        assert received == [("s1", result["changes"])]
+
     @pytest.mark.asyncio
     async def test_invalid_instance_raises(self, service):
         with pytest.raises(ValueError, match="Instance"):
@@ -3,9 +3,11 @@
 
 import json
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import AsyncMock, patch, MagicMock
 from pathlib import Path
 
+from argumentation_analysis.services.jtms_checkpoint_store import JTMSCheckpointStore
 from argumentation_analysis.services.jtms_service import JTMSService
 from argumentation_analysis.services.jtms_session_manager import JTMSSessionManager
 
@@ -206,8 +208,9 @@ class TestCreateCheckpoint:
     async def test_checkpoint_saved_to_disk(self, manager):
         sid = await manager.create_session("watson")
         cp_id = await manager.create_checkpoint(sid, "save_point")
-        cp_file = manager.storage_path / f"{cp_id}.cp.json"
-        assert cp_file.exists()
+        assert list(manager.storage_path.glob(f"{sid}.*.snap"))
+        journaled = await manager.store.load_checkpoints(sid)
+        assert cp_id in [cp["checkpoint_id"] for cp in journaled]
 
     @pytest.mark.asyncio
     async def test_captures_jtms_state(self, manager):
@@ -217,7 +220,9 @@ class TestCreateCheckpoint:
         manager.sessions[sid]["jtms_instances"].append(iid)
         cp_id = await manager.create_checkpoint(sid, "with_evidence")
         cp = [c for c in manager.checkpoints[sid] if c["checkpoint_id"] == cp_id][0]
-        assert iid in cp["jtms_states"]
+        assert iid in cp["jtms_instances"]
+        states = await manager.store.materialize(sid, cp["journal_seq"], [iid])
+        assert states[iid].beliefs["evidence"].valid is True
 
     @pytest.mark.asyncio
     async def test_nonexistent_session_raises(self, manager):
@@ -463,21 +468,156 @@ class TestDiskPersistence:
     async def test_checkpoint_persists_on_disk(self, manager):
         sid = await manager.create_session("watson")
         cp_id = await manager.create_checkpoint(sid, "persist_test")
-        cp_file = manager.storage_path / f"{cp_id}.cp.json"
-        assert cp_file.exists()
-        with open(cp_file, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        assert data["checkpoint_id"] == cp_id
-        assert data["description"] == "persist_test"
+        # A fresh manager over the same directory sees the checkpoint.
+        reloaded = JTMSSessionManager(JTMSService(), str(manager.storage_path))
+        await reloaded._load_session_from_disk(sid)
+        data = [c for c in reloaded.checkpoints[sid] if c["checkpoint_id"] == cp_id]
+        assert data[0]["description"] == "persist_test"
 
     @pytest.mark.asyncio
     async def test_delete_removes_checkpoint_files(self, manager):
         sid = await manager.create_session("watson")
-        cp_id = await manager.create_checkpoint(sid, "to_delete")
-        cp_file = manager.storage_path / f"{cp_id}.cp.json"
-        assert cp_file.exists()
+        await manager.create_checkpoint(sid, "to_delete")
+        assert list(manager.storage_path.glob(f"{sid}.*"))
         await manager.delete_session(sid)
-        assert not cp_file.exists()
+        assert not list(manager.storage_path.glob(f"{sid}.*"))
+
+    def test_concurrent_atomic_writes_publish_whole_files(self, tmp_path):
+        target = tmp_path / "session.snap"
+        payloads = [bytes([i]) * 200_000 for i in range(8)]
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for _ in range(5):
+                list(
+                    pool.map(
+                        lambda data: JTMSCheckpointStore._write_atomic(target, data),
+                        payloads,
+                    )
+                )
+                assert target.read_bytes() in payloads
+        assert [p.name for p in tmp_path.iterdir()] == ["session.snap"]
+
+    @pytest.mark.asyncio
+    async def test_legacy_checkpoint_files_still_load(self, manager):
+        sid = await manager.create_session("watson")
+        legacy = {
+            "checkpoint_id": f"cp_{sid}_legacy",
+            "session_id": sid,
+            "created_at": "2000-01-01T00:00:00",
+            "description": "legacy",
+            "auto_generated": False,
+            "session_version": 1,
+            "jtms_states": {"old": {"beliefs": {"a": {"valid": True}}}},
+            "session_metadata": {},
+        }
+        cp_file = manager.storage_path / f"cp_{sid}_legacy.cp.json"
+        cp_file.write_text(json.dumps(legacy), encoding="utf-8")
+        manager.checkpoints.pop(sid)
+        await manager._load_checkpoints_for_session(sid)
+        assert manager.checkpoints[sid][0]["checkpoint_id"] == f"cp_{sid}_legacy"
+        assert await manager.restore_checkpoint(sid, f"cp_{sid}_legacy")
+        (iid,) = [i for i in manager.sessions[sid]["jtms_instances"]]
+        assert manager.jtms_service.instances[iid].beliefs["a"].valid is True
+
+
+# ── Journal ──
+
+
+async def _network(manager, sid):
+    svc = manager.jtms_service
+    iid = await svc.create_jtms_instance(sid)
+    await manager.add_jtms_instance_to_session(sid, iid)
+    await svc.create_belief(iid, "a", initial_value=True)
+    await svc.add_justification(iid, ["a"], ["c"], "b")
+    return iid
+
+
+class TestJournal:
+    @pytest.mark.asyncio
+    async def test_restore_replays_journal_to_checkpoint(self, manager):
+        sid = await manager.create_session("watson")
+        iid = await _network(manager, sid)
+        cp_id = await manager.create_checkpoint(sid, "b_holds")
+        expected = manager.jtms_service.instances[iid].export_state()
+
+        await manager.jtms_service.set_belief_validity(iid, "c", True)
+        await manager.jtms_service.remove_belief(iid, "a")
+        await manager.create_checkpoint(sid, "later")
+
+        assert await manager.restore_checkpoint(sid, cp_id)
+        (new_iid,) = manager.sessions[sid]["jtms_instances"]
+        assert new_iid != iid
+        assert manager.jtms_service.instances[new_iid].export_state() == expected
+
+    @pytest.mark.asyncio
+    async def test_checkpoints_only_append_deltas(self, manager):
+        sid = await manager.create_session("watson")
+        await _network(manager, sid)
+        await manager.create_checkpoint(sid, "first")
+        snapshots = list(manager.storage_path.glob(f"{sid}.*.snap"))
+        (segment,) = manager.storage_path.glob(f"{sid}.*.wal")
+        size = segment.stat().st_size
+        await manager.create_checkpoint(sid, "second")
+        assert list(manager.storage_path.glob(f"{sid}.*.snap")) == snapshots
+        assert segment.stat().st_size > size
+
+    @pytest.mark.asyncio
+    async def test_snapshot_interval_and_compaction(self, manager):
+        manager.store.snapshot_interval = 2
+        manager.max_checkpoints_per_session = 2
+        sid = await manager.create_session("watson")
+        iid = await _network(manager, sid)
+        for i in range(6):
+            await manager.jtms_service.create_belief(iid, f"x{i}", initial_value=True)
+            await manager.jtms_service.create_belief(iid, f"y{i}")
+            await manager.create_checkpoint(sid, f"cp{i}")
+
+        bases = manager.store._snapshot_bases(sid)
+        retained = manager.checkpoints[sid]
+        # Only the snapshots the retained checkpoints (and the current
+        # segment) rely on survive compaction.
+        assert len(bases) <= len(retained) + 1
+        last = retained[-1]
+        states = await manager.store.materialize(
+            sid, last["journal_seq"], last["jtms_instances"]
+        )
+        assert (
+            states[iid].export_state()
+            == manager.jtms_service.instances[iid].export_state()
+        )
+        reloaded = JTMSSessionManager(JTMSService(), str(manager.storage_path))
+        await reloaded._load_session_from_disk(sid)
+        assert [c["checkpoint_id"] for c in reloaded.checkpoints[sid]] == [
+            c["checkpoint_id"] for c in retained
+        ]
+
+    @pytest.mark.asyncio
+    async def test_pruned_checkpoints_stay_pruned_after_compaction(self, manager):
+        manager.store.snapshot_interval = 3
+        sid = await manager.create_session("watson")
+        iid = await manager.jtms_service.create_jtms_instance(sid)
+        await manager.add_jtms_instance_to_session(sid, iid)
+        for i in range(30):
+            await manager.jtms_service.create_belief(iid, f"x{i}", initial_value=True)
+            await manager.create_checkpoint(sid, f"cp{i}")
+
+        retained = [c["checkpoint_id"] for c in manager.checkpoints[sid]]
+        assert len(retained) == manager.max_checkpoints_per_session
+        reloaded = JTMSSessionManager(JTMSService(), str(manager.storage_path))
+        await reloaded._load_session_from_disk(sid)
+        assert [c["checkpoint_id"] for c in reloaded.checkpoints[sid]] == retained
+
+    @pytest.mark.asyncio
+    async def test_truncated_tail_is_ignored(self, manager):
+        sid = await manager.create_session("watson")
+        await _network(manager, sid)
+        cp_id = await manager.create_checkpoint(sid, "kept")
+        (segment,) = manager.storage_path.glob(f"{sid}.*.wal")
+        with open(segment, "ab") as f:
+            f.write(b"\x00\x00\x10\x00partial")
+        reloaded = JTMSSessionManager(JTMSService(), str(manager.storage_path))
+        await reloaded._load_session_from_disk(sid)
+        assert cp_id in [c["checkpoint_id"] for c in reloaded.checkpoints[sid]]
+        assert await reloaded.restore_checkpoint(sid, cp_id)
 
 
 # ── Integration ──
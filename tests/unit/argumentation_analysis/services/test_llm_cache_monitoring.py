@@ -160,3 +160,39 @@ def test_reset_cache_stats_zeros_all():
     lc._cache_stats.miss_replay = 1
     reset_cache_stats()
     assert get_cache_stats() == {"hit": 0, "miss_record": 0, "miss_replay": 0, "live": 0}
+
+
+# ── per-phase breakdown (llm_cache_phase) ──
+
+
+@pytest.mark.asyncio
+async def test_phase_stats_attribute_traffic_to_the_active_phase(monkeypatch, tmp_path):
+    monkeypatch.setenv("LLM_CACHE_MODE", RECORD)
+    monkeypatch.setenv("LLM_CACHE_DIR", str(tmp_path / "c"))
+    lc.reset_raw_cache()
+    client = _fake_client()
+    messages = [{"role": "user", "content": "q"}]
+    with lc.llm_cache_phase("extract"):
+        await lc.cached_raw_chat_completion(client, model="m", messages=messages)
+    with lc.llm_cache_phase("quality"):
+        await lc.cached_raw_chat_completion(client, model="m", messages=messages)
+    await lc.cached_raw_chat_completion(client, model="m", messages=messages)
+
+    phases = lc.get_cache_phase_stats()
+    assert phases["extract"]["miss_record"] == 1 and phases["extract"]["live"] == 1
+    assert phases["quality"]["hit"] == 1 and phases["quality"]["live"] == 0
+    # The record miss left the value in the memory tier.
+    assert phases["quality"]["memory_hit"] == 1
+    assert phases["quality"]["hit_rate"] == 1.0
+    assert phases[lc._UNSCOPED_PHASE]["hit"] == 1
+    # The flat counters are the sum over phases.
+    assert get_cache_stats() == {"hit": 2, "miss_record": 1, "miss_replay": 0, "live": 1}
+    lc.reset_raw_cache()
+
+
+def test_reset_cache_stats_clears_phases():
+    with lc.llm_cache_phase("p"):
+        lc._cache_stats.count_live(0.01)
+    assert "p" in lc.get_cache_phase_stats()
+    reset_cache_stats()
+    assert lc.get_cache_phase_stats() == {}
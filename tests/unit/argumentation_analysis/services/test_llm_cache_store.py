@@ -0,0 +1,269 @@
+"""Unit tests for the storage tiers of the LLM cache (``llm_cache_store``).
+
+No network, no API key: codec round trips, memory LRU bounds, tier
+attribution of lookups, namespaces, and the offline maintenance helpers
+(compact / prune / merge) on temporary diskcache directories.
+"""
+
+import time
+
+import diskcache
+import pytest
+
+from argumentation_analysis.services import llm_cache_store as store
+from argumentation_analysis.services.llm_cache_store import (
+    CacheValueError,
+    MemoryLRU,
+    TieredCache,
+    compact_cache_dir,
+    decode_value,
+    encode_value,
+    is_encoded,
+    merge_cache_dirs,
+    open_tiered_cache,
+    prune_cache_dir,
+    release_tiered_cache,
+)
+
+_VALUE = [{"role": "assistant", "content": "réponse " * 50, "items": []}]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    c = TieredCache(tmp_path / "c", compression="zlib")
+    yield c
+    c.close()
+
+
+# ── codec ──
+
+
+@pytest.mark.parametrize("compression", ["zlib", "none"])
+def test_codec_round_trip(compression):
+    blob = encode_value(_VALUE, compression)
+    assert is_encoded(blob)
+    assert decode_value(blob) == _VALUE
+
+
+def test_zlib_blob_is_smaller_than_json():
+    assert len(encode_value(_VALUE, "zlib")) < len(encode_value(_VALUE, "none"))
+
+
+def test_legacy_plain_values_pass_through():
+    assert decode_value({"model": "m"}) == {"model": "m"}
+    assert decode_value(_VALUE) == _VALUE
+    assert not is_encoded(_VALUE)
+
+
+def test_non_json_value_is_rejected():
+    with pytest.raises(TypeError):
+        encode_value({"response": object()}, "zlib")
+
+
+def test_corrupt_blob_raises_cache_value_error():
+    with pytest.raises(CacheValueError):
+        decode_value(b"LLMCz" + b"not zlib")
+    with pytest.raises(CacheValueError):
+        decode_value(b"LLMCq" + b"{}")
+
+
+def test_unavailable_zstd_falls_back_to_zlib(monkeypatch):
+    monkeypatch.setattr(store, "zstandard", None)
+    monkeypatch.setenv("LLM_CACHE_COMPRESSION", "zstd")
+    assert store.default_compression() == "zlib"
+
+
+# ── memory tier ──
+
+
+def test_memory_lru_evicts_least_recently_used_by_count():
+    lru = MemoryLRU(max_entries=2, max_bytes=1000)
+    lru.put("a", 1, 1)
+    lru.put("b", 2, 1)
+    assert lru.get("a") == 1  # "b" is now the least recently used
+    lru.put("c", 3, 1)
+    assert lru.get("b") is None
+    assert lru.get("a") == 1 and lru.get("c") == 3
+
+
+def test_memory_lru_is_bounded_by_bytes():
+    lru = MemoryLRU(max_entries=10, max_bytes=10)
+    lru.put("a", 1, 6)
+    lru.put("b", 2, 6)
+    assert len(lru) == 1 and lru.bytes == 6
+    lru.put("huge", 3, 11)  # larger than the whole tier: not kept
+    assert lru.get("huge") is None and lru.get("b") == 2
+
+
+# ── two-tier cache ──
+
+
+def test_lookup_reports_the_serving_tier(cache):
+    assert cache.lookup("k") == (None, None)
+    cache.set("k", _VALUE, namespace="m")
+    assert cache.lookup("k") == (_VALUE, "memory")
+    cache.memory.clear()
+    assert cache.lookup("k") == (_VALUE, "disk")
+    assert cache.lookup("k") == (_VALUE, "memory")  # promoted by the disk hit
+
+
+def test_disk_tier_stores_compressed_blobs(cache):
+    cache.set("k", _VALUE)
+    assert is_encoded(cache.disk["k"])
+
+
+def test_evict_namespace_drops_only_that_model(cache):
+    cache.set("a", 1, namespace="gpt-a")
+    cache.set("b", 2, namespace="gpt-b")
+    assert cache.evict_namespace("gpt-a") == 1
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_ttl_expires_disk_entries(tmp_path):
+    c = TieredCache(tmp_path / "c", memory_entries=0, ttl=0.01)
+    try:
+        c.set("k", 1)
+        time.sleep(0.05)
+        assert c.lookup("k") == (None, None)
+    finally:
+        c.close()
+
+
+def test_open_tiered_cache_is_shared_and_refcounted(tmp_path):
+    first = open_tiered_cache(tmp_path / "c")
+    second = open_tiered_cache(tmp_path / "c")
+    assert first is second
+    release_tiered_cache(first)
+    second.set("k", 1)  # still open for the remaining user
+    release_tiered_cache(second)
+    third = open_tiered_cache(tmp_path / "c")
+    try:
+        assert third is not first
+        assert third.get("k") == 1
+    finally:
+        release_tiered_cache(third)
+
+
+# ── offline maintenance ──
+
+
+def _seed(directory, entries, tag=None):
+    with diskcache.Cache(str(directory), tag_index=True) as db:
+        for key, value in entries.items():
+            db.set(key, value, tag=tag)
+
+
+def test_compact_reencodes_legacy_entries(tmp_path):
+    _seed(tmp_path / "c", {"a": _VALUE, "b": {"model": "m"}}, tag="m")
+    report = compact_cache_dir(tmp_path / "c", compression="zlib")
+    assert report["rewritten"] == 2
+    with diskcache.Cache(str(tmp_path / "c")) as db:
+        assert is_encoded(db["a"]) and decode_value(db["a"]) == _VALUE
+        assert decode_value(db["b"]) == {"model": "m"}
+    # Idempotent once every entry carries the current codec.
+    assert compact_cache_dir(tmp_path / "c", compression="zlib")["rewritten"] == 0
+
+
+def test_prune_by_namespace_and_dry_run(tmp_path):
+    _seed(tmp_path / "c", {"a": 1}, tag="old-model")
+    _seed(tmp_path / "c", {"b": 2}, tag="new-model")
+    dry = prune_cache_dir(tmp_path / "c", namespaces=["old-model"], dry_run=True)
+    assert dry == {"examined": 2, "removed": 1}
+    with diskcache.Cache(str(tmp_path / "c")) as db:
+        assert "a" in db
+    prune_cache_dir(tmp_path / "c", keep_namespaces=["new-model"])
+    with diskcache.Cache(str(tmp_path / "c")) as db:
+        assert "a" not in db and db["b"] == 2
+
+
+def test_prune_by_age(tmp_path):
+    _seed(tmp_path / "c", {"a": 1})
+    assert prune_cache_dir(tmp_path / "c", max_age_s=3600)["removed"] == 0
+    assert prune_cache_dir(tmp_path / "c", max_age_s=-1)["removed"] == 1
+
+
+def test_merge_adds_and_reports_conflicts(tmp_path):
+    _seed(tmp_path / "target", {"same": 1, "clash": "kept"})
+    _seed(tmp_path / "run1", {"same": 1, "clash": "other", "new": [1, 2]}, tag="m")
+    report = merge_cache_dirs([tmp_path / "run1"], tmp_path / "target")
+    assert report == {
+        "added": 1,
+        "replaced": 0,
+        "identical": 1,
+        "conflicts": ["clash"],
+    }
+    with diskcache.Cache(str(tmp_path / "target")) as db:
+        assert decode_value(db["clash"]) == "kept"
+        assert decode_value(db["new"]) == [1, 2]
+
+
+def test_merge_prefer_newest_replaces_older_value(tmp_path):
+    _seed(tmp_path / "target", {"clash": "old"})
+    time.sleep(0.01)
+    _seed(tmp_path / "run1", {"clash": "new"})
+    report = merge_cache_dirs([tmp_path / "run1"], tmp_path / "target", prefer="newest")
+    assert report["replaced"] == 1 and report["conflicts"] == ["clash"]
+    with diskcache.Cache(str(tmp_path / "target")) as db:
+        assert decode_value(db["clash"]) == "new"
+
+
+def test_compact_tags_untagged_raw_entries_with_their_model(tmp_path):
+    raw = {"model": "gpt-5-mini-2025-08-07", "choices": []}
+    _seed(tmp_path / "c", {"raw": raw, "sk": _VALUE})
+    report = compact_cache_dir(tmp_path / "c", compression="zlib")
+    assert report["rewritten"] == 2 and report["tagged"] == 1
+    tags = {key: tag for key, _, tag in store._entries(tmp_path / "c")}
+    assert tags == {"raw": "gpt-5-mini-2025-08-07", "sk": None}
+    again = compact_cache_dir(tmp_path / "c", compression="zlib")
+    assert again["rewritten"] == 0 and again["tagged"] == 0
+
+
+def test_prune_keep_spares_untagged_entries(tmp_path):
+    _seed(tmp_path / "c", {"sk": _VALUE})
+    _seed(tmp_path / "c", {"old": 1}, tag="old-model")
+    report = prune_cache_dir(tmp_path / "c", keep_namespaces=["new-model"])
+    assert report["removed"] == 1
+    with diskcache.Cache(str(tmp_path / "c")) as db:
+        assert "sk" in db and "old" not in db
+
+
+def test_prune_namespace_covers_dated_snapshots_only(tmp_path):
+    _seed(tmp_path / "c", {"a": 1}, tag="gpt-5-mini-2025-08-07")
+    _seed(tmp_path / "c", {"b": 2}, tag="gpt-5-mini-high")
+    _seed(tmp_path / "c", {"c": 3}, tag="gpt-5-mini")
+    prune_cache_dir(tmp_path / "c", namespaces=["gpt-5-mini"])
+    with diskcache.Cache(str(tmp_path / "c")) as db:
+        assert list(db) == ["b"]
+    prune_cache_dir(tmp_path / "c", keep_namespaces=["gpt-5-mini"])
+    with diskcache.Cache(str(tmp_path / "c")) as db:
+        assert list(db) == []
+
+
+def test_merge_tags_untagged_raw_entries(tmp_path):
+    _seed(tmp_path / "run1", {"raw": {"model": "gpt-x"}})
+    merge_cache_dirs([tmp_path / "run1"], tmp_path / "target")
+    tags = {key: tag for key, _, tag in store._entries(tmp_path / "target")}
+    assert tags == {"raw": "gpt-x"}
+
+
+def test_successive_merges_compare_record_times(tmp_path):
+    _seed(tmp_path / "run_a", {"clash": "old"})
+    time.sleep(0.01)
+    _seed(tmp_path / "run_b", {"clash": "new"})
+    merge_cache_dirs([tmp_path / "run_a"], tmp_path / "target", prefer="newest")
+    merge_cache_dirs([tmp_path / "run_b"], tmp_path / "target", prefer="newest")
+    with diskcache.Cache(str(tmp_path / "target")) as db:
+        assert decode_value(db["clash"]) == "new"
+    recorded = {key: t for key, t, _ in store._entries(tmp_path / "run_b")}
+    merged = {key: t for key, t, _ in store._entries(tmp_path / "target")}
+    assert merged == recorded
+
+
+def test_merge_keeps_entry_expiry(tmp_path):
+    with diskcache.Cache(str(tmp_path / "run1")) as db:
+        db.set("k", 1, expire=3600)
+    merge_cache_dirs([tmp_path / "run1"], tmp_path / "target")
+    with diskcache.Cache(str(tmp_path / "target")) as db:
+        _, expire_time = db.get("k", expire_time=True)
+    assert expire_time is not None and expire_time <= time.time() + 3600
@@ -0,0 +1,358 @@
+"""Unit tests for the central LLM request scheduler.
+
+No network, no API key: a local fake provider records concurrency, order of
+service and 429 injection, so admission control, AIMD, priorities and
+single-flight coalescing are checked against observable behaviour.
+"""
+
+import asyncio
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+import argumentation_analysis.orchestration.invoke_callables as ic
+from argumentation_analysis.services.llm_scheduler import (
+    PRIORITY_BATCH,
+    PRIORITY_INTERACTIVE,
+    AdaptiveConcurrency,
+    LLMScheduler,
+    TokenBucket,
+    current_llm_priority,
+    estimate_request_tokens,
+    get_llm_scheduler,
+    is_rate_limit_error,
+    llm_priority_scope,
+    retry_after_seconds,
+    set_llm_scheduler,
+)
+
+
+class RateLimitError(Exception):
+    """Shape of ``openai.RateLimitError``: status 429 and response headers."""
+
+    status_code = 429
+
+    def __init__(self, retry_after=None):
+        super().__init__("429 Too Many Requests")
+        headers = {} if retry_after is None else {"retry-after": str(retry_after)}
+        self.response = SimpleNamespace(status_code=429, headers=headers)
+
+
+class FakeProvider:
+    """Local stand-in for the provider: latency, concurrency and 429 injection."""
+
+    def __init__(self, latency=0.01, rate_limited=0, retry_after=None):
+        self.latency = latency
+        self.rate_limited = rate_limited
+        self.retry_after = retry_after
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+
+    def call(self, label="x"):
+        async def run():
+            self.calls.append(label)
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            try:
+                await asyncio.sleep(self.latency)
+                if self.rate_limited:
+                    self.rate_limited -= 1
+                    raise RateLimitError(self.retry_after)
+                return f"answer:{label}"
+            finally:
+                self.active -= 1
+
+        return run
+
+    # OpenAI-client surface, for the ``_guarded_chat_completion`` funnel.
+    @property
+    def chat(self):
+        return self
+
+    @property
+    def completions(self):
+        return self
+
+    async def create(self, **kwargs):
+        return await self.call(kwargs["messages"][0]["content"])()
+
+
+class TestBuildingBlocks:
+    def test_token_bucket_refills_at_rate(self):
+        now = [0.0]
+        bucket = TokenBucket(60, capacity=2, clock=lambda: now[0])
+        assert bucket.delay(2) == 0
+        bucket.take(2)
+        assert bucket.delay(1) == pytest.approx(1.0)
+        now[0] = 0.5
+        assert bucket.delay(1) == pytest.approx(0.5)
+        bucket.credit(5)
+        assert bucket.level == 2  # capped at capacity
+
+    def test_token_bucket_oversized_take_goes_negative(self):
+        now = [0.0]
+        bucket = TokenBucket(60, capacity=10, clock=lambda: now[0])
+        assert bucket.delay(100) == 0  # waits for a full bucket at most
+        bucket.take(100)
+        assert bucket.delay(1) == pytest.approx(91.0)
+
+    def test_aimd_increase_and_windowed_decrease(self):
+        limit = AdaptiveConcurrency(initial=4, maximum=8)
+        for _ in range(4):
+            limit.on_success()
+        assert limit.limit == 5
+        assert limit.on_congestion(started_at=10.0, now=11.0)
+        assert limit.limit == 2
+        # A call started before the decrease does not cut again.
+        assert not limit.on_congestion(started_at=10.5, now=11.2)
+        assert limit.limit == 2
+        assert limit.on_congestion(started_at=11.5, now=12.0)
+        assert limit.limit == 1
+
+    def test_provider_signals(self):
+        assert is_rate_limit_error(RateLimitError())
+        assert not is_rate_limit_error(ValueError("boom"))
+        assert retry_after_seconds(RateLimitError(retry_after=2)) == 2.0
+        assert retry_after_seconds(RateLimitError()) is None
+
+    def test_estimate_request_tokens(self):
+        kwargs = {
+            "messages": [{"role": "user", "content": "x" * 400}],
+            "max_tokens": 50,
+        }
+        assert estimate_request_tokens(kwargs) == 100 + 1 + 50
+        assert estimate_request_tokens({"messages": []}) == 1 + 512
+
+    def test_priority_scope(self):
+        assert current_llm_priority() == 1
+        with llm_priority_scope("batch"):
+            assert current_llm_priority() == PRIORITY_BATCH
+            with llm_priority_scope(PRIORITY_INTERACTIVE):
+                assert current_llm_priority() == PRIORITY_INTERACTIVE
+        assert current_llm_priority() == 1
+        with pytest.raises(ValueError):
+            with llm_priority_scope("urgent"):
+                pass
+
+
+class TestSingleFlight:
+    async def test_identical_in_flight_calls_are_coalesced(self):
+        provider = FakeProvider()
+        scheduler = LLMScheduler()
+        results = await asyncio.gather(
+            *(scheduler.submit(provider.call("q"), key="k") for _ in range(5))
+        )
+        assert results == ["answer:q"] * 5
+        assert provider.calls == ["q"]
+        assert scheduler.stats.coalesced == 4
+
+    async def test_distinct_keys_and_sequential_calls_are_not(self):
+        provider = FakeProvider()
+        scheduler = LLMScheduler()
+        await asyncio.gather(
+            scheduler.submit(provider.call("a"), key="a"),
+            scheduler.submit(provider.call("b"), key="b"),
+        )
+        await scheduler.submit(provider.call("a"), key="a")
+        assert sorted(provider.calls) == ["a", "a", "b"]
+
+    async def test_leader_error_reaches_followers(self):
+        async def failing():
+            await asyncio.sleep(0.01)
+            raise ValueError("provider down")
+
+        scheduler = LLMScheduler()
+        results = await asyncio.gather(
+            *(scheduler.submit(failing, key="k") for _ in range(3)),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, ValueError) for r in results)
+        assert scheduler.in_flight == 0
+
+    async def test_cancelled_leader_hands_over_to_follower(self):
+        provider = FakeProvider(latency=0.05)
+        scheduler = LLMScheduler()
+        leader = asyncio.ensure_future(scheduler.submit(provider.call("q"), key="k"))
+        await asyncio.sleep(0)
+        follower = asyncio.ensure_future(scheduler.submit(provider.call("q"), key="k"))
+        await asyncio.sleep(0.01)
+        leader.cancel()
+        assert await follower == "answer:q"
+        assert len(provider.calls) == 2
+
+
+class TestAdmission:
+    async def test_concurrency_limit_is_respected(self):
+        provider = FakeProvider()
+        scheduler = LLMScheduler(max_concurrency=3)
+        await asyncio.gather(*(scheduler.submit(provider.call(i)) for i in range(10)))
+        assert provider.peak == 3
+        assert scheduler.in_flight == 0
+
+    async def test_interactive_calls_overtake_batch_calls(self):
+        provider = FakeProvider()
+        scheduler = LLMScheduler(max_concurrency=1)
+        first = asyncio.ensure_future(scheduler.submit(provider.call("first")))
+        await asyncio.sleep(0)
+        queued = [
+            scheduler.submit(provider.call("batch-1"), priority=PRIORITY_BATCH),
+            scheduler.submit(provider.call("batch-2"), priority=PRIORITY_BATCH),
+            scheduler.submit(provider.call("api"), priority=PRIORITY_INTERACTIVE),
+        ]
+        await asyncio.gather(first, *queued)
+        assert provider.calls == ["first", "api", "batch-1", "batch-2"]
+
+    async def test_priority_comes_from_scope(self):
+        provider = FakeProvider()
+        scheduler = LLMScheduler(max_concurrency=1)
+
+        async def batch(label):
+            with llm_priority_scope("batch"):
+                return await scheduler.submit(provider.call(label))
+
+        async def interactive(label):
+            with llm_priority_scope("interactive"):
+                return await scheduler.submit(provider.call(label))
+
+        await asyncio.gather(batch("b0"), batch("b1"), interactive("i"))
+        assert provider.calls == ["b0", "i", "b1"]
+
+    async def test_request_rate_paces_admissions(self):
+        provider = FakeProvider(latency=0)
+        scheduler = LLMScheduler(requests_per_minute=1200, request_burst=1)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        await asyncio.gather(*(scheduler.submit(provider.call(i)) for i in range(4)))
+        # one immediate admission, then one every 50 ms
+        assert loop.time() - start >= 0.14
+
+    async def test_cancelled_waiter_frees_nothing_it_did_not_hold(self):
+        provider = FakeProvider(latency=0.02)
+        scheduler = LLMScheduler(max_concurrency=1)
+        running = asyncio.ensure_future(scheduler.submit(provider.call("a")))
+        await asyncio.sleep(0)
+        waiting = asyncio.ensure_future(scheduler.submit(provider.call("b")))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        await running
+        assert await scheduler.submit(provider.call("c")) == "answer:c"
+        assert provider.calls == ["a", "c"]
+        assert scheduler.in_flight == 0
+
+
+class TestRateLimitFeedback:
+    async def test_429_is_retried_after_a_shared_pause(self):
+        provider = FakeProvider(rate_limited=1, retry_after=0.05)
+        scheduler = LLMScheduler(max_concurrency=4)
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        assert await scheduler.submit(provider.call("q")) == "answer:q"
+        assert loop.time() - start >= 0.05
+        assert scheduler.stats.rate_limited == 1
+        assert scheduler.stats.retries == 1
+        assert scheduler.concurrency.limit == 2
+
+    async def test_retry_after_is_capped_by_max_backoff(self):
+        provider = FakeProvider(rate_limited=1, retry_after=3600)
+        scheduler = LLMScheduler(max_backoff_s=0.02)
+        result = await asyncio.wait_for(scheduler.submit(provider.call("q")), 1.0)
+        assert result == "answer:q"
+        assert scheduler.stats.retries == 1
+
+    async def test_burst_of_429_cuts_the_limit_once(self):
+        provider = FakeProvider(rate_limited=4, retry_after=0.01)
+        scheduler = LLMScheduler(max_concurrency=8)
+        await asyncio.gather(*(scheduler.submit(provider.call(i)) for i in range(4)))
+        assert scheduler.stats.rate_limited == 4
+        assert scheduler.stats.decreases == 1
+        # halved once (8 -> 4), then +1 after the 4 successful retries
+        assert scheduler.concurrency.limit == 5
+
+    async def test_retries_are_bounded(self):
+        provider = FakeProvider(rate_limited=10, retry_after=0)
+        scheduler = LLMScheduler(max_rate_limit_retries=2)
+        with pytest.raises(RateLimitError):
+            await scheduler.submit(provider.call("q"))
+        assert len(provider.calls) == 3
+        assert scheduler.in_flight == 0
+
+    async def test_slow_calls_count_as_congestion(self):
+        provider = FakeProvider(latency=0.03)
+        scheduler = LLMScheduler(max_concurrency=8, latency_target_s=0.01)
+        await scheduler.submit(provider.call("slow"))
+        assert scheduler.concurrency.limit == 4
+
+    async def test_token_budget_is_reconciled_with_usage(self):
+        async def call():
+            return SimpleNamespace(usage=SimpleNamespace(total_tokens=100))
+
+        scheduler = LLMScheduler(tokens_per_minute=6000, token_burst=1000)
+        await scheduler.submit(call, tokens=600)
+        assert scheduler.tokens.level == pytest.approx(900, abs=1)
+
+
+class TestGuardedFunnel:
+    async def test_funnel_coalesces_identical_live_calls(self):
+        provider = FakeProvider()
+        scheduler = LLMScheduler()
+        set_llm_scheduler(scheduler)
+        try:
+            messages = [{"role": "user", "content": "same prompt"}]
+            results = await asyncio.gather(
+                *(
+                    ic._guarded_chat_completion(provider, model="m", messages=messages)
+                    for _ in range(3)
+                )
+            )
+        finally:
+            set_llm_scheduler(None)
+        assert results == ["answer:same prompt"] * 3
+        assert provider.calls == ["same prompt"]
+
+    async def test_timeout_bounds_each_round_trip(self):
+        provider = FakeProvider(latency=1.0)
+        set_llm_scheduler(LLMScheduler())
+        try:
+            with patch.object(ic, "_LLM_CALL_TIMEOUT_S", 0.02):
+                with pytest.raises(asyncio.TimeoutError):
+                    await ic._guarded_chat_completion(
+                        provider, model="m", messages=[{"content": "q"}]
+                    )
+        finally:
+            set_llm_scheduler(None)
+
+    async def test_deadline_bounds_queueing(self):
+        provider = FakeProvider()
+        scheduler = LLMScheduler()
+        scheduler.paused_until = time.monotonic() + 3600
+        set_llm_scheduler(scheduler)
+        try:
+            with patch.object(ic, "_LLM_CALL_TIMEOUT_S", 0.02):
+                with pytest.raises(asyncio.TimeoutError):
+                    await ic._guarded_chat_completion(
+                        provider, model="m", messages=[{"content": "q"}]
+                    )
+        finally:
+            set_llm_scheduler(None)
+        assert provider.calls == []
+        assert scheduler.status()["queued"] == 0
+
+    async def test_scheduler_can_be_disabled(self, monkeypatch):
+        monkeypatch.setenv("LLM_SCHEDULER", "off")
+        assert get_llm_scheduler() is None
+        provider = FakeProvider()
+        result = await ic._guarded_chat_completion(
+            provider, model="m", messages=[{"content": "q"}]
+        )
+        assert result == "answer:q"
+
+    async def test_default_scheduler_is_per_loop(self, monkeypatch):
+        monkeypatch.setenv("LLM_MAX_CONCURRENCY", "5")
+        set_llm_scheduler(None)
+        scheduler = get_llm_scheduler()
+        assert scheduler is get_llm_scheduler()
+        assert scheduler.concurrency.limit == 5
+        set_llm_scheduler(None)
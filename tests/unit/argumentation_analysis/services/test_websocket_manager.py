@@ -8,9 +8,11 @@ Validates:
 - Status and error broadcasts
 - Singleton manager
 - Safe serialization
+- Fan-out: encode once, slow clients, coalescing, eviction, metrics
 """
 
 import asyncio
+import json
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -34,10 +36,14 @@ class FakeWebSocket:
         self.sent_messages = []
         self.accept = AsyncMock()
         self.send_json = AsyncMock(side_effect=self._record_send)
+        self.send_text = AsyncMock(side_effect=self._record_text)
 
     async def _record_send(self, msg):
         self.sent_messages.append(msg)
 
+    async def _record_text(self, data):
+        self.sent_messages.append(json.loads(data))
+
 
 @pytest.fixture
 def manager():
@@ -119,7 +125,7 @@ class TestBroadcasting:
 
     async def test_send_error_cleanup(self, manager):
         ws = FakeWebSocket()
-        ws.send_json = AsyncMock(side_effect=RuntimeError("broken"))
+        ws.send_text = AsyncMock(side_effect=RuntimeError("broken"))
         await manager.connect("sess-1", ws)
 
         await manager.broadcast_status("sess-1", "test")
@@ -202,6 +208,91 @@ class TestBroadcastHelpers:
         assert msg["error"] == "Something went wrong"
 
 
+# ──── Fan-out and Backpressure ────
+
+
+class SlowWebSocket(FakeWebSocket):
+    """Client whose sends block until ``release`` is set."""
+
+    def __init__(self):
+        super().__init__()
+        self.release = asyncio.Event()
+        self.close = AsyncMock()
+        self.send_text = AsyncMock(side_effect=self._slow_text)
+
+    async def _slow_text(self, data):
+        await self.release.wait()
+        self.sent_messages.append(json.loads(data))
+
+
+class TestFanOut:
+    async def test_message_encoded_once_for_all_clients(self, manager):
+        clients = [FakeWebSocket() for _ in range(3)]
+        for ws in clients:
+            await manager.connect("s1", ws)
+        await manager.broadcast_phase_result("s1", "extraction", {"score": 1})
+
+        payloads = [ws.send_text.await_args.args[0] for ws in clients]
+        assert all(p is payloads[0] for p in payloads)
+        assert json.loads(payloads[0])["result"] == {"score": 1}
+
+    async def test_slow_client_does_not_stall_broadcasts(self):
+        manager = AnalysisWebSocketManager(flush_timeout=0.05)
+        fast, slow = FakeWebSocket(), SlowWebSocket()
+        await manager.connect("s1", fast)
+        await manager.connect("s1", slow)
+
+        started = asyncio.get_running_loop().time()
+        for i in range(5):
+            await manager.broadcast_debate_turn("s1", "A", f"arg {i}", round_num=i)
+        # Only the first broadcast waited (bounded) on the slow client.
+        assert asyncio.get_running_loop().time() - started < 0.5
+        assert [m["round"] for m in fast.sent_messages] == [0, 1, 2, 3, 4]
+        assert manager.get_metrics()["queue_depth"] == 4
+
+        slow.release.set()
+        await asyncio.sleep(0.01)
+        assert [m["round"] for m in slow.sent_messages] == [0, 1, 2, 3, 4]
+
+    async def test_stale_status_messages_are_coalesced(self):
+        manager = AnalysisWebSocketManager(flush_timeout=0.01)
+        slow = SlowWebSocket()
+        await manager.connect("s1", slow)
+        await manager.broadcast_status("s1", "phase-1")  # in flight
+        for status in ("phase-2", "phase-3", "phase-4"):
+            await manager.broadcast_status("s1", status)
+        await manager.broadcast_error("s1", "boom")
+        await manager.broadcast_status("s1", "failed")
+
+        slow.release.set()
+        await asyncio.sleep(0.01)
+        received = [m.get("status", m["type"]) for m in slow.sent_messages]
+        assert received == ["phase-1", "error", "failed"]
+        assert manager.get_metrics()["messages_coalesced"] == 3
+
+    async def test_slow_consumer_is_evicted_on_overflow(self):
+        manager = AnalysisWebSocketManager(max_queue=2, flush_timeout=0.01)
+        fast, slow = FakeWebSocket(), SlowWebSocket()
+        await manager.connect("s1", fast)
+        await manager.connect("s1", slow)
+        for i in range(4):
+            await manager.broadcast_debate_turn("s1", "A", "arg", round_num=i)
+
+        assert manager.get_session_count("s1") == 1
+        slow.close.assert_awaited_once_with(code=1013)
+        assert len(fast.sent_messages) == 4
+        assert manager.get_metrics()["evicted"] == 1
+
+    async def test_metrics(self, manager, ws):
+        await manager.connect("s1", ws)
+        await manager.broadcast_status("s1", "ok")
+        metrics = manager.get_metrics()
+        assert metrics["connections"] == 1
+        assert metrics["messages_sent"] == 1
+        assert metrics["queue_depth"] == 0
+        assert metrics["send_latency_ms"]["max"] >= 0
+
+
 # ──── Safe Serialization ────
 
 
@@ -3,9 +3,15 @@
 Tests the JVM-free fallback implementation in qbf_native.py.
 """
 
+import random
+import sys
+
 import pytest
 
 from argumentation_analysis.agents.core.logic.qbf_native import (
+    QDPLLSolver,
+    compile_qbf,
+    run_external_qbf_solver,
     Var,
     Not,
     And,
@@ -245,3 +251,113 @@ class TestExamples:
     def test_example_argumentation(self):
         result = example_argumentation_acceptance()
         assert result["accepted"] is True
+
+
+def _nested(quantifiers, formula_str):
+    """Reference semantics: the ForAll/Exists evaluators on the parsed AST."""
+    formula = parse_formula(formula_str)
+    for q in reversed(quantifiers):
+        cls = Exists if q["type"] == "exists" else ForAll
+        formula = cls(q["vars"], formula)
+    return formula.evaluate({})
+
+
+class TestQDPLLEngine:
+    """Prenex CNF compilation and the QDPLL search."""
+
+    def test_agrees_with_reference_semantics(self):
+        rng = random.Random(7)
+        for _ in range(400):
+            names = [f"v{i}" for i in range(rng.randint(2, 7))]
+            quantifiers = [
+                {"type": rng.choice(["exists", "forall"]), "vars": [name]}
+                for name in names
+                if rng.random() < 0.9
+            ]
+
+            def term():
+                return " & ".join(
+                    ("!" if rng.random() < 0.5 else "") + rng.choice(names)
+                    for _ in range(rng.randint(1, 3))
+                )
+
+            formula = " | ".join(term() for _ in range(rng.randint(1, 5)))
+            if rng.random() < 0.5:
+                formula = f"{term()} | {term()} => {formula}"
+            expected = _nested(quantifiers, formula)
+            assert check_qbf(quantifiers, formula)[0] is expected, formula
+
+    def test_innermost_binding_wins_and_free_variables_are_false(self):
+        quantifiers = [
+            {"type": "exists", "vars": ["x"]},
+            {"type": "forall", "vars": ["x"]},
+        ]
+        assert check_qbf(quantifiers, "x")[0] is False
+        assert check_qbf([], "free")[0] is False
+        assert check_qbf([], "!free")[0] is True
+
+    def test_qdimacs_export(self):
+        compiled = compile_qbf(
+            [{"type": "forall", "vars": ["x"]}, {"type": "exists", "vars": ["y"]}],
+            "!x | y",
+        )
+        lines = compiled.to_qdimacs().splitlines()
+        assert "p cnf 2 1" in lines
+        assert lines[-3:] == ["a 1 0", "e 2 0", "-1 2 0"]
+
+    def test_forty_four_variable_instance(self):
+        xs = [f"x{i}" for i in range(22)]
+        ys = [f"y{i}" for i in range(22)]
+        quantifiers = [
+            {"type": "forall", "vars": xs},
+            {"type": "exists", "vars": ys},
+        ]
+        formula = " | ".join(f"x{i} & !y{i} | !x{i} & y{i}" for i in range(22))
+        analysis = analyze_qbf(quantifiers, formula)
+        assert analysis["valid"] is True
+        assert analysis["statistics"]["reasoner"] == "qdpll"
+        assert analysis["statistics"]["decisions"] < 100
+
+    def test_learning_prunes_the_search(self):
+        compiled = compile_qbf(
+            [
+                {"type": "exists", "vars": ["a", "b"]},
+                {"type": "forall", "vars": ["u"]},
+                {"type": "exists", "vars": ["c"]},
+            ],
+            "a & u & c | a & !u & !c | b & u & !c",
+        )
+        solver = QDPLLSolver(compiled)
+        assert solver.solve() is True
+        assert solver.stats["learned_cubes"] > 0
+
+
+class TestExternalQBFSolver:
+    """Hand-off of the compiled QDIMACS to an external solver binary."""
+
+    COMPILED = compile_qbf([{"type": "exists", "vars": ["x"]}], "x")
+
+    def _fake(self, script):
+        return [sys.executable, "-c", script]
+
+    def test_exit_code_verdict(self):
+        command = self._fake(
+            "import sys; text = sys.stdin.read(); "
+            "sys.exit(10 if text.startswith('c x 1') else 0)"
+        )
+        assert run_external_qbf_solver(self.COMPILED, command) is True
+
+    def test_solution_line_verdict(self):
+        command = self._fake("print('s cnf 0')")
+        assert run_external_qbf_solver(self.COMPILED, command) is False
+
+    def test_malformed_solution_line_is_no_verdict(self):
+        command = self._fake("print('s cnf 01')")
+        assert run_external_qbf_solver(self.COMPILED, command) is None
+
+    def test_missing_binary_falls_back_to_qdpll(self):
+        analysis = analyze_qbf(
+            [{"type": "exists", "vars": ["x"]}], "x", ["/nonexistent/qbf-solver"]
+        )
+        assert analysis["valid"] is True
+        assert analysis["statistics"]["reasoner"] == "qdpll"
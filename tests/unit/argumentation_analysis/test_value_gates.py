@@ -1116,17 +1116,21 @@ class TestDungDFSCycleDetection:
 class TestDungExponentialGuard:
     """Value-gate: exponential enumeration must raise above threshold.
 
-    Beyond _MAX_ENUM_ARGS, admissible/stable must raise RuntimeError
-    with an honest message — not silently blow up or return fake data.
+    Without PySAT, beyond _MAX_ENUM_ARGS, admissible/stable must raise
+    RuntimeError with an honest message — not silently blow up or return
+    fake data. With the SAT engine the argument count is no longer the
+    limit, the number of extensions is (_MAX_SAT_EXTENSIONS).
     """
 
-    def test_admissible_raises_above_threshold(self):
+    def test_admissible_raises_above_threshold(self, monkeypatch):
         """Admissible sets must raise RuntimeError for large frameworks."""
+        from argumentation_analysis.agents.core.logic import dung_native
         from argumentation_analysis.agents.core.logic.dung_native import (
             DungFramework,
             _MAX_ENUM_ARGS,
         )
 
+        monkeypatch.setattr(dung_native, "SAT_ENGINE_AVAILABLE", False)
         fw = DungFramework()
         for i in range(_MAX_ENUM_ARGS + 5):
             fw.add_argument(f"arg_{i}")
@@ -1136,13 +1140,15 @@ class TestDungExponentialGuard:
         with pytest.raises(RuntimeError, match="enumeration limit"):
             fw.admissible_sets()
 
-    def test_stable_raises_above_threshold(self):
+    def test_stable_raises_above_threshold(self, monkeypatch):
         """Stable extensions must raise RuntimeError for large frameworks."""
+        from argumentation_analysis.agents.core.logic import dung_native
         from argumentation_analysis.agents.core.logic.dung_native import (
             DungFramework,
             _MAX_ENUM_ARGS,
         )
 
+        monkeypatch.setattr(dung_native, "SAT_ENGINE_AVAILABLE", False)
         fw = DungFramework()
         for i in range(_MAX_ENUM_ARGS + 5):
             fw.add_argument(f"arg_{i}")
@@ -1150,6 +1156,42 @@ class TestDungExponentialGuard:
         with pytest.raises(RuntimeError, match="enumeration limit"):
             fw.stable_extensions()
 
+    def test_sat_engine_lifts_argument_threshold(self):
+        """With PySAT, stable/preferred work far above _MAX_ENUM_ARGS."""
+        from argumentation_analysis.agents.core.logic.dung_native import (
+            DungFramework,
+            SAT_ENGINE_AVAILABLE,
+            _MAX_ENUM_ARGS,
+        )
+
+        if not SAT_ENGINE_AVAILABLE:
+            pytest.skip("PySAT not installed")
+        fw = DungFramework()
+        for i in range(_MAX_ENUM_ARGS + 5):
+            fw.add_argument(f"arg_{i}")
+            if i > 0:
+                fw.add_attack(f"arg_{i-1}", f"arg_{i}")
+
+        expected = [sorted(f"arg_{i}" for i in range(0, _MAX_ENUM_ARGS + 5, 2))]
+        assert [sorted(e) for e in fw.stable_extensions()] == expected
+        assert [sorted(e) for e in fw.preferred_extensions()] == expected
+
+    def test_sat_engine_raises_above_extension_limit(self):
+        """2^n admissible sets of n unattacked arguments must raise honestly."""
+        from argumentation_analysis.agents.core.logic.dung_native import (
+            DungFramework,
+            SAT_ENGINE_AVAILABLE,
+        )
+
+        if not SAT_ENGINE_AVAILABLE:
+            pytest.skip("PySAT not installed")
+        fw = DungFramework()
+        for i in range(20):
+            fw.add_argument(f"arg_{i}")
+
+        with pytest.raises(RuntimeError, match="enumeration limit"):
+            fw.admissible_sets()
+
     def test_grounded_works_above_threshold(self):
         """Grounded (polynomial) must still work above the exponential limit."""
         from argumentation_analysis.agents.core.logic.dung_native import (
@@ -1230,8 +1272,8 @@ class TestConflictResolutionHonestProb:
 class TestKemenyYoungSafeFallback:
     """Value-gate: kemeny_young_safe falls back to Copeland for large sets.
 
-    For ≤8 candidates, exact Kemeny-Young is used (approximate=False).
-    For >8 candidates, Copeland approximation is returned (approximate=True).
+    Up to _MAX_KEMENY_CANDIDATES, exact Kemeny-Young is used (approximate=False).
+    Beyond, Copeland approximation is returned (approximate=True).
     """
 
     def test_exact_for_small_sets(self):
@@ -1255,14 +1297,14 @@ class TestKemenyYoungSafeFallback:
         assert score > 0
 
     def test_fallback_for_large_sets(self):
-        """10 candidates → Copeland fallback, approximate=True."""
+        """34 candidates (limit 32, plus 2) → Copeland fallback, approximate=True."""
         from argumentation_analysis.agents.core.governance.social_choice import (
             kemeny_young_safe,
             _MAX_KEMENY_CANDIDATES,
         )
 
         options = [f"C{i}" for i in range(_MAX_KEMENY_CANDIDATES + 2)]
-        # Everyone agrees: C0 > C1 > C2 > ... > C9
+        # Everyone agrees: C0 > C1 > C2 > ... > C33
         ballots = [options] * 5
 
         ranking, score, approximate = kemeny_young_safe(ballots, options)
@@ -1278,7 +1320,7 @@ class TestKemenyYoungSafeFallback:
         )
 
     def test_exact_kemeny_raises_for_large_sets(self):
-        """Direct kemeny_young() must still raise ValueError for >8."""
+        """Direct kemeny_young() must still raise ValueError for >32 candidates."""
         from argumentation_analysis.agents.core.governance.social_choice import (
             kemeny_young,
             _MAX_KEMENY_CANDIDATES,
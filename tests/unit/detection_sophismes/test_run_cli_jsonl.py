@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""``run_cli.py --file`` writes only JSON lines on stdout.
+
+``FallacyPipeline.run_batch`` must not print the progress lines of the
+single-text path: any non-JSON line breaks consumers of the ``--file``
+stream. ``2.3.2-detection-sophismes/`` is imported by path; the test needs
+spaCy with a French model and skips otherwise. The CamemBERT classifier is
+left out (``camembert_dir=None``) so no fine-tuned checkpoint is required.
+"""
+
+from __future__ import annotations
+
+import functools
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("spacy")
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+
+import spacy.util  # noqa: E402
+
+PIPELINE_DIR = Path(__file__).resolve().parents[3] / "2.3.2-detection-sophismes"
+FRENCH_MODELS = ("fr_core_news_lg", "fr_core_news_md", "fr_core_news_sm")
+
+
+@pytest.fixture
+def run_cli(monkeypatch):
+    model = next((m for m in FRENCH_MODELS if spacy.util.is_package(m)), None)
+    if model is None:
+        pytest.skip("no French spaCy model installed")
+    monkeypatch.syspath_prepend(str(PIPELINE_DIR))
+    monkeypatch.delitem(sys.modules, "fallacy_pipeline", raising=False)
+    monkeypatch.delitem(sys.modules, "run_cli", raising=False)
+    import run_cli
+
+    monkeypatch.setattr(
+        run_cli,
+        "FallacyPipeline",
+        functools.partial(
+            run_cli.FallacyPipeline, spacy_model=model, camembert_dir=None
+        ),
+    )
+    return run_cli
+
+
+def test_file_mode_stdout_is_json_lines(run_cli, tmp_path, monkeypatch, capsys):
+    corpus = tmp_path / "corpus.txt"
+    texts = [
+        "Un expert a dit que c'est vrai, donc c'est vrai.",
+        "Tout le monde le fait. On ne peut pas faire confiance aux politiciens.",
+    ]
+    corpus.write_text("\n".join(texts) + "\n", encoding="utf-8")
+    monkeypatch.setattr(sys, "argv", ["run_cli.py", "--file", str(corpus)])
+
+    run_cli.main()
+
+    lines = capsys.readouterr().out.splitlines()
+    records = [json.loads(line) for line in lines]
+    assert [r["text"] for r in records] == texts
@@ -0,0 +1,55 @@
+"""Unit tests for the cache maintenance CLI (``scripts/cassettes/maintain.py``)."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import diskcache
+
+from argumentation_analysis.services.llm_cache_store import decode_value, is_encoded
+from scripts.cassettes import maintain
+
+
+def _seed(db_dir: Path, entries: dict, tag: str | None = None) -> None:
+    with diskcache.Cache(str(db_dir), tag_index=True) as db:
+        for key, value in entries.items():
+            db.set(key, value, tag=tag)
+
+
+def test_compact_reencodes_and_prints_report(tmp_path: Path, capsys) -> None:
+    _seed(tmp_path / "db", {"a" * 64: {"model": "m"}})
+    assert (
+        maintain.main(["compact", str(tmp_path / "db"), "--compression", "zlib"]) == 0
+    )
+    assert json.loads(capsys.readouterr().out)["rewritten"] == 1
+    with diskcache.Cache(str(tmp_path / "db")) as db:
+        assert is_encoded(db["a" * 64])
+
+
+def test_prune_requires_a_criterion(tmp_path: Path) -> None:
+    _seed(tmp_path / "db", {"a": 1})
+    assert maintain.main(["prune", str(tmp_path / "db")]) == 1
+
+
+def test_prune_drops_model(tmp_path: Path, capsys) -> None:
+    _seed(tmp_path / "db", {"a": 1}, tag="old")
+    _seed(tmp_path / "db", {"b": 2}, tag="new")
+    assert maintain.main(["prune", str(tmp_path / "db"), "--drop-model", "old"]) == 0
+    assert json.loads(capsys.readouterr().out) == {"examined": 2, "removed": 1}
+
+
+def test_merge_exits_2_on_conflicts(tmp_path: Path, capsys) -> None:
+    _seed(tmp_path / "target", {"k": "a"})
+    _seed(tmp_path / "run", {"k": "b", "n": 1})
+    assert (
+        maintain.main(["merge", str(tmp_path / "target"), str(tmp_path / "run")]) == 2
+    )
+    report = json.loads(capsys.readouterr().out)
+    assert report["added"] == 1 and report["conflicts"] == 1
+    with diskcache.Cache(str(tmp_path / "target")) as db:
+        assert decode_value(db["n"]) == 1
+
+
+def test_missing_dir_is_an_error(tmp_path: Path) -> None:
+    assert maintain.main(["compact", str(tmp_path / "nope")]) == 1